@@ -16,6 +16,8 @@ from werkzeug.middleware.proxy_fix import ProxyFix
 from app.contexts.core.config.setting import settings
 from app.contexts.infra.database.extensions import init_extensions
 from app.contexts.infra.http.errors import register_error_handlers
+from app.contexts.infra.http.compression import ResponseCompressor
+from app.contexts.infra.http.http_cache import bump_after_write
 from app.contexts.infra.realtime.socketio_ext import init_socketio
 from app.contexts.infra.database.db import get_db
 from app.contexts.infra.database.indexes import ensure_indexes
@@ -171,6 +173,11 @@ def create_app():
         elif _is_reset_path(path):
             limiter.limit(reset_limit, override_defaults=False)(lambda: None)()
 
+    compressor = ResponseCompressor.from_settings(settings) if settings.COMPRESS_ENABLED else None
+
+    # Successful admin/upload writes invalidate version-stamped ETags (see http_cache)
+    app.after_request(bump_after_write)
+
     @app.after_request
     def _after(resp):
         # Always attach request id
@@ -208,6 +215,10 @@ def create_app():
             resp.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, PATCH, DELETE, OPTIONS"
             resp.headers["Access-Control-Max-Age"] = "600"
 
+        # Compression last: it must see the final body and headers (Vary, ETag)
+        if compressor is not None:
+            resp = compressor.compress(resp)
+
         return resp
 
     # -------------------------
@@ -216,6 +227,7 @@ def create_app():
     init_extensions(app)
     register_error_handlers(app)
     init_socketio(app)
+    from app.contexts.notifications.realtime import ws_handlers  # noqa: F401  (registers connect/disconnect)
 
     # -------------------------
     # OAuth (optional)
@@ -269,4 +281,34 @@ def create_app():
     with app.app_context():
         ensure_indexes(get_db())
 
+    # Background notification dispatcher (drains notification_outbox)
+    from app.contexts.notifications.services.outbox_dispatcher import start_outbox_dispatcher
+
+    start_outbox_dispatcher(get_db())
+
+    # Periodic unread counter reconciliation
+    from app.contexts.notifications.services.unread_counter import start_unread_reconciler
+
+    start_unread_reconciler(get_db())
+
+    # Retention: move old read notifications to notifications_archive
+    from app.contexts.notifications.services.notification_archiver import start_notification_archiver
+
+    start_notification_archiver(get_db())
+
+    # Telegram channel sender (only with TELEGRAM_BOT_TOKEN)
+    from app.contexts.notifications.services.telegram_delivery import start_telegram_sender
+
+    start_telegram_sender(get_db())
+
+    # Cross-worker room membership refresh (only with SOCKETIO_MESSAGE_QUEUE)
+    from app.contexts.notifications.realtime.rooms import start_room_sync
+
+    start_room_sync(get_db())
+
+    # Cross-worker teacher permission scope invalidation (only with SOCKETIO_MESSAGE_QUEUE)
+    from app.contexts.school.policies.teacher_scope import start_teacher_scope_sync
+
+    start_teacher_scope_sync()
+
     return app
\ No newline at end of file
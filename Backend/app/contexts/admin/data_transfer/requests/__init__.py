@@ -32,7 +32,11 @@ from .subject_schemas import (
 from .schedule_schemas import (
     AdminCreateScheduleSlotSchema,
     AdminUpdateScheduleSlotSchema,
-    AdminAssignScheduleSlotSubjectSchema
+    AdminAssignScheduleSlotSubjectSchema,
+    AdminGenerateTimetableSchema,
+    AdminImportScheduleSchema,
+    AdminCloneClassScheduleSchema,
+    AdminFreeSlotsQuerySchema,
 )
 
 from .assignment_requests import (
@@ -71,6 +75,9 @@ __all__ = [
     "AdminCreateScheduleSlotSchema",
     "AdminUpdateScheduleSlotSchema",
     "AdminAssignScheduleSlotSubjectSchema",
+    "AdminGenerateTimetableSchema",
+    "AdminImportScheduleSchema",
+    "AdminCloneClassScheduleSchema",
 
     # teacher Assignment subject
     "AdminAssignSubjectTeacherRequest",
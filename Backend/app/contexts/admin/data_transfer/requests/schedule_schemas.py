@@ -1,5 +1,5 @@
 from datetime import time
-from typing import Optional, Any
+from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from app.contexts.school.domain.schedule import DayOfWeek  
@@ -69,4 +69,143 @@ class AdminUpdateScheduleSlotSchema(BaseModel):
 class AdminAssignScheduleSlotSubjectSchema(BaseModel):
     model_config = ConfigDict(extra="ignore", use_enum_values=True)
     
-    subject_id: Optional[str] = None
\ No newline at end of file
+    subject_id: Optional[str] = None
+
+
+class AdminPeriodSchema(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    start_time: time
+    end_time: time
+
+    @model_validator(mode="after")
+    def _time_range(self):
+        validate_time_range(self.start_time, self.end_time)
+        return self
+
+
+class AdminGenerateTimetableSchema(BaseModel):
+    """
+    Input for the timetable solver.
+
+    - class_ids: classes to fill; lessons come from each class's subject_ids
+      and the teacher assigned to (class, subject)
+    - periods: daily bell schedule, repeated on every day in `days`
+    - lessons_per_week: per-subject override of default_lessons_per_week
+    - subject_rooms: pin a subject to one room (labs, gym); other lessons use `rooms`
+    """
+    model_config = ConfigDict(extra="ignore")
+
+    class_ids: List[str] = Field(..., min_length=1)
+    days: List[int] = Field(default_factory=lambda: [1, 2, 3, 4, 5])
+    periods: List[AdminPeriodSchema] = Field(..., min_length=1)
+    default_lessons_per_week: int = Field(default=2, ge=0, le=20)
+    lessons_per_week: Dict[str, int] = Field(default_factory=dict)
+    rooms: List[str] = Field(default_factory=list)
+    subject_rooms: Dict[str, str] = Field(default_factory=dict)
+    max_same_subject_per_day: int = Field(default=2, ge=1, le=10)
+    time_budget_ms: int = Field(default=3000, ge=100, le=30000)
+    seed: int = 0
+    dry_run: bool = True
+    allow_partial: bool = False
+
+    @field_validator("class_ids", mode="before")
+    @classmethod
+    def _class_ids(cls, v):
+        out = [oid_to_str(x) for x in (v or [])]
+        if not all(out):
+            raise ValueError("class_ids must be ObjectId strings")
+        return list(dict.fromkeys(out))
+
+    @field_validator("days", mode="before")
+    @classmethod
+    def _days(cls, v):
+        return sorted({int(ensure_day_of_week_1_7(x)) for x in (v or [])})
+
+    @field_validator("lessons_per_week")
+    @classmethod
+    def _counts(cls, v: Dict[str, int]):
+        if any(n < 0 or n > 20 for n in v.values()):
+            raise ValueError("lessons_per_week values must be between 0 and 20")
+        return v
+
+    @model_validator(mode="after")
+    def _periods_disjoint(self):
+        ordered = sorted(self.periods, key=lambda p: p.start_time)
+        for a, b in zip(ordered, ordered[1:]):
+            if b.start_time < a.end_time:
+                raise ValueError("periods must not overlap")
+        return self
+
+
+class AdminImportScheduleSchema(BaseModel):
+    """
+    JSON import body. Rows are validated one by one (AdminCreateScheduleSlotSchema)
+    so errors can be reported per row.
+    """
+    model_config = ConfigDict(extra="ignore")
+
+    slots: List[Dict[str, Any]] = Field(..., min_length=1, max_length=5000)
+    dry_run: bool = False
+
+
+class AdminCloneClassScheduleSchema(BaseModel):
+    """
+    teacher_ids: subject_id -> teacher_id overrides for the target class.
+    Without an override the target class's own assignment is used, then the source teacher.
+    """
+    model_config = ConfigDict(extra="ignore")
+
+    source_class_id: str
+    target_class_id: str
+    teacher_ids: Dict[str, str] = Field(default_factory=dict)
+    keep_rooms: bool = False
+    dry_run: bool = False
+
+    @field_validator("source_class_id", "target_class_id", mode="before")
+    @classmethod
+    def _ids(cls, v):
+        v = oid_to_str(v)
+        if not v:
+            raise ValueError("id is required")
+        return v
+
+    @model_validator(mode="after")
+    def _distinct(self):
+        if self.source_class_id == self.target_class_id:
+            raise ValueError("source_class_id and target_class_id must differ")
+        return self
+
+
+class AdminFreeSlotsQuerySchema(BaseModel):
+    """
+    Query string of GET /schedule/free-slots. `days` is a comma-separated list of 1..7.
+    """
+    model_config = ConfigDict(extra="ignore")
+
+    days: List[int] = Field(default_factory=lambda: [1, 2, 3, 4, 5], min_length=1)
+    teacher_id: Optional[str] = None
+    class_id: Optional[str] = None
+    room: Optional[str] = None
+    day_start: time = time(7, 0)
+    day_end: time = time(17, 0)
+    min_minutes: int = Field(30, ge=1, le=24 * 60)
+
+    @field_validator("days", mode="before")
+    @classmethod
+    def _days(cls, v: Any):
+        if isinstance(v, str):
+            v = [x for x in v.split(",") if x.strip()]
+        return sorted({ensure_day_of_week_1_7(x) for x in v or []})
+
+    @field_validator("teacher_id", "class_id", "room", mode="before")
+    @classmethod
+    def _blank_to_none(cls, v):
+        return strip_or_none(v)
+
+    @model_validator(mode="after")
+    def _check(self):
+        if not (self.teacher_id or self.class_id or self.room):
+            raise ValueError("At least one of teacher_id, class_id or room is required")
+        validate_time_range(self.day_start, self.day_end)
+        return self
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Generic, TypeVar, List
+from typing import Any, Dict, Generic, TypeVar, List
 from pydantic import Field
 
 from .common import BaseDTO, OptionDTO, ItemListDTO
@@ -27,6 +27,91 @@ class AdminScheduleListDTO(PaginatedListDTO[AdminScheduleSlotDataDTO]):
     pass
 
 
+class AdminScheduleConflictDTO(BaseDTO):
+    kind: str
+    resource: str
+    day_of_week: int
+    slot_id: str
+    start_time: str
+    end_time: str
+    other_slot_id: str
+    other_start_time: str
+    other_end_time: str
+
+
+class AdminScheduleConflictListDTO(ItemListDTO[AdminScheduleConflictDTO]):
+    total: int = 0
+
+
+class AdminGeneratedSlotDTO(BaseDTO):
+    id: str | None = None
+    class_id: str
+    subject_id: str
+    teacher_id: str
+    day_of_week: int
+    start_time: str
+    end_time: str
+    room: str | None = None
+
+
+class AdminUnplacedLessonDTO(BaseDTO):
+    class_id: str
+    subject_id: str
+    teacher_id: str | None = None
+    lessons_per_week: int
+    missing: int
+    reason: str
+
+
+class AdminTimetableGenerationDTO(BaseDTO):
+    dry_run: bool
+    complete: bool
+    inserted: int = 0
+    stats: Dict[str, Any] = Field(default_factory=dict)
+    unplaced: List[AdminUnplacedLessonDTO] = Field(default_factory=list)
+    slots: List[AdminGeneratedSlotDTO] = Field(default_factory=list)
+
+
+class AdminBulkScheduleResultDTO(BaseDTO):
+    dry_run: bool
+    inserted: int = 0
+    errors: List[Dict[str, Any]] = Field(default_factory=list)
+    items: List[AdminScheduleSlotDataDTO] = Field(default_factory=list)
+
+
+class AdminFreeSlotDTO(BaseDTO):
+    day_of_week: int
+    start_time: str
+    end_time: str
+    minutes: int
+
+
+class AdminFreeSlotListDTO(ItemListDTO[AdminFreeSlotDTO]):
+    pass
+
+
+class AdminSubstituteSlotDTO(BaseDTO):
+    slot_id: str
+    class_id: str
+    teacher_id: str
+    subject_id: str | None = None
+    day_of_week: int
+    start_time: str
+    end_time: str
+    room: str | None = None
+
+
+class AdminSubstituteTeacherDTO(BaseDTO):
+    teacher_id: str
+    teacher_name: str | None = None
+    match: str
+    busy_minutes_that_day: int = 0
+
+
+class AdminSubstituteListDTO(ItemListDTO[AdminSubstituteTeacherDTO]):
+    slot: AdminSubstituteSlotDTO
+
+
 
 class AdminSubjectSelectDTO(OptionDTO):
     pass
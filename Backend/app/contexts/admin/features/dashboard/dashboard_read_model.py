@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping
 
 from zoneinfo import ZoneInfo
 from bson import ObjectId
@@ -10,6 +10,7 @@ from app.contexts.iam.read_models.iam_read_model import IAMReadModel
 from app.contexts.school.read_models.attendance_read_model import AttendanceReadModel
 from app.contexts.school.read_models.class_read_model import ClassReadModel
 from app.contexts.school.read_models.grade_read_model import GradeReadModel
+from app.contexts.school.read_models.grade_stats_read_model import GradeStatsReadModel
 from app.contexts.school.read_models.schedule_read_model import ScheduleReadModel
 from app.contexts.school.read_models.subject_read_model import SubjectReadModel
 from app.contexts.shared.lifecycle.filters import not_deleted
@@ -39,6 +40,8 @@ class AdminDashboardReadModel(MongoErrorMixin):
             student_read_model=self._student,
         )
 
+        self._grade_stats = GradeStatsReadModel(db, display=self._display_names)
+
         self._schedules_col = db["schedules"]
 
     def _weekday_from_date(self, tz_name: str = "Asia/Phnom_Penh") -> int:
@@ -294,6 +297,21 @@ class AdminDashboardReadModel(MongoErrorMixin):
             "pass_rate_by_class": pass_rate_by_class,
         }
 
+    def get_grade_statistics(
+        self,
+        *,
+        class_id: str | None = None,
+        subject_id: str | None = None,
+        term: str | None = None,
+        weights: Mapping[str, float] | None = None,
+    ) -> Dict[str, Any]:
+        return self._grade_stats.get_statistics(
+            class_id=class_id,
+            subject_id=subject_id,
+            term=term,
+            weights=weights,
+        )
+
     def get_schedule_dashboard(self) -> Dict[str, Any]:
         weekday_raw = self._aggregate_lessons_by_weekday_active()
         teacher_raw = self._aggregate_lessons_by_teacher_active(limit=10)
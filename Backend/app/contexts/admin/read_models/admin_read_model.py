@@ -16,6 +16,7 @@ from app.contexts.staff.read_models.staff_read_model import StaffReadModel
 from app.contexts.student.read_models.student_read_model import StudentReadModel
 from app.contexts.student.domain.student import StudentStatus
 from app.contexts.school.read_models.teacher_assignment_read_model import TeacherAssignmentReadModel
+from app.contexts.school.read_models.timetable_read_model import TimetableReadModel
     
 class AdminReadModel(MongoErrorMixin):
     """
@@ -48,6 +49,7 @@ class AdminReadModel(MongoErrorMixin):
         )
 
         self._assignment_read_model: Final[TeacherAssignmentReadModel] = TeacherAssignmentReadModel(self.db)
+        self._timetable_read_model: Final[TimetableReadModel] = TimetableReadModel(self.db)
 
 
     def _oid(self, id_: Union[str, ObjectId]) -> ObjectId:
@@ -311,6 +313,25 @@ class AdminReadModel(MongoErrorMixin):
     def admin_get_schedule_by_id(self, slot_id: Union[str, ObjectId]) -> Optional[dict]:
         return self._schedule_read_model.get_by_id(slot_id)
 
+    def admin_list_classes_by_ids(self, class_ids: List[Union[str, ObjectId]]) -> List[dict]:
+        return self._class_read_model.list_by_ids(class_ids)
+
+    def admin_list_assignments_for_classes(self, class_ids: List[Union[str, ObjectId]]) -> List[dict]:
+        return self._assignment_read_model.list_for_classes(class_ids)
+
+    def admin_find_free_slots(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        return self._timetable_read_model.free_slots(**kwargs)
+
+    def admin_list_substitutes_for_slot(self, slot_id: Union[str, ObjectId]) -> Dict[str, Any]:
+        result = self._timetable_read_model.substitutes_for_slot(slot_id)
+        items = result["items"]
+        if items:
+            names = self._display_name_service.staff_names_for_ids([r["teacher_id"] for r in items])
+            names_str = {str(k): v for k, v in names.items()}
+            for r in items:
+                r["teacher_name"] = names_str.get(r["teacher_id"]) or "[deleted teacher]"
+        return result
+
     def admin_list_subjects_select_in_class(self, class_id: str | ObjectId) -> List[Dict[str, Any]]:
         coid = self._oid(class_id)
 
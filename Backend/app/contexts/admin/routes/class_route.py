@@ -4,6 +4,7 @@ from flask import request, g
 from app.contexts.admin.routes import admin_bp
 from app.contexts.core.security.auth_utils import get_current_staff_id
 from app.contexts.shared.decorators.response_decorator import wrap_response
+from app.contexts.infra.http.http_cache import ADMIN_VERSION, http_cache
 from app.contexts.iam.auth.jwt_utils import role_required
 from app.contexts.shared.model_converter import pydantic_converter, mongo_converter
 import math
@@ -132,6 +133,15 @@ def admin_soft_delete_class(class_id: str):
     return {"message": "Class soft deleted"}
 
 
+@admin_bp.route("/classes/<class_id>/restore", methods=["POST"])
+@role_required(["admin"])
+@wrap_response
+def admin_restore_class(class_id: str):
+    admin_id = get_current_staff_id()
+    g.admin.class_service.admin_restore_class(class_id=class_id, actor_id=admin_id)
+    return {"message": "Class restored"}
+
+
 
 # ---------------------------------------------------------
 # LIST Students in Class Select
@@ -151,6 +161,7 @@ def admin_list_students_in_class_select(class_id: str):
 @admin_bp.route("/classes/names-select", methods=["GET"])
 @role_required(["admin"])
 @wrap_response
+@http_cache(versions=(ADMIN_VERSION,))
 def admin_list_classes_select():
     classes = g.admin.class_service.admin_list_classes_select()
     items = mongo_converter.list_to_dto(classes, AdminClassSelectOptionDTO)
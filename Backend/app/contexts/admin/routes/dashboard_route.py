@@ -8,6 +8,8 @@ from app.contexts.admin.routes import admin_bp
 from app.contexts.iam.auth.jwt_utils import role_required
 from app.contexts.shared.decorators.response_decorator import wrap_response
 from app.contexts.admin.features.dashboard.dto import AdminDashboardDTO
+from app.contexts.school.data_transfer.responses import GradeStatisticsDTO
+from app.contexts.school.domain.grade_statistics import parse_weights_arg
 
 
 def _parse_date_arg(value: str | None) -> datetime | None:
@@ -62,4 +64,31 @@ def admin_get_dashboard():
     raw = g.admin.dashboard_read_model.get_admin_dashboard(date_from=date_from, date_to=date_to, term=term)
 
     dto = AdminDashboardDTO(**raw)
-    return dto
\ No newline at end of file
+    return dto
+
+
+@admin_bp.route("/dashboard/grade-statistics", methods=["GET"])
+@role_required(["admin"])
+@wrap_response
+def admin_get_grade_statistics():
+    """
+    GET /admin/dashboard/grade-statistics
+
+    Query params (class_id or subject_id is required):
+      - class_id=<ObjectId>
+      - subject_id=<ObjectId>
+      - term=2025-S1 / S1 / S2
+      - weights=exam:0.5,assignment:0.2,homework:0.15,quiz:0.15
+    """
+    class_id = request.args.get("class_id") or None
+    subject_id = request.args.get("subject_id") or None
+    if not class_id and not subject_id:
+        raise ValueError("class_id or subject_id is required")
+
+    raw = g.admin.dashboard_read_model.get_grade_statistics(
+        class_id=class_id,
+        subject_id=subject_id,
+        term=request.args.get("term"),
+        weights=parse_weights_arg(request.args.get("weights")),
+    )
+    return GradeStatisticsDTO(**raw)
@@ -3,18 +3,31 @@ from app.contexts.admin.routes import admin_bp
 from app.contexts.core.security.auth_utils import get_current_staff_id
 from app.contexts.iam.auth.jwt_utils import role_required
 from app.contexts.shared.decorators.response_decorator import wrap_response
+from app.contexts.infra.http.http_cache import ADMIN_VERSION, http_cache
 from app.contexts.shared.model_converter import pydantic_converter, mongo_converter
 
 from app.contexts.admin.data_transfer.requests import (
     AdminCreateScheduleSlotSchema,
     AdminUpdateScheduleSlotSchema,
-    AdminAssignScheduleSlotSubjectSchema
+    AdminAssignScheduleSlotSubjectSchema,
+    AdminGenerateTimetableSchema,
+    AdminImportScheduleSchema,
+    AdminCloneClassScheduleSchema,
+    AdminFreeSlotsQuerySchema,
 )
 from app.contexts.admin.data_transfer.responses import (
     AdminScheduleSlotDataDTO,
     AdminScheduleListDTO,
+    AdminScheduleConflictDTO,
+    AdminScheduleConflictListDTO,
+    AdminFreeSlotDTO,
+    AdminFreeSlotListDTO,
+    AdminSubstituteListDTO,
+    AdminTimetableGenerationDTO,
+    AdminBulkScheduleResultDTO,
 )
 from app.contexts.admin.mapper.school_admin_mapper import SchoolAdminMapper
+from app.contexts.admin.services.schedule_service import parse_schedule_csv
 
 
 
@@ -27,6 +40,7 @@ def _get_pagination():
     page_size = min(max(1, page_size), 100)  # clamp
     return page, page_size
 
+
 # ---------------------------------------------------------
 # CREATE schedule slot
 # ---------------------------------------------------------
@@ -143,6 +157,7 @@ def admin_get_schedule_by_id(slot_id: str):
 @admin_bp.route("/schedule/teacher-select", methods=["GET"])
 @role_required(["admin"])
 @wrap_response
+@http_cache(versions=(ADMIN_VERSION,))
 def admin_schedule_teacher_select():
     class_id = request.args.get("class_id", type=str)
     subject_id = request.args.get("subject_id", type=str)
@@ -150,4 +165,113 @@ def admin_schedule_teacher_select():
         return {"items": []}
 
     items = g.admin.schedule_service.admin_list_teacher_select_for_class_subject(class_id, subject_id)
-    return {"items": items}
\ No newline at end of file
+    return {"items": items}
+
+
+# ---------------------------------------------------------
+# CONFLICTS
+# ---------------------------------------------------------
+@admin_bp.route("/schedule/conflicts", methods=["GET"])
+@role_required(["admin"])
+@wrap_response
+def admin_validate_timetable():
+    items = g.admin.schedule_service.admin_validate_timetable()
+    return AdminScheduleConflictListDTO(
+        items=[AdminScheduleConflictDTO(**c) for c in items],
+        total=len(items),
+    )
+
+
+@admin_bp.route("/schedule/conflicts/check", methods=["POST"])
+@role_required(["admin"])
+@wrap_response
+def admin_check_schedule_slot_conflicts():
+    payload = pydantic_converter.convert_to_model(request.json, AdminCreateScheduleSlotSchema)
+    slot_id = request.args.get("slot_id", type=str) or None
+    items = g.admin.schedule_service.admin_check_schedule_slot_conflicts(payload=payload, slot_id=slot_id)
+    return AdminScheduleConflictListDTO(
+        items=[AdminScheduleConflictDTO(**c) for c in items],
+        total=len(items),
+    )
+
+
+# ---------------------------------------------------------
+# FREE SLOTS / SUBSTITUTES
+# ---------------------------------------------------------
+@admin_bp.route("/schedule/free-slots", methods=["GET"])
+@role_required(["admin"])
+@wrap_response
+def admin_find_free_slots():
+    q = pydantic_converter.convert_to_model(request.args.to_dict(), AdminFreeSlotsQuerySchema)
+    items = g.admin.schedule_service.admin_find_free_slots(
+        teacher_id=q.teacher_id,
+        class_id=q.class_id,
+        room=q.room,
+        days=q.days,
+        day_start=q.day_start.strftime("%H:%M"),
+        day_end=q.day_end.strftime("%H:%M"),
+        min_minutes=q.min_minutes,
+    )
+    return AdminFreeSlotListDTO(items=[AdminFreeSlotDTO(**x) for x in items])
+
+
+@admin_bp.route("/schedule/slots/<slot_id>/substitutes", methods=["GET"])
+@role_required(["admin"])
+@wrap_response
+def admin_list_substitutes_for_slot(slot_id: str):
+    result = g.admin.schedule_service.admin_list_substitutes_for_slot(slot_id)
+    return AdminSubstituteListDTO.model_validate(result)
+
+
+# ---------------------------------------------------------
+# GENERATE timetable (dry_run=true previews without writing)
+# ---------------------------------------------------------
+@admin_bp.route("/schedule/generate", methods=["POST"])
+@role_required(["admin"])
+@wrap_response
+def admin_generate_timetable():
+    payload = pydantic_converter.convert_to_model(request.json, AdminGenerateTimetableSchema)
+    result = g.admin.schedule_service.admin_generate_timetable(payload=payload)
+    return AdminTimetableGenerationDTO.model_validate(result)
+
+
+def _bulk_result_dto(result: dict) -> AdminBulkScheduleResultDTO:
+    return AdminBulkScheduleResultDTO(
+        dry_run=result["dry_run"],
+        inserted=result["inserted"],
+        errors=result["errors"],
+        items=[SchoolAdminMapper.schedule_slot_to_dto(s) for s in result["slots"]],
+    )
+
+
+# ---------------------------------------------------------
+# BULK import / clone (one insert_many, one notification per user)
+# ---------------------------------------------------------
+@admin_bp.route("/schedule/import", methods=["POST"])
+@role_required(["admin"])
+@wrap_response
+def admin_import_schedule():
+    """
+    Body: JSON {"slots": [...], "dry_run": bool}, a text/csv body, or a multipart
+    "file" upload. For CSV, pass ?dry_run=true to preview.
+    """
+    upload = request.files.get("file")
+    if upload is not None or request.mimetype == "text/csv":
+        text = upload.read().decode("utf-8-sig") if upload is not None else request.get_data(as_text=True)
+        rows = parse_schedule_csv(text)
+        dry_run = request.args.get("dry_run", "false").lower() == "true"
+    else:
+        payload = pydantic_converter.convert_to_model(request.json, AdminImportScheduleSchema)
+        rows, dry_run = payload.slots, payload.dry_run
+
+    result = g.admin.schedule_service.admin_import_schedule(rows, dry_run=dry_run)
+    return _bulk_result_dto(result)
+
+
+@admin_bp.route("/schedule/clone", methods=["POST"])
+@role_required(["admin"])
+@wrap_response
+def admin_clone_class_schedule():
+    payload = pydantic_converter.convert_to_model(request.json, AdminCloneClassScheduleSchema)
+    result = g.admin.schedule_service.admin_clone_class_schedule(payload=payload)
+    return _bulk_result_dto(result)
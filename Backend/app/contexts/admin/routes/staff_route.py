@@ -1,6 +1,7 @@
 from flask import request, g
 from app.contexts.admin.routes import admin_bp
 from app.contexts.shared.decorators.response_decorator import wrap_response
+from app.contexts.infra.http.http_cache import ADMIN_VERSION, http_cache
 from app.contexts.iam.auth.jwt_utils import role_required
 from app.contexts.shared.model_converter import pydantic_converter, mongo_converter
 from app.contexts.core.security.auth_utils import get_current_staff_id
@@ -47,6 +48,7 @@ def admin_get_staff_by_id(user_id: str):
 @admin_bp.route("/staff/teacher-select", methods=["GET"])
 @role_required(["admin"])
 @wrap_response
+@http_cache(versions=(ADMIN_VERSION,))
 def admin_list_teacher_select():
     teacher_list = g.admin.staff_service.admin_list_teacher_select()
     teacher_dto = mongo_converter.list_to_dto(teacher_list, AdminTeacherSelectDTO)
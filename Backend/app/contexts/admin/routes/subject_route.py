@@ -2,6 +2,7 @@ from flask import request, g
 from app.contexts.admin.routes import admin_bp
 from app.contexts.core.security.auth_utils import get_current_staff_id
 from app.contexts.shared.decorators.response_decorator import wrap_response
+from app.contexts.infra.http.http_cache import ADMIN_VERSION, http_cache
 from app.contexts.iam.auth.jwt_utils import role_required
 from app.contexts.shared.model_converter import pydantic_converter, mongo_converter
 from app.contexts.admin.data_transfer.requests import (
@@ -107,6 +108,7 @@ def admin_soft_delete_subject(subject_id: str):
 @admin_bp.route("/subjects/names-select", methods=["GET"])
 @role_required(["admin"])
 @wrap_response
+@http_cache(versions=(ADMIN_VERSION,))
 def admin_list_subject_name_select():
     subject_list = g.admin.subject_service.admin_list_subject_name_select()
     subject_dto = mongo_converter.list_to_dto(subject_list, AdminSubjectNameSelectDTO)
@@ -1,4 +1,4 @@
-from typing import Optional, List, Union, Dict, Any
+from typing import Optional, List, Union, Dict, Any, Sequence
 
 from bson import ObjectId
 from pymongo.database import Database
@@ -7,9 +7,10 @@ from app.contexts.school.services.legacy.school_service import SchoolService
 from app.contexts.school.read_models.class_read_model import ClassReadModel
 from app.contexts.admin.read_models.admin_read_model import AdminReadModel
 
-from app.contexts.notifications.services.notification_service import NotificationService
-from app.contexts.notifications.utils.recipient_resolver import NotificationRecipientResolver
+from app.contexts.notifications.services.notification_outbox import NotificationOutbox, RecipientKind
 from app.contexts.notifications.types import NotifType
+from app.contexts.notifications.realtime.rooms import SocketRoomMembership
+from app.contexts.school.policies.teacher_scope import invalidate_teacher_scopes
 
 from app.contexts.school.domain.class_section import ClassSection, ClassSectionStatus 
 from app.contexts.admin.data_transfer.requests import AdminCreateClassSchema, AdminUpdateClassRelationsSchema
@@ -24,8 +25,8 @@ class ClassAdminService:
 
     Principles:
     - Commands go through SchoolService (domain rules enforced).
-    - Notifications are emitted here (application layer), NOT in read models.
-    - Notification user_id must be IAM user_id (Socket room id from JWT payload).
+    - Notifications are enqueued here (application layer), NOT in read models;
+      the outbox dispatcher resolves IAM user_ids and emits them.
     """
 
     def __init__(self, db: Database):
@@ -35,8 +36,8 @@ class ClassAdminService:
         self.class_read_model = ClassReadModel(db)
         self.admin_read_model = AdminReadModel(db)
 
-        self.notification_service = NotificationService(db)
-        self.notif_resolver = NotificationRecipientResolver(db)
+        self.notification_outbox = NotificationOutbox(db)
+        self.socket_rooms = SocketRoomMembership(db)
 
     # -----------------------------
     # Helpers
@@ -49,6 +50,17 @@ class ClassAdminService:
         cls = self.admin_read_model.admin_get_class(class_id) or {}
         return (cls.get("name") or "Class").strip()
 
+    def _refresh_socket_rooms(self, *, student_ids: Sequence[str] = (), staff_ids: Sequence[Optional[str]] = ()) -> None:
+        """Move connected sockets into/out of class rooms after roster/homeroom changes (best-effort)."""
+        try:
+            invalidate_teacher_scopes(staff_ids)
+            if student_ids:
+                self.socket_rooms.refresh_students(student_ids)
+            if any(staff_ids):
+                self.socket_rooms.refresh_staff(staff_ids)
+        except Exception:
+            return
+
     # -----------------------------
     # Teacher notifications (BACKWARD COMPAT)
     # -----------------------------
@@ -63,18 +75,15 @@ class ClassAdminService:
     ) -> None:
         """
         Accepts either homeroom_teacher_id or teacher_id.
-        Resolver best_effort_user_id can handle staff_id or IAM user_id.
+        The dispatcher resolves staff_id or IAM user_id (best effort).
         """
         tid = (homeroom_teacher_id or teacher_id or "").strip()
         if not tid:
             return
 
-        teacher_user_id = self.notif_resolver.best_effort_user_id(tid)
-        if not teacher_user_id:
-            return
-
-        self.notification_service.create_for_user(
-            user_id=teacher_user_id,
+        self.notification_outbox.enqueue(
+            recipient_kind=RecipientKind.STAFF,
+            recipient_ids=[tid],
             role="teacher",
             type=NotifType.CLASS_ASSIGNMENT,
             title=f"You are assigned to {class_name}",
@@ -100,12 +109,9 @@ class ClassAdminService:
         if not tid:
             return
 
-        teacher_user_id = self.notif_resolver.best_effort_user_id(tid)
-        if not teacher_user_id:
-            return
-
-        self.notification_service.create_for_user(
-            user_id=teacher_user_id,
+        self.notification_outbox.enqueue(
+            recipient_kind=RecipientKind.STAFF,
+            recipient_ids=[tid],
             role="teacher",
             type=NotifType.CLASS_UNASSIGNED,
             title=f"You are unassigned from {class_name}",
@@ -119,13 +125,10 @@ class ClassAdminService:
             },
         )
 
-    def _notify_student_enrolled(self, *, student_id: str, class_id: str, class_name: str) -> None:
-        student_user_id = self.notif_resolver.student_to_user_id(student_id)
-        if not student_user_id:
-            return
-
-        self.notification_service.create_for_user(
-            user_id=student_user_id,
+    def _notify_students_enrolled(self, *, student_ids: List[str], class_id: str, class_name: str) -> None:
+        self.notification_outbox.enqueue(
+            recipient_kind=RecipientKind.STUDENT,
+            recipient_ids=student_ids,
             role="student",
             type=NotifType.CLASS_ENROLLED,
             title=f"You were enrolled in {class_name}",
@@ -139,13 +142,10 @@ class ClassAdminService:
             },
         )
 
-    def _notify_student_removed(self, *, student_id: str, class_id: str, class_name: str) -> None:
-        student_user_id = self.notif_resolver.student_to_user_id(student_id)
-        if not student_user_id:
-            return
-
-        self.notification_service.create_for_user(
-            user_id=student_user_id,
+    def _notify_students_removed(self, *, student_ids: List[str], class_id: str, class_name: str) -> None:
+        self.notification_outbox.enqueue(
+            recipient_kind=RecipientKind.STUDENT,
+            recipient_ids=student_ids,
             role="student",
             type=NotifType.CLASS_REMOVED,
             title=f"You were removed from {class_name}",
@@ -187,6 +187,7 @@ class ClassAdminService:
                 class_id=class_id,
                 class_name=class_name,
             )
+            self._refresh_socket_rooms(staff_ids=[str(payload.homeroom_teacher_id)])
 
         return cls
 
@@ -218,6 +219,7 @@ class ClassAdminService:
             class_id=str(class_id),
             class_name=class_name,
         )
+        self._refresh_socket_rooms(staff_ids=[old_teacher_id, new_teacher_id])
 
         return cls
 
@@ -233,11 +235,12 @@ class ClassAdminService:
             return None
 
         class_name = self._class_name(class_id)
-        self._notify_student_enrolled(
-            student_id=str(student_id),
+        self._notify_students_enrolled(
+            student_ids=[str(student_id)],
             class_id=str(class_id),
             class_name=class_name,
         )
+        self._refresh_socket_rooms(student_ids=[str(student_id)])
         return cls
 
     def admin_unenroll_student(self, class_id: str, student_id: str) -> ClassSection | None:
@@ -249,15 +252,31 @@ class ClassAdminService:
             return None
 
         class_name = self._class_name(class_id)
-        self._notify_student_removed(
-            student_id=str(student_id),
+        self._notify_students_removed(
+            student_ids=[str(student_id)],
             class_id=str(class_id),
             class_name=class_name,
         )
+        self._refresh_socket_rooms(student_ids=[str(student_id)])
         return cls
 
+    def _class_teacher_ids(self, class_id: str) -> List[str]:
+        """Homeroom and assigned teachers whose cached scope includes this class."""
+        cls = self.class_read_model.get_by_id(class_id, show_deleted="all", only_active_status=False) or {}
+        ids = [cls.get("homeroom_teacher_id"), cls.get("teacher_id")]
+        ids += [a.get("teacher_id") for a in self.admin_read_model.admin_list_assignments_for_classes([class_id])]
+        return [str(t) for t in ids if t]
+
     def admin_soft_delete_class(self, class_id: str, actor_id: str) -> bool:
-        return self.school_service.soft_delete_class(class_id, actor_id)
+        teacher_ids = self._class_teacher_ids(class_id)
+        deleted = self.school_service.soft_delete_class(class_id, actor_id)
+        self._refresh_socket_rooms(staff_ids=teacher_ids)
+        return deleted
+
+    def admin_restore_class(self, class_id: str, actor_id: str) -> bool:
+        restored = self.school_service.restore_class(class_id, actor_id)
+        self._refresh_socket_rooms(staff_ids=self._class_teacher_ids(class_id))
+        return restored
 
     def admin_update_class_relations(
         self,
@@ -313,19 +332,20 @@ class ClassAdminService:
             )
 
         # 6) Student notifications
-        for sid in added_ids:
-            self._notify_student_enrolled(
-                student_id=sid,
-                class_id=str(class_id),
-                class_name=class_name,
-            )
-
-        for sid in removed_ids:
-            self._notify_student_removed(
-                student_id=sid,
-                class_id=str(class_id),
-                class_name=class_name,
-            )
+        self._notify_students_enrolled(
+            student_ids=added_ids,
+            class_id=str(class_id),
+            class_name=class_name,
+        )
+        self._notify_students_removed(
+            student_ids=removed_ids,
+            class_id=str(class_id),
+            class_name=class_name,
+        )
+        self._refresh_socket_rooms(
+            student_ids=added_ids + removed_ids,
+            staff_ids=[old_tid, new_tid] if old_tid != new_tid else [],
+        )
 
         return {
             "class_id": result.get("class_id"),
@@ -1,32 +1,67 @@
+import csv
+import io
 from typing import Dict, Any, Optional, List
 from bson import ObjectId
+from pydantic import ValidationError
 from pymongo.database import Database
 
 from app.contexts.school.services.legacy.school_service import SchoolService
 from app.contexts.school.domain.schedule import ScheduleSlot
+from app.contexts.school.domain.timetable_index import to_minutes
+from app.contexts.school.domain.timetable_solver import LessonDemand, build_period_grid
+from app.contexts.school.errors.class_exceptions import ClassNotFoundException
+from app.contexts.school.errors.schedule_exceptions import (
+    ScheduleBulkValidationException,
+    TimetableIncompleteException,
+)
 
 from app.contexts.admin.data_transfer.requests import (
     AdminCreateScheduleSlotSchema,
     AdminUpdateScheduleSlotSchema,
+    AdminGenerateTimetableSchema,
+    AdminCloneClassScheduleSchema,
 )
 
 from app.contexts.school.read_models.schedule_read_model import ScheduleReadModel
 from app.contexts.admin.read_models.admin_read_model import AdminReadModel
 
-from app.contexts.notifications.services.notification_service import NotificationService
-from app.contexts.notifications.utils.recipient_resolver import NotificationRecipientResolver
+from app.contexts.notifications.services.notification_outbox import NotificationOutbox, RecipientKind
 from app.contexts.notifications.types import NotifType
+from app.contexts.notifications.realtime.rooms import class_room
 
 from app.contexts.shared.model_converter import mongo_converter
 
 
+SCHEDULE_CSV_COLUMNS = ("class_id", "teacher_id", "day_of_week", "start_time", "end_time", "room", "subject_id")
+
+
+def parse_schedule_csv(text: str) -> List[Dict[str, Any]]:
+    """
+    CSV with a header row using SCHEDULE_CSV_COLUMNS (any order, case-insensitive).
+    Blank cells become None.
+    """
+    reader = csv.DictReader(io.StringIO((text or "").lstrip("\ufeff")))
+    if not reader.fieldnames:
+        raise ValueError("CSV is empty")
+    header = {h: (h or "").strip().lower() for h in reader.fieldnames}
+    missing = [c for c in SCHEDULE_CSV_COLUMNS[:5] if c not in header.values()]
+    if missing:
+        raise ValueError(f"CSV is missing column(s): {', '.join(missing)}")
+
+    rows: List[Dict[str, Any]] = []
+    for raw in reader:
+        row = {header[k]: ((v or "").strip() or None) for k, v in raw.items() if k in header}
+        if any(row.values()):
+            rows.append(row)
+    return rows
+
+
 class ScheduleAdminService:
     """
     Admin-facing application service for Schedule management.
 
     - Commands go through SchoolService (domain rules enforced).
-    - Notifications emitted here (application layer).
-    - Notification user_id must be IAM user_id (socket room id from JWT payload).
+    - Notifications are enqueued here (application layer) and delivered by the outbox dispatcher.
     """
 
     def __init__(self, db: Database):
@@ -34,8 +69,7 @@ class ScheduleAdminService:
         self.schedule_read_model = ScheduleReadModel(db)
         self.admin_read_model = AdminReadModel(db)
 
-        self.notification_service = NotificationService(db)
-        self.notif_resolver = NotificationRecipientResolver(db)
+        self.notification_outbox = NotificationOutbox(db)
 
     # -----------------------------
     # Helpers
@@ -73,12 +107,10 @@ class ScheduleAdminService:
     def _notify_teacher(self, *, teacher_id: str | ObjectId | None, type_: str, title: str, message: str, data: dict):
         if not teacher_id:
             return
-        teacher_user_id = self.notif_resolver.best_effort_user_id(teacher_id)
-        if not teacher_user_id:
-            return
 
-        self.notification_service.create_for_user(
-            user_id=str(teacher_user_id),
+        self.notification_outbox.enqueue(
+            recipient_kind=RecipientKind.STAFF,
+            recipient_ids=[teacher_id],
             role="teacher",
             type=type_,
             title=title,
@@ -93,21 +125,18 @@ class ScheduleAdminService:
         if not student_ids:
             return
 
-        for sid in student_ids:
-            user_id = self.notif_resolver.student_to_user_id(sid)
-            if not user_id:
-                continue
-
-            self.notification_service.create_for_user(
-                user_id=str(user_id),
-                role="student",
-                type=type_,
-                title=title,
-                message=message,
-                entity_type="schedule",
-                entity_id=str(data.get("slot_id") or ""),
-                data=data,
-            )
+        self.notification_outbox.enqueue(
+            recipient_kind=RecipientKind.STUDENT,
+            recipient_ids=student_ids,
+            role="student",
+            type=type_,
+            title=title,
+            message=message,
+            entity_type="schedule",
+            entity_id=str(data.get("slot_id") or ""),
+            data=data,
+            room=class_room(class_id),
+        )
 
     def _slot_payload(
         self,
@@ -138,6 +167,72 @@ class ScheduleAdminService:
             "subject_id": str(subject_id) if subject_id else None,
         }
 
+    def _notify_bulk_schedule(self, slots: List[ScheduleSlot]) -> None:
+        """
+        One summarized notification per affected user instead of one per slot:
+        - each teacher: how many slots they were assigned, in which classes
+        - each student in an affected class: one "schedule updated" notice
+        """
+        if not slots:
+            return
+
+        class_ids = list({s.class_id for s in slots})
+        classes = {str(c["_id"]): c for c in self.admin_read_model.admin_list_classes_by_ids(class_ids)}
+
+        def class_name(cid: str) -> str:
+            return ((classes.get(cid) or {}).get("name") or "Class").strip()
+
+        by_teacher: Dict[str, List[ScheduleSlot]] = {}
+        for s in slots:
+            by_teacher.setdefault(str(s.teacher_id), []).append(s)
+
+        for teacher_id, items in by_teacher.items():
+            cids = sorted({str(s.class_id) for s in items})
+            names = ", ".join(class_name(c) for c in cids)
+            self._notify_teacher(
+                teacher_id=teacher_id,
+                type_=NotifType.SCHEDULE_ASSIGNED,
+                title=f"{len(items)} schedule slot(s) assigned",
+                message=f"New schedule slots have been assigned to you in {names}.",
+                data={"route_teacher": "/teacher/schedule", "class_ids": cids, "slot_count": len(items)},
+            )
+
+        slot_count: Dict[str, int] = {}
+        for s in slots:
+            slot_count[str(s.class_id)] = slot_count.get(str(s.class_id), 0) + 1
+
+        for cid, count in slot_count.items():
+            name = class_name(cid)
+            self._notify_students_in_class(
+                class_id=cid,
+                type_=NotifType.SCHEDULE_UPDATED,
+                title=f"Schedule updated for {name}",
+                message=f"{count} slot(s) were added to your class schedule.",
+                data={"route_student": "/student/schedule", "class_id": cid, "class_name": name, "slot_count": count},
+            )
+
+    @staticmethod
+    def _validate_import_rows(rows: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], List[int], List[dict]]:
+        specs: List[Dict[str, Any]] = []
+        row_index: List[int] = []
+        errors: List[dict] = []
+        for i, row in enumerate(rows):
+            try:
+                m = AdminCreateScheduleSlotSchema.model_validate(row)
+            except ValidationError as e:
+                msg = "; ".join(f"{'.'.join(str(x) for x in err['loc']) or 'row'}: {err['msg']}" for err in e.errors())
+                errors.append({"row": i, "error_code": "SCHEDULE_ROW_INVALID", "message": msg})
+                continue
+            specs.append(m.model_dump())
+            row_index.append(i)
+        return specs, row_index, errors
+
+    def _bulk_create(self, specs: List[Dict[str, Any]], *, dry_run: bool) -> Dict[str, Any]:
+        result = self.school_service.bulk_create_schedule_slots(specs, dry_run=dry_run)
+        if not dry_run:
+            self._notify_bulk_schedule(result["slots"])
+        return result
+
     # -----------------------------
     # Commands
     # -----------------------------
@@ -338,5 +433,137 @@ class ScheduleAdminService:
     def admin_count_schedules_for_teacher(self, teacher_id: str | ObjectId) -> int:
         return self.admin_read_model.admin_count_schedules_for_teacher(teacher_id)
 
+    def admin_check_schedule_slot_conflicts(
+        self,
+        payload: AdminCreateScheduleSlotSchema,
+        slot_id: str | ObjectId | None = None,
+    ) -> List[Dict[str, Any]]:
+        return self.school_service.check_schedule_slot_conflicts(
+            class_id=payload.class_id,
+            teacher_id=payload.teacher_id,
+            day_of_week=payload.day_of_week,
+            start_time=payload.start_time,
+            end_time=payload.end_time,
+            room=payload.room,
+            slot_id=slot_id,
+        )
+
+    def _lesson_demands(self, payload: AdminGenerateTimetableSchema) -> tuple[List[LessonDemand], List[dict]]:
+        """
+        (class, subject) -> weekly lessons + assigned teacher, from two bulk reads.
+        Returns (demands, skipped) where skipped lessons have no teacher assigned.
+        """
+        classes = self.admin_read_model.admin_list_classes_by_ids(payload.class_ids)
+        found = {str(c["_id"]) for c in classes}
+        missing = [cid for cid in payload.class_ids if cid not in found]
+        if missing:
+            raise ClassNotFoundException(missing[0])
+
+        teacher_for: Dict[tuple, str] = {}
+        for a in self.admin_read_model.admin_list_assignments_for_classes(payload.class_ids):
+            key = (str(a.get("class_id")), str(a.get("subject_id")))
+            if a.get("teacher_id"):
+                teacher_for.setdefault(key, str(a["teacher_id"]))
+
+        demands: List[LessonDemand] = []
+        skipped: List[dict] = []
+        for cls in classes:
+            cid = str(cls["_id"])
+            for sid in cls.get("subject_ids") or []:
+                sid = str(sid)
+                count = payload.lessons_per_week.get(sid, payload.default_lessons_per_week)
+                if count <= 0:
+                    continue
+                teacher_id = teacher_for.get((cid, sid))
+                if not teacher_id:
+                    skipped.append(
+                        {
+                            "class_id": cid,
+                            "subject_id": sid,
+                            "teacher_id": None,
+                            "lessons_per_week": count,
+                            "missing": count,
+                            "reason": "no_teacher_assigned",
+                        }
+                    )
+                    continue
+                demands.append(LessonDemand(cid, sid, teacher_id, count, room=payload.subject_rooms.get(sid)))
+        return demands, skipped
+
+    def admin_generate_timetable(self, payload: AdminGenerateTimetableSchema) -> Dict[str, Any]:
+        demands, skipped = self._lesson_demands(payload)
+        if skipped and not payload.dry_run and not payload.allow_partial:
+            raise TimetableIncompleteException(skipped)
+
+        periods = build_period_grid(
+            payload.days,
+            [(to_minutes(p.start_time), to_minutes(p.end_time)) for p in payload.periods],
+        )
+        result = self.school_service.generate_timetable(
+            demands,
+            periods,
+            rooms=payload.rooms,
+            max_same_subject_per_day=payload.max_same_subject_per_day,
+            time_budget_ms=payload.time_budget_ms,
+            seed=payload.seed,
+            dry_run=payload.dry_run,
+            allow_partial=payload.allow_partial,
+        )
+        self._notify_bulk_schedule(result.pop("schedule_slots", []))
+        if skipped:
+            result["unplaced"] = skipped + result["unplaced"]
+            result["complete"] = False
+        return result
+
+    def admin_import_schedule(
+        self,
+        rows: List[Dict[str, Any]],
+        *,
+        dry_run: bool,
+    ) -> Dict[str, Any]:
+        """
+        Import rows (from JSON or CSV). All-or-nothing: any invalid or
+        conflicting row rejects the whole import.
+        """
+        specs, row_index, errors = self._validate_import_rows(rows)
+        if errors and not dry_run:
+            raise ScheduleBulkValidationException(errors)
+
+        result = self._bulk_create(specs, dry_run=dry_run)
+        # map row numbers back to the caller's rows (invalid rows were skipped)
+        for e in result["errors"]:
+            e["row"] = row_index[e["row"]]
+            if "other_row" in e:
+                e["other_row"] = row_index[e["other_row"]]
+        result["errors"] = sorted(errors + result["errors"], key=lambda e: e["row"])
+        return result
+
+    def admin_clone_class_schedule(self, payload: AdminCloneClassScheduleSchema) -> Dict[str, Any]:
+        teacher_for_subject: Dict[str, str] = {}
+        for a in self.admin_read_model.admin_list_assignments_for_classes([payload.target_class_id]):
+            if a.get("subject_id") and a.get("teacher_id"):
+                teacher_for_subject.setdefault(str(a["subject_id"]), str(a["teacher_id"]))
+        teacher_for_subject.update(payload.teacher_ids)
+
+        result = self.school_service.clone_class_schedule(
+            source_class_id=payload.source_class_id,
+            target_class_id=payload.target_class_id,
+            teacher_for_subject=teacher_for_subject,
+            keep_rooms=payload.keep_rooms,
+            dry_run=payload.dry_run,
+        )
+        if not payload.dry_run:
+            self._notify_bulk_schedule(result["slots"])
+        return result
+
+    def admin_validate_timetable(self) -> List[Dict[str, Any]]:
+        return self.school_service.validate_timetable()
+
+    def admin_find_free_slots(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        return self.admin_read_model.admin_find_free_slots(**kwargs)
+
+    def admin_list_substitutes_for_slot(self, slot_id: str | ObjectId) -> Dict[str, Any]:
+        return self.admin_read_model.admin_list_substitutes_for_slot(slot_id)
+
     def admin_list_teacher_select_for_class_subject(self, class_id: str, subject_id: str) -> List[Dict[str, str]]:
         return self.admin_read_model.list_teacher_select_for_class_subject(class_id, subject_id)
\ No newline at end of file
@@ -11,6 +11,8 @@ from app.contexts.school.repositories.teacher_assignment_repository import Teach
 from app.contexts.school.read_models.teacher_assignment_read_model import TeacherAssignmentReadModel
 
 from app.contexts.shared.services.display_name_service import DisplayNameService
+from app.contexts.notifications.realtime.rooms import SocketRoomMembership
+from app.contexts.school.policies.teacher_scope import invalidate_teacher_scopes
 
 
 class DuplicateAssignmentException(Exception):
@@ -27,10 +29,19 @@ class TeachingAssignmentAdminService:
         self.subjects = db["subjects"]
 
         self.display = display
+        self.socket_rooms = SocketRoomMembership(db)
 
     def _oid(self, v: Union[str, ObjectId]) -> ObjectId:
         return mongo_converter.convert_to_object_id(v)
 
+    def _refresh_socket_rooms(self, *teacher_ids: ObjectId | None) -> None:
+        # permission scopes and teacher-class:<id> membership follow assignments
+        try:
+            invalidate_teacher_scopes(teacher_ids)
+            self.socket_rooms.refresh_staff([t for t in teacher_ids if t])
+        except Exception:
+            return
+
     def _normalize_docs(self, docs: List[dict]) -> List[Dict[str, Any]]:
         normalized: List[Dict[str, Any]] = []
         for d in docs:
@@ -145,14 +156,17 @@ class TeachingAssignmentAdminService:
                     assigned_by=aid,
                 )
                 self.repo.insert(rec)
+                self._refresh_socket_rooms(tid)
                 return {"assignment_id": str(rec.id), "created": True, "modified_count": 1}
 
             # If same teacher assigned again, you may treat as no-op
             if rec.teacher_id == tid:
                 return {"assignment_id": str(rec.id), "created": False, "modified_count": 0}
 
+            old_tid = rec.teacher_id
             rec.change_teacher(tid, actor_id=aid)
             self.repo.update(rec)
+            self._refresh_socket_rooms(old_tid, tid)
             return {"assignment_id": str(rec.id), "created": False, "modified_count": 1}
 
         # Create new assignment (subject not assigned yet)
@@ -163,6 +177,7 @@ class TeachingAssignmentAdminService:
             assigned_by=aid,
         )
         self.repo.insert(rec)
+        self._refresh_socket_rooms(tid)
         return {"assignment_id": str(rec.id), "created": True, "modified_count": 1}
 
     # -------------------------
@@ -179,10 +194,14 @@ class TeachingAssignmentAdminService:
         sid = self._oid(subject_id)
         aid = self._oid(actor_id)
 
+        existing = self.read.get_active_by_class_subject(cid, sid) or {}
+
         modified_count = self.repo.soft_delete_by_class_subject(
             class_id=cid,
             subject_id=sid,
             actor_id=aid,
         )
+        if modified_count:
+            self._refresh_socket_rooms(existing.get("teacher_id"))
 
         return {"deleted": bool(modified_count), "modified_count": int(modified_count)}
\ No newline at end of file
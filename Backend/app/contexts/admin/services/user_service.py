@@ -22,6 +22,7 @@ from app.contexts.iam.read_models.iam_read_model import IAMReadModel
 from app.contexts.iam.repositories.iam_repositorie import MongoIAMRepository
 from app.contexts.iam.policies.iam_uniqueness_policy import IAMUniquenessPolicy
 from app.contexts.iam.services.iam_lifecycle_service import IAMLifecycleService
+from app.contexts.iam.services.iam_service import invalidate_safe_user
 from app.contexts.iam.errors.iam_exception import (
     NotFoundUserException,
     UserDeletedException,
@@ -113,22 +114,27 @@ class UserAdminService:
             password=hashed_password,
         )
 
-        return self._iam_repository.update(user_oid, self._iam_mapper.to_persistence(iam))
+        updated = self._iam_repository.update(user_oid, self._iam_mapper.to_persistence(iam))
+        invalidate_safe_user(user_oid)
+        return updated
 
     def admin_soft_delete_user(self, user_id: str | ObjectId, actor_id: str | ObjectId) -> None:
         user_oid = self._oid(user_id)
         actor_oid = self._oid(actor_id)
         self._iam_lifecycle_service.soft_delete_user(user_oid, actor_oid)
+        invalidate_safe_user(user_oid)
 
     def admin_restore_user(self, user_id: str | ObjectId, actor_id: str | ObjectId) -> None:
         user_oid = self._oid(user_id)
         actor_oid = self._oid(actor_id)
         self._iam_lifecycle_service.restore_user(user_oid, actor_oid)
+        invalidate_safe_user(user_oid)
 
     def admin_set_user_status(self, user_id: str | ObjectId, schema: AdminSetUserStatusSchema) -> dict:
         user_oid, iam = self._require_user(user_id)
         iam.set_status(schema.status)
         self._iam_repository.update(user_oid, self._iam_mapper.to_persistence(iam))
+        invalidate_safe_user(user_oid)
         return {"id": str(user_oid), "status": schema.status.value}
 
 
@@ -181,6 +187,7 @@ class UserAdminService:
         user_oid = self._oid(user_id)
         actor_oid = self._oid(deleted_by)
         self._iam_lifecycle_service.hard_delete_user(user_oid, actor_oid)
+        invalidate_safe_user(user_oid)
 
     def _rollback_purge_user(self, user_id: str | ObjectId) -> None:
         """
@@ -45,6 +45,26 @@ class Settings:
         # JWT
         self.ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
         self.JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
+        # verified access-token claims kept per process until `exp` (0 = off)
+        self.JWT_CLAIMS_CACHE_SIZE: int = int(os.getenv("JWT_CLAIMS_CACHE_SIZE", "4096"))
+        # a refresh token replaced less than this ago still yields an access token (parallel tabs)
+        self.REFRESH_REUSE_GRACE_SECONDS: int = int(os.getenv("REFRESH_REUSE_GRACE_SECONDS", "10"))
+        # per-process cache of the user dict used to mint tokens on /refresh (0 = off)
+        self.REFRESH_USER_CACHE_SECONDS: int = int(os.getenv("REFRESH_USER_CACHE_SECONDS", "30"))
+
+        # API response encoder: stdlib (byte-identical legacy output) | orjson | auto (orjson when installed)
+        self.JSON_BACKEND: str = os.getenv("JSON_BACKEND", "stdlib").strip().lower()
+
+        # Response compression (gzip; brotli when the `brotli` package is installed)
+        self.COMPRESS_ENABLED: bool = os.getenv("COMPRESS_ENABLED", "true").lower() == "true"
+        # bodies smaller than this are sent as is (headers + CPU outweigh the savings)
+        self.COMPRESS_MIN_BYTES: int = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+        # gzip 1 (fast) .. 9 (small); brotli 0 .. 11
+        self.COMPRESS_GZIP_LEVEL: int = int(os.getenv("COMPRESS_GZIP_LEVEL", "6"))
+        self.COMPRESS_BROTLI_QUALITY: int = int(os.getenv("COMPRESS_BROTLI_QUALITY", "4"))
+        self.COMPRESS_MIMETYPES: str = os.getenv(
+            "COMPRESS_MIMETYPES", "application/json,text/csv,text/plain,text/html,application/javascript"
+        )
 
         # Frontend
         self.FRONTEND_URL: str = os.getenv("FRONTEND_URL", "http://localhost:3000").strip().rstrip("/")
@@ -60,8 +80,68 @@ class Settings:
         self.GOOGLE_CLIENT_SECRET: Optional[str] = os.getenv("GOOGLE_CLIENT_SECRET")
         self.GOOGLE_DISCOVERY_URL: str = "https://accounts.google.com/.well-known/openid-configuration"
 
+        # Soft-delete purge job: collections purged in parallel, one shared delete throttle (0 = unthrottled)
+        self.PURGE_CONCURRENCY: int = int(os.getenv("PURGE_CONCURRENCY", "3"))
+        self.PURGE_MAX_OPS_PER_SECOND: float = float(os.getenv("PURGE_MAX_OPS_PER_SECOND", "1000"))
+        # a run's lease on a collection checkpoint, renewed every batch; lapses this long after a crash
+        self.PURGE_LEASE_SECONDS: int = int(os.getenv("PURGE_LEASE_SECONDS", "900"))
+
+        # Schedule conflict index (in-process cache of active slots)
+        self.SCHEDULE_INDEX_TTL_SECONDS: int = int(os.getenv("SCHEDULE_INDEX_TTL_SECONDS", "300"))
+
+        # Notification outbox (background dispatcher)
+        self.NOTIFICATION_OUTBOX_WORKER: bool = os.getenv("NOTIFICATION_OUTBOX_WORKER", "true").lower() == "true"
+        self.NOTIFICATION_OUTBOX_BATCH_SIZE: int = int(os.getenv("NOTIFICATION_OUTBOX_BATCH_SIZE", "100"))
+        self.NOTIFICATION_OUTBOX_POLL_SECONDS: float = float(os.getenv("NOTIFICATION_OUTBOX_POLL_SECONDS", "2"))
+        self.NOTIFICATION_OUTBOX_MAX_ATTEMPTS: int = int(os.getenv("NOTIFICATION_OUTBOX_MAX_ATTEMPTS", "5"))
+        self.NOTIFICATION_OUTBOX_LEASE_SECONDS: int = int(os.getenv("NOTIFICATION_OUTBOX_LEASE_SECONDS", "60"))
+        # Unread counter drift repair (0 = off)
+        self.NOTIFICATION_UNREAD_RECONCILE_SECONDS: int = int(os.getenv("NOTIFICATION_UNREAD_RECONCILE_SECONDS", "3600"))
+        # Read notifications older than N days move to notifications_archive (0 = keep forever)
+        self.NOTIFICATION_ARCHIVE_AFTER_DAYS: int = int(os.getenv("NOTIFICATION_ARCHIVE_AFTER_DAYS", "90"))
+        self.NOTIFICATION_ARCHIVE_BATCH_SIZE: int = int(os.getenv("NOTIFICATION_ARCHIVE_BATCH_SIZE", "1000"))
+        self.NOTIFICATION_ARCHIVE_INTERVAL_SECONDS: int = int(os.getenv("NOTIFICATION_ARCHIVE_INTERVAL_SECONDS", "3600"))
+        # Coalescing: these types merge per (user, type, entity_type, class) inside the window (0 = off);
+        # their outbox events wait DELAY seconds so a burst of admin edits lands in one batch
+        self.NOTIFICATION_COALESCE_TYPES: str = os.getenv("NOTIFICATION_COALESCE_TYPES", "SCHEDULE_ASSIGNED,SCHEDULE_UPDATED")
+        self.NOTIFICATION_COALESCE_WINDOW_SECONDS: int = int(os.getenv("NOTIFICATION_COALESCE_WINDOW_SECONDS", "300"))
+        self.NOTIFICATION_COALESCE_DELAY_SECONDS: int = int(os.getenv("NOTIFICATION_COALESCE_DELAY_SECONDS", "5"))
+
+        # Socket.IO message queue (redis://host:6379/0 to run several workers; memory:// in tests)
+        self.SOCKETIO_MESSAGE_QUEUE: Optional[str] = os.getenv("SOCKETIO_MESSAGE_QUEUE") or None
+        self.SOCKETIO_CHANNEL: str = os.getenv("SOCKETIO_CHANNEL", "sms-socketio")
+
+        # Socket.IO class/role room membership cache
+        self.SOCKET_ROOMS_CACHE_SECONDS: int = int(os.getenv("SOCKET_ROOMS_CACHE_SECONDS", "300"))
+
+        # Teacher permission scope (homeroom classes + assignments) cache
+        self.TEACHER_SCOPE_CACHE_SECONDS: int = int(os.getenv("TEACHER_SCOPE_CACHE_SECONDS", "60"))
+
+        # Password hashing (werkzeug method string; existing hashes are upgraded on login)
+        self.PASSWORD_HASH_METHOD: str = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+        self.PASSWORD_HASH_SALT_LENGTH: int = int(os.getenv("PASSWORD_HASH_SALT_LENGTH", "16"))
+        self.PASSWORD_HASH_MAX_CONCURRENCY: int = int(os.getenv("PASSWORD_HASH_MAX_CONCURRENCY", "4"))
+        self.PASSWORD_HASH_OFFLOAD: bool = os.getenv("PASSWORD_HASH_OFFLOAD", "true").lower() == "true"
+
         # Telegram
         self.TELEGRAM_BOT_TOKEN: Optional[str] = os.getenv("TELEGRAM_BOT_TOKEN")
+        self.TELEGRAM_API_BASE_URL: str = os.getenv("TELEGRAM_API_BASE_URL", "https://api.telegram.org")
+        # bot username for the t.me deep link shown when linking a chat (optional)
+        self.TELEGRAM_BOT_USERNAME: Optional[str] = os.getenv("TELEGRAM_BOT_USERNAME")
+        # secret_token given to setWebhook; bot updates without it are rejected (unset: webhook off)
+        self.TELEGRAM_WEBHOOK_SECRET: Optional[str] = os.getenv("TELEGRAM_WEBHOOK_SECRET")
+        # lifetime of a one-time `/start <token>` link token
+        self.TELEGRAM_LINK_TOKEN_SECONDS: int = int(os.getenv("TELEGRAM_LINK_TOKEN_SECONDS", "600"))
+        # Telegram notification channel (only active with a bot token)
+        self.NOTIFICATION_TELEGRAM_ENABLED: bool = os.getenv("NOTIFICATION_TELEGRAM_ENABLED", "true").lower() == "true"
+        # workers allowed to run the sender; one of them at a time holds the send lease
+        self.TELEGRAM_SENDER_WORKER: bool = os.getenv("TELEGRAM_SENDER_WORKER", "true").lower() == "true"
+        self.TELEGRAM_SENDER_BATCH_SIZE: int = int(os.getenv("TELEGRAM_SENDER_BATCH_SIZE", "100"))
+        self.TELEGRAM_SENDER_POLL_SECONDS: float = float(os.getenv("TELEGRAM_SENDER_POLL_SECONDS", "2"))
+        self.TELEGRAM_SENDER_MAX_ATTEMPTS: int = int(os.getenv("TELEGRAM_SENDER_MAX_ATTEMPTS", "5"))
+        self.TELEGRAM_SENDER_LEASE_SECONDS: int = int(os.getenv("TELEGRAM_SENDER_LEASE_SECONDS", "120"))
+        self.TELEGRAM_GLOBAL_RATE_PER_SECOND: float = float(os.getenv("TELEGRAM_GLOBAL_RATE_PER_SECOND", "30"))
+        self.TELEGRAM_CHAT_RATE_PER_SECOND: float = float(os.getenv("TELEGRAM_CHAT_RATE_PER_SECOND", "1"))
 
         # CORS
         raw_origins = os.getenv(
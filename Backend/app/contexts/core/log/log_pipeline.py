@@ -0,0 +1,149 @@
+"""
+Plumbing behind LogService: records go through a QueueHandler to a listener on a
+native OS thread, which does the JSON encoding and the stdout/file I/O. Request
+code only snapshots (sanitizes) the payload and enqueues it.
+"""
+import importlib
+import json
+import logging
+import random
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+def _native(module: str):
+    """The unpatched module under eventlet, so the listener is a real thread, not a greenlet."""
+    if "eventlet" not in sys.modules:
+        return importlib.import_module(module)
+    from eventlet import patcher
+
+    if patcher.is_monkey_patched("thread"):
+        return patcher.original(module)
+    return importlib.import_module(module)
+
+
+class LazyJson:
+    """
+    Log message that is only encoded when a handler formats it (on the listener
+    thread). A line over max_bytes keeps its envelope and loses `extra`.
+    """
+
+    __slots__ = ("data", "pretty", "max_bytes")
+
+    def __init__(self, data: Dict[str, Any], pretty: bool = False, max_bytes: Optional[int] = None):
+        self.data = data
+        self.pretty = pretty
+        self.max_bytes = max_bytes
+
+    def _encode(self, data: Dict[str, Any]) -> str:
+        if self.pretty:
+            return json.dumps(data, indent=2, default=str)
+        return json.dumps(data, separators=(",", ":"), default=str)
+
+    def __str__(self) -> str:
+        line = self._encode(self.data)
+        if self.max_bytes and len(line) > self.max_bytes:
+            size = len(line.encode("utf-8"))
+            if size > self.max_bytes:
+                line = self._encode({**self.data, "extra": {"truncated_bytes": size}})
+        return line
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """Never blocks the caller: a full queue drops the record and counts it."""
+
+    def __init__(self, queue):
+        super().__init__(queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # the default formats here, on the caller's thread; LazyJson is already a snapshot
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except Exception:
+            self.dropped += 1
+
+
+class NativeQueueListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # the default put_nowait raises queue.Full on a backed-up queue; wait for room
+        self.queue.put(self._sentinel)
+
+    def start(self) -> None:
+        self._thread = t = _native("threading").Thread(target=self._monitor, name="log-listener", daemon=True)
+        t.start()
+
+
+def make_queue(maxsize: int):
+    return _native("queue").Queue(maxsize)
+
+
+def parse_event_map(raw: str, cast=float) -> Dict[str, Any]:
+    """"mongo_operation=0.1,http_error=50" -> {"mongo_operation": 0.1, "http_error": 50.0}"""
+    out: Dict[str, Any] = {}
+    for part in (raw or "").split(","):
+        key, sep, value = part.partition("=")
+        if sep and key.strip() and value.strip():
+            out[key.strip()] = cast(value.strip())
+    return out
+
+
+class EventGate:
+    """
+    Per-event sampling (below WARNING only) and per-event rate limits (records per
+    second, any level). Records dropped by the rate limit are counted and reported
+    on the next record of that event that gets through.
+    """
+
+    def __init__(
+        self,
+        sample_rates: Optional[Dict[str, float]] = None,
+        rate_limits: Optional[Dict[str, float]] = None,
+        *,
+        clock=time.monotonic,
+        rng=random.random,
+    ):
+        self.sample_rates = dict(sample_rates or {})
+        self.rate_limits = dict(rate_limits or {})
+        self.clock = clock
+        self.rng = rng
+        # event -> [window_start, count_in_window, suppressed_since_last_emit]
+        self._windows: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def admit(self, event: str, levelno: int) -> Tuple[bool, int]:
+        """(emit?, suppressed count to report with this record)."""
+        rate = self.sample_rates.get(event)
+        if rate is not None and levelno < logging.WARNING and self.rng() >= rate:
+            return False, 0
+
+        limit = self.rate_limits.get(event)
+        if limit is None:
+            return True, 0
+
+        now = self.clock()
+        with self._lock:
+            w = self._windows.get(event)
+            if w is None or now - w[0] >= 1.0:
+                suppressed = w[2] if w else 0
+                self._windows[event] = [now, 1, 0]
+                return True, suppressed
+            if w[1] >= limit:
+                w[2] += 1
+                return False, 0
+            w[1] += 1
+            suppressed, w[2] = w[2], 0
+            return True, suppressed
+
+
+def start_listener(handlers: Iterable[logging.Handler], maxsize: int) -> Tuple[NonBlockingQueueHandler, NativeQueueListener]:
+    q = make_queue(maxsize)
+    listener = NativeQueueListener(q, *handlers, respect_handler_level=True)
+    listener.start()
+    return NonBlockingQueueHandler(q), listener
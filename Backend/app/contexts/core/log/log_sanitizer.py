@@ -0,0 +1,258 @@
+from datetime import date, time
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from bson import ObjectId
+
+REDACTED = "[REDACTED]"
+TRUNCATED_DEPTH = "[TRUNCATED_DEPTH]"
+TRUNCATED_BUDGET = "[TRUNCATED_BUDGET]"
+TRUNCATED_LIST = "...(trunc_list)"
+WILDCARD = "*"
+
+# rough JSON framing per item (quotes, colon, comma) for the byte estimate
+_ITEM_OVERHEAD = 4
+_SCALARS = (int, float, bool)
+_PASSTHROUGH = (date, time, ObjectId, UUID, Decimal)
+_LOWER_CACHE_SIZE = 4096
+
+
+def build_redaction_trie(paths: Iterable[str]) -> Dict[str, Any]:
+    """
+    "json.password,json.*.token" -> nested dict of lowercase segments; a node holding
+    None under "" is a redaction point. List items do not add a segment, "*" matches
+    any single key.
+    """
+    root: Dict[str, Any] = {}
+    for path in paths:
+        segments = [s.strip().lower() for s in str(path).split(".") if s.strip()]
+        if not segments:
+            continue
+        node = root
+        for seg in segments:
+            node = node.setdefault(seg, {})
+        node[""] = None
+    return root
+
+
+def _step(nodes: List[Dict[str, Any]], key: str) -> Tuple[Optional[List[Dict[str, Any]]], bool]:
+    """Advance trie positions by one key: (next positions or None, key is a redaction point)."""
+    out = None
+    hit = False
+    for node in nodes:
+        for nxt in (node.get(key), node.get(WILDCARD)):
+            if nxt is not None:
+                if "" in nxt:
+                    hit = True
+                if out is None:
+                    out = [nxt]
+                else:
+                    out.append(nxt)
+    return out, hit
+
+
+def _frame(container: Any, depth: int, nodes, parent, parent_key, max_list: int) -> list:
+    """[container, items iterator, is_dict, depth, trie nodes, changes, list limit, parent, key in parent]"""
+    if isinstance(container, dict):
+        return [container, iter(container.items()), True, depth, nodes, None, None, parent, parent_key]
+    limit = max_list if len(container) > max_list else None
+    items = enumerate(container if limit is None else container[:limit])
+    return [container, items, False, depth, nodes, None, limit, parent, parent_key]
+
+
+def _rebuild(obj: Any, changes: Optional[Dict[Any, Any]], limit: Optional[int]) -> Any:
+    """Copy of a container with `changes` applied (keys for dicts, indexes for lists)."""
+    changes = changes or {}
+    if isinstance(obj, dict):
+        return {k: (changes[k] if k in changes else v) for k, v in obj.items()}
+    items = obj if limit is None else obj[:limit]
+    out = [changes[i] if i in changes else v for i, v in enumerate(items)]
+    if limit is not None:
+        out.append(TRUNCATED_LIST)
+    return out
+
+
+class LogSanitizer:
+    """
+    Redacts and bounds log payloads without recursion.
+
+    The walk uses an explicit stack and copies lazily: a dict/list is rebuilt only
+    when something under it changed (redaction, truncation, type conversion), so a
+    clean payload comes back as the same object. With copy=True every container is
+    rebuilt, for callers that hand the result to another thread. Keys are matched against
+    precomputed lowercase sets; `redact_paths` ("json.current_password") redact by
+    position. `max_bytes` is an estimate of the encoded size; past it, remaining
+    values become TRUNCATED_BUDGET.
+    """
+
+    def __init__(
+        self,
+        *,
+        sensitive_keys: Iterable[str],
+        allowed_header_keys: Iterable[str],
+        redact_paths: Iterable[str] = (),
+        max_str: int = 250,
+        max_depth: int = 5,
+        max_list: int = 50,
+        max_bytes: int = 16384,
+    ):
+        self.sensitive_keys: Set[str] = {k.lower() for k in sensitive_keys}
+        self.allowed_header_keys: Set[str] = {k.lower() for k in allowed_header_keys}
+        self.blocked_header_keys: Set[str] = {"authorization", "cookie", "set-cookie"}
+        self.redaction_trie = build_redaction_trie(redact_paths)
+        self.max_str = max_str
+        self.max_depth = max_depth
+        self.max_list = max_list
+        self.max_bytes = max_bytes
+        # payload keys repeat (same DTOs, same bulk rows): lowercase each once
+        self._lower_keys: Dict[Any, str] = {}
+
+    # -------------------------
+    # Leaves
+    # -------------------------
+    def truncate(self, value: Any, max_len: Optional[int] = None) -> Any:
+        if value is None:
+            return None
+        max_len = max_len or self.max_str
+        s = value.decode("utf-8", "ignore") if isinstance(value, (bytes, bytearray)) else str(value)
+        return s if len(s) <= max_len else s[:max_len] + "...(trunc)"
+
+    def sanitize_headers(self, headers: Dict[str, Any]) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for k, v in headers.items():
+            lk = str(k).lower()
+            # hard-block common secrets
+            if lk in self.blocked_header_keys:
+                continue
+            if lk in self.allowed_header_keys:
+                out[k] = self.truncate(v, 200)
+        return out
+
+    # -------------------------
+    # Walk
+    # -------------------------
+    def sanitize(self, obj: Any, *, copy: bool = False) -> Any:
+        if obj is None:
+            return None
+        if not isinstance(obj, (dict, list)):
+            return self._leaf(obj)[0]
+
+        max_str = self.max_str
+        max_list = self.max_list
+        max_depth = self.max_depth
+        sensitive = self.sensitive_keys
+        lower_cache = self._lower_keys
+        leaf = self._leaf
+        budget = self.max_bytes
+
+        stack = [_frame(obj, 0, [self.redaction_trie] if self.redaction_trie else None, None, None, max_list)]
+        result: Any = obj
+
+        while stack:
+            f = stack[-1]
+            is_dict = f[2]
+            child_depth = f[3] + 1
+            pushed = False
+
+            # drain this container until it has a child container to descend into
+            for key, value in f[1]:
+                nodes = f[4]
+                if is_dict:
+                    lk = lower_cache.get(key)
+                    if lk is None:
+                        lk = key.lower() if type(key) is str else str(key).lower()
+                        if len(lower_cache) < _LOWER_CACHE_SIZE:
+                            lower_cache[key] = lk
+                    budget -= len(lk) + _ITEM_OVERHEAD
+                    redact = lk in sensitive
+                    if nodes:
+                        if len(nodes) == 1 and WILDCARD not in nodes[0]:
+                            nxt = nodes[0].get(lk)
+                            nodes = None if nxt is None else [nxt]
+                            redact = redact or (nxt is not None and "" in nxt)
+                        else:
+                            nodes, hit = _step(nodes, lk)
+                            redact = redact or hit
+                    if redact:
+                        if f[5] is None:
+                            f[5] = {}
+                        f[5][key] = REDACTED
+                        budget -= len(REDACTED)
+                        continue
+                    if lk == "headers" and isinstance(value, dict):
+                        headers = self.sanitize_headers(value)
+                        if f[5] is None:
+                            f[5] = {}
+                        f[5][key] = headers
+                        for hk, hv in headers.items():
+                            # absent headers stay as None (null), as callers pass them
+                            budget -= len(str(hk)) + (4 if hv is None else len(hv)) + _ITEM_OVERHEAD
+                        continue
+                else:
+                    budget -= _ITEM_OVERHEAD
+
+                if child_depth >= max_depth or budget <= 0:
+                    if value is not None:
+                        if f[5] is None:
+                            f[5] = {}
+                        f[5][key] = TRUNCATED_DEPTH if child_depth >= max_depth else TRUNCATED_BUDGET
+                    continue
+                t = type(value)
+                if t is str:
+                    n = len(value)
+                    if n > max_str:
+                        if f[5] is None:
+                            f[5] = {}
+                        f[5][key] = value[:max_str] + "...(trunc)"
+                        n = max_str + 10
+                    budget -= n
+                    continue
+                if t is int or t is float or t is bool or value is None:
+                    budget -= 8
+                    continue
+                if t is dict or t is list or isinstance(value, (dict, list)):
+                    stack.append(_frame(value, child_depth, nodes, f, key, max_list))
+                    pushed = True
+                    break
+
+                new, size = leaf(value)
+                budget -= size
+                if new is not value:
+                    if f[5] is None:
+                        f[5] = {}
+                    f[5][key] = new
+
+            if pushed:
+                continue
+
+            stack.pop()
+            limit = f[6]
+            if limit is not None:
+                budget -= len(TRUNCATED_LIST) + _ITEM_OVERHEAD
+            out = f[0] if f[5] is None and limit is None and not copy else _rebuild(f[0], f[5], limit)
+            parent = f[7]
+            if parent is None:
+                result = out
+            elif out is not f[0]:
+                if parent[5] is None:
+                    parent[5] = {}
+                parent[5][f[8]] = out
+
+        return result
+
+    def _leaf(self, value: Any):
+        """(sanitized value, estimated encoded bytes); the same object when unchanged."""
+        if isinstance(value, str):
+            if len(value) <= self.max_str:
+                return value, len(value)
+            out = value[: self.max_str] + "...(trunc)"
+            return out, len(out)
+        if isinstance(value, _SCALARS):
+            return value, 8
+        if isinstance(value, _PASSTHROUGH):
+            # immutable and short; the encoder's default=str renders them the same way
+            return value, 32
+        # bytes, sets, arbitrary objects: plain (truncated) string
+        out = self.truncate(value)
+        return out, len(out)
@@ -1,9 +1,26 @@
+import atexit
 import logging
+import logging.handlers
 import sys
-import json
 import os
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, TextIO
+
+from app.contexts.core.log.log_pipeline import EventGate, LazyJson, parse_event_map, start_listener
+from app.contexts.core.log.log_sanitizer import LogSanitizer
+
+_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warn": logging.WARNING,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() in ("1", "true", "yes", "y")
 
 
 class LogService:
@@ -23,12 +40,23 @@ class LogService:
         self.logger = logging.getLogger("SchoolManagementSystem")
         self.logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
 
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(logging.Formatter("%(message)s"))
-
+        self._listener = None
+        self.queue_handler = None
         # Avoid double handlers in reload/debug
         if not self.logger.handlers:
-            self.logger.addHandler(handler)
+            self.configure(
+                use_queue=_env_flag("LOG_QUEUE", "true"),
+                file_path=os.getenv("LOG_FILE") or None,
+            )
+        atexit.register(self.flush)
+
+        # Noisy events, both opt-in (empty = log everything):
+        # LOG_SAMPLE_RATES="mongo_operation=0.1" keeps ~10% of INFO/DEBUG,
+        # LOG_RATE_LIMITS="http_error=50" caps records per second per event.
+        self.gate = EventGate(
+            parse_event_map(os.getenv("LOG_SAMPLE_RATES", "")),
+            parse_event_map(os.getenv("LOG_RATE_LIMITS", "")),
+        )
 
         # --- policy knobs ---
         self.pretty = os.getenv("LOG_PRETTY", "false").lower() in ("1", "true", "yes", "y")
@@ -50,73 +78,85 @@ class LogService:
             "x-request-id", "x-correlation-id", "x-forwarded-for",
         }
 
+        # Path rules on top of the key set, relative to `extra`: "json.current_password,json.*.token"
+        self.redact_paths = [
+            p for p in os.getenv("LOG_REDACT_PATHS", "json.current_password,json.new_password").split(",") if p.strip()
+        ]
+        # Upper bound for one log line; the sanitizer degrades first, the encoder enforces it
+        self.max_bytes = int(os.getenv("LOG_MAX_BYTES", "16384"))
+
+        self.sanitizer = LogSanitizer(
+            sensitive_keys=self.sensitive_keys,
+            allowed_header_keys=self.allowed_header_keys,
+            redact_paths=self.redact_paths,
+            max_str=self.max_str,
+            max_depth=self.max_depth,
+            max_list=self.max_list,
+            max_bytes=self.max_bytes,
+        )
+
     # -------------------------
     # Sanitization helpers
     # -------------------------
     def _truncate(self, value: Any, max_len: Optional[int] = None) -> Any:
-        if value is None:
-            return None
-        max_len = max_len or self.max_str
-        s = value.decode("utf-8", "ignore") if isinstance(value, (bytes, bytearray)) else str(value)
-        return s if len(s) <= max_len else s[:max_len] + "...(trunc)"
-
-    def _sanitize_headers(self, headers: Dict[str, Any]) -> Dict[str, Any]:
-        out: Dict[str, Any] = {}
-        for k, v in headers.items():
-            lk = str(k).lower()
-            # hard-block common secrets
-            if lk in ("authorization", "cookie", "set-cookie"):
-                continue
-            if lk in self.allowed_header_keys:
-                out[k] = self._truncate(v, 200)
-        return out
-
-    def _sanitize(self, obj: Any, *, depth: int = 0) -> Any:
+        return self.sanitizer.truncate(value, max_len)
+
+    def _sanitize(self, obj: Any) -> Any:
         """
-        Recursively sanitize data for logs:
-        - redact sensitive keys
-        - truncate long strings
-        - bound depth and list length
+        Sanitize data for logs (see LogSanitizer):
+        - redact sensitive keys and LOG_REDACT_PATHS
+        - truncate long strings, bound depth, list length and LOG_MAX_BYTES
+        With the queue on, containers are always copied: the listener thread encodes
+        the record later, after the caller may have mutated what it passed in.
         """
-        if obj is None:
-            return None
-
-        if depth >= self.max_depth:
-            return "[TRUNCATED_DEPTH]"
-
-        if isinstance(obj, dict):
-            out: Dict[str, Any] = {}
-            for k, v in obj.items():
-                lk = str(k).lower()
-
-                # redact sensitive keys anywhere
-                if lk in self.sensitive_keys:
-                    out[k] = "[REDACTED]"
-                    continue
-
-                # special-case headers if present
-                if lk == "headers" and isinstance(v, dict):
-                    out[k] = self._sanitize_headers(v)
-                    continue
-
-                out[k] = self._sanitize(v, depth=depth + 1)
-            return out
-
-        if isinstance(obj, list):
-            trimmed = obj[: self.max_list]
-            return [self._sanitize(x, depth=depth + 1) for x in trimmed] + (
-                ["...(trunc_list)"] if len(obj) > self.max_list else []
-            )
+        return self.sanitizer.sanitize(obj, copy=self.queue_handler is not None)
 
-        if isinstance(obj, (str, bytes, bytearray)):
-            return self._truncate(obj)
+    # -------------------------
+    # Handlers
+    # -------------------------
+    def configure(
+        self,
+        *,
+        use_queue: bool = True,
+        stream: Optional[TextIO] = None,
+        file_path: Optional[str] = None,
+    ) -> None:
+        """
+        Sinks: stdout (or `stream`) plus an optional rotating file (LOG_FILE,
+        LOG_FILE_MAX_BYTES, LOG_FILE_BACKUPS; one file per process). With use_queue the
+        caller only enqueues; JSON encoding and writes run on a listener thread.
+        """
+        self.flush()
+        for h in list(self.logger.handlers):
+            self.logger.removeHandler(h)
+
+        formatter = logging.Formatter("%(message)s")
+        sinks = [logging.StreamHandler(stream or sys.stdout)]
+        if file_path:
+            sinks.append(
+                logging.handlers.RotatingFileHandler(
+                    file_path,
+                    maxBytes=int(os.getenv("LOG_FILE_MAX_BYTES", str(10 * 1024 * 1024))),
+                    backupCount=int(os.getenv("LOG_FILE_BACKUPS", "5")),
+                    encoding="utf-8",
+                )
+            )
+        for h in sinks:
+            h.setFormatter(formatter)
 
-        # Convert basic non-JSON types safely
-        if isinstance(obj, (int, float, bool)):
-            return obj
+        if use_queue:
+            self.queue_handler, self._listener = start_listener(sinks, int(os.getenv("LOG_QUEUE_SIZE", "10000")))
+            self.logger.addHandler(self.queue_handler)
+        else:
+            self.queue_handler, self._listener = None, None
+            for h in sinks:
+                self.logger.addHandler(h)
 
-        # Fallback string conversion for ObjectId/datetime/etc.
-        return self._truncate(obj)
+    def flush(self) -> None:
+        """Drain the queue and stop the listener (atexit, reconfigure)."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
 
     # -------------------------
     # Main log method
@@ -129,33 +169,29 @@ class LogService:
         user_id: Optional[str] = None,
         extra: Optional[Dict[str, Any]] = None
     ):
+        levelno = _LEVELS.get(level.lower(), logging.INFO)
+        if not self.logger.isEnabledFor(levelno):
+            return
+
+        event = str((extra or {}).get("event") or message)
+        emit, suppressed = self.gate.admit(event, levelno)
+        if not emit:
+            return
+
         log_data = {
             "ts": datetime.utcnow().isoformat(),
             "level": level.upper(),
             "module": module or "unknown",
             "user_id": user_id,
             "msg": self._truncate(message, 400),
+            # a fresh copy when queued (see _sanitize); encoding happens on the listener
             "extra": self._sanitize(extra or {}),
         }
+        if suppressed:
+            log_data["suppressed"] = suppressed
 
-        # Single-line JSON for monitoring systems (ELK/Loki/CloudWatch/etc.)
-        payload = (
-            json.dumps(log_data, indent=2, default=str)
-            if self.pretty
-            else json.dumps(log_data, separators=(",", ":"), default=str)
-        )
-
-        lvl = level.lower()
-        if lvl == "info":
-            self.logger.info(payload)
-        elif lvl in ("warn", "warning"):
-            self.logger.warning(payload)
-        elif lvl == "error":
-            self.logger.error(payload)
-        elif lvl == "debug":
-            self.logger.debug(payload)
-        else:
-            self.logger.info(payload)
+        # Single-line JSON for monitoring systems (ELK/Loki/CloudWatch/etc.), encoded by the sink
+        self.logger.log(levelno, LazyJson(log_data, self.pretty, self.max_bytes))
 
     # Convenience methods
     def info(self, message: str, **kwargs):
@@ -171,4 +207,4 @@ class LogService:
         self.log(message, level="ERROR", **kwargs)
 
     def debug(self, message: str, **kwargs):
-        self.log(message, level="DEBUG", **kwargs)
\ No newline at end of file
+        self.log(message, level="DEBUG", **kwargs)
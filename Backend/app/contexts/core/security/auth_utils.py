@@ -2,9 +2,9 @@ from flask import request, g
 import jwt
 from bson.objectid import ObjectId
 
-from app.contexts.core.config.setting import settings
 from app.contexts.core.errors import AppBaseException, ErrorSeverity, ErrorCategory
 from app.contexts.shared.model_converter import mongo_converter
+from app.contexts.iam.auth.jwt_utils import decode_access_token
 
 
 # -----------------------------
@@ -141,11 +141,7 @@ def _decode_jwt() -> dict:
         )
 
     try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM],
-        )
+        payload = decode_access_token(token)
         user_id = payload.get("id")    # IAM._id as string
         user_role = payload.get("role")
         if not user_id or not user_role:
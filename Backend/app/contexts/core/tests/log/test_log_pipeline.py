@@ -0,0 +1,118 @@
+import json
+import logging
+import queue
+
+import pytest
+
+from app.contexts.core.log.log_pipeline import (
+    EventGate,
+    LazyJson,
+    NonBlockingQueueHandler,
+    parse_event_map,
+    start_listener,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class ScriptedRng:
+    def __init__(self, *values):
+        self.values = list(values)
+
+    def __call__(self):
+        return self.values.pop(0)
+
+
+def _record(msg="x", level=logging.INFO):
+    return logging.LogRecord("t", level, __file__, 1, msg, None, None)
+
+
+def test_parse_event_map_skips_malformed_parts():
+    assert parse_event_map("mongo_operation=0.1, http_error = 50,bad,=3,empty=") == {
+        "mongo_operation": 0.1,
+        "http_error": 50.0,
+    }
+    assert parse_event_map("a=2", cast=int) == {"a": 2}
+    assert parse_event_map("") == {}
+    with pytest.raises(ValueError):
+        parse_event_map("a=lots")
+
+
+def test_sampling_drops_by_rng_but_never_warnings():
+    gate = EventGate({"mongo_operation": 0.25}, rng=ScriptedRng(0.1, 0.9))
+
+    assert gate.admit("mongo_operation", logging.INFO) == (True, 0)
+    assert gate.admit("mongo_operation", logging.DEBUG) == (False, 0)
+    # WARNING and above do not consume the rng at all
+    assert gate.admit("mongo_operation", logging.WARNING) == (True, 0)
+    assert gate.admit("mongo_operation", logging.ERROR) == (True, 0)
+    assert gate.admit("other", logging.DEBUG) == (True, 0)
+
+
+def test_rate_limit_caps_each_second_and_reports_suppressed_count():
+    clock = FakeClock()
+    gate = EventGate(rate_limits={"http_error": 2}, clock=clock)
+
+    results = [gate.admit("http_error", logging.ERROR) for _ in range(5)]
+    assert results == [(True, 0), (True, 0), (False, 0), (False, 0), (False, 0)]
+
+    clock.now += 0.99
+    assert gate.admit("http_error", logging.ERROR) == (False, 0)
+
+    clock.now += 0.01
+    assert gate.admit("http_error", logging.ERROR) == (True, 4)
+    assert gate.admit("http_error", logging.ERROR) == (True, 0)
+    assert gate.admit("unlimited", logging.ERROR) == (True, 0)
+
+
+def test_sampled_out_records_do_not_count_against_the_limit():
+    clock = FakeClock()
+    gate = EventGate({"e": 0.5}, {"e": 1}, clock=clock, rng=ScriptedRng(0.9, 0.9, 0.1, 0.1))
+
+    assert gate.admit("e", logging.INFO) == (False, 0)
+    assert gate.admit("e", logging.INFO) == (False, 0)
+    assert gate.admit("e", logging.INFO) == (True, 0)
+    assert gate.admit("e", logging.INFO) == (False, 0)
+
+
+def test_queue_handler_drops_and_counts_when_full():
+    handler = NonBlockingQueueHandler(queue.Queue(2))
+    records = [_record(str(i)) for i in range(5)]
+
+    for r in records:
+        handler.emit(r)
+
+    assert handler.dropped == 3
+    assert handler.queue.get_nowait() is records[0]
+    # prepare() leaves the record untouched: no formatting on the caller's thread
+    assert records[0].msg == "0" and records[0].args is None
+
+
+def test_lazy_json_truncates_extra_over_max_bytes():
+    data = {"event": "e", "message": "m", "extra": {"blob": "x" * 500}}
+
+    assert json.loads(str(LazyJson(data)))["extra"]["blob"] == "x" * 500
+    line = str(LazyJson(data, max_bytes=100))
+    assert json.loads(line) == {"event": "e", "message": "m", "extra": {"truncated_bytes": len(str(LazyJson(data)))}}
+
+
+def test_listener_formats_on_its_own_thread():
+    seen = []
+
+    class Capture(logging.Handler):
+        def emit(self, record):
+            seen.append(self.format(record))
+
+    handler, listener = start_listener([Capture()], maxsize=10)
+    try:
+        handler.handle(_record(LazyJson({"event": "e"})))
+    finally:
+        listener.stop()
+
+    assert seen == ['{"event":"e"}']
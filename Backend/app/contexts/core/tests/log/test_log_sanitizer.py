@@ -0,0 +1,61 @@
+import io
+import json
+
+from app.contexts.core.log.log_sanitizer import REDACTED, LogSanitizer
+from app.contexts.core.log.log_service import LogService
+
+
+def _sanitizer():
+    return LogSanitizer(sensitive_keys={"password"}, allowed_header_keys={"host"}, redact_paths=["json.*.token"])
+
+
+def test_clean_payload_is_returned_as_is_unless_a_copy_is_requested():
+    payload = {"json": {"rows": [{"name": "a"}], "n": 1}}
+    sanitizer = _sanitizer()
+
+    assert sanitizer.sanitize(payload) is payload
+
+    copied = sanitizer.sanitize(payload, copy=True)
+    assert copied == payload
+    assert copied is not payload
+    assert copied["json"] is not payload["json"]
+    assert copied["json"]["rows"][0] is not payload["json"]["rows"][0]
+
+
+def test_redaction_copies_only_the_changed_branch():
+    payload = {"json": {"a": {"token": "t"}, "b": {"x": 1}}, "password": "p"}
+
+    out = _sanitizer().sanitize(payload)
+
+    assert out == {"json": {"a": {"token": REDACTED}, "b": {"x": 1}}, "password": REDACTED}
+    assert payload["password"] == "p" and payload["json"]["a"]["token"] == "t"
+    assert out["json"]["b"] is payload["json"]["b"]
+
+
+def test_absent_headers_are_kept_as_none():
+    sanitizer = LogSanitizer(sensitive_keys=(), allowed_header_keys={"host", "x-request-id"})
+    payload = {"headers": {"Host": "api", "X-Request-Id": None, "Authorization": "Bearer t"}}
+
+    assert sanitizer.sanitize(payload) == {"headers": {"Host": "api", "X-Request-Id": None}}
+
+
+def test_queued_log_line_is_not_affected_by_later_mutation():
+    svc = LogService.get_instance()
+    was_queued = svc.queue_handler is not None
+    stream = io.StringIO()
+    svc.configure(use_queue=True, stream=stream)
+    try:
+        # hold the record in the queue until the caller has mutated its payload
+        svc._listener.stop()
+        svc._listener = None
+        extra = {"event": "e", "json": {"rows": [1, 2]}}
+        svc.info("queued", extra=extra)
+        extra["json"]["rows"].append(3)
+        extra["json"]["late"] = True
+
+        record = svc.queue_handler.queue.get_nowait()
+        line = json.loads(str(record.msg))
+    finally:
+        svc.configure(use_queue=was_queued)
+
+    assert line["extra"]["json"] == {"rows": [1, 2]}
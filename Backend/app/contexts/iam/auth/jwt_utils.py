@@ -1,3 +1,9 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
 import jwt
 from datetime import datetime, timedelta, timezone
 from app.contexts.core.config.setting import settings
@@ -6,7 +12,52 @@ from flask import request, jsonify, g
 
 
 SECRET_KEY = settings.SECRET_KEY
-ALGORITHM = "HS256"
+ALGORITHM = settings.JWT_ALGORITHM
+
+
+class TokenClaimsCache:
+    """
+    Bounded LRU of verified claims, keyed by a SHA-256 digest of the whole token
+    (signature included), kept until the token's own `exp`. Only tokens that passed
+    jwt.decode are stored, so a hit means "this exact token verified before".
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items: "OrderedDict[bytes, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, key: bytes, now: float) -> Optional[dict]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            if item[0] <= now:
+                del self._items[key]
+                raise jwt.ExpiredSignatureError("Signature has expired")
+            self._items.move_to_end(key)
+            return item[1]
+
+    def put(self, key: bytes, payload: dict) -> None:
+        exp = payload.get("exp")
+        if self.maxsize <= 0 or not isinstance(exp, (int, float)):
+            return
+        with self._lock:
+            self._items[key] = (float(exp), payload)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+claims_cache = TokenClaimsCache(settings.JWT_CLAIMS_CACHE_SIZE)
 
 
 def create_access_token(data: dict, expire_delta: timedelta = timedelta(hours=1)):
@@ -18,9 +69,19 @@ def create_access_token(data: dict, expire_delta: timedelta = timedelta(hours=1)
     return encoded_jwt
 
 def decode_access_token(token: str) -> dict:
+    """
+    Single decode path for HTTP decorators, get_current_user and the socket handshake.
+    Returns a copy, callers may mutate it.
+    """
     if not token:
         raise jwt.InvalidTokenError("Missing token")
-    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+    key = claims_cache.key(token)
+    payload = claims_cache.get(key, time.time())
+    if payload is None:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        claims_cache.put(key, payload)
+    return dict(payload)
 
 def role_required(allowed_roles: list[str]):
     def decorator(f):
@@ -31,7 +92,7 @@ def role_required(allowed_roles: list[str]):
                 return jsonify({"msg": "Missing or invalid token"}), 401       
             token = auth_header.split(" ")[1]
             try:
-                payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+                payload = decode_access_token(token)
                 role = payload.get("role")
                 user_id = payload.get("id")
                 username = payload.get("username")
@@ -0,0 +1,72 @@
+"""
+Password hashing off the eventlet hub.
+
+werkzeug's KDFs (scrypt / pbkdf2) are pure CPU work; run in a greenlet they stall
+every other request and socket on the worker. Here they run in eventlet's native
+thread pool (tpool) when the process is monkey patched, with at most
+PASSWORD_HASH_MAX_CONCURRENCY hashes in flight so a login storm cannot take every
+core either. Outside eventlet (tests, scripts) they run inline.
+"""
+import threading
+from typing import Any, Callable, Optional
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from app.contexts.core.config.setting import settings
+from app.contexts.infra.concurrency.offload import run_off_hub
+
+
+class PasswordHasher:
+    def __init__(
+        self,
+        *,
+        method: Optional[str] = None,
+        salt_length: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        offload: Optional[bool] = None,
+    ):
+        self.method = method or settings.PASSWORD_HASH_METHOD
+        self.salt_length = salt_length or settings.PASSWORD_HASH_SALT_LENGTH
+        self.offload = settings.PASSWORD_HASH_OFFLOAD if offload is None else offload
+        # green-aware once monkey patched: waiting greenlets yield to the hub
+        self._slots = threading.BoundedSemaphore(max_concurrency or settings.PASSWORD_HASH_MAX_CONCURRENCY)
+        self._scheme: Optional[str] = None
+
+    def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._slots:
+            if self.offload:
+                return run_off_hub(fn, *args)
+            return fn(*args)
+
+    def hash(self, password: str) -> str:
+        return self._run(generate_password_hash, password, self.method, self.salt_length)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        if not hashed_password:
+            return False
+        return bool(self._run(check_password_hash, hashed_password, plain_password))
+
+    @property
+    def scheme(self) -> str:
+        """Fully expanded method ("scrypt" -> "scrypt:32768:8:1"), as stored in the hash prefix."""
+        if self._scheme is None:
+            self._scheme = self.hash("").split("$", 1)[0]
+        return self._scheme
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """True when the stored hash was made with another scheme/cost than the configured one."""
+        return str(hashed_password or "").split("$", 1)[0] != self.scheme
+
+
+_hasher: Optional[PasswordHasher] = None
+_hasher_lock = threading.Lock()
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Process-wide hasher, so the concurrency bound holds across requests."""
+    global _hasher
+    if _hasher is None:
+        with _hasher_lock:
+            if _hasher is None:
+                _hasher = PasswordHasher()
+    return _hasher
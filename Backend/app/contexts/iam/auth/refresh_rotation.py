@@ -0,0 +1,111 @@
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Optional
+
+from pymongo import ReturnDocument
+from pymongo.database import Database
+
+from app.contexts.core.config.setting import settings
+from app.contexts.iam.auth.refresh_utils import REFRESH_TTL, create_refresh_token, hash_refresh_token, now_utc
+
+# replaced hashes remembered per session, so an older stolen token still trips reuse detection
+RETIRED_HASHES_KEPT = 20
+
+
+class RotationStatus:
+    ROTATED = "rotated"    # new refresh token issued
+    GRACE = "grace"        # lost a race with a sibling tab: access token only, keep the sibling's cookie
+    INVALID = "invalid"
+    REVOKED = "revoked"
+    EXPIRED = "expired"
+    REUSED = "reused"      # an old token came back after the grace window: session revoked
+
+
+@dataclass
+class RotationResult:
+    status: str
+    user_id: Optional[str] = None
+    refresh_token: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status in (RotationStatus.ROTATED, RotationStatus.GRACE)
+
+
+class RefreshTokenStore:
+    """
+    One document per login session. Rotation swaps token_hash in place with a single
+    conditional find_one_and_update, so two concurrent refreshes with the same token
+    cannot both succeed, and no separate revoke + insert is needed.
+
+    The replaced hash is kept as previous_hash: presenting it again within
+    REFRESH_REUSE_GRACE_SECONDS (several SPA tabs refreshing at once) still yields an
+    access token; presenting it (or any of the last RETIRED_HASHES_KEPT hashes, kept in
+    retired_hashes) later is treated as token theft and revokes the session.
+    """
+
+    def __init__(self, db: Database):
+        self.col = db["refresh_tokens"]
+
+    def issue(self, user_id: str) -> str:
+        token = create_refresh_token()
+        now = now_utc()
+        self.col.insert_one(
+            {
+                "user_id": str(user_id),
+                "token_hash": hash_refresh_token(token),
+                "previous_hash": None,
+                "retired_hashes": [],
+                "created_at": now,
+                "rotated_at": None,
+                "expires_at": now + REFRESH_TTL,
+                "revoked_at": None,
+            }
+        )
+        return token
+
+    def rotate(self, token: str) -> RotationResult:
+        old_hash = hash_refresh_token(token)
+        new_token = create_refresh_token()
+        now = now_utc()
+
+        doc = self.col.find_one_and_update(
+            {"token_hash": old_hash, "revoked_at": None, "expires_at": {"$gt": now}},
+            {
+                "$set": {
+                    "token_hash": hash_refresh_token(new_token),
+                    "previous_hash": old_hash,
+                    "rotated_at": now,
+                    "expires_at": now + REFRESH_TTL,
+                },
+                "$push": {"retired_hashes": {"$each": [old_hash], "$slice": -RETIRED_HASHES_KEPT}},
+            },
+            projection={"user_id": 1},
+            return_document=ReturnDocument.AFTER,
+        )
+        if doc is not None:
+            return RotationResult(RotationStatus.ROTATED, str(doc["user_id"]), new_token)
+        return self._explain_miss(old_hash, now)
+
+    def _explain_miss(self, old_hash: str, now) -> RotationResult:
+        # failure path only: the happy path above is a single round trip
+        doc = self.col.find_one(
+            {"$or": [{"token_hash": old_hash}, {"previous_hash": old_hash}, {"retired_hashes": old_hash}]}
+        )
+        if doc is None:
+            return RotationResult(RotationStatus.INVALID)
+        if doc.get("revoked_at") is not None:
+            return RotationResult(RotationStatus.REVOKED)
+        if doc["expires_at"] <= now:
+            return RotationResult(RotationStatus.EXPIRED)
+
+        if doc.get("token_hash") == old_hash:
+            # lost a race with a concurrent revoke/rotation; the caller may retry
+            return RotationResult(RotationStatus.INVALID)
+
+        grace = timedelta(seconds=settings.REFRESH_REUSE_GRACE_SECONDS)
+        if doc.get("previous_hash") == old_hash and doc.get("rotated_at") and doc["rotated_at"] >= now - grace:
+            return RotationResult(RotationStatus.GRACE, str(doc["user_id"]))
+
+        self.col.update_one({"_id": doc["_id"], "revoked_at": None}, {"$set": {"revoked_at": now}})
+        return RotationResult(RotationStatus.REUSED)
@@ -1,16 +1,20 @@
 
-from werkzeug.security import generate_password_hash, check_password_hash
 from app.contexts.iam.auth.jwt_utils import create_access_token
+from app.contexts.iam.auth.password_hashing import get_password_hasher
 from datetime import timedelta
 
 
 
 class AuthService:
+    # KDF work runs in eventlet's thread pool (see password_hashing), never on the hub
     def hash_password(self, password: str) -> str:
-        return generate_password_hash(password)
+        return get_password_hasher().hash(password)
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return check_password_hash(hashed_password, plain_password)
+        return get_password_hasher().verify(plain_password, hashed_password)
+
+    def password_needs_rehash(self, hashed_password: str) -> bool:
+        return get_password_hasher().needs_rehash(hashed_password)
 
     def create_access_token(self, user_data: dict) -> str:
         payload = {
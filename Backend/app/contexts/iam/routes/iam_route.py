@@ -17,13 +17,7 @@ from app.contexts.iam.data_transfer.response import IAMResponseDataDTO
 from app.contexts.iam.auth.cookies import set_refresh_cookie, clear_refresh_cookie
 from app.contexts.iam.auth.jwt_utils import login_required
 from app.contexts.core.security.auth_utils import get_current_user
-
-from app.contexts.iam.auth.refresh_utils import (
-    create_refresh_token,
-    hash_refresh_token,
-    now_utc,
-    REFRESH_TTL,
-)
+from app.contexts.iam.auth.refresh_rotation import RotationStatus
 
 
 iam_bp = Blueprint("iam_bp", __name__)
@@ -66,57 +60,31 @@ def logout_user():
 # -------------------------
 @iam_bp.route("/refresh", methods=["POST"])
 def refresh_access_token():
-    db = get_db()
-    refresh_tokens = db["refresh_tokens"]
-
     rt = request.cookies.get("refresh_token")
     if not rt:
         return jsonify({"msg": "Missing refresh token"}), 401
 
-    rt_hash = hash_refresh_token(rt)
-    doc = refresh_tokens.find_one({"token_hash": rt_hash})
-    if not doc:
-        return jsonify({"msg": "Invalid refresh token"}), 401
-
-    if doc.get("revoked_at") is not None:
-        return jsonify({"msg": "Refresh token revoked"}), 401
-
-    if doc["expires_at"] < now_utc():
-        return jsonify({"msg": "Refresh token expired"}), 401
+    iam_service = IAMService(get_db())
 
-    iam_service = IAMService(db)
+    # one conditional find_one_and_update: concurrent refreshes cannot both rotate
+    result = iam_service.rotate_refresh_token(rt)
+    if not result.ok:
+        if result.status == RotationStatus.EXPIRED:
+            return jsonify({"msg": "Refresh token expired"}), 401
+        if result.status in (RotationStatus.REVOKED, RotationStatus.REUSED):
+            return jsonify({"msg": "Refresh token revoked"}), 401
+        return jsonify({"msg": "Invalid refresh token"}), 401
 
-    raw_user = iam_service._iam_read_model.get_by_id(doc["user_id"])
-    if not raw_user:
+    safe_dict = iam_service.get_safe_user_cached(result.user_id)
+    if not safe_dict:
         return jsonify({"msg": "User not found"}), 401
 
-    iam_model = iam_service._iam_mapper.to_domain(raw_user)
-    safe_dict = iam_service._iam_mapper.to_safe_dict(iam_model)
-
-    # Rotate refresh token
-    new_rt = create_refresh_token()
-    new_hash = hash_refresh_token(new_rt)
-
-    refresh_tokens.update_one(
-        {"_id": doc["_id"]},
-        {"$set": {"revoked_at": now_utc(), "replaced_by_hash": new_hash}},
-    )
-
-    refresh_tokens.insert_one(
-        {
-            "user_id": str(safe_dict["id"]),
-            "token_hash": new_hash,
-            "created_at": now_utc(),
-            "expires_at": now_utc() + REFRESH_TTL,
-            "revoked_at": None,
-            "replaced_by_hash": None,
-        }
-    )
-
     access = iam_service._auth_service.create_access_token(safe_dict)
 
     resp = make_response(jsonify({"access_token": access}))
-    set_refresh_cookie(resp, new_rt)
+    # grace: a sibling request already rotated; its cookie is the one to keep
+    if result.refresh_token:
+        set_refresh_cookie(resp, result.refresh_token)
     return resp
 
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Union, Any
+import threading
+import time
+from typing import Union, Any, Dict, Optional, Tuple
 
 from bson import ObjectId
 from pymongo.database import Database
@@ -20,12 +22,13 @@ from app.contexts.iam.errors.iam_exception import (
 )
 
 from app.contexts.iam.auth.refresh_utils import (
-    create_refresh_token,
     hash_refresh_token,
     now_utc,
-    REFRESH_TTL,
 )
 
+from app.contexts.iam.auth.refresh_rotation import RefreshTokenStore, RotationResult
+from app.contexts.core.config.setting import settings
+
 from app.contexts.iam.auth.password_reset_utils import (
     hash_reset_token
 )
@@ -36,6 +39,16 @@ from app.contexts.iam.policies.iam_uniqueness_policy import IAMUniquenessPolicy
 # - find_one(id: ObjectId) -> IAM|None
 
 
+# user_id -> (expires_at, safe user dict): lets /refresh skip the IAM lookup
+_SAFE_USER_CACHE: Dict[str, Tuple[float, dict]] = {}
+_SAFE_USER_LOCK = threading.Lock()
+
+
+def invalidate_safe_user(user_id: str | ObjectId) -> None:
+    with _SAFE_USER_LOCK:
+        _SAFE_USER_CACHE.pop(str(user_id), None)
+
+
 class IAMService:
     """Identity & Access Management Service"""
 
@@ -48,6 +61,7 @@ class IAMService:
         self._uniqueness_policy = IAMUniquenessPolicy(self._iam_read_model)
 
         self._refresh_tokens = db["refresh_tokens"]
+        self._refresh_store = RefreshTokenStore(db)
         self._password_resets = db["password_resets"]
 
     # -------------------------
@@ -70,6 +84,7 @@ class IAMService:
         return raw_user
 
     def _revoke_all_refresh_tokens_for_user(self, user_id: str) -> int:
+        invalidate_safe_user(user_id)
         res = self._refresh_tokens.update_many(
             {"user_id": str(user_id), "revoked_at": None},
             {"$set": {"revoked_at": now_utc()}},
@@ -87,6 +102,13 @@ class IAMService:
         )
         return int(res.modified_count)
 
+    def _upgrade_password_hash(self, raw_user: dict, password: str) -> None:
+        """Re-hash with the configured PASSWORD_HASH_METHOD after a successful login."""
+        stored = raw_user.get("password") or ""
+        if not self._auth_service.password_needs_rehash(stored):
+            return
+        self._iam_repository.update_password(raw_user["_id"], self._auth_service.hash_password(password))
+
     # -------------------------
     # Login / Me
     # -------------------------
@@ -104,26 +126,46 @@ class IAMService:
 
         if not iam_model.check_password(password, self._auth_service):
             raise InvalidPasswordException(password)
+        self._upgrade_password_hash(raw_user, password)
 
         safe_dict = self._iam_mapper.to_safe_dict(iam_model)
 
         access = self._auth_service.create_access_token(safe_dict)
-        refresh = create_refresh_token()
-
-        self._refresh_tokens.insert_one(
-            {
-                "user_id": str(safe_dict["id"]),
-                "token_hash": hash_refresh_token(refresh),
-                "created_at": now_utc(),
-                "expires_at": now_utc() + REFRESH_TTL,
-                "revoked_at": None,
-                "replaced_by_hash": None,
-            }
-        )
+        refresh = self._refresh_store.issue(str(safe_dict["id"]))
 
         dto = IAMResponseDataDTO(user=IAMBaseDataDTO(**safe_dict), access_token=access)
         return dto, refresh
 
+    # -------------------------
+    # Refresh (rotate)
+    # -------------------------
+    def rotate_refresh_token(self, refresh_token: str) -> RotationResult:
+        return self._refresh_store.rotate(refresh_token)
+
+    def get_safe_user_cached(self, user_id: str) -> Optional[dict]:
+        """
+        Safe user dict for token issuing, cached REFRESH_USER_CACHE_SECONDS per process.
+        Profile, password, status and admin user changes drop the entry on this worker;
+        other workers pick them up within the TTL.
+        """
+        now = time.monotonic()
+        with _SAFE_USER_LOCK:
+            cached = _SAFE_USER_CACHE.get(str(user_id))
+        if cached and cached[0] > now:
+            return cached[1]
+
+        raw_user = self._iam_read_model.get_by_id(str(user_id))
+        if not raw_user:
+            invalidate_safe_user(user_id)
+            return None
+        safe_dict = self._iam_mapper.to_safe_dict(self._iam_mapper.to_domain(raw_user))
+
+        ttl = settings.REFRESH_USER_CACHE_SECONDS
+        if ttl > 0:
+            with _SAFE_USER_LOCK:
+                _SAFE_USER_CACHE[str(user_id)] = (now + ttl, safe_dict)
+        return safe_dict
+
     def me(self, user_id: str) -> IAMBaseDataDTO:
         raw_user = self._iam_read_model.get_active_by_id(user_id)
         if not raw_user:
@@ -194,6 +236,7 @@ class IAMService:
         )
 
         self._iam_repository.update(iam_model.id, self._iam_mapper.to_persistence(iam_model))
+        invalidate_safe_user(iam_model.id)
 
         if hashed_pw is not None:
             self._revoke_all_refresh_tokens_for_user(str(iam_model.id))
@@ -0,0 +1,77 @@
+from datetime import timedelta
+
+import jwt
+import pytest
+
+from app.contexts.iam.auth import jwt_utils
+from app.contexts.iam.auth.jwt_utils import TokenClaimsCache, create_access_token, decode_access_token
+
+
+class FakeTime:
+    def __init__(self, now):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    fresh = TokenClaimsCache(16)
+    monkeypatch.setattr(jwt_utils, "claims_cache", fresh)
+    return fresh
+
+
+def test_tokens_are_signed_with_the_configured_algorithm():
+    token = create_access_token({"id": "u1"})
+
+    assert jwt.get_unverified_header(token)["alg"] == jwt_utils.settings.JWT_ALGORITHM
+
+
+def test_cached_claims_expire_at_the_token_exp(monkeypatch, cache):
+    token = create_access_token({"id": "u1", "role": "admin"}, expire_delta=timedelta(minutes=5))
+    exp = jwt.decode(token, options={"verify_signature": False})["exp"]
+    clock = FakeTime(exp - 60)
+    monkeypatch.setattr(jwt_utils, "time", clock)
+
+    assert decode_access_token(token)["id"] == "u1"
+    monkeypatch.setattr(jwt_utils.jwt, "decode", lambda *a, **k: pytest.fail("cache hit expected"))
+    assert decode_access_token(token)["role"] == "admin"
+
+    clock.now = exp
+    with pytest.raises(jwt.ExpiredSignatureError):
+        decode_access_token(token)
+    assert cache.get(cache.key(token), exp - 60) is None
+
+
+def test_returned_claims_are_a_copy(cache):
+    token = create_access_token({"id": "u1"})
+
+    decode_access_token(token)["id"] = "someone-else"
+
+    assert decode_access_token(token)["id"] == "u1"
+
+
+def test_tampered_token_misses_the_cache_and_fails_verification(cache):
+    token = create_access_token({"id": "u1", "role": "student"})
+    decode_access_token(token)
+    header, _, signature = token.split(".")
+    forged = jwt.encode({"id": "u1", "role": "admin", "exp": 4102444800}, "not-the-key", algorithm="HS256")
+    tampered = ".".join([header, forged.split(".")[1], signature])
+
+    assert cache.get(cache.key(tampered), 0) is None
+    with pytest.raises(jwt.InvalidTokenError):
+        decode_access_token(tampered)
+    assert cache.get(cache.key(tampered), 0) is None
+
+
+def test_cache_is_bounded_and_skips_tokens_without_exp():
+    cache = TokenClaimsCache(2)
+    for i in range(3):
+        cache.put(cache.key(str(i)), {"exp": 100, "n": i})
+    cache.put(cache.key("no-exp"), {"n": "x"})
+
+    assert cache.get(cache.key("0"), 0) is None
+    assert [cache.get(cache.key(str(i)), 0)["n"] for i in (1, 2)] == [1, 2]
+    assert cache.get(cache.key("no-exp"), 0) is None
+    assert TokenClaimsCache(0).get(b"k", 0) is None
@@ -0,0 +1,100 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+from bson import ObjectId
+
+from app.contexts.iam.auth import password_hashing
+from app.contexts.iam.auth.password_hashing import PasswordHasher
+from app.contexts.iam.auth.services import AuthService
+from app.contexts.iam.services.iam_service import IAMService
+
+CURRENT = "pbkdf2:sha256:1000"
+LEGACY = "pbkdf2:sha256:500"
+
+
+def _hasher(**kwargs):
+    kwargs.setdefault("method", CURRENT)
+    kwargs.setdefault("max_concurrency", 2)
+    kwargs.setdefault("offload", False)
+    return PasswordHasher(**kwargs)
+
+
+def test_needs_rehash_compares_the_stored_scheme_with_the_configured_one():
+    hasher = _hasher()
+
+    assert hasher.scheme == CURRENT
+    assert hasher.verify("secret", hasher.hash("secret"))
+    assert not hasher.needs_rehash(hasher.hash("secret"))
+    assert hasher.needs_rehash(_hasher(method=LEGACY).hash("secret"))
+    assert hasher.needs_rehash("")
+    assert not hasher.verify("secret", "")
+
+
+def test_kdf_runs_off_the_hub_only_when_offload_is_on(monkeypatch):
+    calls = []
+
+    def fake_run_off_hub(fn, *args):
+        calls.append(fn.__name__)
+        return fn(*args)
+
+    monkeypatch.setattr(password_hashing, "run_off_hub", fake_run_off_hub)
+
+    stored = _hasher(offload=True).hash("secret")
+    _hasher(offload=True).verify("secret", stored)
+    assert calls == ["generate_password_hash", "check_password_hash"]
+
+    _hasher(offload=False).verify("secret", stored)
+    assert len(calls) == 2
+
+
+def test_at_most_max_concurrency_hashes_run_at_once():
+    hasher = _hasher(max_concurrency=2)
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def slow(_):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.02)
+        with lock:
+            state["running"] -= 1
+        return True
+
+    threads = [threading.Thread(target=hasher._run, args=(slow, i)) for i in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert state["peak"] == 2
+
+
+def _service(monkeypatch):
+    monkeypatch.setattr(password_hashing, "_hasher", _hasher())
+    svc = IAMService.__new__(IAMService)
+    svc._auth_service = AuthService()
+    svc._iam_repository = MagicMock()
+    return svc
+
+
+def test_login_upgrades_a_legacy_hash(monkeypatch):
+    svc = _service(monkeypatch)
+    user_id = ObjectId()
+
+    svc._upgrade_password_hash({"_id": user_id, "password": _hasher(method=LEGACY).hash("secret")}, "secret")
+
+    svc._iam_repository.update_password.assert_called_once()
+    oid, new_hash = svc._iam_repository.update_password.call_args.args
+    assert oid == user_id
+    assert new_hash.startswith(CURRENT + "$")
+    assert password_hashing.get_password_hasher().verify("secret", new_hash)
+
+
+def test_login_keeps_a_current_hash(monkeypatch):
+    svc = _service(monkeypatch)
+
+    svc._upgrade_password_hash({"_id": ObjectId(), "password": _hasher().hash("secret")}, "secret")
+
+    svc._iam_repository.update_password.assert_not_called()
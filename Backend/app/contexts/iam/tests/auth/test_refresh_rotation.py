@@ -0,0 +1,170 @@
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+
+from app.contexts.admin.services.user_service import UserAdminService
+from app.contexts.iam.auth import refresh_rotation
+from app.contexts.iam.auth.refresh_rotation import RETIRED_HASHES_KEPT, RefreshTokenStore, RotationStatus
+from app.contexts.iam.auth.refresh_utils import REFRESH_TTL
+from app.contexts.iam.domain.iam import IAMStatus
+from app.contexts.iam.services import iam_service as iam_service_module
+
+
+def _matches(doc, query):
+    for key, cond in query.items():
+        if key == "$or":
+            if not any(_matches(doc, q) for q in cond):
+                return False
+            continue
+        value = doc.get(key)
+        if isinstance(cond, dict) and "$gt" in cond:
+            if value is None or not value > cond["$gt"]:
+                return False
+        elif isinstance(value, list):
+            if cond not in value:
+                return False
+        elif value != cond:
+            return False
+    return True
+
+
+class FakeRefreshTokens:
+    """Just enough of the refresh_tokens collection; each call is atomic like the server's."""
+
+    def __init__(self):
+        self.docs = []
+        self._lock = threading.Lock()
+
+    def insert_one(self, doc):
+        with self._lock:
+            self.docs.append({"_id": len(self.docs) + 1, **doc})
+
+    def find_one(self, query):
+        with self._lock:
+            return next((dict(d) for d in self.docs if _matches(d, query)), None)
+
+    def find_one_and_update(self, query, update, projection=None, return_document=None):
+        with self._lock:
+            doc = next((d for d in self.docs if _matches(d, query)), None)
+            if doc is None:
+                return None
+            doc.update(update["$set"])
+            for field, push in update.get("$push", {}).items():
+                doc[field] = (doc.get(field, []) + push["$each"])[push["$slice"]:]
+            return dict(doc)
+
+    def update_one(self, query, update):
+        with self._lock:
+            for doc in self.docs:
+                if _matches(doc, query):
+                    doc.update(update["$set"])
+                    return
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = datetime(2026, 3, 1, 8, 0, 0)
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, **kwargs):
+        self.now += timedelta(**kwargs)
+
+
+@pytest.fixture
+def store(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(refresh_rotation, "now_utc", clock)
+    monkeypatch.setattr(refresh_rotation.settings, "REFRESH_REUSE_GRACE_SECONDS", 10)
+    col = FakeRefreshTokens()
+    s = RefreshTokenStore({"refresh_tokens": col})
+    s.clock = clock
+    return s
+
+
+def test_rotation_swaps_the_hash_and_keeps_the_session(store):
+    first = store.issue("u1")
+    result = store.rotate(first)
+
+    assert (result.status, result.user_id) == (RotationStatus.ROTATED, "u1")
+    assert result.refresh_token and result.refresh_token != first
+    assert len(store.col.docs) == 1
+    assert store.rotate(result.refresh_token).status == RotationStatus.ROTATED
+
+
+def test_concurrent_refresh_within_the_grace_window_yields_one_rotation(store):
+    token = store.issue("u1")
+    barrier = threading.Barrier(2)
+    results = []
+
+    def refresh():
+        barrier.wait()
+        results.append(store.rotate(token))
+
+    threads = [threading.Thread(target=refresh) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(r.status for r in results) == [RotationStatus.GRACE, RotationStatus.ROTATED]
+    grace = next(r for r in results if r.status == RotationStatus.GRACE)
+    assert grace.ok and grace.user_id == "u1" and grace.refresh_token is None
+    assert store.col.docs[0]["revoked_at"] is None
+
+
+def test_previous_token_after_the_grace_window_revokes_the_session(store):
+    old = store.issue("u1")
+    current = store.rotate(old).refresh_token
+
+    store.clock.advance(seconds=11)
+
+    assert store.rotate(old).status == RotationStatus.REUSED
+    assert store.col.docs[0]["revoked_at"] == store.clock.now
+    assert store.rotate(current).status == RotationStatus.REVOKED
+
+
+def test_an_older_retired_token_revokes_the_session_even_inside_the_grace_window(store):
+    oldest = store.issue("u1")
+    middle = store.rotate(oldest).refresh_token
+    current = store.rotate(middle).refresh_token
+
+    assert store.rotate(oldest).status == RotationStatus.REUSED
+    assert store.rotate(current).status == RotationStatus.REVOKED
+
+
+def test_retired_hashes_are_capped(store):
+    token = store.issue("u1")
+    for _ in range(RETIRED_HASHES_KEPT + 5):
+        token = store.rotate(token).refresh_token
+
+    assert len(store.col.docs[0]["retired_hashes"]) == RETIRED_HASHES_KEPT
+
+
+def test_expired_revoked_and_unknown_tokens_are_refused(store):
+    expired = store.issue("u1")
+    store.clock.advance(seconds=REFRESH_TTL.total_seconds() + 1)
+    assert store.rotate(expired).status == RotationStatus.EXPIRED
+
+    revoked = store.issue("u2")
+    store.col.docs[-1]["revoked_at"] = store.clock.now
+    result = store.rotate(revoked)
+    assert result.status == RotationStatus.REVOKED and not result.ok
+
+    assert store.rotate("never-issued").status == RotationStatus.INVALID
+
+
+def test_admin_status_change_drops_the_cached_refresh_user():
+    user_id = ObjectId()
+    iam_service_module._SAFE_USER_CACHE[str(user_id)] = (float("inf"), {"id": str(user_id)})
+    svc = UserAdminService.__new__(UserAdminService)
+    svc._iam_repository = MagicMock()
+    svc._iam_mapper = MagicMock()
+
+    svc.admin_set_user_status(user_id, MagicMock(status=IAMStatus.INACTIVE))
+
+    assert str(user_id) not in iam_service_module._SAFE_USER_CACHE
@@ -0,0 +1,27 @@
+"""
+CPU-bound work off the eventlet hub.
+
+A greenlet doing pure CPU work (password KDFs, the timetable solver) never
+yields, so every other request and socket on the worker waits for it. Once the
+process is monkey patched, such work runs in eventlet's native thread pool
+(tpool) instead; outside eventlet (tests, scripts) it runs inline.
+"""
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def offload_available() -> bool:
+    try:
+        from eventlet import patcher
+    except ImportError:
+        return False
+    return patcher.is_monkey_patched("thread")
+
+
+def run_off_hub(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    if offload_available():
+        from eventlet import tpool
+
+        return tpool.execute(fn, *args, **kwargs)
+    return fn(*args, **kwargs)
@@ -149,6 +149,16 @@ def ensure_indexes(db: Database) -> None:
         name="uq_refresh_token_hash",
         unique=True,
     )
+    recreate_index(
+        db.refresh_tokens,
+        [("previous_hash", ASCENDING)],
+        name="idx_refresh_previous_hash",
+    )
+    recreate_index(
+        db.refresh_tokens,
+        [("retired_hashes", ASCENDING)],
+        name="idx_refresh_retired_hashes",
+    )
     recreate_index(
         db.refresh_tokens,
         [("expires_at", ASCENDING)],
@@ -214,19 +224,20 @@ def ensure_indexes(db: Database) -> None:
     # =========================
     # NOTIFICATIONS
     # =========================
+    # _id is the tie-breaker of the (created_at, _id) keyset cursor, so every list index ends with it
     recreate_index(
         db.notifications,
-        [("user_id", ASCENDING), ("created_at", DESCENDING)],
+        [("user_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
         name="idx_notif_user_created_desc",
     )
     recreate_index(
         db.notifications,
-        [("user_id", ASCENDING), ("read_at", ASCENDING), ("created_at", DESCENDING)],
+        [("user_id", ASCENDING), ("read_at", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
         name="idx_notif_user_read_created_desc",
     )
     recreate_index(
         db.notifications,
-        [("user_id", ASCENDING), ("type", ASCENDING), ("created_at", DESCENDING)],
+        [("user_id", ASCENDING), ("type", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
         name="idx_notif_user_type_created_desc",
     )
     recreate_index(
@@ -236,9 +247,125 @@ def ensure_indexes(db: Database) -> None:
             ("type", ASCENDING),
             ("read_at", ASCENDING),
             ("created_at", DESCENDING),
+            ("_id", DESCENDING),
         ],
         name="idx_notif_user_type_read_created_desc",
     )
+    # Outbox retries: same (event, user) pair is written at most once
+    recreate_index(
+        db.notifications,
+        [("dedupe_key", ASCENDING)],
+        name="uq_notif_dedupe_key",
+        unique=True,
+        partialFilterExpression={"dedupe_key": {"$exists": True}},
+    )
+
+    # Coalescing: open (unread) group document of a user/type/class key
+    recreate_index(
+        db.notifications,
+        [("coalesce_key", ASCENDING), ("coalesce_until", DESCENDING)],
+        name="idx_notif_coalesce_key_until",
+        partialFilterExpression={"coalesce_key": {"$exists": True}},
+    )
+    # Archive job scan: only read notifications are indexed, oldest first
+    recreate_index(
+        db.notifications,
+        [("created_at", ASCENDING)],
+        name="idx_notif_read_created_archive",
+        partialFilterExpression={"read_at": {"$type": "date"}},
+    )
+    recreate_index(
+        db.notifications_archive,
+        [("user_id", ASCENDING), ("created_at", DESCENDING)],
+        name="idx_notif_archive_user_created_desc",
+    )
+
+    # =========================
+    # NOTIFICATION DELIVERIES (Telegram)
+    # =========================
+    recreate_index(
+        db.notification_deliveries,
+        [("notification_id", ASCENDING), ("channel", ASCENDING)],
+        name="uq_delivery_notification_channel",
+        unique=True,
+    )
+    recreate_index(
+        db.notification_deliveries,
+        [("status", ASCENDING), ("available_at", ASCENDING)],
+        name="idx_delivery_status_available_at",
+    )
+    recreate_index(
+        db.notification_deliveries,
+        [("claim", ASCENDING)],
+        name="idx_delivery_claim",
+        sparse=True,
+    )
+    recreate_index(
+        db.notification_deliveries,
+        [("created_at", ASCENDING)],
+        name="ttl_delivery_created_at",
+        expireAfterSeconds=30 * 24 * 3600,
+    )
+    recreate_index(
+        db.notification_telegram_links,
+        [("user_id", ASCENDING)],
+        name="uq_telegram_link_user",
+        unique=True,
+    )
+    recreate_index(
+        db.notification_telegram_links,
+        [("chat_id", ASCENDING)],
+        name="idx_telegram_link_chat",
+    )
+    recreate_index(
+        db.notification_telegram_link_tokens,
+        [("user_id", ASCENDING)],
+        name="idx_telegram_link_token_user",
+    )
+    recreate_index(
+        db.notification_telegram_link_tokens,
+        [("expires_at", ASCENDING)],
+        name="ttl_telegram_link_token_expires_at",
+        expireAfterSeconds=0,
+    )
+
+    # =========================
+    # NOTIFICATION UNREAD COUNTERS
+    # =========================
+    recreate_index(
+        db.notification_unread_counters,
+        [("user_id", ASCENDING)],
+        name="uq_unread_counter_user",
+        unique=True,
+    )
+
+    # =========================
+    # NOTIFICATION OUTBOX
+    # =========================
+    recreate_index(
+        db.notification_outbox,
+        [("idempotency_key", ASCENDING)],
+        name="uq_outbox_idempotency_key",
+        unique=True,
+    )
+    recreate_index(
+        db.notification_outbox,
+        [("status", ASCENDING), ("available_at", ASCENDING)],
+        name="idx_outbox_status_available_at",
+    )
+    recreate_index(
+        db.notification_outbox,
+        [("claim", ASCENDING)],
+        name="idx_outbox_claim",
+        sparse=True,
+    )
+    # processed (done/failed) events are kept a week for debugging, then expire
+    recreate_index(
+        db.notification_outbox,
+        [("processed_at", ASCENDING)],
+        name="ttl_outbox_processed_at",
+        expireAfterSeconds=7 * 24 * 3600,
+    )
 
     # =========================
     # SUBJECTS
@@ -264,6 +391,21 @@ def ensure_indexes(db: Database) -> None:
         name="idx_attendance_class_record_deleted_at",
     )
 
+    # =========================
+    # GRADES
+    # =========================
+    # Statistics scans: (class, term) and (subject, term) slices
+    recreate_index(
+        db.grades,
+        [("class_id", ASCENDING), ("term", ASCENDING), ("lifecycle.deleted_at", ASCENDING)],
+        name="idx_grades_class_term_deleted_at",
+    )
+    recreate_index(
+        db.grades,
+        [("subject_id", ASCENDING), ("term", ASCENDING), ("lifecycle.deleted_at", ASCENDING)],
+        name="idx_grades_subject_term_deleted_at",
+    )
+
     # =========================
     # TEACHER SUBJECT ASSIGNMENTS
     # =========================
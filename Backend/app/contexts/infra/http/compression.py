@@ -0,0 +1,130 @@
+"""
+Response compression, applied last in the app's after_request hook.
+
+Negotiates Accept-Encoding (br > gzip > identity, honouring q=0), skips small
+bodies, non-text types, HEAD/304/204 and anything already encoded or marked
+no-transform. Streamed responses (exports built from generators) are compressed
+chunk by chunk so they keep streaming. A compressed response's ETag becomes weak:
+the bytes differ from the identity form, but If-None-Match still matches it.
+"""
+import gzip
+import zlib
+from typing import Callable, Iterable, Iterator, Optional, Sequence
+
+from flask import Response as FlaskResponse, request
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+# RFC 1952 gzip container from zlib
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+_SKIP_STATUS = (204, 206, 304)
+
+
+class ResponseCompressor:
+    def __init__(
+        self,
+        *,
+        min_bytes: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        mimetypes: Sequence[str] = ("application/json",),
+    ):
+        self.min_bytes = min_bytes
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.mimetypes = frozenset(m.strip().lower() for m in mimetypes if m.strip())
+        self.encodings = ("br", "gzip") if brotli is not None else ("gzip",)
+
+    @classmethod
+    def from_settings(cls, settings) -> "ResponseCompressor":
+        return cls(
+            min_bytes=settings.COMPRESS_MIN_BYTES,
+            gzip_level=settings.COMPRESS_GZIP_LEVEL,
+            brotli_quality=settings.COMPRESS_BROTLI_QUALITY,
+            mimetypes=settings.COMPRESS_MIMETYPES.split(","),
+        )
+
+    # -------------------------
+    # negotiation
+    # -------------------------
+    def choose_encoding(self) -> Optional[str]:
+        accept = request.accept_encodings
+        best, best_q = None, 0.0
+        for encoding in self.encodings:
+            q = accept.quality(encoding)
+            if q > best_q:
+                best, best_q = encoding, q
+        return best
+
+    def _eligible(self, resp: FlaskResponse) -> bool:
+        if request.method == "HEAD" or resp.status_code < 200 or resp.status_code in _SKIP_STATUS:
+            return False
+        if resp.direct_passthrough or "Content-Encoding" in resp.headers:
+            return False
+        if (resp.mimetype or "").lower() not in self.mimetypes:
+            return False
+        if resp.cache_control.no_transform:
+            return False
+        # buffered bodies below the threshold are not worth it; streamed ones have no length yet
+        return resp.is_streamed or (resp.content_length or 0) >= self.min_bytes
+
+    # -------------------------
+    # encoders
+    # -------------------------
+    def _compress_bytes(self, data: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(data, quality=self.brotli_quality)
+        return gzip.compress(data, compresslevel=self.gzip_level, mtime=0)
+
+    def _stream_compressor(self, encoding: str) -> tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+        if encoding == "br":
+            c = brotli.Compressor(quality=self.brotli_quality)
+            return c.process, c.finish
+        z = zlib.compressobj(self.gzip_level, zlib.DEFLATED, _GZIP_WBITS)
+        # sync flush per chunk: every chunk the app yields reaches the client right away
+        return (lambda chunk: z.compress(chunk) + z.flush(zlib.Z_SYNC_FLUSH)), z.flush
+
+    def _compress_stream(self, chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+        process, finish = self._stream_compressor(encoding)
+        try:
+            for chunk in chunks:
+                if chunk:
+                    out = process(chunk)
+                    if out:
+                        yield out
+            yield finish()
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+
+    # -------------------------
+    # hook
+    # -------------------------
+    def compress(self, resp: FlaskResponse) -> FlaskResponse:
+        if not self._eligible(resp):
+            return resp
+        # the body depends on Accept-Encoding from here on, whether or not we compress
+        resp.vary.add("Accept-Encoding")
+        encoding = self.choose_encoding()
+        if encoding is None:
+            return resp
+
+        if resp.is_streamed:
+            resp.response = self._compress_stream(resp.iter_encoded(), encoding)
+            resp.headers.pop("Content-Length", None)
+        else:
+            data = resp.get_data()
+            compressed = self._compress_bytes(data, encoding)
+            if len(compressed) >= len(data):
+                return resp
+            resp.set_data(compressed)
+
+        resp.headers["Content-Encoding"] = encoding
+        etag, weak = resp.get_etag()
+        if etag and not weak:
+            resp.set_etag(etag, weak=True)
+        return resp
@@ -0,0 +1,127 @@
+"""
+Conditional GET for wrap_response routes.
+
+Every successful GET gets a strong ETag (BLAKE2b of the serialized body) and is
+answered with 304 when If-None-Match matches, which saves the transfer. Routes
+decorated with @http_cache(versions=(...)) get an ETag built from version stamps
+instead (route + query + user + stamps); a matching If-None-Match then returns 304
+before the handler runs, which also saves the queries and serialization.
+
+Stamps live in `http_cache_versions` ({_id: name, v: int}). bump_versions() is
+called from the app's after_request for successful writes under ADMIN_WRITE_PREFIXES.
+"""
+import hashlib
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from flask import Response as FlaskResponse, g, request
+
+from app.contexts.infra.database.db import get_db
+
+VERSIONS_COLLECTION = "http_cache_versions"
+# catalog data (classes, subjects, staff, schedules, enrollment) only changes through these
+ADMIN_VERSION = "admin"
+ADMIN_WRITE_PREFIXES = ("/api/admin/", "/uploads/")
+CACHEABLE_METHODS = ("GET", "HEAD")
+
+
+@dataclass(frozen=True)
+class HttpCachePolicy:
+    max_age: int = 0
+    versions: Tuple[str, ...] = ()
+
+    @property
+    def cache_control(self) -> str:
+        # private: responses are per user; no-cache: always revalidate (cheap with ETags)
+        return f"private, max-age={self.max_age}" if self.max_age > 0 else "private, no-cache"
+
+
+DEFAULT_POLICY = HttpCachePolicy()
+
+
+def http_cache(max_age: int = 0, versions: Sequence[str] = ()) -> Callable:
+    """Per-route Cache-Control max-age and optional version stamps; place below @wrap_response."""
+    policy = HttpCachePolicy(max_age=max_age, versions=tuple(versions))
+
+    def decorator(func):
+        func._http_cache = policy
+        return func
+
+    return decorator
+
+
+def policy_for(func) -> HttpCachePolicy:
+    return getattr(func, "_http_cache", DEFAULT_POLICY)
+
+
+def body_etag(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _current_versions(names: Sequence[str]) -> Dict[str, int]:
+    docs = get_db()[VERSIONS_COLLECTION].find({"_id": {"$in": list(names)}})
+    found = {d["_id"]: int(d.get("v") or 0) for d in docs}
+    return {n: found.get(n, 0) for n in names}
+
+
+def version_etag(policy: HttpCachePolicy) -> Optional[str]:
+    """ETag from version stamps, or None when the route has none (or the lookup fails)."""
+    if not policy.versions:
+        return None
+    try:
+        versions = _current_versions(policy.versions)
+    except Exception:
+        return None
+    user = getattr(g, "user", None) or {}
+    user_id = user.get("id") if isinstance(user, dict) else getattr(user, "id", None)
+    key = "|".join(
+        [request.path, request.query_string.decode("latin-1"), str(user_id or "")]
+        + [f"{n}={v}" for n, v in sorted(versions.items())]
+    )
+    return "v-" + hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def is_cacheable_request() -> bool:
+    return request.method in CACHEABLE_METHODS
+
+
+def not_modified(etag: str, policy: HttpCachePolicy) -> Optional[FlaskResponse]:
+    """304 for a matching If-None-Match, else None."""
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    resp = FlaskResponse(status=304)
+    resp.set_etag(etag)
+    resp.headers["Cache-Control"] = policy.cache_control
+    return resp
+
+
+def apply_validators(resp: FlaskResponse, policy: HttpCachePolicy, etag: Optional[str] = None) -> FlaskResponse:
+    """Tag a 200 response and turn it into a 304 when the client already has it."""
+    if resp.status_code != 200:
+        return resp
+    etag = etag or body_etag(resp.get_data())
+    resp.headers["Cache-Control"] = policy.cache_control
+    return not_modified(etag, policy) or _with_etag(resp, etag)
+
+
+def _with_etag(resp: FlaskResponse, etag: str) -> FlaskResponse:
+    resp.set_etag(etag)
+    return resp
+
+
+def bump_versions(*names: str) -> None:
+    col = get_db()[VERSIONS_COLLECTION]
+    for name in names:
+        col.update_one({"_id": name}, {"$inc": {"v": 1}}, upsert=True)
+
+
+def bump_after_write(resp: FlaskResponse) -> FlaskResponse:
+    """after_request hook: successful admin/upload writes invalidate version-stamped ETags."""
+    if request.method in CACHEABLE_METHODS or request.method == "OPTIONS" or resp.status_code >= 400:
+        return resp
+    if request.path.startswith(ADMIN_WRITE_PREFIXES):
+        try:
+            bump_versions(ADMIN_VERSION)
+        except Exception:
+            pass
+    return resp
@@ -0,0 +1,60 @@
+"""
+One-pass JSON encoding for API responses.
+
+Every type json cannot encode natively (ObjectId, datetime/date/time, Decimal,
+sets, Enum, Pydantic models, ...) renders as str(value), exactly like the former
+json.dumps(..., default=str) round trip.
+
+Backends (JSON_BACKEND):
+  - "stdlib" (default): byte-identical to the previous output (", "/": " separators, ASCII)
+  - "orjson": compact UTF-8, several times faster on large lists; needs orjson
+    installed (not in requirements.txt). orjson encodes Enum, UUID and dataclass
+    values natively, so those may differ from str()
+  - "auto": orjson when installed, else stdlib
+"""
+import json
+from typing import Any
+
+from app.contexts.core.config.setting import settings
+
+try:
+    import orjson
+except ImportError:  # optional fast backend
+    orjson = None
+
+if orjson is not None:
+    # keep str(datetime) / str(dataclass) like the stdlib path instead of orjson's own formats
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+def json_default(obj: Any) -> str:
+    return str(obj)
+
+
+def _use_orjson() -> bool:
+    return orjson is not None and settings.JSON_BACKEND in ("auto", "orjson")
+
+
+def dumps_stdlib(obj: Any) -> str:
+    return json.dumps(obj, default=json_default)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode a response body in a single pass."""
+    if _use_orjson():
+        try:
+            return orjson.dumps(obj, default=json_default, option=_ORJSON_OPTIONS)
+        except (TypeError, orjson.JSONEncodeError):
+            # > 64-bit ints, exotic keys, ...: the stdlib handles them
+            pass
+    return dumps_stdlib(obj).encode("utf-8")
+
+
+def to_jsonable(obj: Any) -> Any:
+    """Plain JSON types (dict/list/str/...) for callers that hand the result to jsonify."""
+    if _use_orjson():
+        try:
+            return orjson.loads(orjson.dumps(obj, default=json_default, option=_ORJSON_OPTIONS))
+        except (TypeError, orjson.JSONEncodeError):
+            pass
+    return json.loads(dumps_stdlib(obj))
@@ -3,10 +3,11 @@ from typing import Optional, Union, Dict, Any
 from app.contexts.core.errors.app_base_exception import ErrorCategory, ErrorSeverity
 from enum import Enum
 from werkzeug.exceptions import HTTPException
-import json
+from app.contexts.infra.http import json_encoder
+
 
 def serialize_for_json(obj):
-    return json.loads(json.dumps(obj, default=str))
+    return json_encoder.to_jsonable(obj)
 
 
 class Response:
@@ -27,8 +28,8 @@ class Response:
         if metadata:
             response["metadata"] = metadata
 
-        json_response = json.dumps(serialize_for_json(response))
-        return FlaskResponse(json_response, status=status_code, mimetype="application/json")
+        # single pass: non-JSON types render as str() inside the encoder, as before
+        return FlaskResponse(json_encoder.dumps(response), status=status_code, mimetype="application/json")
 
     @staticmethod
     def generate_hint_from_field_errors(field_errors: Dict[str, Any]) -> str:
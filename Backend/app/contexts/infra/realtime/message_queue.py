@@ -0,0 +1,208 @@
+"""
+Message-queue backends for running several Socket.IO workers.
+
+SOCKETIO_MESSAGE_QUEUE:
+- unset            -> single process, in-memory client manager (default)
+- redis://, rediss://  -> socketio.RedisManager (emits from any worker reach every client)
+- memory://        -> InMemoryPubSubManager: same pub/sub protocol inside one process,
+                      used by tests to run two "workers" side by side
+
+Besides Socket.IO's own channel, workers share a small control channel
+(`<channel>:control`) for messages the Socket.IO protocol has no verb for,
+e.g. "re-resolve the rooms of these users" after an enrollment change.
+"""
+import json
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import redis
+import socketio
+
+logger = logging.getLogger(__name__)
+
+MEMORY_SCHEME = "memory://"
+REDIS_SCHEMES = ("redis://", "rediss://")
+# control channel resubscribe backoff after a dropped Redis connection
+RECONNECT_MIN_SECONDS = 0.5
+RECONNECT_MAX_SECONDS = 30.0
+
+# channel -> subscriber queues (one per manager / control listener)
+_BROKER: Dict[str, List["queue.Queue"]] = {}
+_BROKER_LOCK = threading.Lock()
+_CLOSED = object()
+
+
+def _subscribe(channel: str) -> "queue.Queue":
+    q: "queue.Queue" = queue.Queue()
+    with _BROKER_LOCK:
+        _BROKER.setdefault(channel, []).append(q)
+    return q
+
+
+def _unsubscribe(channel: str, q: "queue.Queue") -> None:
+    with _BROKER_LOCK:
+        subs = _BROKER.get(channel) or []
+        if q in subs:
+            subs.remove(q)
+    q.put(_CLOSED)
+
+
+def _broadcast(channel: str, message: Any) -> None:
+    with _BROKER_LOCK:
+        subs = list(_BROKER.get(channel) or [])
+    for q in subs:
+        q.put(message)
+
+
+def _iter_queue(q: "queue.Queue") -> Iterator[Any]:
+    while True:
+        message = q.get()
+        if message is _CLOSED:
+            return
+        yield message
+
+
+class InMemoryPubSubManager(socketio.PubSubManager):
+    """
+    Redis-free stand-in for socketio.RedisManager: every manager on the same
+    channel in this process sees every published message, exactly like N workers
+    sharing one Redis channel.
+    """
+
+    name = "memory"
+
+    def __init__(self, url: str = MEMORY_SCHEME, channel: str = "socketio", write_only: bool = False, logger=None):
+        super().__init__(channel=channel, write_only=write_only, logger=logger)
+        self._queue: Optional["queue.Queue"] = None
+
+    def initialize(self):
+        if not self.write_only:
+            self._queue = _subscribe(self.channel)
+        super().initialize()
+
+    def _publish(self, data):
+        _broadcast(self.channel, json.loads(json.dumps(data)))
+
+    def _listen(self):
+        if self._queue is None:
+            self._queue = _subscribe(self.channel)
+        yield from _iter_queue(self._queue)
+
+    def close(self) -> None:
+        if self._queue is not None:
+            _unsubscribe(self.channel, self._queue)
+            self._queue = None
+
+
+def build_client_manager(url: Optional[str], channel: str, *, write_only: bool = False):
+    """socketio client manager for SOCKETIO_MESSAGE_QUEUE, or None for the single-process default."""
+    if not url:
+        return None
+    if url.startswith(MEMORY_SCHEME):
+        return InMemoryPubSubManager(url, channel=channel, write_only=write_only)
+    if url.startswith(REDIS_SCHEMES):
+        return socketio.RedisManager(url, channel=channel, write_only=write_only)
+    raise ValueError(f"Unsupported SOCKETIO_MESSAGE_QUEUE: {url}")
+
+
+class ControlChannel:
+    """
+    Worker-to-worker control messages (JSON dicts) on `<channel>:control`.
+    Every worker, including the publisher, receives each message once.
+
+    A dropped Redis connection is retried with backoff and resubscribed; messages
+    published while disconnected are lost, so `on_reconnect` lets the listener
+    drop whatever state those messages would have invalidated.
+    """
+
+    def __init__(self, url: str, channel: str, *, sleep: Callable[[float], None] = time.sleep):
+        self.url = url
+        self.channel = f"{channel}:control"
+        self._redis = redis.Redis.from_url(url) if url.startswith(REDIS_SCHEMES) else None
+        self._queue: Optional["queue.Queue"] = None
+        self._sleep = sleep
+        self._closed = False
+
+    def publish(self, message: Dict[str, Any]) -> None:
+        if self._redis is not None:
+            self._redis.publish(self.channel, json.dumps(message))
+        else:
+            _broadcast(self.channel, dict(message))
+
+    def _redis_messages(
+        self,
+        ready: Optional[threading.Event],
+        on_reconnect: Optional[Callable[[], None]],
+    ) -> Iterator[Dict[str, Any]]:
+        backoff = RECONNECT_MIN_SECONDS
+        dropped = False
+        while not self._closed:
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self.channel)
+                if ready is not None:
+                    ready.set()
+                if dropped:
+                    logger.info("Realtime control channel %s resubscribed", self.channel)
+                    dropped = False
+                    if on_reconnect is not None:
+                        try:
+                            on_reconnect()
+                        except Exception:
+                            logger.exception("Realtime control channel %s: on_reconnect failed", self.channel)
+                backoff = RECONNECT_MIN_SECONDS
+                for m in pubsub.listen():
+                    if m.get("type") != "message":
+                        continue
+                    try:
+                        message = json.loads(m["data"])
+                    except ValueError:
+                        logger.warning("Realtime control channel %s: dropping malformed message", self.channel)
+                        continue
+                    yield message
+                error: Any = "connection closed"
+            except redis.RedisError as e:
+                error = e
+            finally:
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+            if self._closed:
+                return
+            dropped = True
+            logger.warning(
+                "Realtime control channel %s lost (%s); reconnecting in %.1fs", self.channel, error, backoff
+            )
+            self._sleep(backoff)
+            backoff = min(backoff * 2, RECONNECT_MAX_SECONDS)
+
+    def listen(
+        self,
+        handler: Callable[[Dict[str, Any]], None],
+        ready: Optional[threading.Event] = None,
+        on_reconnect: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Blocking loop; run it as a background task."""
+        if self._redis is not None:
+            messages = self._redis_messages(ready, on_reconnect)
+        else:
+            self._queue = _subscribe(self.channel)
+            if ready is not None:
+                ready.set()
+            messages = _iter_queue(self._queue)
+
+        for message in messages:
+            try:
+                handler(message)
+            except Exception:
+                logger.exception("Realtime control handler failed for %s", message.get("method"))
+
+    def close(self) -> None:
+        self._closed = True
+        if self._queue is not None:
+            _unsubscribe(self.channel, self._queue)
+            self._queue = None
@@ -1,8 +1,10 @@
+from typing import Optional
 
 from flask import Flask
 from flask_socketio import SocketIO
 
 from app.contexts.core.config.setting import settings
+from app.contexts.infra.realtime.message_queue import ControlChannel, build_client_manager
 
 socketio = SocketIO(
     cors_allowed_origins=getattr(settings, "CORS_ALLOWED_ORIGINS", []),
@@ -11,7 +13,22 @@ socketio = SocketIO(
     ping_interval=25,
 )
 
+_control: Optional[ControlChannel] = None
+
 
 def init_socketio(app: Flask) -> SocketIO:
-    socketio.init_app(app)
-    return socketio
\ No newline at end of file
+    global _control
+
+    # With SOCKETIO_MESSAGE_QUEUE set, emits fan out to every worker through the queue
+    manager = build_client_manager(settings.SOCKETIO_MESSAGE_QUEUE, settings.SOCKETIO_CHANNEL)
+    if manager is not None:
+        socketio.init_app(app, client_manager=manager)
+        _control = ControlChannel(settings.SOCKETIO_MESSAGE_QUEUE, settings.SOCKETIO_CHANNEL)
+    else:
+        socketio.init_app(app)
+    return socketio
+
+
+def control_channel() -> Optional[ControlChannel]:
+    """Worker-to-worker control channel, or None when running a single process."""
+    return _control
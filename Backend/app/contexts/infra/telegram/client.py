@@ -0,0 +1,66 @@
+"""
+Minimal synchronous Telegram Bot API client (sendMessage only).
+
+python-telegram-bot 22 is asyncio-only while this app runs on eventlet green
+threads, so the background sender talks to the HTTP Bot API directly; with
+eventlet's monkey patching the blocking `requests` call only parks the green thread.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+import requests
+
+DEFAULT_API_BASE_URL = "https://api.telegram.org"
+
+
+@dataclass
+class SendResult:
+    ok: bool
+    status_code: int
+    description: str = ""
+    retry_after: Optional[float] = None  # 429: seconds Telegram asks us to wait
+
+    @property
+    def retryable(self) -> bool:
+        # 429 / 5xx / network errors are transient; other 4xx (blocked bot, bad chat) are not
+        return not self.ok and (self.status_code == 429 or self.status_code >= 500 or self.status_code == 0)
+
+    @property
+    def chat_unreachable(self) -> bool:
+        # 403: bot blocked / kicked; 400 "chat not found": the link is stale
+        return self.status_code == 403 or (self.status_code == 400 and "chat not found" in self.description.lower())
+
+
+class TelegramClient:
+    def __init__(self, token: str, *, base_url: Optional[str] = None, timeout: float = 10.0):
+        self.base_url = (base_url or DEFAULT_API_BASE_URL).rstrip("/")
+        self.token = token
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def send_message(self, chat_id: str, text: str) -> SendResult:
+        url = f"{self.base_url}/bot{self.token}/sendMessage"
+        try:
+            resp = self.session.post(
+                url,
+                json={"chat_id": chat_id, "text": text, "disable_web_page_preview": True},
+                timeout=self.timeout,
+            )
+        except requests.RequestException as e:
+            return SendResult(ok=False, status_code=0, description=str(e))
+
+        try:
+            body = resp.json()
+        except ValueError:
+            body = {}
+
+        retry_after = (body.get("parameters") or {}).get("retry_after")
+        return SendResult(
+            ok=bool(body.get("ok")) and resp.status_code == 200,
+            status_code=resp.status_code,
+            description=str(body.get("description") or ""),
+            retry_after=float(retry_after) if retry_after is not None else None,
+        )
+
+    def close(self) -> None:
+        self.session.close()
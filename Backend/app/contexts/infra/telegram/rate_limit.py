@@ -0,0 +1,87 @@
+import threading
+import time
+from typing import Callable, Dict
+
+# Telegram Bot API limits: ~30 messages/s overall, ~1 message/s per chat.
+GLOBAL_RATE_PER_SECOND = 30.0
+CHAT_RATE_PER_SECOND = 1.0
+MAX_IDLE_CHAT_BUCKETS = 10_000
+# float refills can land a hair below a whole token; count that as a token
+EPSILON = 1e-9
+
+
+class TokenBucket:
+    """Classic token bucket; `clock` is injectable so tests do not sleep."""
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.clock = clock
+        self.tokens = float(capacity)
+        self.updated = clock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self) -> float:
+        """Seconds until one token is available (0 = now)."""
+        self._refill()
+        return 0.0 if self.tokens >= 1 - EPSILON else (1 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        self._refill()
+        self.tokens -= 1
+
+    @property
+    def full(self) -> bool:
+        self._refill()
+        return self.tokens >= self.capacity
+
+
+class TelegramRateLimiter:
+    """One global bucket plus one bucket per chat; a send needs a token from both."""
+
+    def __init__(
+        self,
+        *,
+        global_rate: float = GLOBAL_RATE_PER_SECOND,
+        chat_rate: float = CHAT_RATE_PER_SECOND,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.clock = clock
+        self.sleep = sleep
+        self.chat_rate = chat_rate
+        self.global_bucket = TokenBucket(global_rate, global_rate, clock)
+        self.chat_buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _chat(self, chat_id: str) -> TokenBucket:
+        bucket = self.chat_buckets.get(chat_id)
+        if bucket is None:
+            if len(self.chat_buckets) >= MAX_IDLE_CHAT_BUCKETS:
+                # a full bucket carries no state worth keeping
+                for key in [k for k, b in self.chat_buckets.items() if b.full]:
+                    del self.chat_buckets[key]
+            bucket = self.chat_buckets[chat_id] = TokenBucket(self.chat_rate, 1, self.clock)
+        return bucket
+
+    def wait_time(self, chat_id: str) -> float:
+        with self._lock:
+            return max(self.global_bucket.wait_time(), self._chat(str(chat_id)).wait_time())
+
+    def acquire(self, chat_id: str) -> float:
+        """Block until both buckets allow a send, take the tokens; returns the time waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                chat = self._chat(str(chat_id))
+                wait = max(self.global_bucket.wait_time(), chat.wait_time())
+                if wait <= 0:
+                    self.global_bucket.take()
+                    chat.take()
+                    return waited
+            self.sleep(wait)
+            waited += wait
@@ -0,0 +1,115 @@
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+
+from app.contexts.infra.http import http_cache
+from app.contexts.infra.http.compression import ResponseCompressor
+from app.contexts.infra.http.http_cache import ADMIN_VERSION, VERSIONS_COLLECTION, bump_after_write
+from app.contexts.shared.decorators.response_decorator import wrap_response
+
+
+class FakeVersions:
+    def __init__(self):
+        self.v = {}
+
+    def find(self, query):
+        return [{"_id": n, "v": self.v[n]} for n in query["_id"]["$in"] if n in self.v]
+
+    def update_one(self, query, update, upsert=False):
+        self.v[query["_id"]] = self.v.get(query["_id"], 0) + update["$inc"]["v"]
+
+
+@pytest.fixture
+def versions(monkeypatch):
+    col = FakeVersions()
+    db = MagicMock()
+    db.__getitem__.side_effect = lambda name: {VERSIONS_COLLECTION: col}[name]
+    monkeypatch.setattr(http_cache, "get_db", lambda: db)
+    return col
+
+
+@pytest.fixture
+def app(versions):
+    app = Flask(__name__)
+    app.calls = []
+    compressor = ResponseCompressor(min_bytes=100)
+
+    @app.route("/api/items")
+    @wrap_response
+    def items():
+        app.calls.append("items")
+        return {"items": list(range(200))}
+
+    @app.route("/api/admin/classes", methods=["GET", "POST"])
+    @wrap_response
+    @http_cache.http_cache(versions=[ADMIN_VERSION])
+    def classes():
+        app.calls.append("classes")
+        return {"n": len(app.calls)}
+
+    @app.route("/api/admin/fail", methods=["POST"])
+    def fail():
+        return "nope", 400
+
+    app.after_request(bump_after_write)
+    app.after_request(compressor.compress)
+    return app
+
+
+def test_body_etag_answers_304_on_if_none_match(app):
+    client = app.test_client()
+
+    first = client.get("/api/items", headers={"Accept-Encoding": "identity"})
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    assert etag == '"%s"' % http_cache.body_etag(first.get_data())
+
+    second = client.get("/api/items", headers={"If-None-Match": etag, "Accept-Encoding": "identity"})
+    assert second.status_code == 304
+    assert second.get_data() == b""
+    assert second.headers["ETag"] == etag
+    assert app.calls == ["items", "items"]
+
+
+def test_version_etag_returns_304_before_the_handler(app, versions):
+    client = app.test_client()
+
+    etag = client.get("/api/admin/classes").headers["ETag"]
+    assert etag.startswith('"v-')
+
+    again = client.get("/api/admin/classes", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert app.calls == ["classes"]
+
+    versions.v[ADMIN_VERSION] = 7
+    changed = client.get("/api/admin/classes", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_successful_admin_writes_bump_the_version_but_reads_and_errors_do_not(app, versions):
+    client = app.test_client()
+
+    client.get("/api/admin/classes")
+    client.post("/api/admin/fail")
+    assert versions.v == {}
+
+    assert client.post("/api/admin/classes").status_code == 200
+    assert versions.v == {ADMIN_VERSION: 1}
+
+    client.get("/api/items")
+    assert versions.v == {ADMIN_VERSION: 1}
+
+
+def test_weak_etag_of_a_compressed_body_still_matches(app):
+    client = app.test_client()
+
+    first = client.get("/api/items", headers={"Accept-Encoding": "gzip"})
+    assert first.headers["Content-Encoding"] == "gzip"
+    assert first.headers["ETag"].startswith('W/"')
+
+    again = client.get("/api/items", headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["ETag"]})
+    assert again.status_code == 304
+    assert "Content-Encoding" not in again.headers
@@ -0,0 +1,86 @@
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+
+import pytest
+from bson import ObjectId
+from pydantic import BaseModel
+
+from app.contexts.infra.http import json_encoder
+from app.contexts.infra.http.responses import Response
+
+
+class Color(Enum):
+    RED = 1
+
+
+class Role(str, Enum):
+    ADMIN = "admin"
+
+
+class Item(BaseModel):
+    n: int
+
+
+OID = ObjectId("65f0c0ffee0000000000abcd")
+
+
+def _body():
+    return {
+        "success": True,
+        "message": "héllo",
+        "data": {
+            "id": OID,
+            "at": datetime(2026, 3, 1, 8, 30, 15, 123456),
+            "day": date(2026, 3, 1),
+            "start": time(7, 0),
+            "price": Decimal("1.50"),
+            "color": Color.RED,
+            "role": Role.ADMIN,
+            "item": Item(n=1),
+            "tags": [1, 2.5, None, "x"],
+            3: "int key",
+        },
+    }
+
+
+def _legacy(body) -> bytes:
+    return json.dumps(json.loads(json.dumps(body, default=str))).encode("utf-8")
+
+
+@pytest.fixture
+def stdlib(monkeypatch):
+    monkeypatch.setattr(json_encoder.settings, "JSON_BACKEND", "stdlib")
+
+
+def test_stdlib_backend_is_byte_identical_to_the_legacy_round_trip(stdlib):
+    body = _body()
+
+    assert json_encoder.dumps(body) == _legacy(body)
+    assert json_encoder.dumps(body) == (
+        b'{"success": true, "message": "h\\u00e9llo", "data": {"id": "65f0c0ffee0000000000abcd", '
+        b'"at": "2026-03-01 08:30:15.123456", "day": "2026-03-01", "start": "07:00:00", "price": "1.50", '
+        b'"color": "Color.RED", "role": "admin", "item": "n=1", "tags": [1, 2.5, null, "x"], "3": "int key"}}'
+    )
+
+
+def test_to_jsonable_matches_the_legacy_round_trip(stdlib):
+    body = _body()
+
+    assert json_encoder.to_jsonable(body) == json.loads(_legacy(body))
+
+
+def test_success_response_body_is_unchanged(stdlib):
+    resp = Response.success_response(data={"id": OID}, message="ok")
+
+    assert resp.mimetype == "application/json"
+    assert resp.get_data() == b'{"success": true, "message": "ok", "data": {"id": "65f0c0ffee0000000000abcd"}}'
+
+
+@pytest.mark.skipif(json_encoder.orjson is None, reason="orjson not installed")
+def test_orjson_backend_keeps_values(monkeypatch):
+    monkeypatch.setattr(json_encoder.settings, "JSON_BACKEND", "orjson")
+    body = {"id": OID, "at": datetime(2026, 3, 1, 8, 30), "big": 2**70}
+
+    assert json.loads(json_encoder.dumps(body)) == json.loads(_legacy(body))
@@ -0,0 +1,120 @@
+import gzip
+import json
+import zlib
+
+import pytest
+from flask import Flask, Response, stream_with_context
+
+from app.contexts.infra.http import compression
+from app.contexts.infra.http.compression import ResponseCompressor
+
+BIG = json.dumps({"rows": [{"id": i, "name": "student"} for i in range(200)]})
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    compressor = ResponseCompressor(min_bytes=512, mimetypes=("application/json", " text/csv "))
+    app.streamed = []
+
+    @app.route("/big", methods=["GET", "HEAD"])
+    def big():
+        resp = Response(BIG, mimetype="application/json")
+        resp.set_etag("abc")
+        return resp
+
+    @app.route("/small")
+    def small():
+        return Response('{"ok": true}', mimetype="application/json")
+
+    @app.route("/html")
+    def html():
+        return Response("<p>" * 1000, mimetype="text/html")
+
+    @app.route("/no-transform")
+    def no_transform():
+        resp = Response(BIG, mimetype="application/json")
+        resp.headers["Cache-Control"] = "no-transform"
+        return resp
+
+    @app.route("/not-modified")
+    def not_modified():
+        return Response(status=304, mimetype="application/json")
+
+    @app.route("/export.csv")
+    def export():
+        def rows():
+            for i in range(3):
+                app.streamed.append(i)
+                yield f"{i},student\n"
+
+        return Response(stream_with_context(rows()), mimetype="text/csv")
+
+    app.after_request(compressor.compress)
+    return app
+
+
+def _get(app, path, encoding, method="get", **headers):
+    headers["Accept-Encoding"] = encoding
+    return getattr(app.test_client(), method)(path, headers=headers)
+
+
+def test_gzip_is_negotiated_and_round_trips(app):
+    resp = _get(app, "/big", "gzip, deflate")
+
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in resp.headers["Vary"]
+    assert int(resp.headers["Content-Length"]) < len(BIG)
+    assert gzip.decompress(resp.get_data()).decode() == BIG
+
+
+def test_q_zero_and_identity_leave_the_body_alone(app, monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+
+    for accept in ("gzip;q=0", "identity", "", "br;q=0, gzip;q=0"):
+        resp = _get(app, "/big", accept)
+        assert "Content-Encoding" not in resp.headers, accept
+        assert resp.get_data(as_text=True) == BIG
+        assert "Accept-Encoding" in resp.headers["Vary"]
+
+
+def test_highest_quality_encoding_wins(app):
+    if compression.brotli is None:
+        pytest.skip("brotli not installed")
+
+    assert _get(app, "/big", "gzip;q=1.0, br;q=0.5").headers["Content-Encoding"] == "gzip"
+    assert _get(app, "/big", "gzip, br").headers["Content-Encoding"] == "br"
+
+
+@pytest.mark.parametrize("path", ["/small", "/html", "/no-transform", "/not-modified"])
+def test_small_bodies_other_types_no_transform_and_304_are_skipped(app, path):
+    resp = _get(app, path, "gzip")
+
+    assert "Content-Encoding" not in resp.headers
+
+
+def test_head_is_not_compressed(app):
+    resp = _get(app, "/big", "gzip", method="head")
+
+    assert "Content-Encoding" not in resp.headers
+    assert int(resp.headers["Content-Length"]) == len(BIG)
+
+
+def test_compressed_etag_becomes_weak(app):
+    assert _get(app, "/big", "gzip").headers["ETag"] == 'W/"abc"'
+    assert _get(app, "/big", "identity").headers["ETag"] == '"abc"'
+
+
+def test_streamed_body_is_compressed_chunk_by_chunk(app):
+    resp = _get(app, "/export.csv", "gzip")
+
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in resp.headers
+
+    chunks = list(resp.response)
+    assert app.streamed == [0, 1, 2]
+    assert len(chunks) == 4  # one per row plus the gzip trailer: still streaming
+    # every chunk is sync-flushed, so the prefix decodes without the gzip trailer
+    partial = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(b"".join(chunks[:-1]))
+    assert partial.decode() == "0,student\n1,student\n2,student\n"
+    assert gzip.decompress(b"".join(chunks)) == partial
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from pymongo import ReturnDocument
 from pymongo.collection import Collection
 from pymongo.database import Database
+from pymongo.errors import DuplicateKeyError
 
+from app.contexts.core.config.setting import settings
 from app.contexts.shared.lifecycle.filters import FIELDS
 
 
@@ -21,6 +28,8 @@ class PurgeStats:
     collection: str
     eligible: int
     deleted: int
+    # done | partial (stopped early, the checkpoint resumes it) | skipped (another run holds it)
+    status: str = "done"
 
 
 @dataclass(frozen=True)
@@ -32,6 +41,11 @@ class PurgeRunResult:
     stats: List[PurgeStats]
     errors: List[str]
 
+    @property
+    def resumable(self) -> List[str]:
+        """Collections left for the next run to continue from their checkpoint."""
+        return [s.collection for s in self.stats if s.status != "done"]
+
 
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
@@ -54,15 +68,73 @@ def _deleted_before_cutoff_query(
     return q
 
 
-def _find_ids_batch(col: Collection, query: Dict[str, Any], batch_size: int) -> List[Any]:
-    cur = col.find(query, {"_id": 1}).sort([("_id", 1)]).limit(int(batch_size))
+CHECKPOINT_COLLECTION = "purge_checkpoints"
+AUDIT_COLLECTION = "purge_audit"
+
+DEFAULT_COLLECTIONS: List[PurgeCollectionPlan] = [
+    PurgeCollectionPlan("attendance"),
+    PurgeCollectionPlan("grades"),
+    PurgeCollectionPlan("schedules"),
+    PurgeCollectionPlan("teacher_subject_assignments"),
+    PurgeCollectionPlan("classes"),
+    PurgeCollectionPlan("subjects"),
+    PurgeCollectionPlan("students"),
+    PurgeCollectionPlan("iam"),
+    PurgeCollectionPlan("staff"),
+]
+
+
+class PurgeThrottle:
+    """
+    Shared pacing across all collection workers: each batch reserves
+    `count / rate` seconds on one timeline and sleeps until its slot, so the
+    whole run stays under `rate` deleted documents per second (0 = unthrottled).
+    `clock` / `sleep` are injectable so tests do not sleep.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = float(rate)
+        self.clock = clock
+        self.sleep = sleep
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, count: int) -> float:
+        """Wait for room for `count` deletes; returns the time waited."""
+        if self.rate <= 0 or count <= 0:
+            return 0.0
+        with self._lock:
+            now = self.clock()
+            start = max(now, self._next_at)
+            self._next_at = start + count / self.rate
+        wait = start - now
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+
+def _find_ids_after(
+    col: Collection,
+    query: Dict[str, Any],
+    after_id: Any,
+    batch_size: int,
+) -> List[Any]:
+    """Keyset page on _id: continues after the last batch instead of rescanning from the start."""
+    q = dict(query) if after_id is None else {"$and": [query, {"_id": {"$gt": after_id}}]}
+    cur = col.find(q, {"_id": 1}).sort([("_id", 1)]).limit(int(batch_size))
     return [d["_id"] for d in cur if d.get("_id") is not None]
 
 
-def _delete_ids_batch(col: Collection, ids: Sequence[Any]) -> int:
+def _delete_ids_batch(col: Collection, query: Dict[str, Any], ids: Sequence[Any]) -> int:
     if not ids:
         return 0
-    res = col.delete_many({"_id": {"$in": list(ids)}})
+    # re-check eligibility: a document restored since the page was read is kept
+    res = col.delete_many({"$and": [query, {"_id": {"$in": list(ids)}}]})
     return int(res.deleted_count or 0)
 
 
@@ -81,6 +153,156 @@ def _dedupe_plans(plans: List[PurgeCollectionPlan]) -> List[PurgeCollectionPlan]
     return out
 
 
+class _PurgeProgress:
+    """
+    Per-collection progress: checkpoint (resume point) and live numbers in the audit doc.
+
+    A run leases a collection's checkpoint before touching it (lease_owner /
+    lease_until, renewed on every save), so overlapping runs never walk the same
+    collection from the same checkpoint. A crashed run's lease lapses after
+    `lease_seconds`.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        audit_id: Any = None,
+        checkpoints: bool = True,
+        *,
+        lease_seconds: Optional[int] = None,
+    ):
+        self.checkpoints = db[CHECKPOINT_COLLECTION] if checkpoints else None
+        self.audit = db[AUDIT_COLLECTION] if audit_id is not None else None
+        self.audit_id = audit_id
+        self.owner = uuid.uuid4().hex
+        self.lease = timedelta(seconds=settings.PURGE_LEASE_SECONDS if lease_seconds is None else lease_seconds)
+
+    def claim(self, plan: PurgeCollectionPlan, cutoff: datetime) -> Optional[Tuple[datetime, Any, int, int]]:
+        """
+        Lease this plan's checkpoint: (cutoff, last _id, scanned, deleted) of an interrupted
+        run, a fresh start, or None while another run holds the lease.
+        """
+        if self.checkpoints is None:
+            return cutoff, None, 0, 0
+        now = _utc_now()
+        try:
+            cp = self.checkpoints.find_one_and_update(
+                {
+                    "_id": plan.name,
+                    "$or": [{"lease_owner": None}, {"lease_owner": self.owner}, {"lease_until": {"$lte": now}}],
+                },
+                {"$set": {"lease_owner": self.owner, "lease_until": now + self.lease}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            # the checkpoint exists and its lease is live: another run is on it
+            return None
+        if not cp or cp.get("status") != "running" or cp.get("query_extra") != (plan.query_extra or {}):
+            return cutoff, None, 0, 0
+        # finish the interrupted run with its own cutoff; the next run starts over with a new one
+        return cp["cutoff"], cp.get("last_id"), int(cp.get("scanned") or 0), int(cp.get("deleted") or 0)
+
+    def save(
+        self,
+        plan: PurgeCollectionPlan,
+        cutoff: datetime,
+        last_id: Any,
+        scanned: int,
+        deleted: int,
+        status: str,
+        *,
+        release: bool = False,
+    ) -> bool:
+        """Record progress and renew (or release) the lease; False once the lease was lost."""
+        now = _utc_now()
+        owned = True
+        if self.checkpoints is not None:
+            res = self.checkpoints.update_one(
+                {"_id": plan.name, "lease_owner": self.owner},
+                {
+                    "$set": {
+                        "status": status,
+                        "cutoff": cutoff,
+                        "query_extra": plan.query_extra or {},
+                        "last_id": last_id,
+                        "scanned": scanned,
+                        "deleted": deleted,
+                        "updated_at": now,
+                        "lease_owner": None if release else self.owner,
+                        "lease_until": None if release else now + self.lease,
+                    }
+                },
+            )
+            owned = res.matched_count != 0
+        if self.audit is not None:
+            self.audit.update_one(
+                {"_id": self.audit_id},
+                {
+                    "$set": {
+                        f"progress.{plan.name}": {
+                            "status": status,
+                            "scanned": scanned,
+                            "deleted": deleted,
+                            "last_id": last_id,
+                        },
+                        "updated_at": now,
+                    }
+                },
+            )
+        return owned
+
+
+def _purge_collection(
+    db: Database,
+    plan: PurgeCollectionPlan,
+    *,
+    cutoff: datetime,
+    batch_size: int,
+    dry_run: bool,
+    max_batches: int,
+    throttle: PurgeThrottle,
+    progress: _PurgeProgress,
+) -> Tuple[PurgeStats, List[str]]:
+    col = db[plan.name]
+    errors: List[str] = []
+
+    if dry_run:
+        query = _deleted_before_cutoff_query(cutoff, plan.query_extra)
+        return PurgeStats(collection=plan.name, eligible=_count_eligible(col, query), deleted=0), errors
+
+    claimed = progress.claim(plan, cutoff)
+    if claimed is None:
+        return PurgeStats(collection=plan.name, eligible=0, deleted=0, status="skipped"), errors
+
+    # no upfront count: every eligible document is seen exactly once by the keyset scan
+    run_cutoff, last_id, scanned, deleted_total = claimed
+    query = _deleted_before_cutoff_query(run_cutoff, plan.query_extra)
+
+    batches = 0
+    status = "done"
+    while True:
+        if batches >= int(max_batches):
+            status = "partial"  # not an error: the checkpoint stays open and the next run resumes here
+            break
+        ids = _find_ids_after(col, query, last_id, batch_size=batch_size)
+        if not ids:
+            break
+        throttle.acquire(len(ids))
+        deleted_total += _delete_ids_batch(col, query, ids)
+        scanned += len(ids)
+        last_id = ids[-1]
+        batches += 1
+        if not progress.save(plan, run_cutoff, last_id, scanned, deleted_total, "running"):
+            # lease expired and another run took over this checkpoint: leave it to that run
+            return PurgeStats(collection=plan.name, eligible=scanned, deleted=deleted_total, status="partial"), errors
+
+    progress.save(
+        plan, run_cutoff, last_id, scanned, deleted_total, "done" if status == "done" else "running", release=True
+    )
+    return PurgeStats(collection=plan.name, eligible=scanned, deleted=deleted_total, status=status), errors
+
+
 def run_purge_soft_deleted(
     db: Database,
     *,
@@ -92,65 +314,109 @@ def run_purge_soft_deleted(
     actor_id: Optional[str] = None,
     cutoff_override: Optional[datetime] = None,
     max_batches_per_collection: int = 10_000,
+    concurrency: Optional[int] = None,
+    max_ops_per_second: Optional[float] = None,
+    checkpoints: bool = True,
 ) -> PurgeRunResult:
+    """
+    Hard-delete documents soft-deleted before the cutoff.
+
+    Collections are purged in parallel by up to `concurrency` workers
+    (PURGE_CONCURRENCY), sharing one throttle of `max_ops_per_second` deleted
+    documents per second (PURGE_MAX_OPS_PER_SECOND, 0 = unthrottled). Each
+    collection is walked once in _id order; after every batch its position is
+    saved in `purge_checkpoints`, so a run that stops (crash, deploy,
+    max_batches_per_collection) is continued by the next one, and mirrored to
+    the run's `purge_audit` document under `progress` while it runs. Checkpoints
+    are leased per run (PURGE_LEASE_SECONDS); a collection another run is on is
+    reported as "skipped". A run that leaves collections to resume ends with
+    audit status "partial" rather than "failed".
+    """
     now = _utc_now()
     cutoff = cutoff_override if cutoff_override is not None else _cutoff_dt(retention_days=retention_days, now=now)
+    concurrency = max(1, int(concurrency if concurrency is not None else settings.PURGE_CONCURRENCY))
+    rate = float(max_ops_per_second if max_ops_per_second is not None else settings.PURGE_MAX_OPS_PER_SECOND)
 
-    default_collections: List[PurgeCollectionPlan] = [
-        PurgeCollectionPlan("attendance"),
-        PurgeCollectionPlan("grades"),
-        PurgeCollectionPlan("schedules"),
-        PurgeCollectionPlan("teacher_subject_assignments"),
-        PurgeCollectionPlan("classes"),
-        PurgeCollectionPlan("subjects"),
-        PurgeCollectionPlan("students"),
-        PurgeCollectionPlan("iam"),
-        PurgeCollectionPlan("staff"),
-    ]
-
-    plans = list(collections) if collections is not None else default_collections
+    plans = list(collections) if collections is not None else list(DEFAULT_COLLECTIONS)
     plans = _dedupe_plans(plans)
 
-    stats: List[PurgeStats] = []
     errors: List[str] = []
-
-    for plan in plans:
-        try:
-            col = db[plan.name]
-            query = _deleted_before_cutoff_query(cutoff, plan.query_extra)
-
-            eligible = _count_eligible(col, query)
-            deleted_total = 0
-
-            if not dry_run and eligible > 0:
-                batches = 0
-                while True:
-                    if batches >= int(max_batches_per_collection):
-                        errors.append(f"{plan.name}: max_batches_per_collection reached")
-                        break
-                    ids = _find_ids_batch(col, query, batch_size=batch_size)
-                    if not ids:
-                        break
-                    deleted_total += _delete_ids_batch(col, ids)
-                    batches += 1
-
-            stats.append(PurgeStats(collection=plan.name, eligible=eligible, deleted=deleted_total))
-        except Exception as e:
-            errors.append(f"{plan.name}: {type(e).__name__}: {e}")
-
+    audit_id = None
     if write_audit:
         try:
             audit_doc: Dict[str, Any] = {
                 "created_at": now,
+                "updated_at": now,
+                "status": "running",
                 "cutoff": cutoff,
                 "dry_run": bool(dry_run),
                 "retention_days": int(retention_days),
                 "batch_size": int(batch_size),
+                "concurrency": concurrency,
+                "max_ops_per_second": rate,
                 "actor_id": actor_id,
-                "stats": [s.__dict__ for s in stats],
-                "errors": list(errors),
+                "progress": {},
+                "stats": [],
+                "errors": [],
             }
-            db["purge_audit"].insert_one(audit_doc)
+            audit_id = db[AUDIT_COLLECTION].insert_one(audit_doc).inserted_id
+        except Exception as e:
+            errors.append(f"purge_audit: {type(e).__name__}: {e}")
+
+    throttle = PurgeThrottle(rate)
+    progress = _PurgeProgress(db, audit_id, checkpoints=checkpoints and not dry_run)
+
+    results: Dict[str, Tuple[Optional[PurgeStats], List[str]]] = {}
+    with ThreadPoolExecutor(max_workers=min(concurrency, max(len(plans), 1)), thread_name_prefix="purge") as pool:
+        futures = {
+            pool.submit(
+                _purge_collection,
+                db,
+                plan,
+                cutoff=cutoff,
+                batch_size=batch_size,
+                dry_run=dry_run,
+                max_batches=max_batches_per_collection,
+                throttle=throttle,
+                progress=progress,
+            ): plan
+            for plan in plans
+        }
+        for future in as_completed(futures):
+            plan = futures[future]
+            try:
+                results[plan.name] = future.result()
+            except Exception as e:
+                results[plan.name] = (None, [f"{plan.name}: {type(e).__name__}: {e}"])
+
+    # report in plan order, whatever order the workers finished in
+    stats: List[PurgeStats] = []
+    for plan in plans:
+        stat, plan_errors = results[plan.name]
+        if stat is not None:
+            stats.append(stat)
+        errors.extend(plan_errors)
+
+    if audit_id is not None:
+        if errors:
+            run_status = "failed"
+        elif any(s.status != "done" for s in stats):
+            run_status = "partial"
+        else:
+            run_status = "completed"
+        try:
+            db[AUDIT_COLLECTION].update_one(
+                {"_id": audit_id},
+                {
+                    "$set": {
+                        "status": run_status,
+                        "finished_at": _utc_now(),
+                        "updated_at": _utc_now(),
+                        "stats": [s.__dict__ for s in stats],
+                        "errors": list(errors),
+                    }
+                },
+            )
         except Exception as e:
             errors.append(f"purge_audit: {type(e).__name__}: {e}")
 
@@ -0,0 +1,149 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from pymongo.errors import DuplicateKeyError
+
+from app.contexts.jobs.purge.purge_soft_deleted import (
+    PurgeCollectionPlan,
+    PurgeThrottle,
+    run_purge_soft_deleted,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def _db(**cols):
+    db = MagicMock()
+    cols.setdefault("purge_checkpoints", MagicMock())
+    cols.setdefault("purge_audit", MagicMock())
+    db.__getitem__.side_effect = lambda name: cols.setdefault(name, MagicMock())
+    return db, cols
+
+
+def _pages(col, *pages):
+    col.find.return_value.sort.return_value.limit.side_effect = [[{"_id": i} for i in page] for page in pages]
+    col.delete_many.side_effect = lambda q: MagicMock(deleted_count=len(q["$and"][1]["_id"]["$in"]))
+
+
+def test_throttle_shares_one_timeline_between_workers():
+    clock = FakeClock()
+    throttle = PurgeThrottle(100, clock=clock, sleep=clock.sleep)
+
+    assert throttle.acquire(50) == 0
+    assert throttle.acquire(50) == pytest.approx(0.5)
+    assert throttle.acquire(100) == pytest.approx(0.5)
+    assert clock.now == pytest.approx(1.0)
+    assert PurgeThrottle(0, clock=clock, sleep=clock.sleep).acquire(10_000) == 0
+
+
+def test_purge_walks_ids_in_order_and_resumes_from_checkpoint():
+    old_cutoff = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    grades = MagicMock()
+    _pages(grades, [6, 7], [])
+    db, cols = _db(grades=grades)
+    cols["purge_checkpoints"].find_one_and_update.return_value = {
+        "_id": "grades",
+        "status": "running",
+        "cutoff": old_cutoff,
+        "query_extra": {},
+        "last_id": 5,
+        "scanned": 5,
+        "deleted": 5,
+    }
+
+    result = run_purge_soft_deleted(
+        db,
+        retention_days=30,
+        dry_run=False,
+        collections=[PurgeCollectionPlan("grades")],
+        max_ops_per_second=0,
+    )
+
+    first_query = grades.find.call_args_list[0].args[0]
+    assert first_query["$and"][1] == {"_id": {"$gt": 5}}
+    assert first_query["$and"][0]["lifecycle.deleted_at"]["$lte"] == old_cutoff
+    assert grades.find.call_args_list[1].args[0]["$and"][1] == {"_id": {"$gt": 7}}
+    assert [(s.collection, s.eligible, s.deleted, s.status) for s in result.stats] == [("grades", 7, 7, "done")]
+    assert result.errors == [] and result.resumable == []
+
+    claim_filter = cols["purge_checkpoints"].find_one_and_update.call_args.args[0]
+    owner = cols["purge_checkpoints"].find_one_and_update.call_args.args[1]["$set"]["lease_owner"]
+    assert {"lease_owner": owner} in claim_filter["$or"]
+    last_filter, last_update = cols["purge_checkpoints"].update_one.call_args.args
+    last = last_update["$set"]
+    assert last_filter == {"_id": "grades", "lease_owner": owner}
+    assert (last["status"], last["last_id"], last["deleted"], last["lease_owner"]) == ("done", 7, 7, None)
+    audit = cols["purge_audit"]
+    assert audit.insert_one.call_args.args[0]["status"] == "running"
+    assert audit.update_one.call_args.args[1]["$set"]["status"] == "completed"
+
+
+def test_purge_keeps_checkpoint_open_when_batch_limit_is_hit():
+    db, cols = _db(a=MagicMock(), b=MagicMock())
+    cols["purge_checkpoints"].find_one_and_update.return_value = {"_id": "new"}
+    for name in ("a", "b"):
+        _pages(cols[name], [1, 2], [3])
+
+    result = run_purge_soft_deleted(
+        db,
+        retention_days=30,
+        dry_run=False,
+        collections=[PurgeCollectionPlan("a"), PurgeCollectionPlan("b")],
+        max_batches_per_collection=1,
+        concurrency=2,
+        max_ops_per_second=0,
+    )
+
+    assert [(s.collection, s.deleted, s.status) for s in result.stats] == [("a", 2, "partial"), ("b", 2, "partial")]
+    assert result.errors == [] and result.resumable == ["a", "b"]
+    finals = [c.args[1]["$set"] for c in cols["purge_checkpoints"].update_one.call_args_list]
+    assert {s["status"] for s in finals} == {"running"}
+    assert cols["purge_audit"].update_one.call_args.args[1]["$set"]["status"] == "partial"
+
+
+def test_purge_skips_a_collection_whose_checkpoint_another_run_holds():
+    db, cols = _db(a=MagicMock())
+    cols["purge_checkpoints"].find_one_and_update.side_effect = DuplicateKeyError("lease held")
+
+    result = run_purge_soft_deleted(
+        db,
+        retention_days=30,
+        dry_run=False,
+        collections=[PurgeCollectionPlan("a")],
+        max_ops_per_second=0,
+    )
+
+    assert [(s.collection, s.status) for s in result.stats] == [("a", "skipped")]
+    cols["a"].find.assert_not_called()
+    cols["purge_checkpoints"].update_one.assert_not_called()
+    assert result.errors == [] and result.resumable == ["a"]
+
+
+def test_purge_stops_when_its_lease_was_taken_over():
+    db, cols = _db(a=MagicMock())
+    cols["purge_checkpoints"].find_one_and_update.return_value = {"_id": "a"}
+    cols["purge_checkpoints"].update_one.return_value = MagicMock(matched_count=0)
+    _pages(cols["a"], [1, 2], [3], [])
+
+    result = run_purge_soft_deleted(
+        db,
+        retention_days=30,
+        dry_run=False,
+        collections=[PurgeCollectionPlan("a")],
+        write_audit=False,
+        max_ops_per_second=0,
+    )
+
+    assert [(s.deleted, s.status) for s in result.stats] == [(2, "partial")]
+    assert cols["a"].delete_many.call_count == 1
+    assert cols["purge_checkpoints"].update_one.call_count == 1
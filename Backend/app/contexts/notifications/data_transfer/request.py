@@ -8,4 +8,4 @@ class MarkReadSchema(BaseModel):
 
 class ListNotificationsQuery(BaseModel):
     limit: int = 30
-    cursor: Optional[str] = None
\ No newline at end of file
+    cursor: Optional[str] = None
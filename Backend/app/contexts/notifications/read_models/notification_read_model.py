@@ -1,8 +1,11 @@
 from typing import Optional, Sequence, Union
 from datetime import datetime
 from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING
 from pymongo.database import Database
 
+from app.contexts.notifications.utils.cursor import decode_cursor, encode_cursor
+
 NotifTypeArg = Union[str, Sequence[str]]
 
 
@@ -10,14 +13,7 @@ class NotificationReadModel:
     def __init__(self, db: Database):
         self.col = db["notifications"]
 
-    def list_latest(
-        self,
-        *,
-        user_id: str,
-        limit: int = 30,
-        type: Optional[NotifTypeArg] = None,
-        unread_only: bool = False,
-    ) -> list[dict]:
+    def _filter(self, *, user_id: str, type: Optional[NotifTypeArg], unread_only: bool) -> dict:
         q: dict = {"user_id": str(user_id)}
 
         if unread_only:
@@ -28,33 +24,96 @@ class NotificationReadModel:
                 q["type"] = {"$in": [str(x) for x in type]}
             else:
                 q["type"] = str(type)
+        return q
 
-        cur = self.col.find(q).sort("created_at", -1).limit(int(limit))
-        return [self._to_dto(d) for d in cur]
+    def _page(
+        self,
+        q: dict,
+        *,
+        limit: int,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+    ) -> tuple[list[dict], bool]:
+        """
+        Keyset page on (created_at, _id), newest first.
+        Returns (docs, has_more) where has_more refers to the paging direction.
+        """
+        if before and after:
+            raise ValueError("Use either before or after, not both")
+
+        cursor = before or after
+        op, direction = ("$gt", ASCENDING) if after else ("$lt", DESCENDING)
+        if cursor:
+            ts, oid = decode_cursor(cursor)
+            q = {**q, "$or": [{"created_at": {op: ts}}, {"created_at": ts, "_id": {op: oid}}]}
+
+        cur = self.col.find(q).sort([("created_at", direction), ("_id", direction)]).limit(int(limit) + 1)
+        docs = list(cur)
+        has_more = len(docs) > int(limit)
+        docs = docs[: int(limit)]
+        if after:
+            docs.reverse()
+        return docs, has_more
 
-    def count_unread(self, *, user_id: str, type: Optional[NotifTypeArg] = None) -> int:
-        q: dict = {"user_id": str(user_id), "read_at": None}
+    def list_latest(
+        self,
+        *,
+        user_id: str,
+        limit: int = 30,
+        type: Optional[NotifTypeArg] = None,
+        unread_only: bool = False,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+    ) -> list[dict]:
+        q = self._filter(user_id=user_id, type=type, unread_only=unread_only)
+        docs, _ = self._page(q, limit=limit, before=before, after=after)
+        return [self._to_dto(d) for d in docs]
 
-        if type:
-            if isinstance(type, (list, tuple, set)):
-                q["type"] = {"$in": [str(x) for x in type]}
-            else:
-                q["type"] = str(type)
+    def list_page(
+        self,
+        *,
+        user_id: str,
+        limit: int = 30,
+        type: Optional[NotifTypeArg] = None,
+        unread_only: bool = False,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+    ) -> dict:
+        """
+        Infinite scroll:
+        - next_cursor: pass as `before` to load older items (None when there are none)
+        - prev_cursor: pass as `after` to load newer items
+        """
+        q = self._filter(user_id=user_id, type=type, unread_only=unread_only)
+        docs, has_more = self._page(q, limit=limit, before=before, after=after)
+
+        older = bool(docs) and (has_more if not after else True)
+        return {
+            "items": [self._to_dto(d) for d in docs],
+            "next_cursor": encode_cursor(docs[-1]["created_at"], docs[-1]["_id"]) if older else None,
+            "prev_cursor": encode_cursor(docs[0]["created_at"], docs[0]["_id"]) if docs else after,
+        }
 
+    def count_unread(self, *, user_id: str, type: Optional[NotifTypeArg] = None) -> int:
+        q = self._filter(user_id=user_id, type=type, unread_only=True)
         return int(self.col.count_documents(q))
 
-    def mark_read(self, *, user_id: str, notification_id: str) -> int:
+    def unread_types(self, *, user_id: str) -> list[str]:
+        return [str(t) for t in self.col.distinct("type", {"user_id": str(user_id), "read_at": None})]
+
+    def mark_read(self, *, user_id: str, notification_id: str) -> Optional[dict]:
+        """Returns the notification that was just marked read, or None if it was not unread."""
         # small safety: if invalid ObjectId => 0 (instead of raising)
         try:
             oid = ObjectId(notification_id)
         except Exception:
-            return 0
+            return None
 
-        res = self.col.update_one(
+        return self.col.find_one_and_update(
             {"_id": oid, "user_id": str(user_id), "read_at": None},
             {"$set": {"read_at": datetime.utcnow()}},
+            projection={"type": 1},
         )
-        return int(res.modified_count)
 
     def mark_all_read(self, *, user_id: str, type: Optional[NotifTypeArg] = None) -> int:
         q: dict = {"user_id": str(user_id), "read_at": None}
@@ -87,6 +146,7 @@ class NotificationReadModel:
             "entity_type": d.get("entity_type"),
             "entity_id": d.get("entity_id"),
             "data": d.get("data") or {},
+            "item_count": int(d.get("item_count") or 1),
             "read_at": self._iso(d.get("read_at")),
             "created_at": self._iso(d.get("created_at")),
         }
\ No newline at end of file
@@ -1,9 +1,36 @@
+from typing import Iterable, Tuple
+
 from app.contexts.infra.realtime.socketio_ext import socketio
 
 EVENT_NAME = "notification:new"
+UPDATED_EVENT_NAME = "notification:updated"  # coalesced notification changed in place
+UNREAD_EVENT_NAME = "notification:unread"
 
-def emit_notification(user_id: str, payload: dict) -> None:
+def emit_notification(user_id: str, payload: dict, event: str = EVENT_NAME) -> None:
     try:
-        socketio.emit(EVENT_NAME, payload, room=str(user_id), namespace="/")
+        socketio.emit(event, payload, room=str(user_id), namespace="/")
     except Exception:
-        pass
\ No newline at end of file
+        pass
+
+
+def emit_notifications(items: Iterable[Tuple[str, dict]], event: str = EVENT_NAME) -> None:
+    """Emit a batch of (user_id, payload) pairs, one per user room."""
+    for user_id, payload in items:
+        emit_notification(user_id, payload, event)
+
+
+def emit_to_room(room: str, payload: dict, event: str = EVENT_NAME) -> None:
+    """One emit for everyone in a Socket.IO room (class:<id>, role:<role>, ...)."""
+    try:
+        socketio.emit(event, payload, room=str(room), namespace="/")
+    except Exception:
+        pass
+
+
+def emit_unread_counts(items: Iterable[Tuple[str, dict]]) -> None:
+    """Push {total, by_type} unread counters to each user's room."""
+    for user_id, counts in items:
+        try:
+            socketio.emit(UNREAD_EVENT_NAME, counts, room=str(user_id), namespace="/")
+        except Exception:
+            pass
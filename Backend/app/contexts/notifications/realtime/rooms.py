@@ -0,0 +1,208 @@
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+from bson import ObjectId
+from pymongo.database import Database
+
+from app.contexts.core.config.setting import settings
+from app.contexts.infra.realtime.socketio_ext import control_channel, socketio
+from app.contexts.notifications.utils.recipient_resolver import NotificationRecipientResolver
+from app.contexts.school.read_models.class_read_model import ClassReadModel
+from app.contexts.school.read_models.teacher_assignment_read_model import TeacherAssignmentReadModel
+from app.contexts.shared.enum.roles import SystemRole
+from app.contexts.shared.model_converter import mongo_converter
+from app.contexts.staff.read_models.staff_read_model import StaffReadModel
+from app.contexts.student.read_models.student_read_model import StudentReadModel
+
+NAMESPACE = "/"
+REFRESH_ROOMS = "refresh_rooms"
+
+
+def user_room(user_id: Union[str, ObjectId]) -> str:
+    return str(user_id)
+
+
+def role_room(role: str) -> str:
+    return f"role:{role}"
+
+
+def class_room(class_id: Union[str, ObjectId]) -> str:
+    return f"class:{class_id}"
+
+
+def teacher_class_room(class_id: Union[str, ObjectId]) -> str:
+    return f"teacher-class:{class_id}"
+
+
+# user_id -> (expires_at, role, rooms) for the DB-derived part of the membership
+_ROOM_CACHE: Dict[str, tuple] = {}
+# user_id -> {sid: rooms joined} for sockets connected to this process
+_CONNECTIONS: Dict[str, Dict[str, Set[str]]] = {}
+_LOCK = threading.Lock()
+
+
+def track_connection(user_id: str, sid: str, rooms: Iterable[str]) -> None:
+    with _LOCK:
+        _CONNECTIONS.setdefault(str(user_id), {})[sid] = set(rooms)
+
+
+def untrack_connection(sid: str) -> None:
+    with _LOCK:
+        for uid in [u for u, sids in _CONNECTIONS.items() if sid in sids]:
+            _CONNECTIONS[uid].pop(sid, None)
+            if not _CONNECTIONS[uid]:
+                del _CONNECTIONS[uid]
+
+
+def clear_rooms_local() -> None:
+    with _LOCK:
+        _ROOM_CACHE.clear()
+
+
+class SocketRoomMembership:
+    """
+    Socket.IO room membership:
+
+    - `<user_id>` and `role:<role>` straight from the JWT claims
+    - students: `class:<current_class_id>`
+    - teachers: `teacher-class:<class_id>` for homeroom + subject-assignment classes
+
+    The DB-derived rooms are cached per user (SOCKET_ROOMS_CACHE_SECONDS) so reconnect
+    storms do not hit Mongo; refresh_* re-resolves them and moves sockets that are
+    connected to this process in/out of rooms after enrollment or assignment changes.
+    """
+
+    def __init__(self, db: Database, ttl_seconds: Optional[int] = None):
+        self.db = db
+        self.ttl_seconds = settings.SOCKET_ROOMS_CACHE_SECONDS if ttl_seconds is None else ttl_seconds
+
+    def _oid(self, v: Any) -> Optional[ObjectId]:
+        try:
+            return mongo_converter.convert_to_object_id(v)
+        except Exception:
+            return None
+
+    # -----------------------------
+    # Lookup
+    # -----------------------------
+
+    def _student_rooms(self, user_id: str) -> List[str]:
+        doc = StudentReadModel(self.db).get_by_user_id(user_id) or {}
+        cid = doc.get("current_class_id")
+        return [class_room(cid)] if cid else []
+
+    def _teacher_rooms(self, user_id: str) -> List[str]:
+        uid = self._oid(user_id)
+        staff = StaffReadModel(self.db).get_by_user_id(uid) if uid else None
+        if not staff:
+            return []
+        tid = staff["_id"]
+
+        class_ids = {str(c["_id"]) for c in ClassReadModel(self.db).list_classes_for_teacher(tid) if c.get("_id")}
+        for a in TeacherAssignmentReadModel(self.db).list_for_teacher(tid):
+            if a.get("class_id"):
+                class_ids.add(str(a["class_id"]))
+        return [teacher_class_room(cid) for cid in sorted(class_ids)]
+
+    def _lookup(self, user_id: str, role: str) -> List[str]:
+        if role == SystemRole.STUDENT.value:
+            return self._student_rooms(user_id)
+        if role == SystemRole.TEACHER.value:
+            return self._teacher_rooms(user_id)
+        return []
+
+    def rooms_for(self, claims: Dict[str, Any]) -> List[str]:
+        user_id = str(claims.get("id") or "")
+        role = str(claims.get("role") or "")
+        if not user_id:
+            return []
+
+        now = time.monotonic()
+        with _LOCK:
+            cached = _ROOM_CACHE.get(user_id)
+        if cached and cached[0] > now and cached[1] == role:
+            extra = cached[2]
+        else:
+            try:
+                extra = self._lookup(user_id, role)
+            except Exception:
+                # never refuse a socket over a lookup failure; user/role rooms still work
+                extra = []
+            else:
+                with _LOCK:
+                    _ROOM_CACHE[user_id] = (now + self.ttl_seconds, role, extra)
+
+        rooms = [user_room(user_id)]
+        if role:
+            rooms.append(role_room(role))
+        return rooms + list(extra)
+
+    # -----------------------------
+    # Refresh after membership changes
+    # -----------------------------
+
+    def refresh_users(self, user_ids: Iterable[Union[str, ObjectId, None]]) -> None:
+        """
+        With a message queue the refresh is broadcast, because the user's sockets
+        may live on any worker; every worker (this one included) applies it locally.
+        """
+        uids = sorted({str(u) for u in user_ids if u})
+        if not uids:
+            return
+        channel = control_channel()
+        if channel is not None:
+            channel.publish({"method": REFRESH_ROOMS, "user_ids": uids})
+        else:
+            self.refresh_local(uids)
+
+    def refresh_local(self, user_ids: Iterable[str]) -> None:
+        uids = {str(u) for u in user_ids if u}
+        with _LOCK:
+            for uid in uids:
+                _ROOM_CACHE.pop(uid, None)
+            live = {uid: dict(_CONNECTIONS.get(uid) or {}) for uid in uids}
+
+        for uid, sockets in live.items():
+            if not sockets:
+                continue
+            for sid, old in sockets.items():
+                role = next((r.split(":", 1)[1] for r in old if r.startswith("role:")), "")
+                new = set(self.rooms_for({"id": uid, "role": role}))
+                try:
+                    for room in old - new:
+                        socketio.server.leave_room(sid, room, namespace=NAMESPACE)
+                    for room in new - old:
+                        socketio.server.enter_room(sid, room, namespace=NAMESPACE)
+                except Exception:
+                    continue
+                track_connection(uid, sid, new)
+
+    def refresh_students(self, student_ids: Iterable[Union[str, ObjectId, None]]) -> None:
+        mapping = NotificationRecipientResolver(self.db).students_to_user_ids(student_ids)
+        self.refresh_users(mapping.values())
+
+    def refresh_staff(self, staff_ids: Iterable[Union[str, ObjectId, None]]) -> None:
+        mapping = NotificationRecipientResolver(self.db).best_effort_user_ids(staff_ids)
+        self.refresh_users(mapping.values())
+
+
+def start_room_sync(db: Database) -> None:
+    """Apply refresh_rooms messages from other workers (no-op without a message queue)."""
+    channel = control_channel()
+    if channel is None:
+        return
+    membership = SocketRoomMembership(db)
+
+    def handle(message: Dict[str, Any]) -> None:
+        if message.get("method") == REFRESH_ROOMS:
+            membership.refresh_local(message.get("user_ids") or [])
+
+    def resync() -> None:
+        # refreshes published while the channel was down are lost: start over
+        clear_rooms_local()
+        with _LOCK:
+            connected = list(_CONNECTIONS)
+        membership.refresh_local(connected)
+
+    socketio.start_background_task(channel.listen, handle, on_reconnect=resync)
@@ -1,23 +1,38 @@
 from flask import request
 from flask_socketio import join_room
-import jwt
 
-from app.contexts.iam.auth.jwt_utils import SECRET_KEY, ALGORITHM
+from app.contexts.iam.auth.jwt_utils import decode_access_token
+from app.contexts.infra.database.db import get_db
 from app.contexts.infra.realtime.socketio_ext import socketio
+from app.contexts.notifications.realtime.rooms import (
+    SocketRoomMembership,
+    track_connection,
+    untrack_connection,
+)
 
 @socketio.on("connect", namespace="/")
-def on_connect():
-    token = request.args.get("token")
+def on_connect(auth=None):
+    token = request.args.get("token") or (auth or {}).get("token")
     if not token:
         return False
 
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_access_token(token)
     except Exception:
         return False
 
     user_id = str(payload.get("id") or "")
     if not user_id:
         return False
-    join_room(user_id)
-    return True
\ No newline at end of file
+
+    # user room + role:<role> + class:<id> / teacher-class:<id> (cached lookup)
+    rooms = SocketRoomMembership(get_db()).rooms_for(payload)
+    for room in rooms:
+        join_room(room)
+    track_connection(user_id, request.sid, rooms)
+    return True
+
+
+@socketio.on("disconnect", namespace="/")
+def on_disconnect(*args):
+    untrack_connection(request.sid)
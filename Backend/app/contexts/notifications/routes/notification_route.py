@@ -1,3 +1,5 @@
+import hmac
+
 from flask import Blueprint, request
 from app.contexts.shared.decorators.response_decorator import wrap_response
 from app.contexts.infra.database.db import get_db
@@ -7,6 +9,10 @@ from flask import g
 from app.contexts.notifications.services.notification_service import NotificationService
 from app.contexts.notifications.read_models.notification_read_model import NotificationReadModel
 from app.contexts.notifications.utils.type_filter import parse_type_filter, parse_unread_only
+from app.contexts.notifications.utils.cursor import parse_cursor_args
+from app.contexts.notifications.services.telegram_delivery import TelegramLinks, telegram_enabled
+from app.contexts.core.errors import AppBaseException, ErrorCategory, ErrorSeverity
+from app.contexts.core.config.setting import settings
 notification_bp = Blueprint("notification_bp", __name__)
 
 
@@ -21,15 +27,17 @@ def list_notifications():
 
     notif_type = parse_type_filter()         
     unread_only = parse_unread_only()      
+    before, after = parse_cursor_args()
 
     rm = NotificationReadModel(get_db())
-    items = rm.list_latest(
+    return rm.list_page(
         user_id=user_id,
         limit=limit,
         type=notif_type,
         unread_only=unread_only,
+        before=before,
+        after=after,
     )
-    return {"items": items}
 
 
 @notification_bp.route("/unread-count", methods=["GET"])
@@ -39,17 +47,15 @@ def unread_count():
     user_id = str(g.user["id"])
     notif_type = parse_type_filter()
 
-    rm = NotificationReadModel(get_db())
-    unread = rm.count_unread(user_id=user_id, type=notif_type)
-    return {"unread": unread}
+    counts = NotificationService(get_db()).unread_counts(user_id=user_id, type=notif_type)
+    return {"unread": counts["total"], "by_type": counts["by_type"]}
 
 @notification_bp.route("/<id>/read", methods=["POST"])
 @wrap_response
 @login_required()
 def mark_read(id: str):
     user_id = str(g.user["id"])
-    rm = NotificationReadModel(get_db())
-    rm.mark_read(user_id=user_id, notification_id=id)
+    NotificationService(get_db()).mark_read(user_id=user_id, notification_id=id)
     return {"ok": True}
 
 @notification_bp.route("/read-all", methods=["POST"])
@@ -59,10 +65,51 @@ def mark_all_read():
     user_id = str(g.user["id"])
     notif_type = parse_type_filter()
 
-    rm = NotificationReadModel(get_db())
-    count = rm.mark_all_read(user_id=user_id, type=notif_type)
+    count = NotificationService(get_db()).mark_all_read(user_id=user_id, type=notif_type)
     return {"ok": True, "updated": count}
     
+@notification_bp.route("/telegram", methods=["GET"])
+@wrap_response
+@login_required()
+def get_telegram_link():
+    link = TelegramLinks(get_db()).get(str(g.user["id"]))
+    return {"enabled": telegram_enabled(), "link": link}
+
+
+@notification_bp.route("/telegram/link-token", methods=["POST"])
+@wrap_response
+@login_required()
+def telegram_link_token():
+    # the user sends `/start <token>` to the bot; the webhook below binds that chat
+    return TelegramLinks(get_db()).issue_token(str(g.user["id"]))
+
+
+@notification_bp.route("/telegram/webhook", methods=["POST"])
+@wrap_response
+def telegram_webhook():
+    secret = settings.TELEGRAM_WEBHOOK_SECRET
+    sent = request.headers.get("X-Telegram-Bot-Api-Secret-Token") or ""
+    if not secret or not hmac.compare_digest(sent, secret):
+        raise AppBaseException(
+            message="Telegram webhook called without a valid secret token",
+            severity=ErrorSeverity.MEDIUM,
+            category=ErrorCategory.AUTHENTICATION,
+            status_code=403,
+            user_message="Forbidden",
+            recoverable=False,
+        )
+    linked = TelegramLinks(get_db()).handle_update(request.get_json(silent=True) or {})
+    return {"ok": True, "linked": linked is not None}
+
+
+@notification_bp.route("/telegram", methods=["DELETE"])
+@wrap_response
+@login_required()
+def unlink_telegram():
+    removed = TelegramLinks(get_db()).unlink(str(g.user["id"]))
+    return {"ok": True, "removed": removed}
+
+
 # Optional: easy testing endpoint
 @notification_bp.route("/test", methods=["POST"])
 @wrap_response
@@ -0,0 +1,95 @@
+import datetime as dt
+import logging
+import time
+from typing import Optional
+
+from pymongo.database import Database
+from pymongo.errors import BulkWriteError
+
+from app.contexts.core.config.setting import settings
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_COLLECTION = "notifications_archive"
+
+
+class NotificationArchiver:
+    """
+    Retention for the hot `notifications` collection: read notifications older
+    than `after_days` are copied to `notifications_archive`, then deleted, in
+    batches of `batch_size`.
+
+    Unread notifications are never moved (the unread counters stay exact).
+    A batch interrupted between copy and delete is simply redone: the archive
+    keeps the original _id, so the second copy is a duplicate-key no-op.
+    """
+
+    def __init__(self, db: Database, *, after_days: Optional[int] = None, batch_size: Optional[int] = None):
+        self.col = db["notifications"]
+        self.archive = db[ARCHIVE_COLLECTION]
+        self.after_days = settings.NOTIFICATION_ARCHIVE_AFTER_DAYS if after_days is None else after_days
+        self.batch_size = batch_size or settings.NOTIFICATION_ARCHIVE_BATCH_SIZE
+
+    def _due(self, now: dt.datetime) -> dict:
+        # matches the partial index idx_notif_read_created_archive
+        return {
+            "read_at": {"$type": "date"},
+            "created_at": {"$lt": now - dt.timedelta(days=self.after_days)},
+        }
+
+    def archive_batch(self, now: Optional[dt.datetime] = None) -> int:
+        due = self._due(now or dt.datetime.utcnow())
+        docs = list(self.col.find(due).sort("created_at", 1).limit(self.batch_size))
+        if not docs:
+            return 0
+
+        archived_at = dt.datetime.utcnow()
+        for d in docs:
+            d["archived_at"] = archived_at
+        try:
+            self.archive.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            # only "already archived" is expected here
+            if any(err.get("code") != 11000 for err in (e.details or {}).get("writeErrors", [])):
+                raise
+
+        res = self.col.delete_many({"_id": {"$in": [d["_id"] for d in docs]}, "read_at": {"$type": "date"}})
+        return int(res.deleted_count)
+
+    def run(self, now: Optional[dt.datetime] = None, max_batches: Optional[int] = None) -> int:
+        """Archive everything due; returns how many notifications were moved."""
+        if self.after_days <= 0:
+            return 0
+        now = now or dt.datetime.utcnow()
+        total = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            moved = self.archive_batch(now)
+            if not moved:
+                break
+            total += moved
+            batches += 1
+        return total
+
+
+def run_notification_archiver(db: Database, interval_seconds: float) -> None:
+    archiver = NotificationArchiver(db)
+    while True:
+        try:
+            moved = archiver.run()
+            if moved:
+                logger.info("Archived %s read notification(s)", moved)
+        except Exception:
+            logger.exception("Notification archive job failed")
+        time.sleep(interval_seconds)
+
+
+def start_notification_archiver(db: Database) -> bool:
+    """NOTIFICATION_ARCHIVE_AFTER_DAYS=0 keeps everything in the hot collection."""
+    if settings.NOTIFICATION_ARCHIVE_AFTER_DAYS <= 0 or settings.NOTIFICATION_ARCHIVE_INTERVAL_SECONDS <= 0:
+        return False
+
+    from app.contexts.infra.realtime.socketio_ext import socketio
+
+    socketio.start_background_task(run_notification_archiver, db, settings.NOTIFICATION_ARCHIVE_INTERVAL_SECONDS)
+    return True
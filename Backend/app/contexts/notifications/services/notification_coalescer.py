@@ -0,0 +1,124 @@
+import datetime as dt
+import uuid
+from typing import Dict, List, Optional, Set, Tuple
+
+from pymongo import UpdateOne
+from pymongo.collection import Collection
+
+from app.contexts.core.config.setting import settings
+
+
+def coalesce_types() -> Set[str]:
+    return {t.strip() for t in (settings.NOTIFICATION_COALESCE_TYPES or "").split(",") if t.strip()}
+
+
+def is_coalesced_type(type: Optional[str]) -> bool:
+    return settings.NOTIFICATION_COALESCE_WINDOW_SECONDS > 0 and str(type) in coalesce_types()
+
+
+def group_key(doc: dict) -> str:
+    """User-independent part of the key; lets a room broadcast be matched client-side."""
+    data = doc.get("data") or {}
+    return f"{doc.get('type')}|{doc.get('entity_type') or ''}|{data.get('class_id') or ''}"
+
+
+class NotificationCoalescer:
+    """
+    Merges notifications keyed by (user, type, entity_type, class_id) inside a window
+    (NOTIFICATION_COALESCE_WINDOW_SECONDS, counted from the first event).
+
+    - same key inside one batch -> one document with item_count = n (latest content wins)
+    - an unread document with the same key whose window is still open -> updated in place
+      ($inc item_count) instead of inserting a new one
+
+    Outbox retries stay idempotent: every merged dedupe_key is recorded in merged_keys
+    and a key that is already there is not counted again.
+    """
+
+    def __init__(self, col: Collection):
+        self.col = col
+
+    @staticmethod
+    def key_for(doc: dict) -> Optional[str]:
+        if not is_coalesced_type(doc.get("type")):
+            return None
+        return f"{doc['user_id']}|{group_key(doc)}"
+
+    def apply(self, docs: List[dict], now: dt.datetime) -> Tuple[List[dict], List[dict]]:
+        """Returns (documents to insert, documents updated in place)."""
+        passthrough: List[dict] = []
+        groups: Dict[str, List[dict]] = {}
+        for doc in docs:
+            key = self.key_for(doc)
+            if key is None:
+                passthrough.append(doc)
+            else:
+                groups.setdefault(key, []).append(doc)
+        if not groups:
+            return docs, []
+
+        open_docs = {
+            d["coalesce_key"]: d
+            for d in self.col.find(
+                {"coalesce_key": {"$in": list(groups)}, "read_at": None, "coalesce_until": {"$gt": now}},
+                {"coalesce_key": 1, "merged_keys": 1},
+            )
+        }
+
+        token = uuid.uuid4().hex
+        ops, ids = [], []
+        for key, items in list(groups.items()):
+            current = open_docs.get(key)
+            if current is None:
+                continue
+            merged = set(current.get("merged_keys") or [])
+            items = [d for d in items if not d.get("dedupe_key") or d["dedupe_key"] not in merged]
+            if not items:
+                # a retried batch that was already merged
+                del groups[key]
+                continue
+            groups[key] = items
+            latest = items[-1]
+            keys = [d["dedupe_key"] for d in items if d.get("dedupe_key")]
+            ids.append(current["_id"])
+            ops.append(
+                UpdateOne(
+                    {"_id": current["_id"], "read_at": None},
+                    {
+                        "$inc": {"item_count": len(items)},
+                        "$set": {
+                            "title": latest["title"],
+                            "message": latest.get("message"),
+                            "entity_id": latest.get("entity_id"),
+                            "data": latest.get("data") or {},
+                            "updated_at": now,
+                            "coalesce_token": token,
+                        },
+                        "$addToSet": {"merged_keys": {"$each": keys}},
+                    },
+                )
+            )
+
+        updated: List[dict] = []
+        if ops:
+            self.col.bulk_write(ops, ordered=False)
+            # read in between -> the update did not match; those groups get a fresh document
+            updated = list(self.col.find({"_id": {"$in": ids}, "coalesce_token": token}))
+
+        done = {d["coalesce_key"] for d in updated}
+        to_insert = list(passthrough)
+        for key, items in groups.items():
+            if key in done:
+                continue
+            doc = dict(items[-1])
+            first_key = next((d["dedupe_key"] for d in items if d.get("dedupe_key")), None)
+            if first_key:
+                doc["dedupe_key"] = first_key
+            doc.update(
+                coalesce_key=key,
+                coalesce_until=now + dt.timedelta(seconds=settings.NOTIFICATION_COALESCE_WINDOW_SECONDS),
+                item_count=len(items),
+                merged_keys=[d["dedupe_key"] for d in items if d.get("dedupe_key")],
+            )
+            to_insert.append(doc)
+        return to_insert, updated
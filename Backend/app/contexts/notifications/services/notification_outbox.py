@@ -0,0 +1,124 @@
+import datetime as dt
+import threading
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from bson import ObjectId
+from pymongo.database import Database
+from pymongo.errors import DuplicateKeyError
+
+from app.contexts.core.config.setting import settings
+from app.contexts.notifications.services.notification_coalescer import is_coalesced_type
+from app.contexts.notifications.utils.normalize import normalize_value
+
+OUTBOX_COLLECTION = "notification_outbox"
+
+
+class OutboxStatus:
+    PENDING = "pending"
+    PROCESSING = "processing"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class RecipientKind:
+    USER = "user"        # IAM user ids (socket room ids)
+    STUDENT = "student"  # student ids -> resolved via students collection
+    STAFF = "staff"      # staff ids or IAM user ids (best effort)
+
+    @classmethod
+    def all(cls) -> set[str]:
+        return {cls.USER, cls.STUDENT, cls.STAFF}
+
+
+# Wakes the in-process dispatcher as soon as something is enqueued,
+# so the poll interval only matters for events written by other workers.
+_wake = threading.Event()
+
+
+def wake_dispatcher() -> None:
+    _wake.set()
+
+
+def wait_for_work(timeout: float) -> bool:
+    woke = _wake.wait(timeout)
+    _wake.clear()
+    return woke
+
+
+class NotificationOutbox:
+    """
+    Write side of the notification pipeline.
+
+    Request handlers append one compact event (recipient ids, not resolved users)
+    and return; NotificationOutboxDispatcher resolves, persists and emits later.
+    """
+
+    def __init__(self, db: Database):
+        self.col = db[OUTBOX_COLLECTION]
+
+    def enqueue(
+        self,
+        *,
+        recipient_kind: str,
+        recipient_ids: Iterable[Union[str, ObjectId, None]],
+        role: str,
+        type: str,
+        title: str,
+        message: Optional[str] = None,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        data: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        room: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Returns the outbox event id, or None when there is nobody to notify
+        or an event with the same idempotency_key was already enqueued.
+
+        `room`: every recipient is in this Socket.IO room (e.g. class:<id>), so the
+        dispatcher emits once to the room instead of once per user.
+        """
+        if recipient_kind not in RecipientKind.all():
+            raise ValueError(f"Unknown recipient kind: {recipient_kind}")
+
+        ids: List[str] = []
+        seen = set()
+        for v in recipient_ids:
+            key = str(v) if v else ""
+            if key and key not in seen:
+                seen.add(key)
+                ids.append(key)
+        if not ids:
+            return None
+
+        now = dt.datetime.utcnow()
+        available_at = now
+        if is_coalesced_type(type):
+            # debounce: later edits of the same burst join this dispatcher batch and are merged
+            available_at = now + dt.timedelta(seconds=settings.NOTIFICATION_COALESCE_DELAY_SECONDS)
+        doc = {
+            "idempotency_key": str(idempotency_key) if idempotency_key else uuid.uuid4().hex,
+            "recipient_kind": recipient_kind,
+            "recipient_ids": ids,
+            "role": str(role),
+            "type": str(type),
+            "title": str(title),
+            "message": message,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "data": normalize_value(data or {}),
+            "room": room,
+            "status": OutboxStatus.PENDING,
+            "attempts": 0,
+            "available_at": available_at,
+            "created_at": now,
+        }
+
+        try:
+            res = self.col.insert_one(doc)
+        except DuplicateKeyError:
+            return None
+
+        wake_dispatcher()
+        return str(res.inserted_id)
@@ -1,11 +1,18 @@
 import datetime as dt
-from typing import Any, Dict, Optional
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 from pymongo.database import Database
+from pymongo.errors import BulkWriteError
 
-from app.contexts.notifications.realtime.emitter import emit_notification
+from app.contexts.notifications.realtime.emitter import UPDATED_EVENT_NAME, emit_notification, emit_notifications
 from app.contexts.notifications.read_models.notification_read_model import NotificationReadModel
+from app.contexts.notifications.services.notification_coalescer import NotificationCoalescer, group_key
+from app.contexts.notifications.services.telegram_delivery import TelegramDeliveryQueue
+from app.contexts.notifications.services.unread_counter import UnreadCounterStore
 from app.contexts.notifications.utils.normalize import normalize_value
 
+logger = logging.getLogger(__name__)
+
 
 def _iso(v):
     if v is None:
@@ -21,22 +28,24 @@ class NotificationService:
         self.db = db
         self.col = db["notifications"]
         self.read_model = NotificationReadModel(db)
+        self.unread = UnreadCounterStore(db)
+        self.coalescer = NotificationCoalescer(self.col)
+        self.telegram = TelegramDeliveryQueue(db)
 
-    def create_for_user(
+    def _build_doc(
         self,
         *,
         user_id: str,
         role: str,
         type: str,
         title: str,
-        message: Optional[str] = None,
-        entity_type: Optional[str] = None,
-        entity_id: Optional[str] = None,
-        data: Optional[Dict[str, Any]] = None,
+        message: Optional[str],
+        entity_type: Optional[str],
+        entity_id: Optional[str],
+        safe_data: Dict[str, Any],
+        created_at: dt.datetime,
     ) -> dict:
-        safe_data = normalize_value(data or {})
-
-        doc = {
+        return {
             "user_id": str(user_id),
             "role": str(role),
             "type": str(type),
@@ -44,18 +53,198 @@ class NotificationService:
             "message": message,
             "entity_type": entity_type,
             "entity_id": entity_id,
-            "data": safe_data,
+            "data": dict(safe_data),
             "read_at": None,
-            "created_at": dt.datetime.utcnow(),
+            "created_at": created_at,
         }
 
+    def create_for_user(
+        self,
+        *,
+        user_id: str,
+        role: str,
+        type: str,
+        title: str,
+        message: Optional[str] = None,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> dict:
+        doc = self._build_doc(
+            user_id=user_id,
+            role=role,
+            type=type,
+            title=title,
+            message=message,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            safe_data=normalize_value(data or {}),
+            created_at=dt.datetime.utcnow(),
+        )
+
         res = self.col.insert_one(doc)
         doc["_id"] = res.inserted_id
 
-        emit_notification(str(user_id), self._to_socket_payload(doc))
+        emit_notification(str(user_id), self.to_socket_payload(doc))
+        self._after_insert([doc])
         return doc
 
-    def _to_socket_payload(self, doc: dict) -> dict:
+    def create_for_users(
+        self,
+        *,
+        user_ids: Iterable[str],
+        role: str,
+        type: str,
+        title: str,
+        message: Optional[str] = None,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> List[dict]:
+        """
+        Fan-out of the same notification to many users.
+        - one insert_many(ordered=False) instead of one insert_one per user
+        - duplicate / empty user ids are dropped (first occurrence wins)
+        - only documents that were actually written are emitted
+        """
+        seen = set()
+        uids: List[str] = []
+        for uid in user_ids:
+            key = str(uid) if uid else ""
+            if key and key not in seen:
+                seen.add(key)
+                uids.append(key)
+        if not uids:
+            return []
+
+        shared = data or {}
+        return self.create_many(
+            {
+                "user_id": uid,
+                "role": role,
+                "type": type,
+                "title": title,
+                "message": message,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "data": shared,
+            }
+            for uid in uids
+        )
+
+    def create_many(self, items: Iterable[Dict[str, Any]], *, emit: bool = True) -> List[dict]:
+        """
+        Persist + emit already-resolved notifications with one insert_many(ordered=False).
+
+        Each item takes the create_for_user keyword arguments plus an optional
+        `dedupe_key`; the unique index on it lets a retried batch skip rows that
+        were already written instead of duplicating them. emit=False leaves the
+        socket emit to the caller (e.g. one room broadcast instead of per-user emits).
+
+        Coalesced types (NOTIFICATION_COALESCE_TYPES) are merged per user/type/class:
+        the result then also holds unread notifications that were updated in place
+        (see is_update); those are emitted as notification:updated and not re-counted.
+        """
+        now = dt.datetime.utcnow()
+        docs: List[dict] = []
+        # fan-out items share one data dict: normalize it once (raw kept alive so ids stay unique)
+        normalized: Dict[int, tuple] = {}
+        for item in items:
+            raw = item.get("data") or {}
+            if id(raw) not in normalized:
+                normalized[id(raw)] = (raw, normalize_value(raw))
+            doc = self._build_doc(
+                user_id=item["user_id"],
+                role=item["role"],
+                type=item["type"],
+                title=item["title"],
+                message=item.get("message"),
+                entity_type=item.get("entity_type"),
+                entity_id=item.get("entity_id"),
+                safe_data=normalized[id(raw)][1],
+                created_at=now,
+            )
+            if item.get("dedupe_key"):
+                doc["dedupe_key"] = str(item["dedupe_key"])
+            docs.append(doc)
+        if not docs:
+            return []
+
+        docs, updated = self.coalescer.apply(docs, now)
+        if docs:
+            try:
+                res = self.col.insert_many(docs, ordered=False)
+                for doc, _id in zip(docs, res.inserted_ids):
+                    doc["_id"] = _id
+            except BulkWriteError as e:
+                write_errors = (e.details or {}).get("writeErrors", [])
+                # only duplicates (an already-written dedupe_key) are expected here
+                if any(err.get("code") != 11000 for err in write_errors):
+                    raise
+                # ordered=False: everything except the failed indexes was written
+                failed = {err.get("index") for err in write_errors}
+                docs = [doc for i, doc in enumerate(docs) if i not in failed and doc.get("_id") is not None]
+
+        if emit:
+            emit_notifications((doc["user_id"], self.to_socket_payload(doc)) for doc in docs)
+            if updated:
+                emit_notifications([(doc["user_id"], self.to_socket_payload(doc)) for doc in updated], UPDATED_EVENT_NAME)
+        self._after_insert(docs, push=emit)
+        return docs + updated
+
+    @staticmethod
+    def is_update(doc: dict) -> bool:
+        """True for a coalesced notification that create_many updated instead of inserting."""
+        return "coalesce_token" in doc
+
+    def _after_insert(self, docs: List[dict], *, push: bool = True) -> None:
+        # the notifications are already written: a counter or channel failure must not fail
+        # delivery (the reconciliation job repairs counter drift)
+        try:
+            self.unread.increment_for(docs, push=push)
+        except Exception:
+            logger.exception("Unread counter update failed for %s notification(s)", len(docs))
+        try:
+            self.telegram.enqueue_for(docs)
+        except Exception:
+            logger.exception("Telegram delivery enqueue failed for %s notification(s)", len(docs))
+
+    # -----------------------------
+    # Read state
+    # -----------------------------
+
+    def unread_counts(self, *, user_id: str, type: Optional[str] = None) -> Dict[str, Any]:
+        counts = self.unread.get(str(user_id))
+        if type:
+            n = counts["by_type"].get(str(type), 0)
+            return {"total": n, "by_type": {str(type): n}}
+        return counts
+
+    def mark_read(self, *, user_id: str, notification_id: str) -> int:
+        doc = self.read_model.mark_read(user_id=user_id, notification_id=notification_id)
+        if doc is None:
+            return 0
+        self.unread.decrement(str(user_id), {str(doc.get("type")): 1})
+        return 1
+
+    def mark_all_read(self, *, user_id: str, type: Optional[Union[str, Sequence[str]]] = None) -> int:
+        """
+        One update_many per unread type, so each counter is decremented by exactly
+        what that update modified (a notification arriving meanwhile stays counted).
+        """
+        if type:
+            types = [str(type)] if isinstance(type, str) else [str(t) for t in type]
+        else:
+            types = self.read_model.unread_types(user_id=user_id)
+
+        modified: Dict[str, int] = {}
+        for t in types:
+            modified[t] = self.read_model.mark_all_read(user_id=user_id, type=t)
+
+        self.unread.decrement(str(user_id), modified)
+        return sum(modified.values())
+
+    def to_socket_payload(self, doc: dict) -> dict:
         return {
             "id": str(doc.get("_id")),
             "user_id": str(doc.get("user_id")),
@@ -66,6 +255,9 @@ class NotificationService:
             "entity_type": doc.get("entity_type"),
             "entity_id": doc.get("entity_id"),
             "data": normalize_value(doc.get("data") or {}),
+            "item_count": int(doc.get("item_count") or 1),
+            "group_key": group_key(doc) if doc.get("coalesce_key") else None,
             "read_at": _iso(doc.get("read_at")),
             "created_at": _iso(doc.get("created_at")),
+            "updated_at": _iso(doc.get("updated_at")),
         }
\ No newline at end of file
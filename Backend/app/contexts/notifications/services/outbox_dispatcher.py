@@ -0,0 +1,276 @@
+import datetime as dt
+import logging
+import uuid
+from typing import Any, Dict, List, Optional
+
+from pymongo import UpdateOne
+from pymongo.database import Database
+
+from app.contexts.core.config.setting import settings
+from app.contexts.notifications.realtime.emitter import (
+    EVENT_NAME,
+    UPDATED_EVENT_NAME,
+    emit_notifications,
+    emit_to_room,
+)
+from app.contexts.notifications.services.notification_outbox import (
+    OUTBOX_COLLECTION,
+    OutboxStatus,
+    RecipientKind,
+    wait_for_work,
+)
+from app.contexts.notifications.services.notification_service import NotificationService
+from app.contexts.notifications.utils.recipient_resolver import NotificationRecipientResolver
+
+logger = logging.getLogger(__name__)
+
+MAX_BACKOFF_SECONDS = 300
+
+
+class NotificationOutboxDispatcher:
+    """
+    Drains `notification_outbox` in batches:
+
+    1) claim up to batch_size due events (lease, so a crashed worker's batch is picked up again)
+    2) resolve every recipient of the batch with one query per recipient kind
+    3) persist all notifications with one insert_many (dedupe_key = idempotency_key:user_id)
+    4) emit, then mark the events done
+
+    A failed batch is retried with exponential backoff up to max_attempts, then parked as `failed`.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        *,
+        batch_size: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        lease_seconds: Optional[int] = None,
+        notification_service: Optional[NotificationService] = None,
+        resolver: Optional[NotificationRecipientResolver] = None,
+    ):
+        self.col = db[OUTBOX_COLLECTION]
+        self.batch_size = batch_size or settings.NOTIFICATION_OUTBOX_BATCH_SIZE
+        self.max_attempts = max_attempts or settings.NOTIFICATION_OUTBOX_MAX_ATTEMPTS
+        self.lease_seconds = lease_seconds or settings.NOTIFICATION_OUTBOX_LEASE_SECONDS
+        self.notification_service = notification_service or NotificationService(db)
+        self.resolver = resolver or NotificationRecipientResolver(db)
+        self._stopped = False
+
+    # -----------------------------
+    # Claim / complete / retry
+    # -----------------------------
+
+    @staticmethod
+    def _due(now: dt.datetime) -> dict:
+        return {
+            "$or": [
+                {"status": OutboxStatus.PENDING, "available_at": {"$lte": now}},
+                {"status": OutboxStatus.PROCESSING, "locked_until": {"$lt": now}},
+            ]
+        }
+
+    def _claim(self) -> List[dict]:
+        now = dt.datetime.utcnow()
+        due = self._due(now)
+        ids = [d["_id"] for d in self.col.find(due, {"_id": 1}).sort("available_at", 1).limit(self.batch_size)]
+        if not ids:
+            return []
+
+        token = uuid.uuid4().hex
+        self.col.update_many(
+            {"$and": [{"_id": {"$in": ids}}, due]},
+            {
+                "$set": {
+                    "status": OutboxStatus.PROCESSING,
+                    "claim": token,
+                    "locked_until": now + dt.timedelta(seconds=self.lease_seconds),
+                }
+            },
+        )
+        return list(self.col.find({"claim": token, "status": OutboxStatus.PROCESSING}))
+
+    def _complete(self, events: List[dict], delivered: int) -> None:
+        self.col.update_many(
+            {"_id": {"$in": [e["_id"] for e in events]}},
+            {
+                "$set": {"status": OutboxStatus.DONE, "processed_at": dt.datetime.utcnow()},
+                "$unset": {"claim": "", "locked_until": ""},
+            },
+        )
+        logger.debug("Notification outbox: %s event(s) -> %s notification(s)", len(events), delivered)
+
+    def _retry(self, events: List[dict], error: Exception) -> None:
+        now = dt.datetime.utcnow()
+        ops = []
+        for e in events:
+            attempts = int(e.get("attempts") or 0) + 1
+            update: Dict[str, Any] = {"attempts": attempts, "last_error": str(error)[:500]}
+            if attempts >= self.max_attempts:
+                update.update(status=OutboxStatus.FAILED, processed_at=now)
+            else:
+                delay = min(2 ** attempts, MAX_BACKOFF_SECONDS)
+                update.update(status=OutboxStatus.PENDING, available_at=now + dt.timedelta(seconds=delay))
+            ops.append(UpdateOne({"_id": e["_id"]}, {"$set": update, "$unset": {"claim": "", "locked_until": ""}}))
+        self.col.bulk_write(ops, ordered=False)
+        logger.warning("Notification outbox batch of %s failed: %s", len(events), error)
+
+    # -----------------------------
+    # Resolve + persist
+    # -----------------------------
+
+    def _resolve(self, events: List[dict]) -> Dict[Any, List[str]]:
+        by_kind: Dict[str, List[str]] = {RecipientKind.STUDENT: [], RecipientKind.STAFF: []}
+        for e in events:
+            if e.get("recipient_kind") in by_kind:
+                by_kind[e["recipient_kind"]].extend(e.get("recipient_ids") or [])
+
+        mapping = {
+            RecipientKind.STUDENT: self.resolver.students_to_user_ids(by_kind[RecipientKind.STUDENT]),
+            RecipientKind.STAFF: self.resolver.best_effort_user_ids(by_kind[RecipientKind.STAFF]),
+        }
+
+        out: Dict[Any, List[str]] = {}
+        for e in events:
+            ids = e.get("recipient_ids") or []
+            kind = e.get("recipient_kind")
+            if kind == RecipientKind.USER:
+                out[e["_id"]] = list(ids)
+            else:
+                m = mapping.get(kind) or {}
+                out[e["_id"]] = [m[i] for i in ids if i in m]
+        return out
+
+    def process(self, events: List[dict]) -> int:
+        recipients = self._resolve(events)
+        items: List[dict] = []
+        keys_by_event: Dict[Any, List[str]] = {}
+        for e in events:
+            keys = keys_by_event.setdefault(e["_id"], [])
+            for uid in recipients.get(e["_id"], []):
+                key = f"{e['idempotency_key']}:{uid}"
+                if key in keys:
+                    continue
+                keys.append(key)
+                items.append(
+                    {
+                        "user_id": uid,
+                        "role": e.get("role"),
+                        "type": e.get("type"),
+                        "title": e.get("title"),
+                        "message": e.get("message"),
+                        "entity_type": e.get("entity_type"),
+                        "entity_id": e.get("entity_id"),
+                        "data": e.get("data"),
+                        "dedupe_key": key,
+                    }
+                )
+
+        docs = self.notification_service.create_many(items, emit=False)
+        self._emit(events, docs, keys_by_event)
+        return len(docs)
+
+    def _emit(self, events: List[dict], docs: List[dict], keys_by_event: Dict[Any, List[str]]) -> None:
+        # a coalesced document stands for every dedupe key merged into it
+        by_key: Dict[str, dict] = {}
+        for d in docs:
+            for k in d.get("merged_keys") or [d.get("dedupe_key")]:
+                by_key[k] = d
+
+        svc = self.notification_service
+        per_user: Dict[str, list] = {EVENT_NAME: [], UPDATED_EVENT_NAME: []}
+        sent = set()
+        for e in events:
+            written = [by_key[k] for k in keys_by_event.get(e["_id"], []) if k in by_key]
+            written = [d for d in written if id(d) not in sent]
+            if not written:
+                continue
+            sent.update(id(d) for d in written)
+            kinds = {UPDATED_EVENT_NAME if svc.is_update(d) else EVENT_NAME for d in written}
+            # one room emit only when every member gets the same event; a mix of
+            # inserted and coalesced documents needs a per-user event each
+            if e.get("room") and len(kinds) == 1:
+                emit_to_room(e["room"], self._room_payload(e, written[0]), kinds.pop())
+                continue
+            for d in written:
+                kind = UPDATED_EVENT_NAME if svc.is_update(d) else EVENT_NAME
+                per_user[kind].append((d["user_id"], svc.to_socket_payload(d)))
+        for event, items in per_user.items():
+            if items:
+                emit_notifications(items, event)
+
+        # room members re-fetch their count on the room event; only per-user
+        # recipients get it pushed (create_many ran with emit=False)
+        pushed = {uid for items in per_user.values() for uid, _ in items}
+        if pushed:
+            try:
+                svc.unread.push(sorted(pushed))
+            except Exception:
+                logger.exception("Unread count push failed for %s user(s)", len(pushed))
+
+    def _room_payload(self, event: dict, sample: dict) -> dict:
+        # shared fields only: clients see `room` without an id and re-fetch their own
+        # copy (new) or match it by group_key (updated)
+        payload = self.notification_service.to_socket_payload(sample)
+        payload.update(id=None, user_id=None, room=event["room"])
+        return payload
+
+    # -----------------------------
+    # Loop / flush
+    # -----------------------------
+
+    def dispatch_once(self) -> int:
+        """Process one batch; returns how many outbox events were claimed."""
+        events = self._claim()
+        if not events:
+            return 0
+        try:
+            delivered = self.process(events)
+        except Exception as e:
+            self._retry(events, e)
+        else:
+            self._complete(events, delivered)
+        return len(events)
+
+    def drain(self, max_batches: Optional[int] = None) -> int:
+        """
+        Flush everything that is due right now (used by tests and scripts).
+        Events pushed back for retry are not due yet, so this always terminates.
+        """
+        total = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            handled = self.dispatch_once()
+            if not handled:
+                break
+            total += handled
+            batches += 1
+        return total
+
+    def run_forever(self, poll_seconds: Optional[float] = None) -> None:
+        poll = poll_seconds or settings.NOTIFICATION_OUTBOX_POLL_SECONDS
+        while not self._stopped:
+            try:
+                self.drain()
+            except Exception:
+                logger.exception("Notification outbox dispatcher crashed; retrying")
+            wait_for_work(poll)
+
+    def stop(self) -> None:
+        self._stopped = True
+
+
+_dispatcher: Optional[NotificationOutboxDispatcher] = None
+
+
+def start_outbox_dispatcher(db: Database) -> Optional[NotificationOutboxDispatcher]:
+    """Start one background dispatcher per process (eventlet green thread via Socket.IO)."""
+    global _dispatcher
+    if _dispatcher is not None or not settings.NOTIFICATION_OUTBOX_WORKER:
+        return _dispatcher
+
+    from app.contexts.infra.realtime.socketio_ext import socketio
+
+    _dispatcher = NotificationOutboxDispatcher(db)
+    socketio.start_background_task(_dispatcher.run_forever)
+    return _dispatcher
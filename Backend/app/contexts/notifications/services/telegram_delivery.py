@@ -0,0 +1,422 @@
+import datetime as dt
+import hashlib
+import logging
+import secrets
+import threading
+import uuid
+from typing import Any, Dict, Iterable, List, Optional
+
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.database import Database
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from app.contexts.core.config.setting import settings
+from app.contexts.infra.telegram.client import SendResult, TelegramClient
+from app.contexts.infra.telegram.rate_limit import TelegramRateLimiter
+
+logger = logging.getLogger(__name__)
+
+DELIVERY_COLLECTION = "notification_deliveries"
+TELEGRAM_LINK_COLLECTION = "notification_telegram_links"
+TELEGRAM_LINK_TOKEN_COLLECTION = "notification_telegram_link_tokens"
+SENDER_LEASE_COLLECTION = "notification_sender_leases"
+TELEGRAM_SENDER_LEASE_ID = "telegram"
+CHANNEL_TELEGRAM = "telegram"
+
+MAX_MESSAGE_CHARS = 4096
+MAX_BACKOFF_SECONDS = 300
+
+
+class DeliveryStatus:
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+def telegram_enabled() -> bool:
+    return bool(settings.TELEGRAM_BOT_TOKEN) and settings.NOTIFICATION_TELEGRAM_ENABLED
+
+
+_wake = threading.Event()
+
+
+def wake_sender() -> None:
+    _wake.set()
+
+
+def wait_for_deliveries(timeout: float) -> bool:
+    woke = _wake.wait(timeout)
+    _wake.clear()
+    return woke
+
+
+def _token_hash(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class TelegramLinks:
+    """
+    user_id <-> Telegram chat_id.
+
+    The chat_id is never taken from the client: the settings page asks for a
+    one-time link token, the user sends `/start <token>` to the bot, and the
+    bot update (webhook) binds the chat it came from to the token's user.
+    """
+
+    def __init__(self, db: Database):
+        self.col = db[TELEGRAM_LINK_COLLECTION]
+        self.tokens = db[TELEGRAM_LINK_TOKEN_COLLECTION]
+
+    def get(self, user_id: str) -> Optional[dict]:
+        return self.col.find_one({"user_id": str(user_id)}, {"_id": 0})
+
+    def issue_token(self, user_id: str) -> dict:
+        """New one-time token for `/start <token>`; replaces any earlier one. Only its hash is stored."""
+        token = secrets.token_urlsafe(24)
+        expires_at = dt.datetime.utcnow() + dt.timedelta(seconds=settings.TELEGRAM_LINK_TOKEN_SECONDS)
+        self.tokens.delete_many({"user_id": str(user_id)})
+        self.tokens.insert_one({"_id": _token_hash(token), "user_id": str(user_id), "expires_at": expires_at})
+
+        bot = settings.TELEGRAM_BOT_USERNAME
+        return {
+            "token": token,
+            "expires_at": expires_at,
+            "command": f"/start {token}",
+            "url": f"https://t.me/{bot}?start={token}" if bot else None,
+        }
+
+    def redeem(self, token: str, chat_id: str) -> Optional[dict]:
+        """Consume a link token and bind chat_id to its user; None for an unknown or expired token."""
+        doc = self.tokens.find_one_and_delete(
+            {"_id": _token_hash(token), "expires_at": {"$gt": dt.datetime.utcnow()}}
+        )
+        if doc is None:
+            return None
+        return self.link(doc["user_id"], chat_id)
+
+    def handle_update(self, update: dict) -> Optional[dict]:
+        """Bot update -> link, for a `/start <token>` message in a private chat; anything else is ignored."""
+        message = update.get("message") or {}
+        chat = message.get("chat") or {}
+        parts = str(message.get("text") or "").split()
+        if chat.get("type") != "private" or chat.get("id") is None:
+            return None
+        if len(parts) != 2 or parts[0].split("@")[0] != "/start":
+            return None
+        return self.redeem(parts[1], str(chat["id"]))
+
+    def link(self, user_id: str, chat_id: str) -> dict:
+        now = dt.datetime.utcnow()
+        self.col.update_one(
+            {"user_id": str(user_id)},
+            {
+                "$set": {"chat_id": str(chat_id), "enabled": True, "linked_at": now},
+                "$unset": {"disabled_reason": ""},
+            },
+            upsert=True,
+        )
+        return {"user_id": str(user_id), "chat_id": str(chat_id), "enabled": True}
+
+    def unlink(self, user_id: str) -> int:
+        return int(self.col.delete_one({"user_id": str(user_id)}).deleted_count)
+
+    def chats_for(self, user_ids: Iterable[str]) -> Dict[str, str]:
+        uids = list({str(u) for u in user_ids if u})
+        if not uids:
+            return {}
+        cur = self.col.find({"user_id": {"$in": uids}, "enabled": True}, {"user_id": 1, "chat_id": 1})
+        return {d["user_id"]: d["chat_id"] for d in cur}
+
+    def disable_chat(self, chat_id: str, reason: str) -> None:
+        self.col.update_many(
+            {"chat_id": str(chat_id)},
+            {"$set": {"enabled": False, "disabled_reason": reason[:200]}},
+        )
+
+
+def format_message(doc: dict) -> str:
+    title = str(doc.get("title") or "")
+    count = int(doc.get("item_count") or 1)
+    if count > 1:
+        title = f"{title} ({count})"
+    message = doc.get("message")
+    return f"{title}\n{message}" if message else title
+
+
+class TelegramDeliveryQueue:
+    """
+    Request / dispatcher side: one delivery row per (notification, linked chat).
+    Only a Mongo insert happens here; the HTTP call is made by TelegramDeliverySender.
+    """
+
+    def __init__(self, db: Database):
+        self.col = db[DELIVERY_COLLECTION]
+        self.links = TelegramLinks(db)
+
+    def enqueue_for(self, docs: List[dict]) -> int:
+        if not docs or not telegram_enabled():
+            return 0
+        chats = self.links.chats_for(d["user_id"] for d in docs)
+        if not chats:
+            return 0
+
+        now = dt.datetime.utcnow()
+        rows = [
+            {
+                "notification_id": d["_id"],
+                "channel": CHANNEL_TELEGRAM,
+                "user_id": str(d["user_id"]),
+                "chat_id": chats[str(d["user_id"])],
+                "text": format_message(d),
+                "status": DeliveryStatus.PENDING,
+                "attempts": 0,
+                "available_at": now,
+                "created_at": now,
+            }
+            for d in docs
+            if str(d["user_id"]) in chats and d.get("_id") is not None
+        ]
+        if not rows:
+            return 0
+
+        try:
+            self.col.insert_many(rows, ordered=False)
+            written = len(rows)
+        except BulkWriteError as e:
+            # unique (notification_id, channel): a re-delivered batch is not sent twice
+            written = int((e.details or {}).get("nInserted", 0))
+        wake_sender()
+        return written
+
+
+class SenderLease:
+    """
+    Mongo lease naming the one worker that may send. The rate limiter's buckets
+    live in process memory, so N senders would make N x the allowed rate.
+
+    acquire() takes a free or expired lease, or renews our own; while another
+    worker holds it, the upsert hits the unique _id and we stay idle.
+    """
+
+    def __init__(self, db: Database, lease_id: str, *, ttl_seconds: int, owner: Optional[str] = None):
+        self.col = db[SENDER_LEASE_COLLECTION]
+        self.lease_id = lease_id
+        self.ttl_seconds = ttl_seconds
+        self.owner = owner or uuid.uuid4().hex
+
+    def acquire(self) -> bool:
+        now = dt.datetime.utcnow()
+        try:
+            doc = self.col.find_one_and_update(
+                {"_id": self.lease_id, "$or": [{"owner": self.owner}, {"expires_at": {"$lt": now}}]},
+                {"$set": {"owner": self.owner, "expires_at": now + dt.timedelta(seconds=self.ttl_seconds)}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            return False
+        return bool(doc) and doc.get("owner") == self.owner
+
+
+class TelegramDeliverySender:
+    """
+    Background sender for `notification_deliveries`:
+
+    1) claim up to batch_size due rows (lease, like the notification outbox)
+    2) group them per chat and join up to max_per_message texts into one message
+    3) wait on the global + per-chat token buckets, then sendMessage
+    4) sent -> done; 429 -> retry after Telegram's retry_after; 5xx/network ->
+       exponential backoff up to max_attempts; blocked bot / unknown chat -> failed
+       and the link is disabled
+
+    Each message's outcome is written as soon as it is sent, so a crash or an
+    expired lease mid-batch never re-sends what already went out. Only the
+    holder of the SenderLease sends (run_forever).
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        *,
+        client: Optional[TelegramClient] = None,
+        limiter: Optional[TelegramRateLimiter] = None,
+        lease: Optional[SenderLease] = None,
+        batch_size: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        lease_seconds: Optional[int] = None,
+        max_per_message: int = 10,
+    ):
+        self.col = db[DELIVERY_COLLECTION]
+        self.links = TelegramLinks(db)
+        self.client = client or TelegramClient(settings.TELEGRAM_BOT_TOKEN or "", base_url=settings.TELEGRAM_API_BASE_URL)
+        self.limiter = limiter or TelegramRateLimiter(
+            global_rate=settings.TELEGRAM_GLOBAL_RATE_PER_SECOND,
+            chat_rate=settings.TELEGRAM_CHAT_RATE_PER_SECOND,
+        )
+        self.batch_size = batch_size or settings.TELEGRAM_SENDER_BATCH_SIZE
+        self.max_attempts = max_attempts or settings.TELEGRAM_SENDER_MAX_ATTEMPTS
+        self.lease_seconds = lease_seconds or settings.TELEGRAM_SENDER_LEASE_SECONDS
+        self.max_per_message = max_per_message
+        self.lease = lease
+        self._stopped = False
+
+    # -----------------------------
+    # Claim
+    # -----------------------------
+
+    @staticmethod
+    def _due(now: dt.datetime) -> dict:
+        return {
+            "$or": [
+                {"status": DeliveryStatus.PENDING, "available_at": {"$lte": now}},
+                {"status": DeliveryStatus.SENDING, "locked_until": {"$lt": now}},
+            ]
+        }
+
+    def _claim(self) -> List[dict]:
+        now = dt.datetime.utcnow()
+        due = self._due(now)
+        ids = [d["_id"] for d in self.col.find(due, {"_id": 1}).sort("available_at", 1).limit(self.batch_size)]
+        if not ids:
+            return []
+
+        token = uuid.uuid4().hex
+        self.col.update_many(
+            {"$and": [{"_id": {"$in": ids}}, due]},
+            {
+                "$set": {
+                    "status": DeliveryStatus.SENDING,
+                    "claim": token,
+                    "locked_until": now + dt.timedelta(seconds=self.lease_seconds),
+                }
+            },
+        )
+        return list(self.col.find({"claim": token, "status": DeliveryStatus.SENDING}).sort("created_at", 1))
+
+    # -----------------------------
+    # Send
+    # -----------------------------
+
+    def _chunks(self, rows: List[dict]) -> List[List[dict]]:
+        chunks: List[List[dict]] = []
+        current: List[dict] = []
+        size = 0
+        for row in rows:
+            length = len(row["text"]) + 2
+            if current and (len(current) >= self.max_per_message or size + length > MAX_MESSAGE_CHARS):
+                chunks.append(current)
+                current, size = [], 0
+            current.append(row)
+            size += length
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _outcome(self, rows: List[dict], result: SendResult, now: dt.datetime) -> List[UpdateOne]:
+        unset = {"claim": "", "locked_until": ""}
+        ops = []
+        for row in rows:
+            attempts = int(row.get("attempts") or 0) + 1
+            if result.ok:
+                update: Dict[str, Any] = {"status": DeliveryStatus.SENT, "sent_at": now, "attempts": attempts}
+            elif result.retryable and attempts < self.max_attempts:
+                delay = result.retry_after if result.retry_after is not None else min(2 ** attempts, MAX_BACKOFF_SECONDS)
+                update = {
+                    "status": DeliveryStatus.PENDING,
+                    "attempts": attempts,
+                    "available_at": now + dt.timedelta(seconds=delay),
+                    "last_error": result.description[:500] or f"HTTP {result.status_code}",
+                }
+            else:
+                update = {
+                    "status": DeliveryStatus.FAILED,
+                    "attempts": attempts,
+                    "failed_at": now,
+                    "last_error": result.description[:500] or f"HTTP {result.status_code}",
+                }
+            ops.append(UpdateOne({"_id": row["_id"]}, {"$set": update, "$unset": unset}))
+        return ops
+
+    def send_batch(self, rows: List[dict]) -> int:
+        """Returns how many deliveries were sent."""
+        by_chat: Dict[str, List[dict]] = {}
+        for row in rows:
+            by_chat.setdefault(str(row["chat_id"]), []).append(row)
+
+        sent = 0
+        for chat_id, chat_rows in by_chat.items():
+            chunks = self._chunks(chat_rows)
+            for i, chunk in enumerate(chunks):
+                self.limiter.acquire(chat_id)
+                result = self.client.send_message(chat_id, "\n\n".join(r["text"] for r in chunk))
+                ops = self._outcome(chunk, result, dt.datetime.utcnow())
+                if result.ok:
+                    sent += len(chunk)
+                elif result.chat_unreachable:
+                    self.links.disable_chat(chat_id, result.description or f"HTTP {result.status_code}")
+                    # the rest of this chat's rows would fail the same way
+                    rest = [r for c in chunks[i + 1:] for r in c]
+                    ops.extend(self._outcome(rest, result, dt.datetime.utcnow()))
+                # persist right away: this message is out, whatever happens to the rest of the batch
+                self.col.bulk_write(ops, ordered=False)
+                if not result.ok and result.chat_unreachable:
+                    break
+        return sent
+
+    # -----------------------------
+    # Loop
+    # -----------------------------
+
+    def dispatch_once(self) -> int:
+        rows = self._claim()
+        if not rows:
+            return 0
+        self.send_batch(rows)
+        return len(rows)
+
+    def drain(self, max_batches: Optional[int] = None) -> int:
+        total = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            # renewed per batch; another worker took over if we lost it
+            if self.lease is not None and not self.lease.acquire():
+                break
+            handled = self.dispatch_once()
+            if not handled:
+                break
+            total += handled
+            batches += 1
+        return total
+
+    def run_forever(self, poll_seconds: Optional[float] = None) -> None:
+        poll = poll_seconds or settings.TELEGRAM_SENDER_POLL_SECONDS
+        while not self._stopped:
+            try:
+                self.drain()
+            except Exception:
+                logger.exception("Telegram sender crashed; retrying")
+            wait_for_deliveries(poll)
+
+    def stop(self) -> None:
+        self._stopped = True
+
+
+_sender: Optional[TelegramDeliverySender] = None
+
+
+def start_telegram_sender(db: Database) -> Optional[TelegramDeliverySender]:
+    """
+    One background sender per process; off unless TELEGRAM_BOT_TOKEN is set.
+    Every worker runs the loop, but only the SenderLease holder sends.
+    """
+    global _sender
+    if _sender is not None or not telegram_enabled() or not settings.TELEGRAM_SENDER_WORKER:
+        return _sender
+
+    from app.contexts.infra.realtime.socketio_ext import socketio
+
+    lease = SenderLease(db, TELEGRAM_SENDER_LEASE_ID, ttl_seconds=settings.TELEGRAM_SENDER_LEASE_SECONDS)
+    _sender = TelegramDeliverySender(db, lease=lease)
+    socketio.start_background_task(_sender.run_forever)
+    return _sender
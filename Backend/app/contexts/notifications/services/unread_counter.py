@@ -0,0 +1,190 @@
+import datetime as dt
+import logging
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.database import Database
+
+from app.contexts.core.config.setting import settings
+from app.contexts.notifications.realtime.emitter import emit_unread_counts
+
+logger = logging.getLogger(__name__)
+
+UNREAD_COLLECTION = "notification_unread_counters"
+RECONCILE_BATCH_SIZE = 500
+
+
+class UnreadCounterStore:
+    """
+    One document per user: {user_id, total, by_type: {<type>: n}, updated_at}.
+
+    Writers keep it in step with `notifications` using $inc only (create +n,
+    mark_read / mark_all_read -n by what was actually modified), so concurrent
+    updates never lose counts. A missing document is rebuilt from
+    `notifications` (on first read, or by the first create for that user) rather
+    than started from 0; reconcile() repairs any drift.
+    """
+
+    def __init__(self, db: Database):
+        self.col = db[UNREAD_COLLECTION]
+        self.notifications = db["notifications"]
+
+    @staticmethod
+    def _view(doc: Optional[dict]) -> Dict[str, Any]:
+        doc = doc or {}
+        by_type = {t: max(0, int(n)) for t, n in (doc.get("by_type") or {}).items() if int(n) > 0}
+        return {"total": max(0, int(doc.get("total") or 0)), "by_type": by_type}
+
+    # -----------------------------
+    # Read
+    # -----------------------------
+
+    def get(self, user_id: str) -> Dict[str, Any]:
+        doc = self.col.find_one({"user_id": str(user_id)})
+        if doc is None:
+            return self.reconcile_users([str(user_id)]).get(str(user_id)) or self._view(None)
+        return self._view(doc)
+
+    # -----------------------------
+    # Write
+    # -----------------------------
+
+    def increment_for(self, docs: Iterable[dict], *, push: bool = True) -> None:
+        """
+        Count freshly inserted (unread) notifications: one bulk update per batch.
+        Users without a counter are seeded by a recount instead, which already sees
+        the inserted notifications (an $inc upsert would start them from 0).
+        push=False leaves the push to the caller (room broadcasts refresh counts client-side).
+        """
+        per_user: Dict[str, Counter] = defaultdict(Counter)
+        for d in docs:
+            per_user[str(d["user_id"])][str(d.get("type"))] += 1
+        if not per_user:
+            return
+
+        uids = list(per_user)
+        counted = {d["user_id"] for d in self.col.find({"user_id": {"$in": uids}}, {"user_id": 1})}
+        self.reconcile_users([uid for uid in uids if uid not in counted])
+
+        now = dt.datetime.utcnow()
+        ops = []
+        for uid in uids:
+            if uid not in counted:
+                continue
+            types = per_user[uid]
+            inc = {f"by_type.{t}": n for t, n in types.items()}
+            inc["total"] = sum(types.values())
+            ops.append(UpdateOne({"user_id": uid}, {"$inc": inc, "$set": {"updated_at": now}}))
+        if ops:
+            self.col.bulk_write(ops, ordered=False)
+
+        if push:
+            self.push(per_user.keys())
+
+    def decrement(self, user_id: str, by_type: Dict[str, int], *, push: bool = True) -> Optional[Dict[str, Any]]:
+        """Subtract notifications that were just marked read (counts from modified_count)."""
+        by_type = {str(t): int(n) for t, n in by_type.items() if n}
+        if not by_type:
+            return None
+
+        inc = {f"by_type.{t}": -n for t, n in by_type.items()}
+        inc["total"] = -sum(by_type.values())
+        doc = self.col.find_one_and_update(
+            {"user_id": str(user_id)},
+            {"$inc": inc, "$set": {"updated_at": dt.datetime.utcnow()}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if doc is None:
+            # never counted yet: the next get() rebuilds it from `notifications`
+            return None
+
+        counts = self._view(doc)
+        if push:
+            emit_unread_counts([(str(user_id), counts)])
+        return counts
+
+    def push(self, user_ids: Iterable[str]) -> None:
+        uids = [str(u) for u in user_ids]
+        if not uids:
+            return
+        docs = self.col.find({"user_id": {"$in": uids}}, {"user_id": 1, "total": 1, "by_type": 1})
+        emit_unread_counts((d["user_id"], self._view(d)) for d in docs)
+
+    # -----------------------------
+    # Reconciliation
+    # -----------------------------
+
+    def reconcile_users(self, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Recount unread notifications of these users (index: user_id, read_at) and overwrite their counters."""
+        if not user_ids:
+            return {}
+
+        # read before the recount: an $inc landing in between changes updated_at
+        seen = {
+            d["user_id"]: d.get("updated_at")
+            for d in self.col.find({"user_id": {"$in": user_ids}}, {"user_id": 1, "updated_at": 1})
+        }
+        counts: Dict[str, Dict[str, Any]] = {uid: {"total": 0, "by_type": {}} for uid in user_ids}
+        pipeline = [
+            {"$match": {"user_id": {"$in": user_ids}, "read_at": None}},
+            {"$group": {"_id": {"user_id": "$user_id", "type": "$type"}, "n": {"$sum": 1}}},
+        ]
+        for row in self.notifications.aggregate(pipeline):
+            c = counts[row["_id"]["user_id"]]
+            c["by_type"][str(row["_id"]["type"])] = int(row["n"])
+            c["total"] += int(row["n"])
+
+        now = dt.datetime.utcnow()
+        ops = []
+        for uid, c in counts.items():
+            values = {"total": c["total"], "by_type": c["by_type"], "updated_at": now}
+            if uid in seen:
+                # a counter that moved during the recount is left for the next run
+                ops.append(UpdateOne({"user_id": uid, "updated_at": seen[uid]}, {"$set": values}))
+            else:
+                # created meanwhile by an $inc: same, do not overwrite it
+                ops.append(UpdateOne({"user_id": uid}, {"$setOnInsert": values}, upsert=True))
+        self.col.bulk_write(ops, ordered=False)
+        return counts
+
+    def reconcile(self, batch_size: int = RECONCILE_BATCH_SIZE) -> int:
+        """
+        Recount every existing counter, batch_size users at a time.
+        Users without a counter are seeded lazily by get(), so they are skipped here.
+        """
+        done = 0
+        last_id = None
+        while True:
+            q = {"_id": {"$gt": last_id}} if last_id is not None else {}
+            batch = list(self.col.find(q, {"user_id": 1}).sort("_id", 1).limit(batch_size))
+            if not batch:
+                break
+            last_id = batch[-1]["_id"]
+            self.reconcile_users([d["user_id"] for d in batch])
+            done += len(batch)
+        return done
+
+
+def run_unread_reconciler(db: Database, interval_seconds: float) -> None:
+    store = UnreadCounterStore(db)
+    while True:
+        time.sleep(interval_seconds)
+        try:
+            n = store.reconcile()
+            logger.info("Unread counters reconciled for %s user(s)", n)
+        except Exception:
+            logger.exception("Unread counter reconciliation failed")
+
+
+def start_unread_reconciler(db: Database) -> bool:
+    """Periodic drift repair; NOTIFICATION_UNREAD_RECONCILE_SECONDS=0 disables it."""
+    interval = settings.NOTIFICATION_UNREAD_RECONCILE_SECONDS
+    if interval <= 0:
+        return False
+
+    from app.contexts.infra.realtime.socketio_ext import socketio
+
+    socketio.start_background_task(run_unread_reconciler, db, interval)
+    return True
@@ -0,0 +1,63 @@
+import datetime as dt
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+
+from app.contexts.notifications.read_models.notification_read_model import NotificationReadModel
+from app.contexts.notifications.utils.cursor import decode_cursor, encode_cursor
+
+
+def _doc(minute):
+    return {"_id": ObjectId(), "user_id": "u1", "type": "A", "created_at": dt.datetime(2026, 1, 1, 8, minute)}
+
+
+@pytest.fixture
+def rm():
+    m = NotificationReadModel(MagicMock())
+    m.col.find.return_value.sort.return_value.limit.side_effect = lambda n: m.rows[:n]
+    return m
+
+
+def test_cursor_round_trip_is_exact():
+    created, oid = dt.datetime(2026, 3, 4, 5, 6, 7, 891000), ObjectId()
+    assert decode_cursor(encode_cursor(created, oid)) == (created, oid)
+    with pytest.raises(ValueError):
+        decode_cursor("garbage")
+
+
+def test_before_pages_older_items_on_created_at_then_id(rm):
+    newest, older, oldest = _doc(3), _doc(2), _doc(1)
+    rm.rows = [newest, older, oldest]
+
+    page = rm.list_page(user_id="u1", limit=2)
+
+    assert [i["id"] for i in page["items"]] == [str(newest["_id"]), str(older["_id"])]
+    assert page["next_cursor"] == encode_cursor(older["created_at"], older["_id"])
+
+    rm.rows = [oldest]
+    page = rm.list_page(user_id="u1", limit=2, before=page["next_cursor"])
+
+    q = rm.col.find.call_args.args[0]
+    assert q["$or"] == [
+        {"created_at": {"$lt": older["created_at"]}},
+        {"created_at": older["created_at"], "_id": {"$lt": older["_id"]}},
+    ]
+    assert rm.col.find.return_value.sort.call_args.args[0] == [("created_at", -1), ("_id", -1)]
+    assert page["next_cursor"] is None
+
+
+def test_after_returns_newer_items_newest_first(rm):
+    anchor, newer, newest = _doc(1), _doc(2), _doc(3)
+    rm.rows = [newer, newest]  # ascending from the cursor
+
+    page = rm.list_page(user_id="u1", limit=5, after=encode_cursor(anchor["created_at"], anchor["_id"]))
+
+    assert rm.col.find.return_value.sort.call_args.args[0] == [("created_at", 1), ("_id", 1)]
+    assert [i["id"] for i in page["items"]] == [str(newest["_id"]), str(newer["_id"])]
+    assert page["prev_cursor"] == encode_cursor(newest["created_at"], newest["_id"])
+
+
+def test_before_and_after_together_are_rejected(rm):
+    with pytest.raises(ValueError):
+        rm.list_page(user_id="u1", before="1_" + "0" * 24, after="1_" + "0" * 24)
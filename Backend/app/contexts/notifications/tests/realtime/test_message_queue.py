@@ -0,0 +1,123 @@
+import threading
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+import redis
+import socketio
+
+from app.contexts.infra.realtime.message_queue import ControlChannel, InMemoryPubSubManager, build_client_manager
+
+
+def _worker(channel):
+    """One Socket.IO "worker" wired to the shared in-memory queue."""
+    server = socketio.Server(async_mode="threading", client_manager=InMemoryPubSubManager(channel=channel))
+    server.manager_initialized = True
+    server.manager.initialize()
+    return server
+
+
+def test_emit_on_one_worker_reaches_room_member_on_another():
+    channel = f"test-{uuid.uuid4().hex}"
+    worker_a, worker_b = _worker(channel), _worker(channel)
+
+    sid = worker_b.manager.connect("eio-1", "/")
+    worker_b.manager.enter_room(sid, "/", "class:c1")
+
+    delivered = threading.Event()
+    packets = []
+
+    def capture(eio_sid, pkt):
+        packets.append((eio_sid, pkt.data))
+        delivered.set()
+
+    worker_b._send_eio_packet = capture
+    try:
+        # worker A has no sockets at all; only the queue can get this to B
+        worker_a.emit("notification:new", {"title": "Schedule updated"}, room="class:c1")
+
+        assert delivered.wait(timeout=5)
+        eio_sid, data = packets[0]
+        assert eio_sid == "eio-1"
+        assert "notification:new" in data and "Schedule updated" in data
+    finally:
+        worker_a.manager.close()
+        worker_b.manager.close()
+
+
+def test_control_channel_reaches_every_worker():
+    url, channel = "memory://", f"test-{uuid.uuid4().hex}"
+    listeners = [ControlChannel(url, channel), ControlChannel(url, channel)]
+    received = [[], []]
+    done = [threading.Event(), threading.Event()]
+
+    for i, listener in enumerate(listeners):
+        ready = threading.Event()
+
+        def handle(message, i=i):
+            received[i].append(message)
+            done[i].set()
+
+        threading.Thread(target=listener.listen, args=(handle, ready), daemon=True).start()
+        assert ready.wait(timeout=5)
+
+    try:
+        ControlChannel(url, channel).publish({"method": "refresh_rooms", "user_ids": ["u1"]})
+
+        assert all(d.wait(timeout=5) for d in done)
+        assert received == [[{"method": "refresh_rooms", "user_ids": ["u1"]}]] * 2
+    finally:
+        for listener in listeners:
+            listener.close()
+
+
+class FakePubSub:
+    def __init__(self, script):
+        self.script = script
+
+    def subscribe(self, channel):
+        if isinstance(self.script, Exception):  # server still down
+            raise self.script
+
+    def listen(self):
+        for item in self.script:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def close(self):
+        pass
+
+
+def test_control_channel_resubscribes_after_redis_drops():
+    waits = []
+    channel = ControlChannel("redis://localhost:6379/0", "c", sleep=waits.append)
+    message = {"type": "message", "data": '{"method": "refresh_rooms"}'}
+    scripts = [
+        [redis.ConnectionError("gone")],
+        redis.ConnectionError("still gone"),
+        [message, redis.ConnectionError("gone again")],
+        [message],
+    ]
+    channel._redis = MagicMock()
+    channel._redis.pubsub.side_effect = lambda **kw: FakePubSub(scripts.pop(0))
+    received, reconnects = [], []
+
+    def handle(m):
+        received.append(m)
+        if len(received) == 2:
+            channel.close()
+
+    channel.listen(handle, on_reconnect=lambda: reconnects.append(1))
+
+    assert received == [{"method": "refresh_rooms"}] * 2
+    assert waits == [0.5, 1.0, 0.5]  # backoff doubles, and resets once subscribed again
+    assert len(reconnects) == 2
+
+
+def test_client_manager_from_url():
+    assert build_client_manager(None, "c") is None
+    assert isinstance(build_client_manager("memory://", "c"), InMemoryPubSubManager)
+    assert isinstance(build_client_manager("redis://localhost:6379/0", "c"), socketio.RedisManager)
+    with pytest.raises(ValueError):
+        build_client_manager("amqp://localhost", "c")
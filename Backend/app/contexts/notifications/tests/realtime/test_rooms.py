@@ -0,0 +1,80 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.contexts.notifications.realtime import rooms
+from app.contexts.notifications.realtime.rooms import SocketRoomMembership, track_connection, untrack_connection
+
+
+@pytest.fixture(autouse=True)
+def clean_state(monkeypatch):
+    monkeypatch.setattr(rooms, "_ROOM_CACHE", {})
+    monkeypatch.setattr(rooms, "_CONNECTIONS", {})
+
+
+@pytest.fixture
+def membership(monkeypatch):
+    m = SocketRoomMembership(MagicMock(), ttl_seconds=60)
+    m.lookups = []
+    m.classes = {"u1": ["class:c1"]}
+
+    def lookup(user_id, role):
+        m.lookups.append(user_id)
+        return list(m.classes.get(user_id, []))
+
+    monkeypatch.setattr(m, "_lookup", lookup)
+    return m
+
+
+def test_rooms_come_from_claims_plus_cached_lookup(membership):
+    claims = {"id": "u1", "role": "student"}
+
+    assert membership.rooms_for(claims) == ["u1", "role:student", "class:c1"]
+    assert membership.rooms_for(claims) == ["u1", "role:student", "class:c1"]
+    assert membership.lookups == ["u1"]
+
+
+def test_refresh_moves_connected_sockets_between_class_rooms(membership, monkeypatch):
+    server = MagicMock()
+    monkeypatch.setattr(rooms.socketio, "server", server)
+    track_connection("u1", "sid-1", membership.rooms_for({"id": "u1", "role": "student"}))
+
+    membership.classes["u1"] = ["class:c2"]
+    membership.refresh_local(["u1"])
+
+    server.leave_room.assert_called_once_with("sid-1", "class:c1", namespace="/")
+    server.enter_room.assert_called_once_with("sid-1", "class:c2", namespace="/")
+    assert rooms._CONNECTIONS["u1"]["sid-1"] == {"u1", "role:student", "class:c2"}
+
+    untrack_connection("sid-1")
+    assert rooms._CONNECTIONS == {}
+
+
+def test_lookup_failure_still_joins_user_and_role_rooms(monkeypatch):
+    m = SocketRoomMembership(MagicMock(), ttl_seconds=60)
+    monkeypatch.setattr(m, "_lookup", MagicMock(side_effect=RuntimeError("db down")))
+
+    assert m.rooms_for({"id": "u2", "role": "teacher"}) == ["u2", "role:teacher"]
+    assert rooms._ROOM_CACHE == {}
+
+
+def test_room_sync_starts_over_after_the_channel_reconnects(membership, monkeypatch):
+    server = MagicMock()
+    monkeypatch.setattr(rooms.socketio, "server", server)
+    started = {}
+    monkeypatch.setattr(rooms, "control_channel", lambda: MagicMock())
+    monkeypatch.setattr(rooms, "SocketRoomMembership", lambda db: membership)
+    monkeypatch.setattr(
+        rooms.socketio, "start_background_task", lambda fn, handle, on_reconnect=None: started.update(on_reconnect=on_reconnect)
+    )
+    track_connection("u1", "sid-1", membership.rooms_for({"id": "u1", "role": "student"}))
+    membership.rooms_for({"id": "u9", "role": "teacher"})
+
+    rooms.start_room_sync(MagicMock())
+    # the refresh_rooms message for u1 was published while the channel was down
+    membership.classes["u1"] = ["class:c2"]
+    started["on_reconnect"]()
+
+    assert "u9" not in rooms._ROOM_CACHE
+    server.enter_room.assert_called_once_with("sid-1", "class:c2", namespace="/")
+    assert rooms._CONNECTIONS["u1"]["sid-1"] == {"u1", "role:student", "class:c2"}
@@ -0,0 +1,44 @@
+import datetime as dt
+from unittest.mock import MagicMock
+
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from app.contexts.notifications.services.notification_archiver import NotificationArchiver
+
+
+def _archiver(batches):
+    a = NotificationArchiver(MagicMock(), after_days=30, batch_size=2)
+    a.col.find.return_value.sort.return_value.limit.side_effect = batches
+    a.col.delete_many.side_effect = lambda q, **kw: MagicMock(deleted_count=len(q["_id"]["$in"]))
+    return a
+
+
+def test_moves_read_notifications_older_than_cutoff_in_batches():
+    now = dt.datetime(2026, 6, 1)
+    first = [{"_id": ObjectId()}, {"_id": ObjectId()}]
+    second = [{"_id": ObjectId()}]
+    a = _archiver([first, second, []])
+
+    assert a.run(now=now) == 3
+
+    q = a.col.find.call_args.args[0]
+    assert q == {"read_at": {"$type": "date"}, "created_at": {"$lt": now - dt.timedelta(days=30)}}
+    assert a.archive.insert_many.call_count == 2
+    assert all("archived_at" in d for d in first + second)
+    deleted = a.col.delete_many.call_args_list[0].args[0]
+    assert deleted == {"_id": {"$in": [d["_id"] for d in first]}, "read_at": {"$type": "date"}}
+
+
+def test_rerun_after_crash_tolerates_already_archived_docs():
+    a = _archiver([[{"_id": ObjectId()}], []])
+    a.archive.insert_many.side_effect = BulkWriteError({"writeErrors": [{"index": 0, "code": 11000}]})
+
+    assert a.run(now=dt.datetime(2026, 6, 1)) == 1
+    a.col.delete_many.assert_called_once()
+
+
+def test_zero_days_keeps_everything():
+    a = NotificationArchiver(MagicMock(), after_days=0)
+    assert a.run() == 0
+    a.col.find.assert_not_called()
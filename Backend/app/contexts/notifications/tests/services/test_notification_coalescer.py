@@ -0,0 +1,103 @@
+import datetime as dt
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+
+from app.contexts.notifications.services import notification_service as service_module
+from app.contexts.notifications.services.notification_coalescer import NotificationCoalescer
+from app.contexts.notifications.services.notification_service import NotificationService
+
+NOW = dt.datetime(2026, 5, 4, 9, 0)
+
+
+@pytest.fixture(autouse=True)
+def coalesce_settings(monkeypatch):
+    from app.contexts.core.config.setting import settings
+
+    monkeypatch.setattr(settings, "NOTIFICATION_COALESCE_TYPES", "SCHEDULE_UPDATED")
+    monkeypatch.setattr(settings, "NOTIFICATION_COALESCE_WINDOW_SECONDS", 300)
+
+
+def _doc(user_id, key, type="SCHEDULE_UPDATED", class_id="c1", title="Schedule updated"):
+    return {
+        "user_id": user_id,
+        "type": type,
+        "entity_type": "schedule",
+        "title": title,
+        "data": {"class_id": class_id},
+        "read_at": None,
+        "dedupe_key": key,
+    }
+
+
+def test_same_key_in_one_batch_becomes_one_document_with_count():
+    col = MagicMock()
+    col.find.return_value = []
+    docs = [
+        _doc("u1", "e1:u1"),
+        _doc("u1", "e2:u1", title="Latest"),
+        _doc("u2", "e1:u2"),
+        _doc("u1", "e3:u1", class_id="c2"),
+        _doc("u1", "e4:u1", type="GRADE_PUBLISHED"),
+    ]
+
+    to_insert, updated = NotificationCoalescer(col).apply(docs, NOW)
+
+    assert updated == []
+    merged = next(d for d in to_insert if d.get("coalesce_key") == "u1|SCHEDULE_UPDATED|schedule|c1")
+    assert merged["item_count"] == 2
+    assert merged["title"] == "Latest"
+    assert merged["dedupe_key"] == "e1:u1"
+    assert merged["merged_keys"] == ["e1:u1", "e2:u1"]
+    assert merged["coalesce_until"] == NOW + dt.timedelta(seconds=300)
+    assert len(to_insert) == 4
+    assert not any("coalesce_key" in d for d in to_insert if d["type"] == "GRADE_PUBLISHED")
+
+
+def test_open_unread_document_is_updated_in_place_and_retries_are_skipped():
+    col = MagicMock()
+    open_id = ObjectId()
+    col.find.side_effect = [
+        [{"_id": open_id, "coalesce_key": "u1|SCHEDULE_UPDATED|schedule|c1", "merged_keys": ["e1:u1"]}],
+        [{"_id": open_id, "coalesce_key": "u1|SCHEDULE_UPDATED|schedule|c1", "item_count": 3, "coalesce_token": "t"}],
+    ]
+
+    to_insert, updated = NotificationCoalescer(col).apply([_doc("u1", "e1:u1"), _doc("u1", "e2:u1")], NOW)
+
+    assert to_insert == []
+    assert [d["_id"] for d in updated] == [open_id]
+    op = col.bulk_write.call_args.args[0][0]
+    assert op._filter == {"_id": open_id, "read_at": None}
+    assert op._doc["$inc"] == {"item_count": 1}
+    assert op._doc["$addToSet"] == {"merged_keys": {"$each": ["e2:u1"]}}
+
+
+def test_document_read_meanwhile_gets_a_fresh_notification():
+    col = MagicMock()
+    col.find.side_effect = [
+        [{"_id": ObjectId(), "coalesce_key": "u1|SCHEDULE_UPDATED|schedule|c1", "merged_keys": []}],
+        [],  # update matched nothing: read between find and update
+    ]
+
+    to_insert, updated = NotificationCoalescer(col).apply([_doc("u1", "e5:u1")], NOW)
+
+    assert updated == []
+    assert [d["item_count"] for d in to_insert] == [1]
+
+
+def test_service_does_not_recount_updated_notifications(monkeypatch):
+    svc = NotificationService(MagicMock())
+    svc.unread = MagicMock()
+    sent = []
+    monkeypatch.setattr(service_module, "emit_notifications", lambda items, event=None: sent.append((event, list(items))))
+    updated = {"_id": ObjectId(), "user_id": "u1", "type": "SCHEDULE_UPDATED", "coalesce_token": "t", "item_count": 4}
+    monkeypatch.setattr(svc.coalescer, "apply", lambda docs, now: ([], [updated]))
+
+    result = svc.create_many([{"user_id": "u1", "role": "student", "type": "SCHEDULE_UPDATED", "title": "x"}])
+
+    assert result == [updated] and svc.is_update(updated)
+    svc.col.insert_many.assert_not_called()
+    svc.unread.increment_for.assert_called_once_with([], push=True)
+    assert sent[-1][0] == "notification:updated"
+    assert sent[-1][1][0][1]["item_count"] == 4
@@ -0,0 +1,191 @@
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+
+from app.contexts.notifications.services.notification_outbox import (
+    NotificationOutbox,
+    OutboxStatus,
+    RecipientKind,
+)
+from app.contexts.notifications.services import outbox_dispatcher as dispatcher_module
+from app.contexts.notifications.services.notification_service import NotificationService
+from app.contexts.notifications.services.outbox_dispatcher import NotificationOutboxDispatcher
+
+
+def _event(kind, ids, key=None, attempts=0, room=None):
+    return {
+        "room": room,
+        "_id": ObjectId(),
+        "idempotency_key": key or str(ObjectId()),
+        "recipient_kind": kind,
+        "recipient_ids": ids,
+        "role": "student",
+        "type": "SCHEDULE_UPDATED",
+        "title": "Schedule updated",
+        "data": {"class_id": "c1"},
+        "attempts": attempts,
+    }
+
+
+def test_enqueue_writes_one_compact_event():
+    outbox = NotificationOutbox(MagicMock())
+
+    event_id = outbox.enqueue(
+        recipient_kind=RecipientKind.STUDENT,
+        recipient_ids=["s1", "s2", "s1", None],
+        role="student",
+        type="SCHEDULE_UPDATED",
+        title="t",
+        idempotency_key="slot:1",
+    )
+
+    assert event_id is not None
+    doc = outbox.col.insert_one.call_args.args[0]
+    assert doc["recipient_ids"] == ["s1", "s2"]
+    assert doc["status"] == OutboxStatus.PENDING
+    assert doc["idempotency_key"] == "slot:1"
+
+
+def test_enqueue_is_idempotent_and_skips_empty():
+    outbox = NotificationOutbox(MagicMock())
+    outbox.col.insert_one.side_effect = DuplicateKeyError("dup")
+
+    assert outbox.enqueue(recipient_kind="user", recipient_ids=["u1"], role="r", type="x", title="t") is None
+
+    outbox.col.insert_one.reset_mock()
+    assert outbox.enqueue(recipient_kind="user", recipient_ids=[], role="r", type="x", title="t") is None
+    outbox.col.insert_one.assert_not_called()
+
+    with pytest.raises(ValueError):
+        outbox.enqueue(recipient_kind="nobody", recipient_ids=["x"], role="r", type="x", title="t")
+
+
+@pytest.fixture
+def emitted(monkeypatch):
+    sent = {"users": [], "rooms": [], "room_events": [], "updated": []}
+
+    def emit_users(items, event=dispatcher_module.EVENT_NAME):
+        sent["users" if event == dispatcher_module.EVENT_NAME else "updated"].extend(items)
+
+    def emit_room(room, payload, event=dispatcher_module.EVENT_NAME):
+        sent["rooms"].append(room)
+        sent["room_events"].append((room, event, payload))
+
+    monkeypatch.setattr(dispatcher_module, "emit_notifications", emit_users)
+    monkeypatch.setattr(dispatcher_module, "emit_to_room", emit_room)
+    return sent
+
+
+@pytest.fixture
+def dispatcher(emitted):
+    resolver = MagicMock()
+    resolver.students_to_user_ids.return_value = {"s1": "u1", "s2": "u2"}
+    resolver.best_effort_user_ids.return_value = {"t1": "u9"}
+    svc = MagicMock()
+    svc.create_many.side_effect = lambda items, emit=True: list(items)
+    svc.to_socket_payload.side_effect = lambda doc: {"id": "n", "user_id": doc["user_id"]}
+    svc.is_update.side_effect = NotificationService.is_update
+    return NotificationOutboxDispatcher(
+        MagicMock(), batch_size=10, max_attempts=3, lease_seconds=30, notification_service=svc, resolver=resolver
+    )
+
+
+def test_process_resolves_whole_batch_once_and_writes_once(dispatcher):
+    events = [
+        _event(RecipientKind.STUDENT, ["s1", "s2", "s3"], key="a"),
+        _event(RecipientKind.STUDENT, ["s2"], key="b"),
+        _event(RecipientKind.STAFF, ["t1"], key="c"),
+        _event(RecipientKind.USER, ["u5"], key="d"),
+    ]
+
+    assert dispatcher.process(events) == 5
+
+    dispatcher.resolver.students_to_user_ids.assert_called_once_with(["s1", "s2", "s3", "s2"])
+    dispatcher.notification_service.create_many.assert_called_once()
+    items = dispatcher.notification_service.create_many.call_args.args[0]
+    assert [(i["user_id"], i["dedupe_key"]) for i in items] == [
+        ("u1", "a:u1"),
+        ("u2", "a:u2"),
+        ("u2", "b:u2"),
+        ("u9", "c:u9"),
+        ("u5", "d:u5"),
+    ]
+
+
+def test_dispatch_once_marks_done(dispatcher, monkeypatch):
+    events = [_event(RecipientKind.USER, ["u1"])]
+    monkeypatch.setattr(dispatcher, "_claim", lambda: events)
+
+    assert dispatcher.dispatch_once() == 1
+
+    update = dispatcher.col.update_many.call_args.args[1]
+    assert update["$set"]["status"] == OutboxStatus.DONE
+    dispatcher.col.bulk_write.assert_not_called()
+
+
+def test_failed_batch_is_retried_then_parked(dispatcher, monkeypatch):
+    events = [_event(RecipientKind.USER, ["u1"], attempts=0), _event(RecipientKind.USER, ["u2"], attempts=2)]
+    monkeypatch.setattr(dispatcher, "_claim", lambda: events)
+    dispatcher.notification_service.create_many.side_effect = RuntimeError("mongo down")
+
+    dispatcher.dispatch_once()
+
+    ops = dispatcher.col.bulk_write.call_args.args[0]
+    first, second = (op._doc["$set"] for op in ops)
+    assert first["status"] == OutboxStatus.PENDING and first["attempts"] == 1
+    assert second["status"] == OutboxStatus.FAILED and second["attempts"] == 3
+    dispatcher.col.update_many.assert_not_called()
+
+
+def test_drain_stops_when_nothing_is_due(dispatcher, monkeypatch):
+    batches = [[_event(RecipientKind.USER, ["u1"])], [_event(RecipientKind.USER, ["u2"])], []]
+    monkeypatch.setattr(dispatcher, "_claim", lambda: batches.pop(0))
+
+    assert dispatcher.drain() == 2
+
+
+def test_room_event_is_persisted_per_user_but_emitted_once(dispatcher, emitted):
+    events = [
+        _event(RecipientKind.STUDENT, ["s1", "s2"], key="a", room="class:c1"),
+        _event(RecipientKind.USER, ["u7"], key="b"),
+    ]
+
+    assert dispatcher.process(events) == 3
+
+    assert emitted["rooms"] == ["class:c1"]
+    assert [uid for uid, _ in emitted["users"]] == ["u7"]
+    assert dispatcher.notification_service.create_many.call_args.kwargs == {"emit": False}
+    # unread counts are pushed to the per-user recipient only; room members re-fetch theirs
+    dispatcher.notification_service.unread.push.assert_called_once_with(["u7"])
+
+
+def _written(user_id, key, coalesced=False):
+    doc = {"_id": ObjectId(), "user_id": user_id, "dedupe_key": key}
+    if coalesced:
+        doc.update(coalesce_token="t", merged_keys=["old", key])
+    return doc
+
+
+def test_room_emit_uses_the_event_of_its_documents(dispatcher, emitted):
+    event = _event(RecipientKind.STUDENT, ["s1", "s2"], key="a", room="class:c1")
+    docs = [_written("u1", "a:u1", coalesced=True), _written("u2", "a:u2", coalesced=True)]
+
+    dispatcher._emit([event], docs, {event["_id"]: ["a:u1", "a:u2"]})
+
+    [(room, name, payload)] = emitted["room_events"]
+    assert (room, name) == ("class:c1", dispatcher_module.UPDATED_EVENT_NAME)
+    assert payload["id"] is None and payload["room"] == "class:c1"
+    assert emitted["users"] == emitted["updated"] == []
+
+
+def test_room_with_mixed_inserts_and_updates_is_emitted_per_user(dispatcher, emitted):
+    event = _event(RecipientKind.STUDENT, ["s1", "s2"], key="a", room="class:c1")
+    docs = [_written("u1", "a:u1", coalesced=True), _written("u2", "a:u2")]
+
+    dispatcher._emit([event], docs, {event["_id"]: ["a:u1", "a:u2"]})
+
+    assert emitted["room_events"] == []
+    assert [uid for uid, _ in emitted["updated"]] == ["u1"]
+    assert [uid for uid, _ in emitted["users"]] == ["u2"]
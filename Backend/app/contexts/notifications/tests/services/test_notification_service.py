@@ -0,0 +1,89 @@
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from app.contexts.notifications.services import notification_service as module
+from app.contexts.notifications.services.notification_service import NotificationService
+from app.contexts.notifications.utils.recipient_resolver import NotificationRecipientResolver
+
+
+@pytest.fixture
+def emitted(monkeypatch):
+    sent = []
+    monkeypatch.setattr(module, "emit_notifications", lambda items, event=None: sent.extend(items))
+    return sent
+
+
+@pytest.fixture
+def service():
+    db = MagicMock()
+    svc = NotificationService(db)
+    svc.col.insert_many.side_effect = lambda docs, ordered: MagicMock(inserted_ids=[ObjectId() for _ in docs])
+    return svc
+
+
+def test_create_for_users_writes_once_and_emits_each(service, emitted):
+    docs = service.create_for_users(
+        user_ids=["u1", "u2", "u1", None, ""],
+        role="student",
+        type="schedule_updated",
+        title="Schedule updated",
+        data={"class_id": "c1"},
+    )
+
+    service.col.insert_many.assert_called_once()
+    args, kwargs = service.col.insert_many.call_args
+    assert kwargs == {"ordered": False}
+    assert [d["user_id"] for d in args[0]] == ["u1", "u2"]
+    assert [uid for uid, _ in emitted] == ["u1", "u2"]
+    assert all(p["id"] == str(d["_id"]) for (_, p), d in zip(emitted, docs))
+    service.col.insert_one.assert_not_called()
+
+
+def test_create_for_users_skips_empty_recipients(service, emitted):
+    assert service.create_for_users(user_ids=[], role="student", type="x", title="t") == []
+    service.col.insert_many.assert_not_called()
+    assert emitted == []
+
+
+def test_create_for_users_emits_only_written_docs(service, emitted):
+    def partial(docs, ordered):
+        for d in docs:
+            d["_id"] = ObjectId()
+        raise BulkWriteError({"writeErrors": [{"index": 1, "code": 11000}]})
+
+    service.col.insert_many.side_effect = partial
+
+    docs = service.create_for_users(user_ids=["u1", "u2", "u3"], role="student", type="x", title="t")
+
+    assert [d["user_id"] for d in docs] == ["u1", "u3"]
+    assert [uid for uid, _ in emitted] == ["u1", "u3"]
+
+
+def test_create_for_users_raises_on_unexpected_write_errors(service, emitted):
+    service.col.insert_many.side_effect = BulkWriteError(
+        {"writeErrors": [{"index": 0, "code": 11000}, {"index": 1, "code": 121}]}
+    )
+
+    with pytest.raises(BulkWriteError):
+        service.create_for_users(user_ids=["u1", "u2"], role="student", type="x", title="t")
+    assert emitted == []
+
+
+def test_students_to_user_ids_uses_one_query():
+    resolver = NotificationRecipientResolver(MagicMock())
+    s1, s2, s3 = ObjectId(), ObjectId(), ObjectId()
+    u1, u2 = ObjectId(), ObjectId()
+    resolver._student_read = MagicMock()
+    resolver._student_read.list_user_ids_by_ids.return_value = [
+        {"_id": s1, "user_id": u1},
+        {"_id": s2, "user_id": u2},
+        {"_id": s3},
+    ]
+
+    mapping = resolver.students_to_user_ids([str(s1), s2, s3, "not-an-id"])
+
+    resolver._student_read.list_user_ids_by_ids.assert_called_once()
+    assert mapping == {str(s1): str(u1), str(s2): str(u2)}
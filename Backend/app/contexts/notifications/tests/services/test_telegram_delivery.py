@@ -0,0 +1,242 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+
+from app.contexts.infra.telegram.client import TelegramClient
+from app.contexts.infra.telegram.rate_limit import TelegramRateLimiter, TokenBucket
+from app.contexts.notifications.services.telegram_delivery import (
+    DeliveryStatus,
+    SenderLease,
+    TelegramDeliveryQueue,
+    TelegramDeliverySender,
+    TelegramLinks,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def telegram_api():
+    """Local stand-in for api.telegram.org: chat 403 is blocked, chat 429 is throttled once."""
+    calls = []
+    throttled = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            calls.append((self.path, body))
+            chat = str(body["chat_id"])
+            if chat == "403":
+                status, reply = 403, {"ok": False, "description": "Forbidden: bot was blocked by the user"}
+            elif chat == "429" and chat not in throttled:
+                throttled.add(chat)
+                status, reply = 429, {"ok": False, "description": "Too Many Requests", "parameters": {"retry_after": 7}}
+            else:
+                status, reply = 200, {"ok": True, "result": {"message_id": len(calls)}}
+            data = json.dumps(reply).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", calls
+    server.shutdown()
+    server.server_close()
+
+
+def _row(chat_id, text):
+    return {"_id": ObjectId(), "chat_id": chat_id, "text": text, "attempts": 0}
+
+
+def _statuses(col):
+    return [op._doc["$set"] for call in col.bulk_write.call_args_list for op in call.args[0]]
+
+
+def test_token_bucket_waits_for_refill():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+    bucket.take()
+    bucket.take()
+    assert bucket.wait_time() == pytest.approx(0.5)
+    clock.sleep(0.5)
+    assert bucket.wait_time() == 0
+
+
+def test_limiter_enforces_per_chat_and_global_rates():
+    clock = FakeClock()
+    limiter = TelegramRateLimiter(global_rate=3, chat_rate=1, clock=clock, sleep=clock.sleep)
+
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("a") == pytest.approx(1.0)  # same chat: 1 msg/s
+    assert limiter.acquire("b") == 0
+    assert limiter.acquire("c") == 0
+    assert limiter.acquire("d") > 0  # global bucket (3/s) is empty
+
+
+def test_sender_batches_per_chat_and_records_state(telegram_api):
+    base_url, calls = telegram_api
+    clock = FakeClock()
+    sender = TelegramDeliverySender(
+        MagicMock(),
+        client=TelegramClient("TOKEN", base_url=base_url, timeout=5),
+        limiter=TelegramRateLimiter(clock=clock, sleep=clock.sleep),
+        max_attempts=3,
+        lease_seconds=30,
+    )
+    rows = [_row("1", "Schedule updated"), _row("1", "Grade published"), _row("429", "Hello"), _row("403", "Hi")]
+
+    assert sender.send_batch(rows) == 2
+
+    assert [c[0] for c in calls] == ["/botTOKEN/sendMessage"] * 3
+    assert calls[0][1]["text"] == "Schedule updated\n\nGrade published"
+    sets = _statuses(sender.col)
+    assert [s["status"] for s in sets] == [
+        DeliveryStatus.SENT,
+        DeliveryStatus.SENT,
+        DeliveryStatus.PENDING,  # 429: retried after Telegram's retry_after
+        DeliveryStatus.FAILED,  # blocked: no retry
+    ]
+    assert (sets[2]["available_at"] - sets[0]["sent_at"]).total_seconds() == pytest.approx(7, abs=1)
+    sender.links.col.update_many.assert_called_once()
+    assert sender.links.col.update_many.call_args.args[0] == {"chat_id": "403"}
+
+
+def test_each_message_outcome_is_written_before_the_next_send(telegram_api):
+    base_url, calls = telegram_api
+    clock = FakeClock()
+    client = TelegramClient("TOKEN", base_url=base_url, timeout=5)
+    sender = TelegramDeliverySender(
+        MagicMock(),
+        client=client,
+        limiter=TelegramRateLimiter(clock=clock, sleep=clock.sleep),
+        max_attempts=3,
+        lease_seconds=30,
+    )
+    real_send = client.send_message
+    client.send_message = MagicMock(side_effect=[real_send("1", "x"), RuntimeError("worker killed")])
+
+    with pytest.raises(RuntimeError):
+        sender.send_batch([_row("1", "first"), _row("2", "second")])
+
+    # the message that went out is already recorded as sent; only chat 2 will be retried
+    assert [s["status"] for s in _statuses(sender.col)] == [DeliveryStatus.SENT]
+
+
+def test_only_the_lease_holder_sends():
+    db = MagicMock()
+    mine = SenderLease(db, "telegram", ttl_seconds=30, owner="a")
+    db[""].find_one_and_update.return_value = {"_id": "telegram", "owner": "a"}
+    assert mine.acquire()
+
+    other = SenderLease(db, "telegram", ttl_seconds=30, owner="b")
+    db[""].find_one_and_update.side_effect = DuplicateKeyError("held by a")
+    assert not other.acquire()
+
+    sender = TelegramDeliverySender(db, client=MagicMock(), limiter=MagicMock(), lease=other)
+    assert sender.drain() == 0
+    sender.col.find.assert_not_called()
+
+
+def test_network_errors_back_off_then_fail(telegram_api):
+    clock = FakeClock()
+    sender = TelegramDeliverySender(
+        MagicMock(),
+        client=TelegramClient("TOKEN", base_url="http://127.0.0.1:9", timeout=1),
+        limiter=TelegramRateLimiter(clock=clock, sleep=clock.sleep),
+        max_attempts=2,
+        lease_seconds=30,
+    )
+    row = _row("1", "x")
+
+    sender.send_batch([row])
+    row["attempts"] = 1
+    sender.send_batch([row])
+
+    assert [s["status"] for s in _statuses(sender.col)] == [DeliveryStatus.PENDING, DeliveryStatus.FAILED]
+
+
+def test_queue_only_writes_rows_for_linked_users(monkeypatch):
+    from app.contexts.core.config.setting import settings
+
+    monkeypatch.setattr(settings, "TELEGRAM_BOT_TOKEN", "TOKEN")
+    monkeypatch.setattr(settings, "NOTIFICATION_TELEGRAM_ENABLED", True)
+    queue = TelegramDeliveryQueue(MagicMock())
+    queue.links.col.find.return_value = [{"user_id": "u1", "chat_id": "100"}]
+    docs = [
+        {"_id": ObjectId(), "user_id": "u1", "title": "Schedule updated", "message": "Mon 08:00", "item_count": 3},
+        {"_id": ObjectId(), "user_id": "u2", "title": "x"},
+    ]
+
+    assert queue.enqueue_for(docs) == 1
+    (rows,), _ = queue.col.insert_many.call_args
+    assert [(r["user_id"], r["chat_id"], r["text"]) for r in rows] == [("u1", "100", "Schedule updated (3)\nMon 08:00")]
+
+
+def test_queue_is_off_without_a_bot_token(monkeypatch):
+    from app.contexts.core.config.setting import settings
+
+    monkeypatch.setattr(settings, "TELEGRAM_BOT_TOKEN", None)
+    queue = TelegramDeliveryQueue(MagicMock())
+    assert queue.enqueue_for([{"_id": ObjectId(), "user_id": "u1", "title": "x"}]) == 0
+    queue.links.col.find.assert_not_called()
+
+
+def _links_with_token_store():
+    links = TelegramLinks(MagicMock())
+    stored = {}
+    links.tokens.insert_one.side_effect = lambda doc: stored.update({doc["_id"]: doc})
+    links.tokens.find_one_and_delete.side_effect = lambda q: stored.pop(q["_id"], None)
+    return links, stored
+
+
+def test_chat_is_bound_from_the_bot_update_not_the_client():
+    links, stored = _links_with_token_store()
+
+    issued = links.issue_token("u1")
+    assert issued["command"] == f"/start {issued['token']}"
+    assert issued["token"] not in stored  # only the hash is kept
+
+    update = {"message": {"chat": {"id": 4242, "type": "private"}, "text": issued["command"]}}
+    assert links.handle_update(update) == {"user_id": "u1", "chat_id": "4242", "enabled": True}
+    (query, change), _ = links.col.update_one.call_args
+    assert query == {"user_id": "u1"} and change["$set"]["chat_id"] == "4242"
+
+    # one-time: replaying the same /start does nothing
+    links.col.update_one.reset_mock()
+    assert links.handle_update(update) is None
+    links.col.update_one.assert_not_called()
+
+
+def test_updates_other_than_a_private_start_with_a_known_token_are_ignored():
+    links, _ = _links_with_token_store()
+    token = links.issue_token("u1")["token"]
+
+    for update in (
+        {"message": {"chat": {"id": -100, "type": "group"}, "text": f"/start {token}"}},
+        {"message": {"chat": {"id": 1, "type": "private"}, "text": "hello"}},
+        {"message": {"chat": {"id": 1, "type": "private"}, "text": "/start not-a-token"}},
+        {"edited_message": {}},
+    ):
+        assert links.handle_update(update) is None
+    links.col.update_one.assert_not_called()
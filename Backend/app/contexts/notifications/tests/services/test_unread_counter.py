@@ -0,0 +1,120 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.contexts.notifications.services import unread_counter as module
+from app.contexts.notifications.services.notification_service import NotificationService
+from app.contexts.notifications.services.unread_counter import UnreadCounterStore
+
+
+@pytest.fixture
+def pushed(monkeypatch):
+    sent = []
+    monkeypatch.setattr(module, "emit_unread_counts", lambda items: sent.extend(items))
+    return sent
+
+
+@pytest.fixture
+def store():
+    return UnreadCounterStore(MagicMock())
+
+
+def _counters(store, docs):
+    """Serve col.find() from `docs`, whatever the projection."""
+    store.col.find.side_effect = lambda q, projection=None: [d for d in docs if d["user_id"] in q["user_id"]["$in"]]
+
+
+def test_increment_is_one_bulk_update_per_batch(store, pushed):
+    _counters(store, [{"user_id": "u1", "total": 2, "by_type": {"A": 1, "B": 1}}])
+
+    store.increment_for(
+        [
+            {"user_id": "u1", "type": "A"},
+            {"user_id": "u1", "type": "B"},
+        ]
+    )
+
+    store.col.bulk_write.assert_called_once()
+    ops = store.col.bulk_write.call_args.args[0]
+    by_user = {op._filter["user_id"]: op._doc["$inc"] for op in ops}
+    assert by_user == {"u1": {"by_type.A": 1, "by_type.B": 1, "total": 2}}
+    assert not any(op._upsert for op in ops)
+    assert pushed == [("u1", {"total": 2, "by_type": {"A": 1, "B": 1}})]
+
+
+def test_increment_seeds_missing_counters_from_notifications(store, pushed):
+    _counters(store, [{"user_id": "u1", "total": 1, "by_type": {"A": 1}}])
+    # u2 already had 4 unread before this batch; the new one is in `notifications` too
+    store.notifications.aggregate.return_value = [{"_id": {"user_id": "u2", "type": "A"}, "n": 5}]
+
+    store.increment_for([{"user_id": "u1", "type": "A"}, {"user_id": "u2", "type": "A"}])
+
+    seed, inc = (call.args[0] for call in store.col.bulk_write.call_args_list)
+    assert [op._filter["user_id"] for op in seed] == ["u2"]
+    assert seed[0]._doc["$setOnInsert"]["total"] == 5
+    assert seed[0]._upsert
+    assert [(op._filter["user_id"], op._doc["$inc"]["total"]) for op in inc] == [("u1", 1)]
+
+
+def test_decrement_pushes_new_counts(store, pushed):
+    store.col.find_one_and_update.return_value = {"user_id": "u1", "total": 1, "by_type": {"A": 0, "B": 1}}
+
+    counts = store.decrement("u1", {"A": 1, "B": 0})
+
+    update = store.col.find_one_and_update.call_args.args[1]
+    assert update["$inc"] == {"by_type.A": -1, "total": -1}
+    assert counts == {"total": 1, "by_type": {"B": 1}}
+    assert pushed == [("u1", counts)]
+
+
+def test_missing_counter_is_rebuilt_from_notifications(store):
+    store.col.find_one.return_value = None
+    store.notifications.aggregate.return_value = [
+        {"_id": {"user_id": "u1", "type": "A"}, "n": 3},
+        {"_id": {"user_id": "u1", "type": "B"}, "n": 1},
+    ]
+
+    assert store.get("u1") == {"total": 4, "by_type": {"A": 3, "B": 1}}
+    op = store.col.bulk_write.call_args.args[0][0]
+    assert op._doc["$setOnInsert"]["total"] == 4
+    assert op._upsert
+
+
+def test_reconcile_does_not_overwrite_counters_that_moved(store):
+    seen_at = object()
+    store.col.find.return_value = [{"user_id": "u1", "updated_at": seen_at}]
+    store.notifications.aggregate.return_value = [{"_id": {"user_id": "u1", "type": "A"}, "n": 2}]
+
+    store.reconcile_users(["u1", "u2"])
+
+    u1, u2 = store.col.bulk_write.call_args.args[0]
+    assert u1._filter == {"user_id": "u1", "updated_at": seen_at}
+    assert u1._doc["$set"]["total"] == 2 and not u1._upsert
+    assert u2._filter == {"user_id": "u2"} and "$setOnInsert" in u2._doc
+
+
+def test_increment_without_push_emits_nothing(store, pushed):
+    store.increment_for([{"user_id": "u1", "type": "A"}], push=False)
+
+    store.col.bulk_write.assert_called_once()
+    assert pushed == []
+
+
+def test_mark_all_read_decrements_each_type_by_what_was_modified(monkeypatch):
+    svc = NotificationService(MagicMock())
+    monkeypatch.setattr(svc.read_model, "unread_types", lambda user_id: ["A", "B"])
+    monkeypatch.setattr(svc.read_model, "mark_all_read", lambda user_id, type: {"A": 2, "B": 1}[type])
+    svc.unread = MagicMock()
+
+    assert svc.mark_all_read(user_id="u1") == 3
+    svc.unread.decrement.assert_called_once_with("u1", {"A": 2, "B": 1})
+
+
+def test_mark_read_only_decrements_when_something_changed(monkeypatch):
+    svc = NotificationService(MagicMock())
+    svc.unread = MagicMock()
+    monkeypatch.setattr(svc.read_model, "mark_read", MagicMock(side_effect=[{"type": "A"}, None]))
+
+    assert svc.mark_read(user_id="u1", notification_id="n1") == 1
+    assert svc.mark_read(user_id="u1", notification_id="n1") == 0
+    svc.unread.decrement.assert_called_once_with("u1", {"A": 1})
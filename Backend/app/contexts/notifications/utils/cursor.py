@@ -0,0 +1,31 @@
+import datetime as dt
+from typing import Optional, Tuple
+
+from bson import ObjectId
+from flask import request
+
+# "<created_at epoch ms>_<_id hex>": Mongo stores datetimes with ms precision,
+# so the round trip is exact and (created_at, _id) is a total order.
+
+
+def encode_cursor(created_at: dt.datetime, _id: ObjectId) -> str:
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(dt.timezone.utc).replace(tzinfo=None)
+    ms = (created_at - dt.datetime(1970, 1, 1)) // dt.timedelta(milliseconds=1)
+    return f"{ms}_{_id}"
+
+
+def decode_cursor(value: str) -> Tuple[dt.datetime, ObjectId]:
+    try:
+        ms, oid = str(value).split("_", 1)
+        return dt.datetime(1970, 1, 1) + dt.timedelta(milliseconds=int(ms)), ObjectId(oid)
+    except Exception:
+        raise ValueError(f"Invalid cursor: {value}")
+
+
+def parse_cursor_args() -> Tuple[Optional[str], Optional[str]]:
+    before = (request.args.get("before") or "").strip() or None
+    after = (request.args.get("after") or "").strip() or None
+    if before and after:
+        raise ValueError("Use either before or after, not both")
+    return before, after
@@ -1,4 +1,4 @@
-from typing import Optional, Union
+from typing import Dict, Iterable, Optional, Union
 from bson import ObjectId
 from pymongo.database import Database
 
@@ -36,6 +36,22 @@ class NotificationRecipientResolver:
         uid = doc.get("user_id")
         return str(uid) if uid else None
 
+    def students_to_user_ids(
+        self,
+        student_ids: Iterable[Union[str, ObjectId, None]],
+        *,
+        show_deleted: ShowDeleted = "active",
+    ) -> Dict[str, str]:
+        """
+        Bulk variant of student_to_user_id: one $in query for the whole list.
+        Returns {student_id: user_id}; unknown students / students without an account are left out.
+        """
+        sids = [oid for oid in (self._oid(v) for v in student_ids) if oid]
+        if not sids:
+            return {}
+        docs = self._student_read.list_user_ids_by_ids(sids, show_deleted=show_deleted)
+        return {str(d["_id"]): str(d["user_id"]) for d in docs if d.get("user_id")}
+
     def staff_to_user_id(
         self,
         staff_id: Union[str, ObjectId],
@@ -62,4 +78,22 @@ class NotificationRecipientResolver:
         if uid:
             return uid
         # fallback: assume already IAM user_id
-        return str(maybe_user_or_staff_id) if maybe_user_or_staff_id else None
\ No newline at end of file
+        return str(maybe_user_or_staff_id) if maybe_user_or_staff_id else None
+
+    def best_effort_user_ids(
+        self,
+        maybe_user_or_staff_ids: Iterable[Union[str, ObjectId, None]],
+        *,
+        show_deleted: ShowDeleted = "active",
+    ) -> Dict[str, str]:
+        """
+        Bulk variant of best_effort_user_id: one $in query over staff,
+        anything that is not a staff id is assumed to be an IAM user_id already.
+        """
+        raw = [str(v) for v in maybe_user_or_staff_ids if v]
+        if not raw:
+            return {}
+        oids = [oid for oid in (self._oid(v) for v in raw) if oid]
+        docs = self._staff_read.list_by_ids(oids, show_deleted=show_deleted) if oids else []
+        staff = {str(d["_id"]): str(d["user_id"]) for d in (docs or []) if d.get("user_id")}
+        return {v: staff.get(v, v) for v in raw}
@@ -0,0 +1,181 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from pymongo.collection import Collection
+from pymongo.database import Database
+
+from app.contexts.core.config.setting import settings
+from app.contexts.shared.lifecycle.filters import not_deleted
+from app.contexts.shared.model_converter import mongo_converter
+from app.contexts.school.domain.timetable_index import (
+    ScheduleConflict,
+    TimetableEntry,
+    TimetableIndex,
+    minutes_to_hhmm,
+)
+from app.contexts.school.ports.schedule_conflict_port import ScheduleConflictPort
+
+logger = logging.getLogger(__name__)
+
+_PROJECTION: Dict[str, int] = {
+    "_id": 1,
+    "class_id": 1,
+    "teacher_id": 1,
+    "subject_id": 1,
+    "day_of_week": 1,
+    "start_time": 1,
+    "end_time": 1,
+    "room": 1,
+}
+
+
+class _CachedIndex:
+    __slots__ = ("index", "loaded_at", "lock")
+
+    def __init__(self) -> None:
+        self.index: Optional[TimetableIndex] = None
+        self.loaded_at: float = 0.0
+        self.lock = threading.RLock()
+
+
+# One index per database, shared by every request in this process.
+_CACHE: Dict[Tuple[int, str], _CachedIndex] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_for(db: Database) -> _CachedIndex:
+    key = (id(db.client), db.name)
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+        if cached is None:
+            cached = _CACHE[key] = _CachedIndex()
+        return cached
+
+
+class MongoScheduleConflictIndex(ScheduleConflictPort):
+    """
+    Process-wide TimetableIndex over active `schedules` docs.
+
+    - Loaded once with a narrow projection, then kept current by ScheduleService writes
+    - Reloaded after SCHEDULE_INDEX_TTL_SECONDS so writes from other workers
+      (or direct DB edits) are picked up
+    - Serves reads (free slots, conflict previews, validate_all); writes are
+      checked against Mongo with load_overlapping, since the cache can lag
+      behind other workers
+    """
+
+    def __init__(self, db: Database, *, ttl_seconds: Optional[int] = None):
+        self.collection: Collection = db["schedules"]
+        self.ttl_seconds = settings.SCHEDULE_INDEX_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self._cached = _cache_for(db)
+
+    def _load(self) -> TimetableIndex:
+        idx = TimetableIndex()
+        for doc in self.collection.find(not_deleted(), _PROJECTION):
+            try:
+                idx.add(TimetableEntry.from_doc(doc))
+            except (TypeError, ValueError):
+                logger.warning("Skipping malformed schedule slot %s in conflict index", doc.get("_id"))
+        return idx
+
+    def index(self) -> TimetableIndex:
+        c = self._cached
+        with c.lock:
+            stale = c.index is None or (time.monotonic() - c.loaded_at) > self.ttl_seconds
+            if stale:
+                c.index = self._load()
+                c.loaded_at = time.monotonic()
+            return c.index
+
+    @contextmanager
+    def locked(self) -> Iterator[TimetableIndex]:
+        """Hold the index for several reads (free-slot / substitute queries)."""
+        with self._cached.lock:
+            yield self.index()
+
+    # -------- queries --------
+
+    def find_conflicts(self, entry: TimetableEntry) -> List[ScheduleConflict]:
+        with self._cached.lock:
+            return self.index().find_conflicts(entry)
+
+    def validate_all(self) -> List[ScheduleConflict]:
+        with self._cached.lock:
+            return self.index().validate_all()
+
+    def load_overlapping(self, entries: Sequence[TimetableEntry]) -> TimetableIndex:
+        """
+        Active slots that overlap any of `entries` (same weekday, intersecting
+        times), read from Mongo rather than the cache. Times are stored as
+        zero-padded "HH:MM", so the range filter compares as strings.
+
+        What was read is synced into the cache on the way.
+        """
+        windows: Dict[int, Tuple[int, int]] = {}
+        for e in entries:
+            lo, hi = windows.get(e.day_of_week, (e.start, e.end))
+            windows[e.day_of_week] = (min(lo, e.start), max(hi, e.end))
+        current = TimetableIndex()
+        if not windows:
+            return current
+
+        query = not_deleted(
+            {
+                "$or": [
+                    {
+                        "day_of_week": day,
+                        "start_time": {"$lt": minutes_to_hhmm(hi)},
+                        "end_time": {"$gt": minutes_to_hhmm(lo)},
+                    }
+                    for day, (lo, hi) in windows.items()
+                ]
+            }
+        )
+        for doc in self.collection.find(query, _PROJECTION):
+            try:
+                current.add(TimetableEntry.from_doc(doc))
+            except (TypeError, ValueError):
+                logger.warning("Skipping malformed schedule slot %s in conflict check", doc.get("_id"))
+
+        with self._cached.lock:
+            idx = self.index()
+            for entry in current.entries():
+                idx.add(entry)
+        return current
+
+    def load_entry(self, slot_id: Any) -> Optional[TimetableEntry]:
+        """One slot straight from Mongo, soft-deleted or not (e.g. before a restore)."""
+        oid = mongo_converter.convert_to_object_id(slot_id)
+        doc = self.collection.find_one({"_id": oid}, _PROJECTION)
+        return TimetableEntry.from_doc(doc) if doc else None
+
+    # -------- write-through --------
+
+    def upsert(self, entry: TimetableEntry) -> None:
+        with self._cached.lock:
+            self.index().add(entry)
+
+    def remove(self, slot_id: Any) -> Optional[TimetableEntry]:
+        with self._cached.lock:
+            return self.index().remove(slot_id)
+
+    def refresh_slot(self, slot_id: Any) -> None:
+        """
+        Re-read one slot (e.g. after restore) and sync it into the index.
+        """
+        oid = mongo_converter.convert_to_object_id(slot_id)
+        doc = self.collection.find_one(not_deleted({"_id": oid}), _PROJECTION)
+        with self._cached.lock:
+            idx = self.index()
+            if doc is None:
+                idx.remove(oid)
+            else:
+                idx.add(TimetableEntry.from_doc(doc))
+
+    def invalidate(self) -> None:
+        with self._cached.lock:
+            self._cached.index = None
+            self._cached.loaded_at = 0.0
@@ -126,6 +126,48 @@ class ScheduleDTO(BaseModel):
         return v
 
 
+class GradeStatsSummaryDTO(BaseModel):
+    count: int = 0
+    mean: Optional[float] = None
+    std: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    percentiles: dict[str, Optional[float]] = Field(default_factory=dict)
+
+
+class GradeStatsByTypeDTO(BaseModel):
+    type: GradeType
+    count: int = 0
+    mean: Optional[float] = None
+    std: Optional[float] = None
+
+
+class GradeStatsStudentDTO(BaseModel):
+    student_id: str
+    student_name: str = "Unknown"
+    student_name_en: Optional[str] = None
+    student_name_kh: Optional[str] = None
+    rank: int
+    weighted_avg: Optional[float] = None
+    mean: Optional[float] = None
+    z_score: Optional[float] = None
+    percentile: Optional[float] = None
+    grade_count: int = 0
+    by_type: dict[str, Optional[float]] = Field(default_factory=dict)
+
+
+class GradeStatisticsDTO(BaseModel):
+    class_id: Optional[str] = None
+    subject_id: Optional[str] = None
+    term: Optional[str] = None
+    weights: dict[str, float] = Field(default_factory=dict)
+    summary: GradeStatsSummaryDTO = Field(default_factory=GradeStatsSummaryDTO)
+    weighted_summary: GradeStatsSummaryDTO = Field(default_factory=GradeStatsSummaryDTO)
+    by_type: list[GradeStatsByTypeDTO] = Field(default_factory=list)
+    student_count: int = 0
+    students: list[GradeStatsStudentDTO] = Field(default_factory=list)
+
+
 # ------------ Domain -> DTO mappers ------------
 
 def class_section_to_dto(section: ClassSection) -> ClassSectionDTO:
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional
+
+import numpy as np
+
+from app.contexts.school.domain.grade import GradeType
+
+
+# Order matters: the index of a type in this tuple is its integer code.
+GRADE_TYPE_ORDER: tuple[GradeType, ...] = (
+    GradeType.EXAM,
+    GradeType.ASSIGNMENT,
+    GradeType.HOMEWORK,
+    GradeType.QUIZ,
+)
+_TYPE_CODE: Dict[str, int] = {t.value: i for i, t in enumerate(GRADE_TYPE_ORDER)}
+
+DEFAULT_GRADE_TYPE_WEIGHTS: Dict[str, float] = {
+    GradeType.EXAM.value: 0.5,
+    GradeType.ASSIGNMENT.value: 0.2,
+    GradeType.HOMEWORK.value: 0.15,
+    GradeType.QUIZ.value: 0.15,
+}
+
+SUMMARY_PERCENTILES: tuple[int, ...] = (10, 25, 50, 75, 90)
+
+
+def grade_type_code(value: Any) -> int:
+    """
+    Map a stored grade type ("exam", GradeType.EXAM, ...) to its integer code.
+    Unknown values fall back to EXAM, same as GradeMapper.
+    """
+    raw = getattr(value, "value", value)
+    return _TYPE_CODE.get(str(raw or "").strip().lower(), 0)
+
+
+@dataclass(slots=True)
+class GradeArrays:
+    """
+    Compact columnar view of grade rows.
+
+    - student_idx / subject_idx are dense 0..N-1 codes into student_ids / subject_ids
+    - type_code is the index into GRADE_TYPE_ORDER
+    - score is float64
+    """
+
+    student_ids: List[Any] = field(default_factory=list)
+    subject_ids: List[Any] = field(default_factory=list)
+    student_idx: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    subject_idx: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    type_code: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int8))
+    score: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+
+    def __len__(self) -> int:
+        return int(self.score.shape[0])
+
+    @classmethod
+    def from_rows(cls, rows) -> "GradeArrays":
+        """
+        Build arrays from an iterable of {student_id, subject_id, type, score} dicts.
+        The only per-row Python work is id encoding; everything after is vectorized.
+        """
+        student_map: Dict[Any, int] = {}
+        subject_map: Dict[Any, int] = {}
+        s_idx: List[int] = []
+        sub_idx: List[int] = []
+        t_code: List[int] = []
+        scores: List[float] = []
+
+        type_code = _TYPE_CODE.get
+        for row in rows:
+            score = row.get("score")
+            sid = row.get("student_id")
+            if score is None or sid is None:
+                continue
+
+            s = student_map.get(sid)
+            if s is None:
+                s = student_map[sid] = len(student_map)
+
+            sub = row.get("subject_id")
+            j = subject_map.get(sub)
+            if j is None:
+                j = subject_map[sub] = len(subject_map)
+
+            t = row.get("type")
+            code = type_code(t) if t.__class__ is str else None
+
+            s_idx.append(s)
+            sub_idx.append(j)
+            t_code.append(grade_type_code(t) if code is None else code)
+            scores.append(score)
+
+        return cls(
+            student_ids=list(student_map),
+            subject_ids=list(subject_map),
+            student_idx=np.asarray(s_idx, dtype=np.int32),
+            subject_idx=np.asarray(sub_idx, dtype=np.int32),
+            type_code=np.asarray(t_code, dtype=np.int8),
+            score=np.asarray(scores, dtype=np.float64),
+        )
+
+
+def _round(v: float, digits: int = 2) -> Optional[float]:
+    if v is None or not np.isfinite(v):
+        return None
+    return round(float(v), digits)
+
+
+def _weights_vector(weights: Optional[Mapping[str, float]]) -> np.ndarray:
+    merged = dict(DEFAULT_GRADE_TYPE_WEIGHTS)
+    for k, v in (weights or {}).items():
+        key = str(getattr(k, "value", k)).strip().lower()
+        if key in _TYPE_CODE:
+            merged[key] = max(float(v), 0.0)
+    return np.asarray([merged[t.value] for t in GRADE_TYPE_ORDER], dtype=np.float64)
+
+
+def _summary(values: np.ndarray) -> Dict[str, Any]:
+    if values.size == 0:
+        return {"count": 0, "mean": None, "std": None, "min": None, "max": None, "percentiles": {}}
+
+    pct = np.percentile(values, SUMMARY_PERCENTILES)
+    return {
+        "count": int(values.size),
+        "mean": _round(values.mean()),
+        "std": _round(values.std()),
+        "min": _round(values.min()),
+        "max": _round(values.max()),
+        "percentiles": {f"p{p}": _round(v) for p, v in zip(SUMMARY_PERCENTILES, pct)},
+    }
+
+
+def _competition_rank(values: np.ndarray) -> np.ndarray:
+    """
+    Standard competition ranking ("1224"): rank = 1 + number of strictly greater values.
+    """
+    asc = np.sort(values)
+    greater = values.size - np.searchsorted(asc, values, side="right")
+    return (greater + 1).astype(np.int32)
+
+
+def _percentile_rank(values: np.ndarray) -> np.ndarray:
+    """
+    Share of the cohort at or below each value (mid-rank for ties), 0..100.
+    """
+    n = values.size
+    if n == 0:
+        return np.empty(0, dtype=np.float64)
+    asc = np.sort(values)
+    below = np.searchsorted(asc, values, side="left")
+    equal = np.searchsorted(asc, values, side="right") - below
+    return (below + 0.5 * equal) / n * 100.0
+
+
+def compute_grade_statistics(
+    arrays: GradeArrays,
+    *,
+    weights: Optional[Mapping[str, float]] = None,
+) -> Dict[str, Any]:
+    """
+    Cohort statistics over a (class, term) or (subject, term) slice.
+
+    Per-student weighted average:
+      1) mean score per (student, grade type)
+      2) weighted mean of those type means, renormalized over the types
+         the student actually has (missing homework does not count as 0)
+
+    Rank / z-score / percentile are computed on the weighted averages.
+    """
+    n_types = len(GRADE_TYPE_ORDER)
+    n_students = len(arrays.student_ids)
+    scores = arrays.score
+
+    by_type: List[Dict[str, Any]] = []
+    for code, gt in enumerate(GRADE_TYPE_ORDER):
+        sel = scores[arrays.type_code == code]
+        if sel.size == 0:
+            continue
+        by_type.append(
+            {
+                "type": gt.value,
+                "count": int(sel.size),
+                "mean": _round(sel.mean()),
+                "std": _round(sel.std()),
+            }
+        )
+
+    result: Dict[str, Any] = {
+        "summary": _summary(scores),
+        "by_type": by_type,
+        "weights": {t.value: float(w) for t, w in zip(GRADE_TYPE_ORDER, _weights_vector(weights))},
+        "student_count": n_students,
+        "students": [],
+    }
+    if n_students == 0:
+        return result
+
+    # (student, type) cells, flattened to one bincount
+    cell = arrays.student_idx.astype(np.int64) * n_types + arrays.type_code
+    size = n_students * n_types
+    cell_sum = np.bincount(cell, weights=scores, minlength=size).reshape(n_students, n_types)
+    cell_cnt = np.bincount(cell, minlength=size).reshape(n_students, n_types)
+
+    present = cell_cnt > 0
+    type_mean = np.divide(cell_sum, cell_cnt, out=np.zeros_like(cell_sum), where=present)
+
+    w = _weights_vector(weights)
+    w_present = present * w
+    w_total = w_present.sum(axis=1)
+    weighted_sum = (type_mean * w_present).sum(axis=1)
+
+    # students with only zero-weight types fall back to their plain mean
+    student_sum = cell_sum.sum(axis=1)
+    student_cnt = cell_cnt.sum(axis=1)
+    plain_mean = student_sum / student_cnt
+    weighted = np.where(w_total > 0, weighted_sum / np.where(w_total > 0, w_total, 1.0), plain_mean)
+
+    mu = weighted.mean()
+    sigma = weighted.std()
+    z = (weighted - mu) / sigma if sigma > 0 else np.zeros_like(weighted)
+
+    rank = _competition_rank(weighted)
+    pct = _percentile_rank(weighted)
+    order = np.lexsort((np.arange(n_students), rank))
+
+    # plain Python lists for the per-student output loop (no NumPy scalar overhead)
+    rank_l = rank.tolist()
+    weighted_l = weighted.tolist()
+    mean_l = plain_mean.tolist()
+    z_l = z.tolist()
+    pct_l = pct.tolist()
+    cnt_l = student_cnt.tolist()
+    type_mean_l = type_mean.tolist()
+    present_l = present.tolist()
+    type_names = [t.value for t in GRADE_TYPE_ORDER]
+
+    students: List[Dict[str, Any]] = []
+    for i in order.tolist():
+        students.append(
+            {
+                "student_id": arrays.student_ids[i],
+                "rank": rank_l[i],
+                "weighted_avg": round(weighted_l[i], 2),
+                "mean": round(mean_l[i], 2),
+                "z_score": round(z_l[i], 3),
+                "percentile": round(pct_l[i], 1),
+                "grade_count": cnt_l[i],
+                "by_type": {
+                    type_names[c]: round(type_mean_l[i][c], 2)
+                    for c in range(n_types)
+                    if present_l[i][c]
+                },
+            }
+        )
+
+    result["students"] = students
+    result["weighted_summary"] = _summary(weighted)
+    return result
+
+
+def parse_weights_arg(raw: Optional[str]) -> Dict[str, float]:
+    """
+    Parse "exam:0.6,quiz:0.1" (query string form) into a weights mapping.
+    Unknown types, malformed pairs and non-finite values ("nan", "inf") are ignored.
+    """
+    out: Dict[str, float] = {}
+    for part in str(raw or "").split(","):
+        key, sep, value = part.partition(":")
+        key = key.strip().lower()
+        if not sep or key not in _TYPE_CODE:
+            continue
+        try:
+            weight = float(value)
+        except ValueError:
+            continue
+        if math.isfinite(weight):
+            out[key] = weight
+    return out
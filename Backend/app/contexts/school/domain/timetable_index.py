@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Resources a slot occupies. A clash on any of them is a conflict.
+RESOURCE_KINDS: Tuple[str, ...] = ("teacher", "class", "room")
+
+BucketKey = Tuple[str, str, int]  # (kind, resource_key, day_of_week)
+Interval = Tuple[int, int]  # [start, end) in minutes from midnight
+
+
+def to_minutes(value: Any) -> int:
+    """
+    Accepts datetime.time or "HH:MM" (how ScheduleMapper persists times).
+    """
+    if isinstance(value, time):
+        return value.hour * 60 + value.minute
+    text = str(value or "").strip()
+    hh, _, mm = text.partition(":")
+    return int(hh) * 60 + int(mm or 0)
+
+
+def minutes_to_hhmm(m: int) -> str:
+    return f"{m // 60:02d}:{m % 60:02d}"
+
+
+def normalize_room(room: Any) -> Optional[str]:
+    text = str(room or "").strip().lower()
+    return " ".join(text.split()) or None
+
+
+def resource_key(kind: str, value: Any) -> str:
+    """Key a resource the same way TimetableEntry.resource_keys does."""
+    if kind == "room":
+        return normalize_room(value) or ""
+    return str(value)
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """Union of half-open intervals, sorted; touching intervals are joined."""
+    out: List[Interval] = []
+    for s, e in sorted(intervals):
+        if out and s <= out[-1][1]:
+            if e > out[-1][1]:
+                out[-1] = (out[-1][0], e)
+        else:
+            out.append((s, e))
+    return out
+
+
+def subtract_intervals(window: Interval, busy: Iterable[Interval]) -> List[Interval]:
+    """window minus the union of busy, as sorted disjoint intervals."""
+    lo, hi = window
+    out: List[Interval] = []
+    cursor = lo
+    for s, e in merge_intervals(busy):
+        if e <= cursor:
+            continue
+        if s >= hi:
+            break
+        if s > cursor:
+            out.append((cursor, s))
+        cursor = max(cursor, e)
+    if cursor < hi:
+        out.append((cursor, hi))
+    return out
+
+
+@dataclass(frozen=True, slots=True)
+class TimetableEntry:
+    """
+    Minimal, hashable view of one active schedule slot.
+    Ids are kept as strings so legacy ObjectId/str storage compares equal.
+    """
+
+    slot_id: str
+    class_id: str
+    teacher_id: str
+    day_of_week: int
+    start: int
+    end: int
+    room: Optional[str] = None
+    subject_id: Optional[str] = None
+
+    @classmethod
+    def from_doc(cls, doc: Dict[str, Any]) -> "TimetableEntry":
+        return cls(
+            slot_id=str(doc.get("_id") or doc.get("id")),
+            class_id=str(doc.get("class_id")),
+            teacher_id=str(doc.get("teacher_id")),
+            day_of_week=int(doc.get("day_of_week")),
+            start=to_minutes(doc.get("start_time")),
+            end=to_minutes(doc.get("end_time")),
+            room=normalize_room(doc.get("room")),
+            subject_id=str(doc["subject_id"]) if doc.get("subject_id") else None,
+        )
+
+    @classmethod
+    def from_slot(cls, slot: Any) -> "TimetableEntry":
+        """Build from a ScheduleSlot domain object."""
+        return cls(
+            slot_id=str(slot.id),
+            class_id=str(slot.class_id),
+            teacher_id=str(slot.teacher_id),
+            day_of_week=int(slot.day_of_week),
+            start=to_minutes(slot.start_time),
+            end=to_minutes(slot.end_time),
+            room=normalize_room(getattr(slot, "room", None)),
+            subject_id=str(slot.subject_id) if getattr(slot, "subject_id", None) else None,
+        )
+
+    def resource_keys(self) -> List[BucketKey]:
+        keys: List[BucketKey] = [
+            ("teacher", self.teacher_id, self.day_of_week),
+            ("class", self.class_id, self.day_of_week),
+        ]
+        if self.room:
+            keys.append(("room", self.room, self.day_of_week))
+        return keys
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleConflict:
+    kind: str  # teacher | class | room
+    resource: str
+    day_of_week: int
+    slot_id: str
+    start: int
+    end: int
+    other_slot_id: str
+    other_start: int
+    other_end: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "resource": self.resource,
+            "day_of_week": self.day_of_week,
+            "slot_id": self.slot_id,
+            "start_time": minutes_to_hhmm(self.start),
+            "end_time": minutes_to_hhmm(self.end),
+            "other_slot_id": self.other_slot_id,
+            "other_start_time": minutes_to_hhmm(self.other_start),
+            "other_end_time": minutes_to_hhmm(self.other_end),
+        }
+
+
+class IntervalBucket:
+    """
+    Intervals of one resource on one weekday, sorted by start.
+
+    Overlap query is O(log N + k): any interval that can overlap [s, e) must start
+    in (s - max_len, e), which is a contiguous range of the sorted starts.
+    `max_len` only ever grows, so it stays a safe upper bound after removals.
+    """
+
+    __slots__ = ("starts", "entries", "max_len")
+
+    def __init__(self) -> None:
+        self.starts: List[Tuple[int, str]] = []
+        self.entries: List[TimetableEntry] = []
+        self.max_len: int = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, entry: TimetableEntry) -> None:
+        key = (entry.start, entry.slot_id)
+        i = bisect_left(self.starts, key)
+        self.starts.insert(i, key)
+        self.entries.insert(i, entry)
+        self.max_len = max(self.max_len, entry.end - entry.start)
+
+    def remove(self, entry: TimetableEntry) -> bool:
+        key = (entry.start, entry.slot_id)
+        i = bisect_left(self.starts, key)
+        if i < len(self.starts) and self.starts[i] == key:
+            del self.starts[i]
+            del self.entries[i]
+            return True
+        return False
+
+    def overlapping(self, start: int, end: int, *, ignore_slot_id: Optional[str] = None) -> List[TimetableEntry]:
+        lo = bisect_right(self.starts, (start - self.max_len, "￿"))
+        hi = bisect_left(self.starts, (end, ""))
+        out: List[TimetableEntry] = []
+        for e in self.entries[lo:hi]:
+            if e.slot_id == ignore_slot_id:
+                continue
+            if e.start < end and start < e.end:
+                out.append(e)
+        return out
+
+
+class TimetableIndex:
+    """
+    Per-weekday interval indexes keyed by teacher, class and room.
+
+    - add / remove keep the index in step with writes (add replaces by slot_id)
+    - find_conflicts answers "would this slot clash?" in O(log N) per resource
+    - validate_all sweeps every bucket once: O(N log N) for the whole timetable
+    """
+
+    def __init__(self, entries: Iterable[TimetableEntry] = ()) -> None:
+        self._buckets: Dict[BucketKey, IntervalBucket] = {}
+        self._by_id: Dict[str, TimetableEntry] = {}
+        for e in entries:
+            self.add(e)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, slot_id: object) -> bool:
+        return str(slot_id) in self._by_id
+
+    def get(self, slot_id: Any) -> Optional[TimetableEntry]:
+        return self._by_id.get(str(slot_id))
+
+    def entries(self) -> List[TimetableEntry]:
+        return list(self._by_id.values())
+
+    def bucket(self, kind: str, resource: str, day_of_week: int) -> List[TimetableEntry]:
+        b = self._buckets.get((kind, resource, int(day_of_week)))
+        return list(b.entries) if b else []
+
+    # -------- writes --------
+
+    def add(self, entry: TimetableEntry) -> None:
+        if entry.slot_id in self._by_id:
+            self.remove(entry.slot_id)
+        self._by_id[entry.slot_id] = entry
+        for key in entry.resource_keys():
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = IntervalBucket()
+            bucket.add(entry)
+
+    def remove(self, slot_id: Any) -> Optional[TimetableEntry]:
+        entry = self._by_id.pop(str(slot_id), None)
+        if entry is None:
+            return None
+        for key in entry.resource_keys():
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+            bucket.remove(entry)
+            if not bucket:
+                del self._buckets[key]
+        return entry
+
+    # -------- queries --------
+
+    def busy(self, kind: str, resource: Any, day_of_week: int) -> List[Interval]:
+        b = self._buckets.get((kind, resource_key(kind, resource), int(day_of_week)))
+        return [(e.start, e.end) for e in b.entries] if b else []
+
+    def is_free(
+        self,
+        kind: str,
+        resource: Any,
+        day_of_week: int,
+        start: int,
+        end: int,
+        *,
+        ignore_slot_id: Optional[str] = None,
+    ) -> bool:
+        b = self._buckets.get((kind, resource_key(kind, resource), int(day_of_week)))
+        return b is None or not b.overlapping(start, end, ignore_slot_id=ignore_slot_id)
+
+    def free_intervals(
+        self,
+        resources: Iterable[Tuple[str, Any]],
+        day_of_week: int,
+        *,
+        day_start: int,
+        day_end: int,
+        min_minutes: int = 1,
+    ) -> List[Interval]:
+        """
+        Intervals inside [day_start, day_end) where ALL given (kind, resource) pairs are free.
+        """
+        busy: List[Interval] = []
+        for kind, resource in resources:
+            busy.extend(self.busy(kind, resource, day_of_week))
+        return [
+            (s, e)
+            for s, e in subtract_intervals((day_start, day_end), busy)
+            if e - s >= min_minutes
+        ]
+
+    def find_conflicts(self, entry: TimetableEntry) -> List[ScheduleConflict]:
+        """
+        Conflicts between `entry` and what is already indexed.
+        The entry's own slot_id is ignored, so a move can be checked in place.
+        """
+        out: List[ScheduleConflict] = []
+        for kind, resource, day in entry.resource_keys():
+            bucket = self._buckets.get((kind, resource, day))
+            if bucket is None:
+                continue
+            for other in bucket.overlapping(entry.start, entry.end, ignore_slot_id=entry.slot_id):
+                out.append(_conflict(kind, resource, entry, other))
+        return out
+
+    def validate_all(self) -> List[ScheduleConflict]:
+        """
+        Every overlapping pair in the index, reported once per shared resource.
+        """
+        out: List[ScheduleConflict] = []
+        for (kind, resource, _day), bucket in self._buckets.items():
+            # sweep: entries are sorted by start; keep the "still open" ones
+            active: List[TimetableEntry] = []
+            for e in bucket.entries:
+                active = [a for a in active if a.end > e.start]
+                for a in active:
+                    out.append(_conflict(kind, resource, a, e))
+                active.append(e)
+        return out
+
+
+def _conflict(kind: str, resource: str, a: TimetableEntry, b: TimetableEntry) -> ScheduleConflict:
+    return ScheduleConflict(
+        kind=kind,
+        resource=resource,
+        day_of_week=a.day_of_week,
+        slot_id=a.slot_id,
+        start=a.start,
+        end=a.end,
+        other_slot_id=b.slot_id,
+        other_start=b.start,
+        other_end=b.end,
+    )
@@ -0,0 +1,422 @@
+from __future__ import annotations
+
+import random
+import time as _time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from app.contexts.school.domain.timetable_index import TimetableIndex, minutes_to_hhmm, normalize_room
+
+
+@dataclass(frozen=True, slots=True)
+class Period:
+    """One cell of the weekly period grid (minutes from midnight)."""
+
+    day_of_week: int
+    start: int
+    end: int
+
+
+@dataclass(frozen=True, slots=True)
+class LessonDemand:
+    """
+    `lessons_per_week` lessons of `subject_id` for `class_id`, taught by `teacher_id`.
+    `room` pins the lesson to one room; otherwise any room from the solver's pool is used.
+    """
+
+    class_id: str
+    subject_id: str
+    teacher_id: str
+    lessons_per_week: int
+    room: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class Placement:
+    class_id: str
+    subject_id: str
+    teacher_id: str
+    day_of_week: int
+    start: int
+    end: int
+    room: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "class_id": self.class_id,
+            "subject_id": self.subject_id,
+            "teacher_id": self.teacher_id,
+            "day_of_week": self.day_of_week,
+            "start_time": minutes_to_hhmm(self.start),
+            "end_time": minutes_to_hhmm(self.end),
+            "room": self.room,
+        }
+
+
+@dataclass(slots=True)
+class SolverResult:
+    placements: List[Placement] = field(default_factory=list)
+    unplaced: List[Dict[str, Any]] = field(default_factory=list)
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def complete(self) -> bool:
+        return not self.unplaced
+
+
+def build_period_grid(days: Iterable[int], period_times: Iterable[Tuple[int, int]]) -> List[Period]:
+    """Same daily bell schedule on every given weekday."""
+    times = sorted(set(period_times))
+    return [Period(int(d), s, e) for d in sorted(set(days)) for s, e in times]
+
+
+class _Unit:
+    __slots__ = ("uid", "demand", "class_id", "teacher_id", "subject_id", "fixed_room", "domain", "cs_key")
+
+    def __init__(self, uid: int, demand: LessonDemand, domain: List[int]):
+        self.uid = uid
+        self.demand = demand
+        self.class_id = demand.class_id
+        self.teacher_id = demand.teacher_id
+        self.subject_id = demand.subject_id
+        self.fixed_room = normalize_room(demand.room)
+        self.domain = domain
+        self.cs_key = (demand.class_id, demand.subject_id)
+
+
+class _State:
+    """Occupancy maps for the working assignment."""
+
+    __slots__ = ("teacher_at", "class_at", "room_at", "per_day", "where")
+
+    def __init__(self) -> None:
+        self.teacher_at: Dict[Tuple[str, int], int] = {}
+        self.class_at: Dict[Tuple[str, int], int] = {}
+        self.room_at: Dict[Tuple[str, int], int] = {}
+        self.per_day: Dict[Tuple[str, str, int], Set[int]] = {}  # (class, subject, day) -> uids
+        self.where: Dict[int, Tuple[int, Optional[str]]] = {}  # uid -> (period, room)
+
+    def snapshot(self) -> Dict[int, Tuple[int, Optional[str]]]:
+        return dict(self.where)
+
+
+class TimetableSolver:
+    """
+    Weekly timetable generator.
+
+    1) Constraint propagation: every lesson unit starts with the periods where its
+       teacher, class and (pinned) room are not already busy in `existing`.
+    2) Greedy construction, most-constrained unit first (smallest domain, busiest teacher),
+       spreading a subject over the week.
+    3) Local search until the time budget runs out: an unplaced unit takes the period
+       that evicts the fewest other units (tabu on recent moves); evicted units
+       go back to the queue. The best assignment seen is returned.
+
+    Hard constraints: no teacher / class / room double-booking, at most
+    `max_same_subject_per_day` lessons of one subject per class per day.
+    """
+
+    def __init__(
+        self,
+        demands: Sequence[LessonDemand],
+        periods: Sequence[Period],
+        *,
+        rooms: Iterable[str] = (),
+        existing: Optional[TimetableIndex] = None,
+        max_same_subject_per_day: int = 2,
+        seed: int = 0,
+    ) -> None:
+        self.periods = list(periods)
+        # normalized key -> label as given, so written slots keep the admin's casing
+        self._room_label: Dict[str, str] = {}
+        for r in rooms:
+            key = normalize_room(r)
+            if key:
+                self._room_label.setdefault(key, str(r).strip())
+        self.rooms: List[str] = sorted(self._room_label)
+        self.existing = existing
+        self.max_per_day = max(1, int(max_same_subject_per_day))
+        self.rng = random.Random(seed)
+
+        self.units: List[_Unit] = []
+        self.infeasible: List[Dict[str, Any]] = []
+        self._build_units(demands)
+
+    # -------- propagation --------
+
+    def _free_periods(self, kind: str, resource: str) -> List[int]:
+        if self.existing is None:
+            return list(range(len(self.periods)))
+        return [
+            i
+            for i, p in enumerate(self.periods)
+            if self.existing.is_free(kind, resource, p.day_of_week, p.start, p.end)
+        ]
+
+    def _build_units(self, demands: Sequence[LessonDemand]) -> None:
+        free_cache: Dict[Tuple[str, str], Set[int]] = {}
+
+        def free(kind: str, resource: str) -> Set[int]:
+            key = (kind, resource)
+            if key not in free_cache:
+                free_cache[key] = set(self._free_periods(kind, resource))
+            return free_cache[key]
+
+        uid = 0
+        for d in demands:
+            if d.lessons_per_week <= 0:
+                continue
+            dom = free("teacher", d.teacher_id) & free("class", d.class_id)
+            room = normalize_room(d.room)
+            if room:
+                dom &= free("room", room)
+            domain = sorted(dom)
+            days = {self.periods[i].day_of_week for i in domain}
+            if len(domain) < d.lessons_per_week or len(days) * self.max_per_day < d.lessons_per_week:
+                self.infeasible.append(
+                    {**_demand_dict(d), "missing": d.lessons_per_week, "reason": "not_enough_free_periods"}
+                )
+                continue
+            for _ in range(d.lessons_per_week):
+                self.units.append(_Unit(uid, d, domain))
+                uid += 1
+
+    # -------- moves --------
+
+    def _room_options(self, st: _State, unit: _Unit, p: int) -> List[Optional[str]]:
+        if unit.fixed_room:
+            return [unit.fixed_room]
+        if not self.rooms:
+            return [None]
+        return self.rooms
+
+    def _pick_free_room(self, st: _State, unit: _Unit, p: int) -> Tuple[bool, Optional[str]]:
+        for r in self._room_options(st, unit, p):
+            if r is None or (r, p) not in st.room_at:
+                if r is not None and self.existing is not None and not unit.fixed_room:
+                    per = self.periods[p]
+                    if not self.existing.is_free("room", r, per.day_of_week, per.start, per.end):
+                        continue
+                return True, r
+        return False, None
+
+    def _place(self, st: _State, unit: _Unit, p: int, room: Optional[str]) -> None:
+        st.teacher_at[(unit.teacher_id, p)] = unit.uid
+        st.class_at[(unit.class_id, p)] = unit.uid
+        if room is not None:
+            st.room_at[(room, p)] = unit.uid
+        key = (unit.class_id, unit.subject_id, self.periods[p].day_of_week)
+        st.per_day.setdefault(key, set()).add(unit.uid)
+        st.where[unit.uid] = (p, room)
+
+    def _unplace(self, st: _State, unit: _Unit) -> None:
+        p, room = st.where.pop(unit.uid)
+        del st.teacher_at[(unit.teacher_id, p)]
+        del st.class_at[(unit.class_id, p)]
+        if room is not None:
+            del st.room_at[(room, p)]
+        key = (unit.class_id, unit.subject_id, self.periods[p].day_of_week)
+        st.per_day[key].discard(unit.uid)
+
+    def _spread_penalty(self, st: _State, unit: _Unit, p: int) -> int:
+        return len(st.per_day.get((unit.class_id, unit.subject_id, self.periods[p].day_of_week), ()))
+
+    def _day_full(self, st: _State, unit: _Unit, p: int) -> bool:
+        return self._spread_penalty(st, unit, p) >= self.max_per_day
+
+    # -------- phases --------
+
+    def _greedy(self, st: _State) -> List[_Unit]:
+        teacher_load: Dict[str, int] = {}
+        for u in self.units:
+            teacher_load[u.teacher_id] = teacher_load.get(u.teacher_id, 0) + 1
+
+        order = sorted(self.units, key=lambda u: (len(u.domain), -teacher_load[u.teacher_id], u.uid))
+        unplaced: List[_Unit] = []
+        for u in order:
+            best: Optional[Tuple[int, float, int, Optional[str]]] = None
+            for p in u.domain:
+                if (u.teacher_id, p) in st.teacher_at or (u.class_id, p) in st.class_at:
+                    continue
+                if self._day_full(st, u, p):
+                    continue
+                ok, room = self._pick_free_room(st, u, p)
+                if not ok:
+                    continue
+                score = (self._spread_penalty(st, u, p), self.rng.random())
+                if best is None or score < best[:2]:
+                    best = (score[0], score[1], p, room)
+            if best is None:
+                unplaced.append(u)
+            else:
+                self._place(st, u, best[2], best[3])
+        return unplaced
+
+    def _evictions(self, st: _State, unit: _Unit, p: int) -> Optional[Tuple[Set[int], Optional[str]]]:
+        """
+        Units that must leave period p so `unit` fits, and the room it would use.
+        None when p is impossible regardless of evictions (day cap by other lessons
+        of the same subject is handled by evicting one of them).
+        """
+        out: Set[int] = set()
+        t = st.teacher_at.get((unit.teacher_id, p))
+        if t is not None:
+            out.add(t)
+        c = st.class_at.get((unit.class_id, p))
+        if c is not None:
+            out.add(c)
+
+        if self._day_full(st, unit, p):
+            same = st.per_day[(unit.class_id, unit.subject_id, self.periods[p].day_of_week)] - {unit.uid}
+            if not same:
+                return None
+            if not (same & out):
+                out.add(self.rng.choice(sorted(same)))
+
+        ok, room = self._pick_free_room(st, unit, p)
+        if not ok:
+            options = [r for r in self._room_options(st, unit, p) if r is not None]
+            holders = [(r, st.room_at.get((r, p))) for r in options]
+            holders = [(r, h) for r, h in holders if h is not None]
+            if not holders:
+                return None
+            # prefer a room whose holder is already being evicted
+            holders.sort(key=lambda rh: (rh[1] not in out, self.rng.random()))
+            room, holder = holders[0]
+            out.add(holder)
+        return out, room
+
+    def _local_search(self, st: _State, unplaced: List[_Unit], deadline: float) -> Tuple[Dict[int, Tuple[int, Optional[str]]], int, int]:
+        best = st.snapshot()
+        best_unplaced = len(unplaced)
+        queue = list(unplaced)
+        tabu: Dict[Tuple[int, int], int] = {}
+        tenure = 10
+        it = 0
+
+        while queue and _time.perf_counter() < deadline:
+            it += 1
+            u = queue.pop(self.rng.randrange(len(queue)))
+
+            choice = None
+            for p in u.domain:
+                res = self._evictions(st, u, p)
+                if res is None:
+                    continue
+                evict, room = res
+                cost = len(evict) * 10 + self._spread_penalty(st, u, p)
+                if tabu.get((u.uid, p), 0) > it:
+                    cost += 100
+                key = (cost, self.rng.random())
+                if choice is None or key < choice[0]:
+                    choice = (key, p, evict, room)
+
+            if choice is None:
+                queue.append(u)
+                continue
+
+            _key, p, evict, _room = choice
+            for uid in evict:
+                ev = self.units[uid]
+                q, _r = st.where[uid]
+                self._unplace(st, ev)
+                tabu[(uid, q)] = it + tenure
+                queue.append(ev)
+
+            ok, room = self._pick_free_room(st, u, p)
+            if not ok:
+                # evicted holder freed the room chosen in _evictions
+                room = _room
+            self._place(st, u, p, room)
+
+            if len(queue) < best_unplaced:
+                best_unplaced = len(queue)
+                best = st.snapshot()
+
+        return best, best_unplaced, it
+
+    # -------- entry point --------
+
+    def solve(self, *, time_budget_ms: int = 3000) -> SolverResult:
+        started = _time.perf_counter()
+        deadline = started + max(0, time_budget_ms) / 1000.0
+
+        st = _State()
+        unplaced = self._greedy(st)
+        greedy_unplaced = len(unplaced)
+
+        where = st.snapshot()
+        iterations = 0
+        if unplaced:
+            where, _n, iterations = self._local_search(st, unplaced, deadline)
+
+        placements: List[Placement] = []
+        placed_ids: Set[int] = set()
+        for uid, (p, room) in sorted(where.items()):
+            u = self.units[uid]
+            per = self.periods[p]
+            placements.append(
+                Placement(
+                    class_id=u.class_id,
+                    subject_id=u.subject_id,
+                    teacher_id=u.teacher_id,
+                    day_of_week=per.day_of_week,
+                    start=per.start,
+                    end=per.end,
+                    room=u.demand.room if u.fixed_room else self._room_label.get(room or "", None),
+                )
+            )
+            placed_ids.add(uid)
+
+        missing: Dict[LessonDemand, int] = {}
+        for u in self.units:
+            if u.uid not in placed_ids:
+                missing[u.demand] = missing.get(u.demand, 0) + 1
+
+        unplaced_out = list(self.infeasible)
+        for d, n in missing.items():
+            unplaced_out.append({**_demand_dict(d), "missing": n, "reason": "no_conflict_free_period"})
+
+        placements.sort(key=lambda x: (x.class_id, x.day_of_week, x.start))
+        return SolverResult(
+            placements=placements,
+            unplaced=unplaced_out,
+            stats={
+                "units": len(self.units) + sum(x["missing"] for x in self.infeasible),
+                "placed": len(placements),
+                "greedy_unplaced": greedy_unplaced,
+                "iterations": iterations,
+                "elapsed_ms": round((_time.perf_counter() - started) * 1000, 1),
+                "periods": len(self.periods),
+                "rooms": len(self.rooms),
+            },
+        )
+
+
+def _demand_dict(d: LessonDemand) -> Dict[str, Any]:
+    return {
+        "class_id": d.class_id,
+        "subject_id": d.subject_id,
+        "teacher_id": d.teacher_id,
+        "lessons_per_week": d.lessons_per_week,
+    }
+
+
+def solve_timetable(
+    demands: Sequence[LessonDemand],
+    periods: Sequence[Period],
+    *,
+    rooms: Iterable[str] = (),
+    existing: Optional[TimetableIndex] = None,
+    max_same_subject_per_day: int = 2,
+    time_budget_ms: int = 3000,
+    seed: int = 0,
+) -> SolverResult:
+    return TimetableSolver(
+        demands,
+        periods,
+        rooms=rooms,
+        existing=existing,
+        max_same_subject_per_day=max_same_subject_per_day,
+        seed=seed,
+    ).solve(time_budget_ms=time_budget_ms)
@@ -89,4 +89,48 @@ class ScheduleSlotDeletedException(AppBaseException):
             details={"slot_id": str(slot_id)},
             hint="Restore the schedule slot before modifying it, or create a new one.",
             recoverable=True,
-        )
\ No newline at end of file
+        )
+
+class ScheduleConflictException(AppBaseException):
+    def __init__(self, conflicts: list):
+        super().__init__(
+            message=f"Schedule slot overlaps {len(conflicts)} existing slot(s)",
+            error_code="SCHEDULE_CONFLICT",
+            status_code=409,
+            severity=ErrorSeverity.LOW,
+            category=ErrorCategory.BUSINESS_LOGIC,
+            user_message="This time overlaps another slot for the same teacher, class or room.",
+            recoverable=True,
+            details={"conflicts": conflicts},
+            hint="Pick another time or room, or move the conflicting slot first."
+        )
+
+
+class TimetableIncompleteException(AppBaseException):
+    def __init__(self, unplaced: list):
+        super().__init__(
+            message=f"Timetable generation left {len(unplaced)} lesson group(s) unplaced",
+            error_code="TIMETABLE_INCOMPLETE",
+            status_code=409,
+            severity=ErrorSeverity.LOW,
+            category=ErrorCategory.BUSINESS_LOGIC,
+            user_message="Not every lesson could be placed without conflicts. Nothing was saved.",
+            recoverable=True,
+            details={"unplaced": unplaced},
+            hint="Run a dry run to inspect the result, add periods/rooms, raise the time budget, or allow a partial timetable."
+        )
+
+
+class ScheduleBulkValidationException(AppBaseException):
+    def __init__(self, errors: list):
+        super().__init__(
+            message=f"Bulk schedule write rejected: {len(errors)} row error(s)",
+            error_code="SCHEDULE_BULK_INVALID",
+            status_code=400,
+            severity=ErrorSeverity.LOW,
+            category=ErrorCategory.VALIDATION,
+            user_message="Some schedule rows are invalid or overlap. Nothing was saved.",
+            recoverable=True,
+            details={"errors": errors},
+            hint="Fix the listed rows (or run with dry_run=true to preview) and submit again."
+        )
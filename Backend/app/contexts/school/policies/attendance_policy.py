@@ -13,6 +13,7 @@ from app.contexts.shared.lifecycle.filters import (
 )
 from app.contexts.shared.lifecycle.policy_result import PolicyResult
 from app.contexts.shared.model_converter import mongo_converter
+from app.contexts.school.policies.teacher_scope import TeacherScopeReader
 
 
 class AttendancePolicy:
@@ -35,6 +36,7 @@ class AttendancePolicy:
         self.attendance = db["attendance"]
         self.assignments = db["teacher_subject_assignments"]
         self.schedule = db["schedules"]  # your schedules collection name
+        self.scopes = TeacherScopeReader(db)
 
     # -------------------------
     # Helpers
@@ -66,33 +68,13 @@ class AttendancePolicy:
         }
 
     def _is_homeroom(self, *, teacher_id: ObjectId, class_id: ObjectId) -> bool:
-        cls = self.classes.find_one(
-            not_deleted({"_id": class_id}),
-            {"_id": 1, "homeroom_teacher_id": 1, "teacher_id": 1},
-        )
-        if not cls:
-            return False
-
-        homeroom_id = cls.get("homeroom_teacher_id") or cls.get("teacher_id")
-        return str(homeroom_id or "") == str(teacher_id)
+        return self.scopes.get(teacher_id).is_homeroom(class_id)
 
     def _teacher_assigned(
         self, *, teacher_id: ObjectId, class_id: ObjectId, subject_id: ObjectId
     ) -> bool:
-        """
-        Robust assignment check: supports ObjectId or string storage in teacher_subject_assignments.
-        """
-        q = not_deleted(
-            {
-                "$and": [
-                    self._match_oid_or_str("teacher_id", teacher_id),
-                    self._match_oid_or_str("class_id", class_id),
-                    self._match_oid_or_str("subject_id", subject_id),
-                ]
-            }
-        )
-        return self.assignments.count_documents(q, limit=1) > 0
-
+        """Set lookup in the cached teacher scope (ObjectId or string storage both count)."""
+        return self.scopes.get(teacher_id).is_assigned(class_id, subject_id)
 
     def _slot_allowed(
         self,
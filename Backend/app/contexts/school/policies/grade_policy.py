@@ -5,6 +5,7 @@ from pymongo.database import Database
 
 from app.contexts.shared.lifecycle.filters import by_show_deleted, not_deleted, ShowDeleted
 from app.contexts.shared.lifecycle.policy_result import PolicyResult
+from app.contexts.school.policies.teacher_scope import TeacherScopeReader
 
 
 class GradePolicy:
@@ -41,6 +42,7 @@ class GradePolicy:
         self.students = db["students"]
         self.grades = db["grades"]
         self.assignments = db["teacher_subject_assignments"]
+        self.scopes = TeacherScopeReader(db)
 
     # -------------------------
     # Helpers
@@ -53,20 +55,10 @@ class GradePolicy:
         )
 
     def _is_homeroom(self, *, teacher_id: ObjectId, class_id: ObjectId) -> bool:
-        cls = self._get_class_for_guard(class_id=class_id)
-        if not cls:
-            return False
-        return cls.get("homeroom_teacher_id") == teacher_id
+        return self.scopes.get(teacher_id).is_homeroom(class_id)
 
     def _teacher_assigned(self, *, teacher_id: ObjectId, class_id: ObjectId, subject_id: ObjectId) -> bool:
-        q = not_deleted(
-            {
-                "teacher_id": teacher_id,
-                "class_id": class_id,
-                "subject_id": subject_id,
-            }
-        )
-        return self.assignments.count_documents(q, limit=1) > 0
+        return self.scopes.get(teacher_id).is_assigned(class_id, subject_id)
 
     def _get_grade_for_guard(self, *, grade_id: ObjectId) -> dict | None:
         return self.grades.find_one(
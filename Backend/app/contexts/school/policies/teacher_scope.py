@@ -0,0 +1,138 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+from bson import ObjectId
+from pymongo.database import Database
+
+from app.contexts.core.config.setting import settings
+from app.contexts.infra.realtime.socketio_ext import control_channel, socketio
+from app.contexts.shared.lifecycle.filters import not_deleted
+from app.contexts.shared.model_converter import mongo_converter
+
+INVALIDATE_TEACHER_SCOPE = "invalidate_teacher_scope"
+
+
+@dataclass(frozen=True)
+class TeacherScope:
+    """What one teacher (staff _id) may touch; every permission check is a set lookup."""
+
+    teacher_id: str
+    homeroom_class_ids: FrozenSet[str]
+    assignments: FrozenSet[Tuple[str, str]]  # (class_id, subject_id)
+
+    @property
+    def assigned_class_ids(self) -> FrozenSet[str]:
+        return frozenset(cid for cid, _ in self.assignments)
+
+    def is_homeroom(self, class_id: Union[str, ObjectId, None]) -> bool:
+        return str(class_id or "") in self.homeroom_class_ids
+
+    def is_assigned(self, class_id: Union[str, ObjectId, None], subject_id: Union[str, ObjectId, None]) -> bool:
+        return (str(class_id or ""), str(subject_id or "")) in self.assignments
+
+    def has_any_assignment_in(self, class_id: Union[str, ObjectId, None]) -> bool:
+        return str(class_id or "") in self.assigned_class_ids
+
+    def subject_ids_in(self, class_id: Union[str, ObjectId, None]) -> List[ObjectId]:
+        cid = str(class_id or "")
+        return [ObjectId(sid) for c, sid in sorted(self.assignments) if c == cid and ObjectId.is_valid(sid)]
+
+
+# teacher_id -> (expires_at, scope)
+_SCOPE_CACHE: Dict[str, Tuple[float, TeacherScope]] = {}
+_LOCK = threading.Lock()
+
+
+class TeacherScopeReader:
+    """
+    Loads a teacher's homeroom classes and (class, subject) assignments with two
+    indexed queries and caches the result per process for TEACHER_SCOPE_CACHE_SECONDS.
+    Admin changes to assignments or homeroom teachers call invalidate_teacher_scopes.
+    """
+
+    def __init__(self, db: Database, ttl_seconds: Optional[int] = None):
+        self.classes = db["classes"]
+        self.assignments = db["teacher_subject_assignments"]
+        self.ttl_seconds = settings.TEACHER_SCOPE_CACHE_SECONDS if ttl_seconds is None else ttl_seconds
+
+    @staticmethod
+    def _oid_or_str(field: str, oid: ObjectId) -> Dict[str, Any]:
+        return {field: {"$in": [oid, str(oid)]}}
+
+    def load(self, teacher_id: Union[str, ObjectId]) -> TeacherScope:
+        tid = mongo_converter.convert_to_object_id(teacher_id)
+
+        homeroom = set()
+        class_q = not_deleted(
+            {
+                "$or": [
+                    self._oid_or_str("homeroom_teacher_id", tid),
+                    # legacy documents carried the homeroom teacher as teacher_id
+                    {"homeroom_teacher_id": None, **self._oid_or_str("teacher_id", tid)},
+                ]
+            }
+        )
+        for cls in self.classes.find(class_q, {"_id": 1}):
+            homeroom.add(str(cls["_id"]))
+
+        pairs = set()
+        assign_q = not_deleted(self._oid_or_str("teacher_id", tid))
+        for a in self.assignments.find(assign_q, {"class_id": 1, "subject_id": 1}):
+            if a.get("class_id") and a.get("subject_id"):
+                pairs.add((str(a["class_id"]), str(a["subject_id"])))
+
+        return TeacherScope(str(tid), frozenset(homeroom), frozenset(pairs))
+
+    def get(self, teacher_id: Union[str, ObjectId]) -> TeacherScope:
+        key = str(teacher_id)
+        now = time.monotonic()
+        with _LOCK:
+            cached = _SCOPE_CACHE.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        scope = self.load(teacher_id)
+        if self.ttl_seconds > 0:
+            with _LOCK:
+                _SCOPE_CACHE[key] = (now + self.ttl_seconds, scope)
+        return scope
+
+
+def invalidate_teacher_scopes_local(teacher_ids: Iterable[Union[str, ObjectId, None]]) -> None:
+    with _LOCK:
+        for tid in teacher_ids:
+            if tid:
+                _SCOPE_CACHE.pop(str(tid), None)
+
+
+def clear_teacher_scopes_local() -> None:
+    with _LOCK:
+        _SCOPE_CACHE.clear()
+
+
+def invalidate_teacher_scopes(teacher_ids: Iterable[Union[str, ObjectId, None]]) -> None:
+    """Drop cached scopes on every worker (broadcast when a message queue is configured)."""
+    tids = sorted({str(t) for t in teacher_ids if t})
+    if not tids:
+        return
+    # this worker never waits on the queue (or on a publish that failed)
+    invalidate_teacher_scopes_local(tids)
+    channel = control_channel()
+    if channel is not None:
+        channel.publish({"method": INVALIDATE_TEACHER_SCOPE, "teacher_ids": tids})
+
+
+def start_teacher_scope_sync() -> None:
+    """Apply scope invalidations from other workers (no-op without a message queue)."""
+    channel = control_channel()
+    if channel is None:
+        return
+
+    def handle(message: Dict[str, Any]) -> None:
+        if message.get("method") == INVALIDATE_TEACHER_SCOPE:
+            invalidate_teacher_scopes_local(message.get("teacher_ids") or [])
+
+    # invalidations published while the channel was down are lost: start over
+    socketio.start_background_task(channel.listen, handle, on_reconnect=clear_teacher_scopes_local)
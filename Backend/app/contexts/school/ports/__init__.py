@@ -1,7 +1,9 @@
 from .student_membership_port import StudentMembershipPort
 from .schedule_port import SchedulePort
+from .schedule_conflict_port import ScheduleConflictPort
 
 __all__ = [
     "StudentMembershipPort",
     "SchedulePort",
+    "ScheduleConflictPort",
 ]
@@ -0,0 +1,18 @@
+from typing import ContextManager, Protocol, Any, List, Optional, Sequence
+
+from app.contexts.school.domain.timetable_index import ScheduleConflict, TimetableEntry, TimetableIndex
+
+
+class ScheduleConflictPort(Protocol):
+    def index(self) -> TimetableIndex: ...
+    def locked(self) -> ContextManager[TimetableIndex]: ...
+
+    def find_conflicts(self, entry: TimetableEntry) -> List[ScheduleConflict]: ...
+    def validate_all(self) -> List[ScheduleConflict]: ...
+    def load_overlapping(self, entries: Sequence[TimetableEntry]) -> TimetableIndex: ...
+    def load_entry(self, slot_id: Any) -> Optional[TimetableEntry]: ...
+
+    def upsert(self, entry: TimetableEntry) -> None: ...
+    def remove(self, slot_id: Any) -> Optional[TimetableEntry]: ...
+    def refresh_slot(self, slot_id: Any) -> None: ...
+    def invalidate(self) -> None: ...
@@ -4,7 +4,9 @@ from .attendance_read_model import AttendanceReadModel
 from .teacher_read_model import TeacherReadModel
 from .teacher_assignment_read_model import TeacherAssignmentReadModel
 from .grade_read_model import GradeReadModel
+from .grade_stats_read_model import GradeStatsReadModel
 from .schedule_read_model import ScheduleReadModel
+from .timetable_read_model import TimetableReadModel
 
 
 __all__ = [
@@ -14,5 +16,7 @@ __all__ = [
     "TeacherReadModel",
     "TeacherAssignmentReadModel",
     "GradeReadModel",
+    "GradeStatsReadModel",
     "ScheduleReadModel",
+    "TimetableReadModel",
 ]
\ No newline at end of file
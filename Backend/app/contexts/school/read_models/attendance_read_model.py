@@ -236,10 +236,11 @@ class AttendanceReadModel(MongoErrorMixin):
         class_id: Union[str, ObjectId],
         *,
         show_deleted: ShowDeleted = "active",
+        projection: Optional[Dict[str, int]] = None,
     ) -> List[Dict[str, Any]]:
         cid = self._oid(class_id)
         q = self._q({"class_id": cid}, show_deleted=show_deleted)
-        return list(self._collection.find(q).sort(FIELDS.k(FIELDS.created_at), -1))
+        return list(self._collection.find(q, projection).sort(FIELDS.k(FIELDS.created_at), -1))
 
 
     def list_attendance_for_class_by_date(
@@ -251,6 +252,7 @@ class AttendanceReadModel(MongoErrorMixin):
         subject_ids: Optional[List[Union[str, ObjectId]]] = None,  # NEW
         schedule_slot_id: Union[str, ObjectId, None] = None,
         show_deleted: ShowDeleted = "active",
+        projection: Optional[Dict[str, int]] = None,
     ) -> List[Dict[str, Any]]:
         cid = self._oid(class_id)
         extra: Dict[str, Any] = {"class_id": cid}
@@ -278,7 +280,7 @@ class AttendanceReadModel(MongoErrorMixin):
         # no date => latest by created_at
         if record_date is None or str(record_date).strip() == "":
             q = self._q(extra, show_deleted=show_deleted)
-            return list(self._collection.find(q).sort(FIELDS.k(FIELDS.created_at), -1))
+            return list(self._collection.find(q, projection).sort(FIELDS.k(FIELDS.created_at), -1))
 
         if isinstance(record_date, str):
             record_date = datetime.strptime(record_date, "%Y-%m-%d").date()
@@ -290,7 +292,7 @@ class AttendanceReadModel(MongoErrorMixin):
             },
             show_deleted=show_deleted,
         )
-        return list(self._collection.find(q).sort(FIELDS.k(FIELDS.created_at), -1))
+        return list(self._collection.find(q, projection).sort(FIELDS.k(FIELDS.created_at), -1))
     # -----------------------------
     # Latest (DEFAULT: latest by record_date)
     # -----------------------------
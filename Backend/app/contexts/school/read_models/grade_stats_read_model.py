@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Optional, Union, TYPE_CHECKING
+
+from bson import ObjectId
+from pymongo.collection import Collection
+from pymongo.database import Database
+
+from app.contexts.core.errors.mongo_error_mixin import MongoErrorMixin
+from app.contexts.school.domain.grade_statistics import GradeArrays, compute_grade_statistics
+from app.contexts.shared.lifecycle.filters import ShowDeleted, by_show_deleted
+from app.contexts.shared.model_converter import mongo_converter
+
+if TYPE_CHECKING:
+    from app.contexts.shared.services.display_name_service import DisplayNameService
+
+
+# Only the four columns the statistics need; keeps BSON decode small.
+_STATS_PROJECTION: Dict[str, int] = {"_id": 0, "student_id": 1, "subject_id": 1, "type": 1, "score": 1}
+_STATS_BATCH_SIZE = 5000
+
+
+class GradeStatsReadModel(MongoErrorMixin):
+    """
+    Cohort statistics over grades (percentiles, std, z-scores, rank, weighted averages).
+
+    - Pulls compact (student_id, subject_id, type, score) rows with a projection
+    - Computes with NumPy in app.contexts.school.domain.grade_statistics
+    - `display` is OPTIONAL; when passed, student names are attached to each row
+    """
+
+    def __init__(self, db: Database, *, display: Optional[DisplayNameService] = None):
+        self.collection: Collection = db["grades"]
+        self.display = display
+
+    def _oid(self, v: Union[str, ObjectId]) -> ObjectId:
+        return mongo_converter.convert_to_object_id(v)
+
+    def _term_filter(self, term: Optional[str]) -> Dict[str, Any]:
+        # same semantics as GradeReadModel._term_filter
+        t = str(term or "").strip()
+        if not t:
+            return {}
+        if t in ("S1", "S2"):
+            return {"term": {"$regex": f"-{t}$"}}
+        return {"term": t}
+
+    def load_arrays(
+        self,
+        *,
+        class_id: Optional[Union[str, ObjectId]] = None,
+        subject_id: Optional[Union[str, ObjectId]] = None,
+        term: Optional[str] = None,
+        show_deleted: ShowDeleted = "active",
+    ) -> GradeArrays:
+        match: Dict[str, Any] = {}
+        if class_id is not None:
+            match["class_id"] = self._oid(class_id)
+        if subject_id is not None:
+            match["subject_id"] = self._oid(subject_id)
+        match.update(self._term_filter(term))
+
+        query = by_show_deleted(show_deleted, match)
+        try:
+            cursor = self.collection.find(query, _STATS_PROJECTION).batch_size(_STATS_BATCH_SIZE)
+            return GradeArrays.from_rows(cursor)
+        except Exception as e:
+            self._handle_mongo_error("load_grade_arrays", e)
+            return GradeArrays()
+
+    def get_statistics(
+        self,
+        *,
+        class_id: Optional[Union[str, ObjectId]] = None,
+        subject_id: Optional[Union[str, ObjectId]] = None,
+        term: Optional[str] = None,
+        weights: Optional[Mapping[str, float]] = None,
+        show_deleted: ShowDeleted = "active",
+    ) -> Dict[str, Any]:
+        arrays = self.load_arrays(
+            class_id=class_id,
+            subject_id=subject_id,
+            term=term,
+            show_deleted=show_deleted,
+        )
+        stats = compute_grade_statistics(arrays, weights=weights)
+
+        names = {}
+        if self.display is not None and stats["students"]:
+            names = self.display.student_names_for_student_ids(arrays.student_ids)
+
+        for row in stats["students"]:
+            sid = row["student_id"]
+            pack = names.get(sid) or {}
+            row["student_id"] = str(sid)
+            row["student_name_en"] = pack.get("en") or None
+            row["student_name_kh"] = pack.get("kh") or None
+            row["student_name"] = pack.get("en") or pack.get("kh") or "Unknown"
+
+        stats["class_id"] = str(class_id) if class_id else None
+        stats["subject_id"] = str(subject_id) if subject_id else None
+        stats["term"] = term or None
+        return stats
@@ -226,13 +226,16 @@ class StudentStatsReadModel(MongoErrorMixin):
         student_id: Union[str, ObjectId],
         *,
         show_deleted: ShowDeleted = "active",
+        projection: Optional[Dict[str, int]] = None,
     ) -> List[Dict[str, Any]]:
         class_doc = self._get_active_current_class_doc(student_id, show_deleted=show_deleted)
         if not class_doc:
             return []
 
         class_id = class_doc["_id"]
-        schedule_docs = self._schedule_read.list_schedules_for_classes([class_id], show_deleted=show_deleted) 
+        schedule_docs = self._schedule_read.list_schedules_for_classes(
+            [class_id], show_deleted=show_deleted, projection=projection
+        )
         if not schedule_docs:
             return []
 
@@ -121,4 +121,34 @@ class TeacherAssignmentReadModel:
             if tid:
                 out.append(tid)
         # de-dup
-        return list({ObjectId(str(x)) for x in out})
\ No newline at end of file
+        return list({ObjectId(str(x)) for x in out})
+
+    def list_teacher_class_pairs_for_subject(
+        self,
+        subject_id: Union[str, ObjectId],
+        *,
+        show_deleted: ShowDeleted = "active",
+    ) -> List[Dict[str, ObjectId]]:
+        """
+        One query: every (teacher_id, class_id) assigned to teach `subject_id`.
+        """
+        sid = self._oid(subject_id)
+        q = self._q(self._match_oid_or_str("subject_id", sid), show_deleted=show_deleted)
+        cursor = self._collection.find(q, projection={"_id": 0, "teacher_id": 1, "class_id": 1})
+        return [d for d in cursor if d.get("teacher_id")]
+
+    def list_for_classes(
+        self,
+        class_ids: List[Union[str, ObjectId]],
+        *,
+        show_deleted: ShowDeleted = "active",
+    ) -> List[dict]:
+        """
+        One query for many classes (oldest assignment first per class/subject).
+        """
+        oids = [self._oid(c) for c in class_ids]
+        if not oids:
+            return []
+        q = self._q({"class_id": {"$in": oids + [str(o) for o in oids]}}, show_deleted=show_deleted)
+        projection = {"_id": 0, "teacher_id": 1, "class_id": 1, "subject_id": 1}
+        return list(self._collection.find(q, projection).sort(FIELDS.k(FIELDS.created_at), 1))
@@ -0,0 +1,145 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from bson import ObjectId
+from pymongo.database import Database
+
+from app.contexts.school.adapters.mongo_schedule_conflict_index import MongoScheduleConflictIndex
+from app.contexts.school.domain.timetable_index import (
+    TimetableIndex,
+    merge_intervals,
+    minutes_to_hhmm,
+    to_minutes,
+)
+from app.contexts.school.errors.schedule_exceptions import ScheduleNotFoundException
+from app.contexts.school.read_models.teacher_assignment_read_model import TeacherAssignmentReadModel
+
+DEFAULT_DAYS: Tuple[int, ...] = (1, 2, 3, 4, 5)
+DEFAULT_DAY_START = "07:00"
+DEFAULT_DAY_END = "17:00"
+DEFAULT_MIN_MINUTES = 30
+
+
+class TimetableReadModel:
+    """
+    Timetable queries answered from the cached in-memory TimetableIndex:
+
+    - free_slots: when are teacher T, class C and room R all free? (interval-set subtraction)
+    - substitutes_for_slot: which qualified teachers are free during slot S?
+
+    The only Mongo round-trip per call is one teacher_subject_assignments query
+    for substitutes; busy intervals never hit the database.
+    """
+
+    def __init__(self, db: Database, *, conflict_index: Optional[MongoScheduleConflictIndex] = None):
+        self._index = conflict_index or MongoScheduleConflictIndex(db)
+        self._assignments = TeacherAssignmentReadModel(db)
+
+    def free_slots(
+        self,
+        *,
+        teacher_id: Optional[Union[str, ObjectId]] = None,
+        class_id: Optional[Union[str, ObjectId]] = None,
+        room: Optional[str] = None,
+        days: Iterable[int] = DEFAULT_DAYS,
+        day_start: str = DEFAULT_DAY_START,
+        day_end: str = DEFAULT_DAY_END,
+        min_minutes: int = DEFAULT_MIN_MINUTES,
+    ) -> List[Dict[str, Any]]:
+        resources: List[Tuple[str, Any]] = []
+        if teacher_id:
+            resources.append(("teacher", teacher_id))
+        if class_id:
+            resources.append(("class", class_id))
+        if room:
+            resources.append(("room", room))
+        if not resources:
+            raise ValueError("At least one of teacher_id, class_id or room is required")
+
+        start, end = to_minutes(day_start), to_minutes(day_end)
+        if start >= end:
+            raise ValueError("day_start must be before day_end")
+
+        out: List[Dict[str, Any]] = []
+        with self._index.locked() as idx:
+            for day in sorted({int(d) for d in days}):
+                for s, e in idx.free_intervals(
+                    resources,
+                    day,
+                    day_start=start,
+                    day_end=end,
+                    min_minutes=max(1, int(min_minutes)),
+                ):
+                    out.append(
+                        {
+                            "day_of_week": day,
+                            "start_time": minutes_to_hhmm(s),
+                            "end_time": minutes_to_hhmm(e),
+                            "minutes": e - s,
+                        }
+                    )
+        return out
+
+    def _qualified_teachers(self, class_id: str, subject_id: Optional[str]) -> Dict[str, str]:
+        """
+        teacher_id -> match tier.
+        - "class_subject": assigned this subject in this class
+        - "subject":       assigned this subject in another class
+        - "class":         slot has no subject; teaches something in this class
+        """
+        tiers: Dict[str, str] = {}
+        if subject_id:
+            for row in self._assignments.list_teacher_class_pairs_for_subject(subject_id):
+                tid = str(row["teacher_id"])
+                if str(row.get("class_id")) == class_id:
+                    tiers[tid] = "class_subject"
+                else:
+                    tiers.setdefault(tid, "subject")
+        else:
+            for row in self._assignments.list_for_class(class_id):
+                if row.get("teacher_id"):
+                    tiers.setdefault(str(row["teacher_id"]), "class")
+        return tiers
+
+    def substitutes_for_slot(self, slot_id: Union[str, ObjectId]) -> Dict[str, Any]:
+        with self._index.locked() as idx:
+            slot = idx.get(slot_id)
+        if slot is None:
+            raise ScheduleNotFoundException(str(slot_id))
+
+        tiers = self._qualified_teachers(slot.class_id, slot.subject_id)
+        tiers.pop(slot.teacher_id, None)
+
+        items: List[Dict[str, Any]] = []
+        with self._index.locked() as idx:
+            for tid, match in tiers.items():
+                if not idx.is_free("teacher", tid, slot.day_of_week, slot.start, slot.end):
+                    continue
+                items.append(
+                    {
+                        "teacher_id": tid,
+                        "match": match,
+                        "busy_minutes_that_day": _busy_minutes(idx, tid, slot.day_of_week),
+                    }
+                )
+
+        # best match first, then the least loaded teacher that day
+        rank = {"class_subject": 0, "subject": 1, "class": 2}
+        items.sort(key=lambda r: (rank[r["match"]], r["busy_minutes_that_day"], r["teacher_id"]))
+
+        return {
+            "slot": {
+                "slot_id": slot.slot_id,
+                "class_id": slot.class_id,
+                "teacher_id": slot.teacher_id,
+                "subject_id": slot.subject_id,
+                "day_of_week": slot.day_of_week,
+                "start_time": minutes_to_hhmm(slot.start),
+                "end_time": minutes_to_hhmm(slot.end),
+                "room": slot.room,
+            },
+            "items": items,
+        }
+
+
+def _busy_minutes(idx: TimetableIndex, teacher_id: str, day_of_week: int) -> int:
+    return sum(e - s for s, e in merge_intervals(idx.busy("teacher", teacher_id, day_of_week)))
@@ -18,6 +18,10 @@ class IScheduleRepository(ABC):
     def insert(self, slot: ScheduleSlot) -> ScheduleSlot:
         ...
 
+    @abstractmethod
+    def insert_many(self, slots: list[ScheduleSlot]) -> list[ScheduleSlot]:
+        ...
+
     @abstractmethod
     def update(self, slot: ScheduleSlot) -> Optional[ScheduleSlot]:
         ...
@@ -63,6 +67,12 @@ class MongoScheduleRepository(IScheduleRepository):
         self.collection.insert_one(payload)
         return slot
 
+    def insert_many(self, slots: list[ScheduleSlot]) -> list[ScheduleSlot]:
+        if not slots:
+            return []
+        self.collection.insert_many([self.mapper.to_persistence(s) for s in slots], ordered=True)
+        return slots
+
     def update(self, slot: ScheduleSlot) -> Optional[ScheduleSlot]:
         payload = self.mapper.to_persistence(slot)
         _id = payload.pop("_id")
@@ -33,11 +33,12 @@ from app.contexts.school.services.lifecycle import (
     GradeLifecycleService,
     AttendanceLifecycleService,
 )
-from app.contexts.school.ports import SchedulePort, StudentMembershipPort
+from app.contexts.school.ports import SchedulePort, ScheduleConflictPort, StudentMembershipPort
 from app.contexts.student.services.student_service import StudentService
 
 from app.contexts.student.adapters.mongo_student_membership_gateway import MongoStudentMembershipGateway
 from app.contexts.school.adapters.mongo_schedule_gateway import MongoScheduleGateway
+from app.contexts.school.adapters.mongo_schedule_conflict_index import MongoScheduleConflictIndex
 
 from app.contexts.school.policies import (
     SubjectUpdatePolicy,
@@ -60,6 +61,7 @@ def build_school_facade(db: Database) -> SchoolFacade:
 
     student_membership: StudentMembershipPort = MongoStudentMembershipGateway(db)
     schedule: SchedulePort = MongoScheduleGateway(db)
+    schedule_conflicts: ScheduleConflictPort = MongoScheduleConflictIndex(db)
 
     class_lifecycle = ClassLifecycleService(db)
     subject_lifecycle = SubjectLifecycleService(db)
@@ -95,6 +97,7 @@ def build_school_facade(db: Database) -> SchoolFacade:
         schedule_repo=schedule_repo,
         class_repo=class_repo,
         schedule_lifecycle=schedule_lifecycle,
+        conflict_index=schedule_conflicts,
     )
 
     attendance_service = AttendanceService(
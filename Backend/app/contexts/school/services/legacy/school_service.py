@@ -140,4 +140,19 @@ class SchoolService:
         return self._facade.schedule_service.restore_schedule_slot(*args, **kwargs)
 
     def hard_delete_schedule_slot(self, *args, **kwargs):
-        return self._facade.schedule_service.hard_delete_schedule_slot(*args, **kwargs)
\ No newline at end of file
+        return self._facade.schedule_service.hard_delete_schedule_slot(*args, **kwargs)
+
+    def check_schedule_slot_conflicts(self, *args, **kwargs):
+        return self._facade.schedule_service.check_schedule_slot_conflicts(*args, **kwargs)
+
+    def validate_timetable(self, *args, **kwargs):
+        return self._facade.schedule_service.validate_timetable(*args, **kwargs)
+
+    def generate_timetable(self, *args, **kwargs):
+        return self._facade.schedule_service.generate_timetable(*args, **kwargs)
+
+    def bulk_create_schedule_slots(self, *args, **kwargs):
+        return self._facade.schedule_service.bulk_create_schedule_slots(*args, **kwargs)
+
+    def clone_class_schedule(self, *args, **kwargs):
+        return self._facade.schedule_service.clone_class_schedule(*args, **kwargs)
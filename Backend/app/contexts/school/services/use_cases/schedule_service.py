@@ -1,23 +1,97 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 from datetime import time
+
 from bson import ObjectId
 
+from app.contexts.core.errors.app_base_exception import AppBaseException
+from app.contexts.infra.concurrency.offload import run_off_hub
 from app.contexts.school.domain.schedule import ScheduleSlot, DayOfWeek
+from app.contexts.school.domain.timetable_index import TimetableEntry, TimetableIndex
+from app.contexts.school.domain.timetable_solver import LessonDemand, Period, TimetableSolver
 from app.contexts.school.errors.class_exceptions import ClassNotFoundException
 from app.contexts.school.errors.schedule_exceptions import (
+    ScheduleBulkValidationException,
+    ScheduleConflictException,
     ScheduleNotFoundException,
     ScheduleUpdateFailedException,
+    TimetableIncompleteException,
 )
 
 from ._base import OidMixin
 
 
 class ScheduleService(OidMixin):
-    def __init__(self, *, schedule_repo, class_repo, schedule_lifecycle):
+    def __init__(self, *, schedule_repo, class_repo, schedule_lifecycle, conflict_index=None):
         self.schedule_repo = schedule_repo
         self.class_repo = class_repo
         self.schedule_lifecycle = schedule_lifecycle
+        # ScheduleConflictPort; None disables conflict checks (e.g. unit tests)
+        self.conflict_index = conflict_index
+
+    # ------------------------
+    # Conflict detection
+    # ------------------------
+
+    def _write_guard(self):
+        """
+        Serialize check + write within this worker. The check itself reads
+        Mongo (load_overlapping), so slots written by other workers count too.
+        """
+        return self.conflict_index.locked() if self.conflict_index is not None else nullcontext()
+
+    def _ensure_no_conflicts(self, *slots: ScheduleSlot) -> None:
+        if self.conflict_index is None or not slots:
+            return
+        entries = [TimetableEntry.from_slot(s) for s in slots]
+        current = self.conflict_index.load_overlapping(entries)
+        conflicts = [c for e in entries for c in current.find_conflicts(e)]
+        if conflicts:
+            raise ScheduleConflictException([c.to_dict() for c in conflicts])
+
+    def _index_upsert(self, slot: ScheduleSlot) -> None:
+        if self.conflict_index is not None:
+            self.conflict_index.upsert(TimetableEntry.from_slot(slot))
+
+    def _index_remove(self, slot_id: ObjectId) -> None:
+        if self.conflict_index is not None:
+            self.conflict_index.remove(slot_id)
+
+    def check_schedule_slot_conflicts(
+        self,
+        class_id: str | ObjectId,
+        teacher_id: str | ObjectId,
+        day_of_week: DayOfWeek | int,
+        start_time: time,
+        end_time: time,
+        room: str | None = None,
+        slot_id: str | ObjectId | None = None,
+    ) -> list[dict]:
+        """
+        Report (without writing) what a new/moved slot would clash with.
+        Pass slot_id when checking a move so the slot does not clash with itself.
+        """
+        if self.conflict_index is None:
+            return []
+        slot = ScheduleSlot(
+            class_id=self._oid(class_id),
+            teacher_id=self._oid(teacher_id),
+            day_of_week=day_of_week,
+            start_time=start_time,
+            end_time=end_time,
+            room=room,
+            id=self._oid(slot_id) if slot_id else None,
+        )
+        return [c.to_dict() for c in self.conflict_index.find_conflicts(TimetableEntry.from_slot(slot))]
+
+    def validate_timetable(self) -> list[dict]:
+        """
+        Bulk mode: every overlapping pair across the whole active timetable.
+        """
+        if self.conflict_index is None:
+            return []
+        return [c.to_dict() for c in self.conflict_index.validate_all()]
 
     # ------------------------
     # Create / Update (domain)
@@ -48,7 +122,11 @@ class ScheduleService(OidMixin):
             room=room,
             subject_id=subject_id,
         )
-        return self.schedule_repo.insert(slot)
+        with self._write_guard():
+            self._ensure_no_conflicts(slot)
+            inserted = self.schedule_repo.insert(slot)
+            self._index_upsert(inserted)
+        return inserted
 
     def assign_subject_to_schedule_slot(
         self,
@@ -64,6 +142,7 @@ class ScheduleService(OidMixin):
         updated = self.schedule_repo.update(slot)
         if updated is None:
             raise ScheduleUpdateFailedException(str(slot_id))
+        self._index_upsert(updated)
         return updated
 
     def move_schedule_slot(
@@ -88,12 +167,215 @@ class ScheduleService(OidMixin):
             new_room=new_room,
             new_subject_id=new_subject_id,
         )
-
-        updated = self.schedule_repo.update(slot)
-        if updated is None:
-            raise ScheduleUpdateFailedException(str(slot_id))
+        with self._write_guard():
+            self._ensure_no_conflicts(slot)
+            updated = self.schedule_repo.update(slot)
+            if updated is None:
+                raise ScheduleUpdateFailedException(str(slot_id))
+            self._index_upsert(updated)
         return updated
 
+    # ------------------------
+    # Bulk create / clone
+    # ------------------------
+
+    def _build_bulk_slots(self, rows: list[dict]) -> tuple[list[ScheduleSlot], list[dict]]:
+        """
+        Build domain slots for every row; collect per-row errors instead of stopping
+        at the first one. Class existence is checked once per distinct class.
+        """
+        slots: list[ScheduleSlot] = []
+        errors: list[dict] = []
+        class_ok: dict[ObjectId, bool] = {}
+
+        for i, row in enumerate(rows):
+            try:
+                class_oid = self._oid(row["class_id"])
+                if class_oid not in class_ok:
+                    class_ok[class_oid] = self.class_repo.find_by_id(class_oid) is not None
+                if not class_ok[class_oid]:
+                    raise ClassNotFoundException(str(row["class_id"]))
+
+                slots.append(
+                    ScheduleSlot(
+                        class_id=class_oid,
+                        teacher_id=self._oid(row["teacher_id"]),
+                        day_of_week=row["day_of_week"],
+                        start_time=row["start_time"],
+                        end_time=row["end_time"],
+                        room=row.get("room"),
+                        subject_id=row.get("subject_id") or None,
+                    )
+                )
+            except AppBaseException as e:
+                errors.append({"row": i, "error_code": e.error_code, "message": e.message})
+            except (KeyError, TypeError, ValueError) as e:
+                errors.append({"row": i, "error_code": "SCHEDULE_ROW_INVALID", "message": str(e)})
+        return slots, errors
+
+    def _batch_conflicts(self, slots: list[ScheduleSlot], rows_of: list[int]) -> list[dict]:
+        """
+        One pass: each new slot is checked against the active slots in Mongo
+        (one read for the whole batch) and against the rows before it in the batch.
+        """
+        entries = [TimetableEntry.from_slot(s) for s in slots]
+        current = self.conflict_index.load_overlapping(entries) if self.conflict_index is not None else None
+        batch = TimetableIndex()
+        row_by_slot = {str(s.id): r for s, r in zip(slots, rows_of)}
+        out: list[dict] = []
+        for entry, row in zip(entries, rows_of):
+            found = current.find_conflicts(entry) if current is not None else []
+            found += batch.find_conflicts(entry)
+            for c in found:
+                item = {
+                    "row": row,
+                    "error_code": "SCHEDULE_CONFLICT",
+                    "message": f"{c.kind} {c.resource} is already booked",
+                    **c.to_dict(),
+                }
+                if c.other_slot_id in row_by_slot:
+                    item["other_row"] = row_by_slot[c.other_slot_id]
+                out.append(item)
+            batch.add(entry)
+        return out
+
+    def bulk_create_schedule_slots(self, rows: list[dict], *, dry_run: bool = False) -> dict:
+        """
+        All-or-nothing bulk create: validate every row (domain rules + conflicts)
+        in one pass, then write with a single insert_many.
+        """
+        slots, errors = self._build_bulk_slots(rows)
+        bad_rows = {e["row"] for e in errors}
+        rows_of = [i for i in range(len(rows)) if i not in bad_rows]
+
+        with self._write_guard():
+            errors += self._batch_conflicts(slots, rows_of)
+            errors.sort(key=lambda e: e["row"])
+
+            if dry_run:
+                return {"dry_run": True, "inserted": 0, "errors": errors, "slots": slots}
+            if errors:
+                raise ScheduleBulkValidationException(errors)
+
+            inserted = self.schedule_repo.insert_many(slots)
+            for slot in inserted:
+                self._index_upsert(slot)
+        return {"dry_run": False, "inserted": len(inserted), "errors": [], "slots": inserted}
+
+    def clone_class_schedule(
+        self,
+        source_class_id: str | ObjectId,
+        target_class_id: str | ObjectId,
+        *,
+        teacher_for_subject: dict[str, str] | None = None,
+        keep_rooms: bool = False,
+        dry_run: bool = False,
+    ) -> dict:
+        """
+        Copy every active slot of the source class onto the target class.
+
+        teacher_for_subject maps subject_id -> teacher_id for the target class;
+        subjects not in the map keep the source teacher.
+        """
+        source_oid = self._oid(source_class_id)
+        if self.class_repo.find_by_id(source_oid) is None:
+            raise ClassNotFoundException(str(source_class_id))
+
+        teacher_for_subject = teacher_for_subject or {}
+        rows = [
+            {
+                "class_id": target_class_id,
+                "teacher_id": teacher_for_subject.get(str(s.subject_id), s.teacher_id),
+                "day_of_week": s.day_of_week,
+                "start_time": s.start_time,
+                "end_time": s.end_time,
+                "room": s.room if keep_rooms else None,
+                "subject_id": s.subject_id,
+            }
+            for s in sorted(
+                self.schedule_repo.list_for_class(source_oid),
+                key=lambda s: (int(s.day_of_week), s.start_time),
+            )
+        ]
+        return self.bulk_create_schedule_slots(rows, dry_run=dry_run)
+
+    # ------------------------
+    # Timetable generation
+    # ------------------------
+
+    def generate_timetable(
+        self,
+        demands: list[LessonDemand],
+        periods: list[Period],
+        *,
+        rooms: list[str] | None = None,
+        max_same_subject_per_day: int = 2,
+        time_budget_ms: int = 3000,
+        seed: int = 0,
+        dry_run: bool = True,
+        allow_partial: bool = False,
+    ) -> dict:
+        """
+        Solve around the existing active timetable, then (unless dry_run) write
+        every generated slot with one insert_many.
+
+        The solve is pure CPU work for up to time_budget_ms, so it runs off the
+        eventlet hub on a copy of the index; the index lock is only held for
+        the copy and for the final re-check + insert.
+        """
+        existing = None
+        if self.conflict_index is not None:
+            with self.conflict_index.locked() as idx:
+                existing = TimetableIndex(idx.entries())
+
+        solver = TimetableSolver(
+            demands,
+            periods,
+            rooms=rooms or (),
+            existing=existing,
+            max_same_subject_per_day=max_same_subject_per_day,
+            seed=seed,
+        )
+        result = run_off_hub(solver.solve, time_budget_ms=time_budget_ms)
+
+        out = {
+            "dry_run": dry_run,
+            "complete": result.complete,
+            "inserted": 0,
+            "stats": result.stats,
+            "unplaced": result.unplaced,
+            "slots": [p.to_dict() for p in result.placements],
+        }
+        if dry_run:
+            return out
+        if not result.complete and not allow_partial:
+            raise TimetableIncompleteException(result.unplaced)
+
+        slots = [
+            ScheduleSlot(
+                class_id=self._oid(p.class_id),
+                teacher_id=self._oid(p.teacher_id),
+                day_of_week=p.day_of_week,
+                start_time=time(p.start // 60, p.start % 60),
+                end_time=time(p.end // 60, p.end % 60),
+                room=p.room,
+                subject_id=self._oid(p.subject_id),
+            )
+            for p in result.placements
+        ]
+        with self._write_guard():
+            # the timetable may have moved on while we were solving
+            self._ensure_no_conflicts(*slots)
+            inserted = self.schedule_repo.insert_many(slots)
+            for slot in inserted:
+                self._index_upsert(slot)
+
+        out["inserted"] = len(inserted)
+        out["slots"] = [{**p.to_dict(), "id": str(s.id)} for p, s in zip(result.placements, inserted)]
+        # domain slots for callers that notify (not part of the response)
+        out["schedule_slots"] = inserted
+        return out
+
     # ------------------------
     # Lifecycle operations
     # ------------------------
@@ -102,19 +384,38 @@ class ScheduleService(OidMixin):
         oid = self._oid(slot_id)
         actor_oid = self._oid(actor_id)
         res = self.schedule_lifecycle.soft_delete_slot(oid, actor_oid)
+        self._index_remove(oid)
         return res.modified_count > 0
 
     def restore_schedule_slot(self, slot_id: str | ObjectId) -> bool:
+        """
+        Restoring re-activates the slot, so it must not clash with whatever was
+        booked into its time while it was deleted.
+        """
         oid = self._oid(slot_id)
-        res = self.schedule_lifecycle.restore_slot(oid)
+        if self.conflict_index is None:
+            return self.schedule_lifecycle.restore_slot(oid).modified_count > 0
+
+        with self._write_guard():
+            entry = self.conflict_index.load_entry(oid)
+            if entry is not None:
+                conflicts = self.conflict_index.load_overlapping([entry]).find_conflicts(entry)
+                if conflicts:
+                    raise ScheduleConflictException([c.to_dict() for c in conflicts])
+            res = self.schedule_lifecycle.restore_slot(oid)
+            self.conflict_index.refresh_slot(oid)
         return res.modified_count > 0
 
     def hard_delete_schedule_slot(self, slot_id: str | ObjectId, actor_id: str | ObjectId) -> bool:
         oid = self._oid(slot_id)
         actor_oid = self._oid(actor_id)
         res = self.schedule_lifecycle.hard_delete_slot(oid, actor_oid)
+        self._index_remove(oid)
         return res.deleted_count > 0
 
     # Optional: keep legacy “delete” name if controllers already call it
     def delete_schedule_slot(self, slot_id: str | ObjectId) -> bool:
-        return self.schedule_repo.delete(self._oid(slot_id))
\ No newline at end of file
+        oid = self._oid(slot_id)
+        deleted = self.schedule_repo.delete(oid)
+        self._index_remove(oid)
+        return deleted
\ No newline at end of file
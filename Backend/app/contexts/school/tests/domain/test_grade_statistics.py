@@ -0,0 +1,107 @@
+import pytest
+from bson import ObjectId
+
+from app.contexts.school.domain.grade_statistics import (
+    GradeArrays,
+    compute_grade_statistics,
+    parse_weights_arg,
+)
+
+
+def _row(student_id, score, type_="exam", subject_id=None):
+    return {"student_id": student_id, "subject_id": subject_id, "type": type_, "score": score}
+
+
+def test_from_rows_encodes_ids_densely_and_skips_incomplete_rows():
+    s1, s2 = ObjectId(), ObjectId()
+    arrays = GradeArrays.from_rows(
+        [
+            _row(s1, 80),
+            _row(s2, 60, "quiz"),
+            _row(s1, 70, "homework"),
+            {"student_id": s2, "type": "exam", "score": None},
+        ]
+    )
+
+    assert len(arrays) == 3
+    assert arrays.student_ids == [s1, s2]
+    assert arrays.student_idx.tolist() == [0, 1, 0]
+    assert arrays.type_code.tolist() == [0, 3, 2]
+
+
+def test_empty_arrays_return_empty_statistics():
+    stats = compute_grade_statistics(GradeArrays())
+
+    assert stats["student_count"] == 0
+    assert stats["students"] == []
+    assert stats["summary"]["count"] == 0
+    assert stats["summary"]["mean"] is None
+
+
+def test_summary_mean_std_and_percentiles():
+    rows = [_row(ObjectId(), s) for s in (10, 20, 30, 40, 50)]
+    stats = compute_grade_statistics(GradeArrays.from_rows(rows))
+
+    summary = stats["summary"]
+    assert summary["count"] == 5
+    assert summary["mean"] == 30.0
+    assert summary["std"] == pytest.approx(14.14, abs=0.01)
+    assert summary["min"] == 10.0
+    assert summary["max"] == 50.0
+    assert summary["percentiles"]["p50"] == 30.0
+
+
+def test_weighted_average_renormalizes_over_present_types():
+    s1 = ObjectId()
+    rows = [_row(s1, 90, "exam"), _row(s1, 70, "exam"), _row(s1, 50, "quiz")]
+    stats = compute_grade_statistics(
+        GradeArrays.from_rows(rows),
+        weights={"exam": 0.75, "quiz": 0.25},
+    )
+
+    student = stats["students"][0]
+    # exam mean 80, quiz mean 50, assignment/homework absent -> 0.75*80 + 0.25*50
+    assert student["weighted_avg"] == 72.5
+    assert student["mean"] == pytest.approx(70.0)
+    assert student["by_type"] == {"exam": 80.0, "quiz": 50.0}
+    assert student["grade_count"] == 3
+
+
+def test_rank_uses_competition_ranking_and_sorts_output():
+    a, b, c, d = ObjectId(), ObjectId(), ObjectId(), ObjectId()
+    rows = [_row(a, 70), _row(b, 90), _row(c, 70), _row(d, 50)]
+    stats = compute_grade_statistics(GradeArrays.from_rows(rows))
+
+    ranks = [(s["student_id"], s["rank"]) for s in stats["students"]]
+    assert ranks == [(b, 1), (a, 2), (c, 2), (d, 4)]
+
+
+def test_z_score_and_percentile_rank():
+    a, b = ObjectId(), ObjectId()
+    stats = compute_grade_statistics(GradeArrays.from_rows([_row(a, 40), _row(b, 80)]))
+
+    by_id = {s["student_id"]: s for s in stats["students"]}
+    assert by_id[b]["z_score"] == 1.0
+    assert by_id[a]["z_score"] == -1.0
+    assert by_id[b]["percentile"] == 75.0
+    assert by_id[a]["percentile"] == 25.0
+
+
+def test_z_score_is_zero_when_no_spread():
+    rows = [_row(ObjectId(), 60), _row(ObjectId(), 60)]
+    stats = compute_grade_statistics(GradeArrays.from_rows(rows))
+
+    assert [s["z_score"] for s in stats["students"]] == [0.0, 0.0]
+    assert [s["rank"] for s in stats["students"]] == [1, 1]
+
+
+def test_parse_weights_arg_ignores_unknown_and_malformed_pairs():
+    assert parse_weights_arg("exam:0.6, quiz:0.1,bogus:1,homework:x,assignment") == {
+        "exam": 0.6,
+        "quiz": 0.1,
+    }
+    assert parse_weights_arg(None) == {}
+
+
+def test_parse_weights_arg_ignores_non_finite_values():
+    assert parse_weights_arg("exam:nan,quiz:inf,homework:-inf,assignment:0.5") == {"assignment": 0.5}
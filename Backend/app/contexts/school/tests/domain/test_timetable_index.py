@@ -0,0 +1,194 @@
+import random
+from datetime import time
+
+from bson import ObjectId
+
+from app.contexts.school.domain.schedule import ScheduleSlot, DayOfWeek
+from app.contexts.school.domain.timetable_index import (
+    TimetableEntry,
+    TimetableIndex,
+    merge_intervals,
+    subtract_intervals,
+    to_minutes,
+)
+
+
+def _entry(slot_id, start, end, *, teacher="t1", class_id="c1", room=None, day=1):
+    return TimetableEntry(
+        slot_id=slot_id,
+        class_id=class_id,
+        teacher_id=teacher,
+        day_of_week=day,
+        start=start,
+        end=end,
+        room=room,
+    )
+
+
+def test_to_minutes_accepts_time_and_hhmm():
+    assert to_minutes(time(8, 30)) == 510
+    assert to_minutes("08:30") == 510
+    assert to_minutes("13:05") == 785
+
+
+def test_from_doc_normalizes_ids_and_room():
+    oid, cid, tid = ObjectId(), ObjectId(), ObjectId()
+    e = TimetableEntry.from_doc(
+        {
+            "_id": oid,
+            "class_id": cid,
+            "teacher_id": str(tid),
+            "day_of_week": 2,
+            "start_time": "09:00",
+            "end_time": "10:00",
+            "room": "  Lab  A ",
+        }
+    )
+    assert e.slot_id == str(oid)
+    assert e.class_id == str(cid)
+    assert e.teacher_id == str(tid)
+    assert (e.start, e.end) == (540, 600)
+    assert e.room == "lab a"
+
+
+def test_touching_intervals_do_not_conflict():
+    idx = TimetableIndex([_entry("a", 480, 540)])
+    assert idx.find_conflicts(_entry("b", 540, 600)) == []
+    assert idx.find_conflicts(_entry("c", 420, 480)) == []
+
+
+def test_teacher_class_and_room_conflicts_are_reported_per_resource():
+    idx = TimetableIndex([_entry("a", 480, 540, teacher="t1", class_id="c1", room="r1")])
+
+    teacher_only = idx.find_conflicts(_entry("b", 500, 560, teacher="t1", class_id="c2"))
+    assert [c.kind for c in teacher_only] == ["teacher"]
+
+    room_only = idx.find_conflicts(_entry("c", 500, 560, teacher="t2", class_id="c2", room="r1"))
+    assert [c.kind for c in room_only] == ["room"]
+
+    all_three = idx.find_conflicts(_entry("d", 500, 560, teacher="t1", class_id="c1", room="r1"))
+    assert sorted(c.kind for c in all_three) == ["class", "room", "teacher"]
+    assert all(c.other_slot_id == "a" for c in all_three)
+
+
+def test_other_weekday_does_not_conflict():
+    idx = TimetableIndex([_entry("a", 480, 540, day=1)])
+    assert idx.find_conflicts(_entry("b", 480, 540, day=2)) == []
+
+
+def test_long_interval_is_found_from_far_left():
+    # starts well before the query window; only max_len makes it reachable
+    idx = TimetableIndex([_entry("long", 60, 900), _entry("short", 100, 110)])
+    hits = idx.find_conflicts(_entry("q", 800, 820, teacher="t1", class_id="other"))
+    assert [c.other_slot_id for c in hits] == ["long"]
+
+
+def test_move_ignores_own_slot_and_remove_frees_interval():
+    idx = TimetableIndex([_entry("a", 480, 540), _entry("b", 600, 660)])
+
+    assert idx.find_conflicts(_entry("a", 490, 550)) == []
+    assert [c.other_slot_id for c in idx.find_conflicts(_entry("a", 590, 620))] == ["b", "b"]
+
+    idx.remove("b")
+    assert idx.find_conflicts(_entry("a", 590, 620)) == []
+    assert len(idx) == 1
+
+
+def test_add_replaces_existing_slot_id():
+    idx = TimetableIndex([_entry("a", 480, 540)])
+    idx.add(_entry("a", 600, 660))
+
+    assert len(idx) == 1
+    assert idx.find_conflicts(_entry("x", 480, 540)) == []
+    assert idx.bucket("teacher", "t1", 1)[0].start == 600
+
+
+def test_from_slot_matches_domain_overlaps():
+    a = ScheduleSlot(ObjectId(), ObjectId(), DayOfWeek.MONDAY, time(8, 0), time(9, 0), room="R1")
+    b = ScheduleSlot(ObjectId(), ObjectId(), DayOfWeek.MONDAY, time(8, 30), time(9, 30), room="r1")
+
+    idx = TimetableIndex([TimetableEntry.from_slot(a)])
+    hits = idx.find_conflicts(TimetableEntry.from_slot(b))
+
+    assert a.overlaps(b)
+    assert [c.kind for c in hits] == ["room"]
+
+
+def test_validate_all_matches_brute_force():
+    rng = random.Random(7)
+    entries = []
+    for i in range(300):
+        start = rng.randrange(420, 1000, 5)
+        entries.append(
+            _entry(
+                f"s{i:03d}",
+                start,
+                start + rng.choice((30, 45, 60, 90)),
+                teacher=f"t{rng.randrange(15)}",
+                class_id=f"c{rng.randrange(10)}",
+                room=rng.choice((None, "r1", "r2", "r3")),
+                day=rng.randrange(1, 6),
+            )
+        )
+
+    idx = TimetableIndex(entries)
+    got = {(c.kind, c.resource, frozenset((c.slot_id, c.other_slot_id))) for c in idx.validate_all()}
+
+    expected = set()
+    for i, a in enumerate(entries):
+        for b in entries[i + 1:]:
+            if a.day_of_week != b.day_of_week or not (a.start < b.end and b.start < a.end):
+                continue
+            pair = frozenset((a.slot_id, b.slot_id))
+            if a.teacher_id == b.teacher_id:
+                expected.add(("teacher", a.teacher_id, pair))
+            if a.class_id == b.class_id:
+                expected.add(("class", a.class_id, pair))
+            if a.room and a.room == b.room:
+                expected.add(("room", a.room, pair))
+
+    assert got == expected
+    assert len(idx.validate_all()) == len(expected)
+
+
+def test_merge_intervals_joins_overlapping_and_touching():
+    assert merge_intervals([(600, 660), (480, 540), (530, 560), (560, 570)]) == [(480, 570), (600, 660)]
+    assert merge_intervals([]) == []
+
+
+def test_subtract_intervals_clips_to_window():
+    busy = [(400, 450), (480, 540), (530, 600), (1000, 1100)]
+    assert subtract_intervals((420, 1020), busy) == [(450, 480), (600, 1000)]
+    assert subtract_intervals((420, 1020), []) == [(420, 1020)]
+    assert subtract_intervals((480, 540), [(400, 600)]) == []
+
+
+def test_free_intervals_intersects_teacher_class_and_room():
+    idx = TimetableIndex(
+        [
+            _entry("a", 480, 540, teacher="t1", class_id="c9"),
+            _entry("b", 600, 660, teacher="t9", class_id="c1"),
+            _entry("c", 720, 780, teacher="t8", class_id="c8", room="lab"),
+            _entry("d", 480, 900, teacher="t1", class_id="c1", day=2),
+        ]
+    )
+
+    free = idx.free_intervals(
+        [("teacher", "t1"), ("class", "c1"), ("room", " lab ")],
+        1,
+        day_start=420,
+        day_end=900,
+        min_minutes=30,
+    )
+    assert free == [(420, 480), (540, 600), (660, 720), (780, 900)]
+
+    assert idx.free_intervals([("teacher", "t1")], 2, day_start=420, day_end=900, min_minutes=30) == [
+        (420, 480)
+    ]
+
+
+def test_is_free_honours_ignore_slot_id():
+    idx = TimetableIndex([_entry("a", 480, 540)])
+    assert not idx.is_free("teacher", "t1", 1, 500, 520)
+    assert idx.is_free("teacher", "t1", 1, 500, 520, ignore_slot_id="a")
+    assert idx.is_free("teacher", "t2", 1, 500, 520)
@@ -0,0 +1,113 @@
+from app.contexts.school.domain.timetable_index import TimetableEntry, TimetableIndex
+from app.contexts.school.domain.timetable_solver import (
+    LessonDemand,
+    TimetableSolver,
+    build_period_grid,
+    solve_timetable,
+)
+
+PERIOD_TIMES = [(480, 530), (540, 590), (600, 650), (660, 710)]
+
+
+def _index_of(placements):
+    return TimetableIndex(
+        TimetableEntry(
+            slot_id=str(i),
+            class_id=p.class_id,
+            teacher_id=p.teacher_id,
+            day_of_week=p.day_of_week,
+            start=p.start,
+            end=p.end,
+            room=(p.room or "").lower() or None,
+            subject_id=p.subject_id,
+        )
+        for i, p in enumerate(placements)
+    )
+
+
+def test_build_period_grid_repeats_bell_schedule_per_day():
+    grid = build_period_grid([2, 1, 1], [(540, 590), (480, 530)])
+    assert [(p.day_of_week, p.start) for p in grid] == [(1, 480), (1, 540), (2, 480), (2, 540)]
+
+
+def test_solver_places_every_lesson_without_conflicts():
+    demands = []
+    for c in range(6):
+        for s, count in enumerate((3, 3, 2, 2)):
+            demands.append(LessonDemand(f"c{c}", f"s{s}", f"t{s}-{c // 2}", count))
+    periods = build_period_grid(range(1, 4), PERIOD_TIMES)
+
+    result = solve_timetable(demands, periods, rooms=[f"R{i}" for i in range(6)], time_budget_ms=2000)
+
+    assert result.complete
+    assert len(result.placements) == 6 * 10
+    assert _index_of(result.placements).validate_all() == []
+
+
+def test_max_same_subject_per_day_is_respected():
+    demands = [LessonDemand("c1", "math", "t1", 4)]
+    periods = build_period_grid([1, 2], PERIOD_TIMES)
+
+    result = solve_timetable(demands, periods, max_same_subject_per_day=2)
+
+    per_day = {}
+    for p in result.placements:
+        per_day[p.day_of_week] = per_day.get(p.day_of_week, 0) + 1
+    assert per_day == {1: 2, 2: 2}
+
+
+def test_existing_slots_are_propagated_out_of_domains():
+    existing = TimetableIndex(
+        [TimetableEntry("old", "other", "t1", 1, 480, 530), TimetableEntry("old2", "c1", "tx", 1, 540, 590)]
+    )
+    demands = [LessonDemand("c1", "math", "t1", 2)]
+    periods = build_period_grid([1], PERIOD_TIMES)
+
+    result = solve_timetable(demands, periods, existing=existing)
+
+    assert result.complete
+    assert sorted(p.start for p in result.placements) == [600, 660]
+
+
+def test_pinned_room_and_pool_keep_labels_and_never_double_book():
+    demands = [
+        LessonDemand("c1", "lab", "t1", 2, room="Lab 1"),
+        LessonDemand("c2", "lab", "t2", 2, room="lab 1"),
+        LessonDemand("c3", "art", "t3", 2),
+    ]
+    periods = build_period_grid([1], PERIOD_TIMES)
+
+    result = solve_timetable(demands, periods, rooms=["Room A"])
+
+    assert result.complete
+    assert {p.room for p in result.placements if p.subject_id == "art"} == {"Room A"}
+    labs = [(p.day_of_week, p.start) for p in result.placements if p.subject_id == "lab"]
+    assert len(labs) == len(set(labs)) == 4
+
+
+def test_infeasible_demand_is_reported_not_placed():
+    demands = [LessonDemand("c1", "math", "t1", 5), LessonDemand("c1", "art", "t2", 1)]
+    periods = build_period_grid([1], PERIOD_TIMES)
+
+    result = TimetableSolver(demands, periods, max_same_subject_per_day=5).solve(time_budget_ms=200)
+
+    assert not result.complete
+    assert result.unplaced[0]["reason"] == "not_enough_free_periods"
+    assert result.unplaced[0]["subject_id"] == "math"
+    assert [p.subject_id for p in result.placements] == ["art"]
+
+
+def test_local_search_repairs_greedy_dead_ends():
+    # three classes share two teachers on a tight grid; greedy alone tends to strand a lesson
+    demands = [
+        LessonDemand("c1", "a", "t1", 2),
+        LessonDemand("c1", "b", "t2", 2),
+        LessonDemand("c2", "a", "t1", 2),
+        LessonDemand("c2", "b", "t2", 2),
+    ]
+    periods = build_period_grid([1], PERIOD_TIMES)
+
+    for seed in range(5):
+        result = solve_timetable(demands, periods, seed=seed, time_budget_ms=1000)
+        assert result.complete, seed
+        assert _index_of(result.placements).validate_all() == []
@@ -0,0 +1,102 @@
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+
+from app.contexts.admin.services import class_service as class_service_module
+from app.contexts.admin.services.class_service import ClassAdminService
+from app.contexts.school.policies import teacher_scope
+from app.contexts.school.policies.grade_policy import GradePolicy
+from app.contexts.school.policies.teacher_scope import TeacherScopeReader, invalidate_teacher_scopes
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    teacher_scope._SCOPE_CACHE.clear()
+    yield
+    teacher_scope._SCOPE_CACHE.clear()
+
+
+def _db(homeroom, assignments):
+    db = MagicMock()
+    cols = {"classes": MagicMock(), "teacher_subject_assignments": MagicMock()}
+    cols["classes"].find.return_value = [{"_id": c} for c in homeroom]
+    cols["teacher_subject_assignments"].find.return_value = assignments
+    db.__getitem__.side_effect = lambda name: cols.setdefault(name, MagicMock())
+    return db, cols
+
+
+def test_scope_answers_checks_from_sets():
+    tid, home, other, math = ObjectId(), ObjectId(), ObjectId(), ObjectId()
+    db, _ = _db([home], [{"class_id": other, "subject_id": math}, {"class_id": str(home), "subject_id": str(math)}])
+
+    scope = TeacherScopeReader(db).get(tid)
+
+    assert scope.is_homeroom(home) and not scope.is_homeroom(other)
+    assert scope.is_assigned(other, math) and scope.is_assigned(str(home), math)  # string storage tolerated
+    assert not scope.is_assigned(other, ObjectId())
+    assert scope.has_any_assignment_in(other)
+    assert scope.subject_ids_in(other) == [math]
+
+
+def test_scope_is_cached_until_invalidated(monkeypatch):
+    monkeypatch.setattr(teacher_scope, "control_channel", lambda: None)
+    tid = ObjectId()
+    db, cols = _db([], [])
+    reader = TeacherScopeReader(db, ttl_seconds=60)
+
+    reader.get(tid)
+    reader.get(tid)
+    assert cols["classes"].find.call_count == 1
+
+    invalidate_teacher_scopes([tid])
+    reader.get(tid)
+    assert cols["classes"].find.call_count == 2
+
+
+def test_invalidation_drops_the_local_entry_even_when_publishing(monkeypatch):
+    channel = MagicMock()
+    channel.publish.side_effect = ConnectionError("redis down")
+    monkeypatch.setattr(teacher_scope, "control_channel", lambda: channel)
+    tid = ObjectId()
+    teacher_scope._SCOPE_CACHE[str(tid)] = (float("inf"), MagicMock())
+
+    with pytest.raises(ConnectionError):
+        invalidate_teacher_scopes([tid, None])
+
+    assert str(tid) not in teacher_scope._SCOPE_CACHE
+    channel.publish.assert_called_once_with(
+        {"method": teacher_scope.INVALIDATE_TEACHER_SCOPE, "teacher_ids": [str(tid)]}
+    )
+
+
+@pytest.mark.parametrize("action", ["admin_soft_delete_class", "admin_restore_class"])
+def test_class_delete_and_restore_invalidate_its_teachers(monkeypatch, action):
+    homeroom, assigned, cid = ObjectId(), ObjectId(), ObjectId()
+    invalidated = []
+    monkeypatch.setattr(class_service_module, "invalidate_teacher_scopes", lambda ids: invalidated.extend(ids))
+    svc = ClassAdminService.__new__(ClassAdminService)
+    svc.school_service = MagicMock()
+    svc.socket_rooms = MagicMock()
+    svc.class_read_model = MagicMock()
+    svc.class_read_model.get_by_id.return_value = {"_id": cid, "homeroom_teacher_id": homeroom}
+    svc.admin_read_model = MagicMock()
+    svc.admin_read_model.admin_list_assignments_for_classes.return_value = [{"teacher_id": assigned}]
+
+    getattr(svc, action)(str(cid), "actor")
+
+    assert invalidated == [str(homeroom), str(assigned)]
+    assert svc.class_read_model.get_by_id.call_args.kwargs["show_deleted"] == "all"
+
+
+def test_grade_policy_uses_one_scope_load_for_repeated_checks():
+    tid, cid, sid = ObjectId(), ObjectId(), ObjectId()
+    db, cols = _db([cid], [{"class_id": cid, "subject_id": sid}])
+    policy = GradePolicy(db)
+
+    for _ in range(5):
+        assert policy._is_homeroom(teacher_id=tid, class_id=cid)
+        assert policy._teacher_assigned(teacher_id=tid, class_id=cid, subject_id=sid)
+
+    assert cols["classes"].find.call_count == 1
+    cols["teacher_subject_assignments"].count_documents.assert_not_called()
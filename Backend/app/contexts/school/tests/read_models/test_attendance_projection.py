@@ -0,0 +1,79 @@
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+
+from app.contexts.school.data_transfer.responses import GradeDTO
+from app.contexts.school.read_models.attendance_read_model import AttendanceReadModel
+from app.contexts.shared.field_selection import FieldSelection, InvalidFieldSelectionException
+from app.contexts.student.data_transfer.responses import StudentScheduleDTO
+
+GRADE_FIELDS = FieldSelection(GradeDTO, derived={"subject_label": ("subject_id",)})
+
+
+def test_default_projection_is_every_stored_dto_field():
+    assert GRADE_FIELDS.projection(None) == {
+        "_id": 1,
+        "class_id": 1,
+        "lifecycle": 1,
+        "score": 1,
+        "student_id": 1,
+        "subject_id": 1,
+        "teacher_id": 1,
+        "term": 1,
+        "type": 1,
+    }
+
+
+def test_default_projection_keeps_what_enrichment_reads():
+    # teacher_id is not a DTO field, but enrichment needs it to fill teacher_name
+    selection = FieldSelection(
+        StudentScheduleDTO,
+        derived={"student_id": (), "teacher_name": ("teacher_id",), "class_name": ("class_id",)},
+        default_exclude=("room",),
+    )
+
+    projection = selection.projection(None)
+
+    assert projection["teacher_id"] == 1
+    assert projection["class_id"] == 1
+    assert "room" not in projection
+    assert "student_id" not in projection and "teacher_name" not in projection
+
+
+def test_requested_fields_keep_required_ones():
+    # class_id / teacher_id / term are optional in the DTO and were not asked for
+    assert GRADE_FIELDS.projection("score, term") == {
+        "_id": 1,
+        "lifecycle": 1,
+        "score": 1,
+        "student_id": 1,
+        "subject_id": 1,
+        "term": 1,
+        "type": 1,
+    }
+
+
+def test_derived_field_projects_its_source():
+    projection = GRADE_FIELDS.projection("score,subject_label")
+    assert projection["subject_id"] == 1
+    assert "subject_label" not in projection
+
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(InvalidFieldSelectionException) as exc:
+        GRADE_FIELDS.projection("score,password,$where")
+    assert exc.value.details["unknown"] == ["$where", "password"]
+
+
+def test_attendance_read_model_pushes_projection_down():
+    db = MagicMock()
+    col = db.__getitem__.return_value
+    col.find.return_value.sort.return_value = []
+    projection = {"_id": 1, "status": 1}
+
+    AttendanceReadModel(db).list_attendance_for_class_by_date(
+        ObjectId(), record_date="2026-10-01", projection=projection
+    )
+
+    assert col.find.call_args.args[1] == projection
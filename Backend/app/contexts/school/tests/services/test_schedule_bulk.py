@@ -0,0 +1,178 @@
+from contextlib import contextmanager
+from datetime import time
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+
+from app.contexts.school.domain.schedule import ScheduleSlot
+from app.contexts.school.domain.timetable_index import TimetableEntry, TimetableIndex
+from app.contexts.school.domain.timetable_solver import LessonDemand, Period
+from app.contexts.school.errors.schedule_exceptions import (
+    ScheduleBulkValidationException,
+    ScheduleConflictException,
+)
+from app.contexts.school.services.use_cases import schedule_service as schedule_service_module
+from app.contexts.school.services.use_cases.schedule_service import ScheduleService
+
+
+class InMemoryConflictIndex:
+    """`idx` is this worker's cache; `stored` stands in for the schedules collection."""
+
+    def __init__(self, entries=()):
+        self.idx = TimetableIndex(entries)
+        self.stored = TimetableIndex(entries)
+        self.deleted = {}
+
+    @contextmanager
+    def locked(self):
+        yield self.idx
+
+    def find_conflicts(self, entry):
+        return self.idx.find_conflicts(entry)
+
+    def load_overlapping(self, entries):
+        return TimetableIndex(self.stored.entries())
+
+    def load_entry(self, slot_id):
+        return self.stored.get(slot_id) or self.deleted.get(str(slot_id))
+
+    def upsert(self, entry):
+        self.idx.add(entry)
+        self.stored.add(entry)
+
+    def remove(self, slot_id):
+        self.stored.remove(slot_id)
+        return self.idx.remove(slot_id)
+
+    def refresh_slot(self, slot_id):
+        entry = self.deleted.pop(str(slot_id), None)
+        if entry is not None:
+            self.upsert(entry)
+
+
+@pytest.fixture
+def service():
+    repo = MagicMock()
+    repo.insert_many.side_effect = lambda slots: slots
+    class_repo = MagicMock()
+    class_repo.find_by_id.return_value = object()
+    return ScheduleService(
+        schedule_repo=repo,
+        class_repo=class_repo,
+        schedule_lifecycle=MagicMock(),
+        conflict_index=InMemoryConflictIndex(),
+    )
+
+
+def _row(class_id, teacher_id, start, end, day=1, room=None):
+    return {
+        "class_id": class_id,
+        "teacher_id": teacher_id,
+        "day_of_week": day,
+        "start_time": start,
+        "end_time": end,
+        "room": room,
+    }
+
+
+def test_bulk_create_inserts_once_and_updates_index(service):
+    c, t = ObjectId(), ObjectId()
+    rows = [_row(c, t, time(8), time(9)), _row(c, t, time(9), time(10))]
+
+    result = service.bulk_create_schedule_slots(rows)
+
+    assert result["inserted"] == 2
+    service.schedule_repo.insert_many.assert_called_once()
+    assert len(service.conflict_index.idx) == 2
+
+
+def test_bulk_create_reports_conflicts_inside_batch_and_writes_nothing(service):
+    c, t = ObjectId(), ObjectId()
+    rows = [
+        _row(c, t, time(8), time(9)),
+        _row(ObjectId(), t, time(8, 30), time(9, 30)),
+        _row(c, t, time(10), time(9)),
+    ]
+
+    with pytest.raises(ScheduleBulkValidationException) as exc:
+        service.bulk_create_schedule_slots(rows)
+
+    errors = exc.value.details["errors"]
+    assert [(e["row"], e["error_code"]) for e in errors] == [
+        (1, "SCHEDULE_CONFLICT"),
+        (2, "SCHEDULE_START_AFTER_END"),
+    ]
+    assert errors[0]["kind"] == "teacher"
+    assert errors[0]["other_row"] == 0
+    service.schedule_repo.insert_many.assert_not_called()
+
+
+def test_bulk_create_dry_run_checks_existing_timetable(service):
+    c, t = ObjectId(), ObjectId()
+    existing = ScheduleSlot(c, t, 1, time(8), time(9))
+    service.conflict_index.upsert(TimetableEntry.from_slot(existing))
+
+    result = service.bulk_create_schedule_slots([_row(ObjectId(), t, time(8), time(8, 45))], dry_run=True)
+
+    assert result["dry_run"] is True
+    assert result["errors"][0]["other_slot_id"] == str(existing.id)
+    service.schedule_repo.insert_many.assert_not_called()
+
+
+def test_clone_uses_target_teachers_and_drops_rooms(service):
+    src, dst, t_old, t_new, subj = ObjectId(), ObjectId(), ObjectId(), ObjectId(), ObjectId()
+    service.schedule_repo.list_for_class.return_value = [
+        ScheduleSlot(src, t_old, 2, time(9), time(10), room="A1", subject_id=subj),
+        ScheduleSlot(src, t_old, 1, time(8), time(9), room="A1"),
+    ]
+
+    result = service.clone_class_schedule(src, dst, teacher_for_subject={str(subj): str(t_new)})
+
+    slots = result["slots"]
+    assert [int(s.day_of_week) for s in slots] == [1, 2]
+    assert all(s.class_id == dst and s.room is None for s in slots)
+    assert [s.teacher_id for s in slots] == [t_old, t_new]
+
+
+def test_create_checks_slots_written_by_other_workers(service):
+    c, t = ObjectId(), ObjectId()
+    elsewhere = ScheduleSlot(ObjectId(), t, 1, time(8), time(9))
+    service.conflict_index.stored.add(TimetableEntry.from_slot(elsewhere))  # not in this worker's cache
+
+    with pytest.raises(ScheduleConflictException):
+        service.create_schedule_slot_for_class(c, t, 1, time(8, 30), time(9, 30))
+    service.schedule_repo.insert.assert_not_called()
+
+
+def test_restore_rejects_a_slot_whose_time_was_taken(service):
+    c, t = ObjectId(), ObjectId()
+    deleted = ScheduleSlot(c, t, 1, time(8), time(9))
+    service.conflict_index.deleted[str(deleted.id)] = TimetableEntry.from_slot(deleted)
+    service.conflict_index.upsert(TimetableEntry.from_slot(ScheduleSlot(ObjectId(), t, 1, time(8), time(9))))
+
+    with pytest.raises(ScheduleConflictException):
+        service.restore_schedule_slot(deleted.id)
+    service.schedule_lifecycle.restore_slot.assert_not_called()
+
+
+def test_generate_solves_off_the_hub_on_a_copy_of_the_index(service, monkeypatch):
+    calls = []
+
+    def run_off_hub(fn, *args, **kwargs):
+        calls.append(fn)
+        return fn(*args, **kwargs)
+
+    monkeypatch.setattr(schedule_service_module, "run_off_hub", run_off_hub)
+    c, t, subj = str(ObjectId()), str(ObjectId()), str(ObjectId())
+
+    result = service.generate_timetable(
+        [LessonDemand(class_id=c, subject_id=subj, teacher_id=t, lessons_per_week=1)],
+        [Period(day_of_week=1, start=8 * 60, end=9 * 60)],
+        dry_run=False,
+    )
+
+    assert len(calls) == 1
+    assert result["inserted"] == 1
+    assert [str(s.class_id) for s in result["schedule_slots"]] == [c]
+    assert len(service.conflict_index.idx) == 1
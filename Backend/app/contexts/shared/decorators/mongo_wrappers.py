@@ -21,7 +21,7 @@ def mongo_operation(operation_name: str):
                     f"Mongo operation '{operation_name}' succeeded",
                     level="INFO",
                     module=module_name,
-                    extra={"operation": operation_name, "success": True},
+                    extra={"event": "mongo_operation", "operation": operation_name, "success": True},
                 )
                 return result
 
@@ -31,6 +31,7 @@ def mongo_operation(operation_name: str):
                     level="ERROR",
                     module=module_name,
                     extra={
+                        "event": "mongo_operation",
                         "operation": operation_name,
                         "error_type": type(e).__name__,
                         "error": str(e),
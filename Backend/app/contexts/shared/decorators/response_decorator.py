@@ -9,6 +9,7 @@ from typing import Any, Dict, Optional
 from flask import request, g
 from pydantic import BaseModel, RootModel
 
+from app.contexts.infra.http import http_cache
 from app.contexts.infra.http.responses import Response
 from app.contexts.core.log.log_service import LogService
 from app.contexts.core.errors.app_base_exception import AppBaseException, handle_exception
@@ -133,51 +134,67 @@ def _build_error_extra(
 # -----------------------
 # decorator
 # -----------------------
+def _success(result: Any, default_message: str):
+    # BaseResponseDTO
+    if isinstance(result, BaseResponseDTO):
+        data = result.data
+        if isinstance(data, BaseModel):
+            data = _dump_pydantic(data)
+        elif isinstance(data, list) and all(isinstance(x, BaseModel) for x in data):
+            data = [x.model_dump(mode="json", exclude_none=True) for x in data]
+
+        return Response.success_response(
+            data=data,
+            message=getattr(result, "message", default_message),
+            success=getattr(result, "success", True),
+        )
+
+    # Plain BaseModel
+    if isinstance(result, BaseModel):
+        return Response.success_response(
+            data=result.model_dump(mode="json", exclude_none=True),
+            message=default_message,
+            success=True,
+        )
+
+    # Plain dict/list
+    if isinstance(result, (dict, list)):
+        return Response.success_response(
+            data=result,
+            message=default_message,
+            success=True,
+        )
+
+    # fallback
+    return Response.success_response(
+        data={"result": result},
+        message=default_message,
+        success=True,
+    )
+
+
 def wrap_response(func):
+    policy = http_cache.policy_for(func)
+
     @wraps(func)
     def wrapper(*args, **kwargs):
         start_time = time()
         try:
+            # version-stamped routes: a current client skips the handler entirely
+            etag = http_cache.version_etag(policy) if http_cache.is_cacheable_request() else None
+            if etag is not None:
+                unchanged = http_cache.not_modified(etag, policy)
+                if unchanged is not None:
+                    return unchanged
+
             result = func(*args, **kwargs)
 
             default_message = f"{func.__name__.replace('_', ' ').title()} executed successfully"
+            resp = _success(result, default_message)
 
-            # BaseResponseDTO
-            if isinstance(result, BaseResponseDTO):
-                data = result.data
-                if isinstance(data, BaseModel):
-                    data = _dump_pydantic(data)
-                elif isinstance(data, list) and all(isinstance(x, BaseModel) for x in data):
-                    data = [x.model_dump(mode="json", exclude_none=True) for x in data]
-
-                return Response.success_response(
-                    data=data,
-                    message=getattr(result, "message", default_message),
-                    success=getattr(result, "success", True),
-                )
-
-            # Plain BaseModel
-            if isinstance(result, BaseModel):
-                return Response.success_response(
-                    data=result.model_dump(mode="json", exclude_none=True),
-                    message=default_message,
-                    success=True,
-                )
-
-            # Plain dict/list
-            if isinstance(result, (dict, list)):
-                return Response.success_response(
-                    data=result,
-                    message=default_message,
-                    success=True,
-                )
-
-            # fallback
-            return Response.success_response(
-                data={"result": result},
-                message=default_message,
-                success=True,
-            )
+            if http_cache.is_cacheable_request():
+                resp = http_cache.apply_validators(resp, policy, etag)
+            return resp
 
         except AppBaseException as e:
             # Business-rule errors: small log, no stack
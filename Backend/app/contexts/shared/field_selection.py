@@ -0,0 +1,86 @@
+"""
+`fields=` query parameter -> validated Mongo projection for list routes.
+
+Each route declares one FieldSelection from its response DTO:
+
+    _GRADE_FIELDS = FieldSelection(TeacherGradeDTO, derived={"student_name": ("student_id",)})
+    projection = _GRADE_FIELDS.from_request()
+
+- Stored fields are the DTO fields that are not `derived` (filled in by enrichment
+  or the service); "id" maps to "_id". Only these can reach the projection, so a
+  client cannot ask for anything the DTO would not return anyway.
+- Without `fields=`, the projection is every stored field plus every derived
+  field's source ids, minus `default_exclude` (documents lose whatever the DTO
+  and enrichment do not read, e.g. legacy keys or embedded history).
+- With `fields=a,b`, the projection is the DTO's required fields (so validation
+  still passes) plus the requested ones; a derived field pulls in its source ids.
+  Unrequested optional fields come back as None and are dropped by wrap_response.
+"""
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Type
+
+from flask import request
+from pydantic import BaseModel
+
+from app.contexts.core.errors.app_base_exception import AppBaseException, ErrorCategory, ErrorSeverity
+
+FIELDS_PARAM = "fields"
+
+
+class InvalidFieldSelectionException(AppBaseException):
+    def __init__(self, *, unknown: list[str], allowed: list[str]):
+        super().__init__(
+            message=f"Unknown fields requested: {unknown}. Allowed={allowed}",
+            error_code="INVALID_FIELD_SELECTION",
+            severity=ErrorSeverity.LOW,
+            category=ErrorCategory.VALIDATION,
+            user_message=f"Unknown field(s) in '{FIELDS_PARAM}': {', '.join(unknown)}.",
+            details={"field": FIELDS_PARAM, "unknown": unknown, "allowed": allowed},
+            hint=f"Use a comma-separated subset of: {', '.join(allowed)}",
+            recoverable=True,
+            status_code=400,
+        )
+
+
+class FieldSelection:
+    def __init__(
+        self,
+        dto: Type[BaseModel],
+        *,
+        derived: Optional[Mapping[str, Sequence[str]]] = None,
+        default_exclude: Iterable[str] = (),
+    ):
+        model_fields = dto.model_fields
+        self.derived: Dict[str, tuple] = {k: tuple(v) for k, v in (derived or {}).items()}
+        self.stored = tuple(name for name in model_fields if name not in self.derived)
+        self.required = frozenset(
+            name for name, info in model_fields.items() if info.is_required() and name not in self.derived
+        )
+        self.allowed = tuple(model_fields) + tuple(name for name in self.derived if name not in model_fields)
+        excluded = set(default_exclude)
+        sources = (source for sources in self.derived.values() for source in sources)
+        self.default = self._project(
+            name for name in (*self.stored, *sources) if name not in excluded
+        )
+
+    @staticmethod
+    def _project(names: Iterable[str]) -> Dict[str, int]:
+        projection = {("_id" if name == "id" else name): 1 for name in sorted(set(names))}
+        projection.setdefault("_id", 1)
+        return projection
+
+    def projection(self, raw: Optional[str]) -> Dict[str, int]:
+        requested = [part.strip() for part in str(raw or "").split(",") if part.strip()]
+        if not requested:
+            return dict(self.default)
+
+        unknown = sorted({name for name in requested if name not in self.allowed})
+        if unknown:
+            raise InvalidFieldSelectionException(unknown=unknown, allowed=list(self.allowed))
+
+        wanted = set(self.required)
+        for name in requested:
+            wanted.update(self.derived.get(name, (name,)))
+        return self._project(wanted)
+
+    def from_request(self) -> Dict[str, int]:
+        return self.projection(request.args.get(FIELDS_PARAM))
@@ -1,7 +1,11 @@
 from pydantic import ValidationError as PydanticValidationError
-from typing import TypeVar, Dict, Any , Union, Type, List
-from pydantic import BaseModel
+from typing import TypeVar, Dict, Any , Union, Type, List, Callable, Optional, Tuple, Literal, get_args, get_origin
+from pydantic import BaseModel, RootModel, TypeAdapter
 import logging
+import threading
+import types
+from datetime import date, datetime, time
+from decimal import Decimal
 from enum import Enum
 from app.contexts.core.errors.pydantic_error_exception import PydanticBaseValidationError, AppTypeError
 from bson import ObjectId
@@ -71,6 +75,209 @@ class ModelConverterUtils():
         return results
 
 
+# -------------------------
+# Compiled per-DTO converters
+# -------------------------
+# field annotations whose values only need ObjectId -> str
+_SCALAR_TYPES = (str, int, float, bool, bytes, date, datetime, time, Decimal)
+# values convert_ids passes through untouched; checked by exact type before any isinstance
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None), datetime, date, time, Decimal, bytes})
+
+
+def _deep(value: Any) -> Any:
+    """Value conversion of convert_ids, for fields whose shape the DTO does not pin down."""
+    t = type(value)
+    if t in _ATOMIC_TYPES:
+        return value
+    if t is ObjectId:
+        return value.binary.hex()  # == str(value), without bson's Python-level __str__
+    if t is dict:
+        return _deep_dict(value)
+    if t is list:
+        return [_deep_item(item) for item in value]
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, dict):
+        return _deep_dict(value)
+    if isinstance(value, list):
+        return [_deep_item(item) for item in value]
+    return value
+
+
+def _deep_item(item: Any) -> Any:
+    # list items: ObjectId and dicts are converted, nested lists are left alone (as in convert_ids)
+    t = type(item)
+    if t in _ATOMIC_TYPES:
+        return item
+    if t is ObjectId:
+        return item.binary.hex()
+    if isinstance(item, ObjectId):
+        return str(item)
+    if t is dict or isinstance(item, dict):
+        return _deep_dict(item)
+    return item
+
+
+def _deep_dict(doc: dict) -> dict:
+    """convert_ids without the per-value isinstance chain for plain values."""
+    out = {}
+    for k, v in doc.items():
+        if k == "_id":
+            out["id"] = v.binary.hex() if type(v) is ObjectId else str(v)
+            continue
+        t = type(v)
+        if t not in _ATOMIC_TYPES:
+            v = _deep(v)
+        out[k] = v
+    return out
+
+
+def _id_str(value: Any) -> str:
+    return value.binary.hex() if type(value) is ObjectId else str(value)
+
+
+def _scalar(value: Any) -> Any:
+    t = type(value)
+    if t is ObjectId:
+        return value.binary.hex()
+    if t is dict or t is list:
+        return _deep(value)  # wrong shape: keep the legacy conversion so validation reports the same error
+    return value
+
+
+def _scalar_list(value: Any) -> Any:
+    if type(value) is not list:
+        return _scalar(value)
+    return [item.binary.hex() if type(item) is ObjectId else _deep(item) if type(item) is dict else item for item in value]
+
+
+class _DtoPlan:
+    """
+    Which document keys a DTO reads and how to convert each one, worked out once
+    per class into a flat list of steps: ObjectIds become str, "_id" becomes "id",
+    nested models call their own plan, and only fields typed loosely (dict, Any,
+    unions) are walked deeply. Keys the DTO does not declare are skipped, which is
+    what model_validate would do with them anyway.
+    """
+
+    __slots__ = ("steps", "_ops", "apply")
+
+    def __init__(self):
+        # (document key, DTO key, converter); converter None = plain scalar conversion
+        self.steps: List[Tuple[str, str, Optional[Callable[[Any], Any]]]] = []
+        self._ops: Tuple[Tuple[str, str, Callable[[Any], Any]], ...] = ()
+        self.apply: Callable[[dict], dict] = self._apply_steps
+
+    def _apply_steps(self, doc: dict) -> dict:
+        out = {}
+        get = doc.get
+        for src, dest, convert in self._ops:
+            v = get(src, _MISSING)
+            if v is not _MISSING:
+                out[dest] = convert(v)
+        return out
+
+    def build(self) -> None:
+        # a nested plan calls apply lazily, so a self-referencing model sees the finished steps
+        self._ops = tuple((src, dest, convert or _scalar) for src, dest, convert in self.steps)
+
+
+_MISSING = object()
+
+
+class _DtoCompiler:
+    def __init__(self):
+        self._plans: Dict[type, Optional[_DtoPlan]] = {}
+        self._adapters: Dict[type, TypeAdapter] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _compilable(dto_class: type) -> bool:
+        # anything that may read undeclared keys keeps the generic path
+        if issubclass(dto_class, RootModel):
+            return False
+        if dto_class.model_config.get("extra") in ("allow", "forbid"):
+            return False
+        decorators = dto_class.__pydantic_decorators__
+        if any(d.info.mode in ("before", "wrap") for d in decorators.model_validators.values()):
+            return False
+        return all(
+            info.validation_alias is None and (info.alias is None or info.alias == name)
+            for name, info in dto_class.model_fields.items()
+        )
+
+    def plan(self, dto_class: type) -> Optional[_DtoPlan]:
+        try:
+            return self._plans[dto_class]
+        except KeyError:
+            pass
+        with self._lock:
+            if dto_class not in self._plans:
+                self._compile(dto_class)
+            return self._plans[dto_class]
+
+    def _compile(self, dto_class: type) -> Optional[_DtoPlan]:
+        if not self._compilable(dto_class):
+            self._plans[dto_class] = None
+            return None
+        plan = self._plans[dto_class] = _DtoPlan()  # registered first: models may refer to themselves
+        for name, info in dto_class.model_fields.items():
+            if name == "id":
+                # "_id" is always stringified; a stored "id" (enriched docs) comes later and wins, as in convert_ids
+                plan.steps.append(("_id", "id", _id_str))
+                plan.steps.append(("id", "id", None))
+            else:
+                plan.steps.append((name, name, self._converter(info.annotation)))
+        plan.build()
+        return plan
+
+    def _model_converter(self, model: type) -> Callable[[Any], Any]:
+        # called while compiling, under the lock
+        sub = self._plans[model] if model in self._plans else self._compile(model)
+        if sub is None:
+            return _deep
+        return lambda value: sub.apply(value) if type(value) is dict else _scalar(value)
+
+    def _converter(self, annotation: Any) -> Optional[Callable[[Any], Any]]:
+        origin = get_origin(annotation)
+        if origin in (Union, types.UnionType):
+            args = [a for a in get_args(annotation) if a is not type(None)]
+            return self._converter(args[0]) if len(args) == 1 else _deep
+        if origin is Literal:
+            return None
+        if origin in (list, List):
+            args = get_args(annotation)
+            item = args[0] if args else Any
+            if isinstance(item, type) and issubclass(item, BaseModel):
+                convert = self._model_converter(item)
+                return lambda value: [convert(v) for v in value] if type(value) is list else _deep(value)
+            if item in _SCALAR_TYPES or (isinstance(item, type) and issubclass(item, Enum)):
+                return _scalar_list
+            return _deep
+        if isinstance(annotation, type):
+            if issubclass(annotation, BaseModel):
+                return self._model_converter(annotation)
+            if annotation in _SCALAR_TYPES or issubclass(annotation, Enum):
+                return None
+        return _deep
+
+    def adapter(self, dto_class: type) -> TypeAdapter:
+        adapter = self._adapters.get(dto_class)
+        if adapter is None:
+            adapter = self._adapters[dto_class] = TypeAdapter(List[dto_class])
+        return adapter
+
+    def converter(self, dto_class: type) -> Callable[[Any], Any]:
+        plan = self.plan(dto_class)
+        if plan is None:
+            return AdvancedMongoConverter.convert_ids
+        apply = plan.apply
+        return lambda doc: apply(doc) if type(doc) is dict else AdvancedMongoConverter.convert_ids(doc)
+
+
+_compiler = _DtoCompiler()
+
+
 class AdvancedMongoConverter:
 
     @staticmethod
@@ -101,7 +308,7 @@ class AdvancedMongoConverter:
     @classmethod
     def doc_to_dto(cls, doc: dict, dto_class: Type[BaseModel]) -> BaseModel:
         try:
-            converted = cls.convert_ids(doc)
+            converted = _compiler.converter(dto_class)(doc)
             return dto_class.model_validate(converted)
         except PydanticValidationError as e:
             field_errors = { ".".join(str(x) for x in err['loc']) if err['loc'] else "unknown_field": err['msg'] for err in e.errors() }
@@ -122,10 +329,20 @@ class AdvancedMongoConverter:
                 details={"received_value": docs},
                 hint=f"Expected list of dicts to convert to {dto_class.__name__}"
             )
-        results = []
-        for doc in docs:
-            results.append(cls.doc_to_dto(doc, dto_class))
-        return results
+        try:
+            convert = _compiler.converter(dto_class)
+            converted = [convert(doc) for doc in docs]
+            return _compiler.adapter(dto_class).validate_python(converted)
+        except PydanticValidationError as e:
+            # one wrap for the whole batch; locations start with the item index
+            field_errors = { ".".join(str(x) for x in err['loc']) if err['loc'] else "unknown_field": err['msg'] for err in e.errors() }
+            raise PydanticBaseValidationError(
+                message=f"Validation failed for {dto_class.__name__}",
+                cause=e,
+                details=field_errors
+            )
+        except Exception as e:
+            raise handle_exception(e)
 
     @classmethod
     def cursor_to_dto(cls, cursor, dto_class: Type[BaseModel]) -> List[BaseModel]:
@@ -0,0 +1,80 @@
+from datetime import datetime
+from typing import List, Optional
+
+import pytest
+from bson import ObjectId
+from pydantic import BaseModel
+
+from app.contexts.core.errors.pydantic_error_exception import PydanticBaseValidationError
+from app.contexts.school.data_transfer.responses import ClassSectionDTO
+from app.contexts.shared.model_converter import AdvancedMongoConverter, mongo_converter
+
+
+def _class_doc(**overrides):
+    doc = {
+        "_id": ObjectId(),
+        "name": "Grade 9A",
+        "homeroom_teacher_id": ObjectId(),
+        "subject_ids": [ObjectId(), ObjectId()],
+        "enrolled_count": 31,
+        "max_students": 40,
+        "status": "active",
+        "lifecycle": {
+            "created_at": datetime(2026, 9, 1),
+            "updated_at": datetime(2026, 9, 2),
+            "deleted_at": None,
+            "deleted_by": ObjectId(),
+        },
+        "legacy_field": {"_id": ObjectId()},
+    }
+    doc.update(overrides)
+    return doc
+
+
+def _legacy(doc):
+    return ClassSectionDTO.model_validate(AdvancedMongoConverter.convert_ids(doc))
+
+
+def test_compiled_converter_matches_convert_ids():
+    docs = [_class_doc(), _class_doc(homeroom_teacher_id=None), _class_doc(subject_ids=[])]
+
+    assert mongo_converter.list_to_dto(docs, ClassSectionDTO) == [_legacy(d) for d in docs]
+    assert mongo_converter.doc_to_dto(docs[0], ClassSectionDTO) == _legacy(docs[0])
+
+
+def test_object_ids_become_hex_strings():
+    doc = _class_doc()
+    dto = mongo_converter.doc_to_dto(doc, ClassSectionDTO)
+
+    assert dto.id == str(doc["_id"])
+    assert dto.subject_ids == [str(x) for x in doc["subject_ids"]]
+    assert dto.lifecycle.deleted_by == str(doc["lifecycle"]["deleted_by"])
+
+
+class TreeNodeDTO(BaseModel):
+    id: str
+    parent_id: Optional[str] = None
+    children: List["TreeNodeDTO"] = []
+
+
+def test_self_referencing_model_converts_every_level():
+    leaf, mid, root = ObjectId(), ObjectId(), ObjectId()
+    doc = {
+        "_id": root,
+        "children": [{"_id": mid, "parent_id": root, "children": [{"_id": leaf, "parent_id": mid}]}],
+        "undeclared": ObjectId(),
+    }
+
+    dto = mongo_converter.doc_to_dto(doc, TreeNodeDTO)
+
+    assert dto == TreeNodeDTO.model_validate(AdvancedMongoConverter.convert_ids(doc))
+    assert dto.children[0].children[0].parent_id == str(mid)
+
+
+def test_batch_errors_are_wrapped_once_with_item_index():
+    docs = [_class_doc(), _class_doc(enrolled_count="many")]
+
+    with pytest.raises(PydanticBaseValidationError) as exc:
+        mongo_converter.list_to_dto(docs, ClassSectionDTO)
+
+    assert list(exc.value.details) == ["1.enrolled_count"]
@@ -0,0 +1,39 @@
+import pytest
+from flask import Flask
+
+from app.contexts.shared.decorators.response_decorator import wrap_response
+from app.contexts.shared.field_selection import InvalidFieldSelectionException
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+
+    @app.route("/rule")
+    @wrap_response
+    def rule():
+        raise InvalidFieldSelectionException(unknown=["x"], allowed=["id"])
+
+    @app.route("/boom")
+    @wrap_response
+    def boom():
+        raise RuntimeError("boom")
+
+    return app.test_client()
+
+
+def test_business_rule_error_is_a_json_4xx_without_optional_headers(client):
+    # no X-Request-Id / X-Forwarded-For / Origin / Referer: logged as None
+    resp = client.get("/rule")
+
+    assert resp.status_code == 400
+    assert resp.is_json
+    assert resp.get_json()["code"] == "INVALID_FIELD_SELECTION"
+
+
+def test_unexpected_error_is_a_json_error(client):
+    resp = client.get("/boom", headers={"X-Request-Id": "r1"})
+
+    assert resp.status_code >= 400
+    assert resp.is_json
+    assert resp.get_json()["success"] is False
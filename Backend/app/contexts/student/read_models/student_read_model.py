@@ -62,6 +62,25 @@ class StudentReadModel(MongoErrorMixin):
             self._handle_mongo_error("get_by_id", e)
             return None
 
+    def list_user_ids_by_ids(
+        self,
+        student_ids: Iterable[ObjectId | str | None],
+        *,
+        show_deleted: ShowDeleted = "active",
+    ) -> List[Dict[str, Any]]:
+        ids = self._normalize_ids(student_ids)
+        if not ids:
+            return []
+        try:
+            cursor = self.collection.find(
+                by_show_deleted(show_deleted, {"_id": {"$in": ids}}),
+                {"user_id": 1},
+            )
+            return list(cursor)
+        except Exception as e:
+            self._handle_mongo_error("list_user_ids_by_ids", e)
+            return []
+
     def get_me(self, user_id: ObjectId | str) -> Dict[str, Any] | None:
         return self.get_by_user_id(user_id)
 
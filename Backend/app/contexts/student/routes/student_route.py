@@ -4,7 +4,9 @@ from app.contexts.student.routes import student_bp
 from app.contexts.core.security.auth_utils import get_current_student_id
 from app.contexts.iam.auth.jwt_utils import role_required
 from app.contexts.shared.decorators.response_decorator import wrap_response
+from app.contexts.infra.http.http_cache import http_cache
 from app.contexts.shared.model_converter import mongo_converter
+from app.contexts.shared.field_selection import FieldSelection
 
 from app.contexts.student.data_transfer.requests import StudentGradesFilterSchema
 from app.contexts.student.data_transfer.responses import (
@@ -19,10 +21,21 @@ from app.contexts.student.data_transfer.responses import (
     
 )
 
+_SCHEDULE_FIELDS = FieldSelection(
+    StudentScheduleDTO,
+    derived={
+        "student_id": (),
+        "class_name": ("class_id",),
+        "teacher_name": ("teacher_id",),
+        "subject_label": ("subject_id",),
+    },
+)
+
 
 @student_bp.route("/me/classes", methods=["GET"])
 @role_required(["student"])
 @wrap_response
+@http_cache(max_age=30)
 def get_my_classes():
     student_id = get_current_student_id()
     classes = g.student_service.get_my_classes(student_id)
@@ -85,8 +98,9 @@ def get_my_grades():
 @student_bp.route("/me/schedule", methods=["GET"])
 @role_required(["student"])
 @wrap_response
+@http_cache(max_age=30)
 def get_my_schedule():
     student_id = get_current_student_id()
-    schedule = g.student_service.get_my_schedule(student_id)
+    schedule = g.student_service.get_my_schedule(student_id, projection=_SCHEDULE_FIELDS.from_request())
     items = mongo_converter.list_to_dto(schedule, StudentScheduleDTO)
     return StudentScheduleListDTO(items=items)
\ No newline at end of file
@@ -140,8 +140,8 @@ class StudentService:
     def get_my_classes(self, student_id: str | ObjectId) -> list[dict]:
         return self._student_stats.list_my_classes_enriched(student_id)
 
-    def get_my_schedule(self, student_id: str | ObjectId) -> list[dict]:
-        return self._student_stats.list_my_schedule_enriched(student_id)
+    def get_my_schedule(self, student_id: str | ObjectId, projection: Optional[dict] = None) -> list[dict]:
+        return self._student_stats.list_my_schedule_enriched(student_id, projection=projection)
 
     def get_my_attendance(self, student_id: str | ObjectId, class_id: str | ObjectId | None = None) -> list[dict]:
         return self._student_stats.list_my_attendance_enriched(student_id, class_id)
@@ -15,9 +15,11 @@ from app.contexts.school.read_models.subject_read_model import SubjectReadModel
 from app.contexts.school.read_models.schedule_read_model import ScheduleReadModel
 from app.contexts.school.read_models.attendance_read_model import AttendanceReadModel
 from app.contexts.school.read_models.grade_read_model import GradeReadModel
+from app.contexts.school.read_models.grade_stats_read_model import GradeStatsReadModel
 
 from app.contexts.shared.services.display_name_service import DisplayNameService
 from app.contexts.school.read_models.teacher_assignment_read_model import TeacherAssignmentReadModel
+from app.contexts.school.policies.teacher_scope import TeacherScope, TeacherScopeReader
 
 
 class TeacherReadModel(MongoErrorMixin):
@@ -50,6 +52,10 @@ class TeacherReadModel(MongoErrorMixin):
 
         self.assignment_read: Final[TeacherAssignmentReadModel] = TeacherAssignmentReadModel(db)
 
+        self.grade_stats: Final[GradeStatsReadModel] = GradeStatsReadModel(db, display=self.display)
+
+        self.scopes: Final[TeacherScopeReader] = TeacherScopeReader(db)
+
     def _oid(self, v: Union[str, ObjectId]) -> ObjectId:
         return mongo_converter.convert_to_object_id(v)
 
@@ -75,17 +81,12 @@ class TeacherReadModel(MongoErrorMixin):
     # -------------------------
     # Permission checks
     # -------------------------
-    def is_homeroom_teacher(self, *, teacher_id: Union[str, ObjectId], class_id: Union[str, ObjectId]) -> bool:
-        tid = self._oid(teacher_id)
-        cid = self._oid(class_id)
-        cls = self.classes.get_by_id(cid)
-        if not cls:
-            return False
-
-        homeroom_id = cls.get("homeroom_teacher_id")
-        legacy_id = cls.get("teacher_id")  # optional fallback
+    # Backed by the cached TeacherScope: set lookups, no query per check.
+    def scope(self, teacher_id: Union[str, ObjectId]) -> TeacherScope:
+        return self.scopes.get(self._oid(teacher_id))
 
-        return str(homeroom_id or legacy_id or "") == str(tid)
+    def is_homeroom_teacher(self, *, teacher_id: Union[str, ObjectId], class_id: Union[str, ObjectId]) -> bool:
+        return self.scope(teacher_id).is_homeroom(self._oid(class_id))
 
     def is_assigned_subject_teacher(
         self,
@@ -94,19 +95,7 @@ class TeacherReadModel(MongoErrorMixin):
         class_id: Union[str, ObjectId],
         subject_id: Union[str, ObjectId],
     ) -> bool:
-        tid = self._oid(teacher_id)
-        cid = self._oid(class_id)
-        sid = self._oid(subject_id)
-
-        # Build a robust query that matches both string/ObjectId storage.
-        q = {
-            "$and": [
-                self.assignment_read._match_oid_or_str("teacher_id", tid),
-                self.assignment_read._match_oid_or_str("class_id", cid),
-                self.assignment_read._match_oid_or_str("subject_id", sid),
-            ]
-        }
-        return self.assignment_read.exists(q, show_deleted="active")
+        return self.scope(teacher_id).is_assigned(self._oid(class_id), self._oid(subject_id))
     # -------------------------
     # Classes (roles-enriched)
     # -------------------------
@@ -172,8 +161,12 @@ class TeacherReadModel(MongoErrorMixin):
     # -------------------------
     # Students
     # -------------------------
-    def list_my_students_in_class(self, class_id: Union[str, ObjectId]) -> List[Dict[str, Any]]:
-        return self.student.list_students_in_class(class_id, projection={"history": 0})
+    def list_my_students_in_class(
+        self,
+        class_id: Union[str, ObjectId],
+        projection: Optional[Dict[str, int]] = None,
+    ) -> List[Dict[str, Any]]:
+        return self.student.list_students_in_class(class_id, projection=projection or {"history": 0})
 
     def list_student_name_options_in_class(self, class_id: Union[str, ObjectId]) -> List[Dict[str, Any]]:
         students = self.student.list_student_ids_in_class(self._oid(class_id))
@@ -238,6 +231,7 @@ class TeacherReadModel(MongoErrorMixin):
         term: str | None = None,
         grade_type: str | None = None,
         q: str | None = None,
+        projection: Optional[Dict[str, int]] = None,
     ) -> Dict[str, Any]:
 
         result = self.grade.list_grades_for_class_paged(
@@ -251,6 +245,7 @@ class TeacherReadModel(MongoErrorMixin):
             q=q,
             sort="-created_at",
             show_deleted="active",
+            projection=projection,
         )
 
         result["items"] = self.display.enrich_grades(result["items"])
@@ -278,14 +273,7 @@ class TeacherReadModel(MongoErrorMixin):
         *,
         class_id: Union[str, ObjectId],
     ) -> bool:
-        tid = self._oid(teacher_id)
-        cid = self._oid(class_id)
-
-        q: Dict[str, Any] = {
-            "teacher_id": tid,
-            "class_id": cid,
-        }
-        return self.assignment_read.exists(q, show_deleted="active")
+        return self.scope(teacher_id).has_any_assignment_in(self._oid(class_id))
     # -------------------------
     # Assignments list (enriched)
     # -------------------------
@@ -387,6 +375,7 @@ class TeacherReadModel(MongoErrorMixin):
         subject_ids: Optional[List[Union[str, ObjectId]]] = None,  # NEW
         schedule_slot_id: Union[str, ObjectId, None] = None,
         show_deleted: str = "active",
+        projection: Optional[Dict[str, int]] = None,
     ) -> list[dict]:
         docs = self.attendance.list_attendance_for_class_by_date(
             class_id=class_id,
@@ -395,6 +384,7 @@ class TeacherReadModel(MongoErrorMixin):
             subject_ids=subject_ids,         
             schedule_slot_id=schedule_slot_id,
             show_deleted=show_deleted,
+            projection=projection,
         )
         if not docs:
             return []
@@ -7,6 +7,7 @@ from app.contexts.core.security.auth_utils import get_current_staff_id
 from app.contexts.iam.auth.jwt_utils import role_required
 from app.contexts.shared.decorators.response_decorator import wrap_response
 from app.contexts.shared.model_converter import pydantic_converter, mongo_converter
+from app.contexts.shared.field_selection import FieldSelection
 from datetime import date as date_type
 from app.contexts.teacher.data_transfer.requests import (
     TeacherMarkAttendanceRequest,
@@ -17,6 +18,21 @@ from app.contexts.teacher.data_transfer.responses import (
     TeacherAttendanceDTO,
 )
 
+_ATTENDANCE_FIELDS = FieldSelection(
+    TeacherAttendanceDTO,
+    derived={
+        "student_name": ("student_id",),
+        "class_name": ("class_id",),
+        "teacher_name": ("marked_by_teacher_id",),
+        "subject_label": ("subject_id",),
+        # copied from the schedule slot
+        "day_of_week": ("schedule_slot_id",),
+        "start_time": ("schedule_slot_id",),
+        "end_time": ("schedule_slot_id",),
+        "room": ("schedule_slot_id",),
+    },
+)
+
 
 @teacher_bp.route("/attendance", methods=["POST"])
 @role_required(["teacher"])
@@ -67,6 +83,7 @@ def list_attendance_for_class_enriched(class_id: str):
         record_date=date_str,
         subject_id=subject_id,
         schedule_slot_id=schedule_slot_id,
+        projection=_ATTENDANCE_FIELDS.from_request(),
     )
 
     items = mongo_converter.list_to_dto(docs, TeacherAttendanceDTO)
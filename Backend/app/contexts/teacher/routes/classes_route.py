@@ -7,7 +7,9 @@ from app.contexts.teacher.routes import teacher_bp
 from app.contexts.core.security.auth_utils import get_current_staff_id
 from app.contexts.iam.auth.jwt_utils import role_required
 from app.contexts.shared.decorators.response_decorator import wrap_response
+from app.contexts.infra.http.http_cache import http_cache
 from app.contexts.shared.model_converter import mongo_converter
+from app.contexts.shared.field_selection import FieldSelection
 
 from app.contexts.teacher.data_transfer.responses import (
     TeacherClassSectionDTO,
@@ -18,10 +20,14 @@ from app.contexts.teacher.data_transfer.responses import (
     TeacherStudentListDTO,
 )
 
+# enrollment history is the bulk of a student document and the roster never shows it
+_STUDENT_FIELDS = FieldSelection(TeacherStudentDTO, default_exclude=("history",))
+
 
 @teacher_bp.route("/me/classes", methods=["GET"])
 @role_required(["teacher"])
 @wrap_response
+@http_cache(max_age=30)
 def list_my_classes_enriched():
     teacher_id = get_current_staff_id()
 
@@ -61,6 +67,7 @@ def list_my_students_in_class(class_id: str):
     docs = g.teacher_service.list_my_students_in_class(
         teacher_id=teacher_id,
         class_id=class_id,
+        projection=_STUDENT_FIELDS.from_request(),
     )
 
     items_dto = mongo_converter.list_to_dto(docs, TeacherStudentDTO)
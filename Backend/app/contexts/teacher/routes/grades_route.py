@@ -6,6 +6,7 @@ from app.contexts.core.security.auth_utils import get_current_staff_id
 from app.contexts.iam.auth.jwt_utils import role_required
 from app.contexts.shared.decorators.response_decorator import wrap_response
 from app.contexts.shared.model_converter import pydantic_converter, mongo_converter
+from app.contexts.shared.field_selection import FieldSelection
 
 from app.contexts.teacher.data_transfer.requests import (
     TeacherAddGradeRequest,
@@ -16,6 +17,22 @@ from app.contexts.teacher.data_transfer.responses import (
     TeacherGradePagedListDTO,
     TeacherGradeDTO,
 )
+from app.contexts.school.data_transfer.responses import GradeStatisticsDTO
+from app.contexts.school.domain.grade_statistics import parse_weights_arg
+
+_GRADE_FIELDS = FieldSelection(
+    TeacherGradeDTO,
+    derived={
+        "is_homeroom": (),
+        "can_edit": ("teacher_id", "subject_id"),
+        "student_name": ("student_id",),
+        "student_name_en": ("student_id",),
+        "student_name_kh": ("student_id",),
+        "class_name": ("class_id",),
+        "teacher_name": ("teacher_id",),
+        "subject_label": ("subject_id",),
+    },
+)
 
 @teacher_bp.route("/grades", methods=["POST"])
 @role_required(["teacher"])
@@ -68,6 +85,7 @@ def list_grades_for_class_enriched(class_id: str):
         term=term,
         grade_type=grade_type,
         q=q,
+        projection=_GRADE_FIELDS.from_request(),
     )
 
     items = mongo_converter.list_to_dto(result["items"], TeacherGradeDTO)
@@ -82,6 +100,22 @@ def list_grades_for_class_enriched(class_id: str):
 
 
 
+@teacher_bp.route("/classes/<class_id>/grade-statistics", methods=["GET"])
+@role_required(["teacher"])
+@wrap_response
+def get_grade_statistics_for_class(class_id: str):
+    teacher_id = get_current_staff_id()
+
+    result = g.teacher_service.get_grade_statistics_for_class(
+        teacher_id=teacher_id,
+        class_id=class_id,
+        subject_id=request.args.get("subject_id") or None,
+        term=request.args.get("term"),
+        weights=parse_weights_arg(request.args.get("weights")),
+    )
+    return GradeStatisticsDTO(**result)
+
+
 @teacher_bp.route("/grades/<grade_id>", methods=["DELETE"])
 @role_required(["teacher"])
 @wrap_response
@@ -6,6 +6,7 @@ from app.contexts.core.security.auth_utils import get_current_staff_id
 from app.contexts.iam.auth.jwt_utils import role_required
 from app.contexts.shared.decorators.response_decorator import wrap_response
 from app.contexts.shared.model_converter import mongo_converter
+from app.contexts.shared.field_selection import FieldSelection
 
 from app.contexts.teacher.data_transfer.responses import (
     TeacherScheduleListDTO,
@@ -14,6 +15,11 @@ from app.contexts.teacher.data_transfer.responses import (
     TeacherScheduleSlotSelectDTO,
 )
 
+_SCHEDULE_FIELDS = FieldSelection(
+    TeacherScheduleDTO,
+    derived={"class_name": ("class_id",), "teacher_name": ("teacher_id",), "subject_label": ("subject_id",)},
+)
+
 
 
 @teacher_bp.route("/schedule", methods=["GET"])
@@ -39,6 +45,7 @@ def get_schedule():
         day_of_week=day_of_week,
         start_time_from=start_time_from,
         start_time_to=start_time_to,
+        projection=_SCHEDULE_FIELDS.from_request(),
     )
 
     items = mongo_converter.list_to_dto(schedules, TeacherScheduleDTO)
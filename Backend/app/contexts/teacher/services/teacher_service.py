@@ -24,8 +24,7 @@ from app.contexts.school.data_transfer.responses import (
     GradeDTO,
 )
 
-from app.contexts.notifications.services.notification_service import NotificationService
-from app.contexts.notifications.utils.recipient_resolver import NotificationRecipientResolver
+from app.contexts.notifications.services.notification_outbox import NotificationOutbox, RecipientKind
 from app.contexts.notifications.types import NotifType
 
 
@@ -35,8 +34,7 @@ class TeacherService:
         self._teacher_read = TeacherReadModel(db)
 
 
-        self.notification_service = NotificationService(db)
-        self.notif_resolver = NotificationRecipientResolver(db)
+        self.notification_outbox = NotificationOutbox(db)
 
     @property
     def teacher_read(self) -> TeacherReadModel:
@@ -139,16 +137,13 @@ class TeacherService:
         """
         Best-effort notification to student when grade is created/updated.
 
-        - Uses your existing resolver: student_id -> IAM user_id
+        - Enqueued to the notification outbox; the dispatcher resolves
+          student_id -> IAM user_id, persists and emits off the request path
         - Does NOT require `route` (optional). Keep data payload rich so UI can
           add routing later without changing backend.
         """
         try:
             sid = str(student_id)
-            student_user_id = self.notif_resolver.student_to_user_id(sid)
-            if not student_user_id:
-                return
-
             payload: Dict[str, Any] = {
                 "student_id": sid,
                 "grade_id": str(grade_id),
@@ -162,8 +157,9 @@ class TeacherService:
             # remove None values
             payload = {k: v for k, v in payload.items() if v is not None}
 
-            self.notification_service.create_for_user(
-                user_id=str(student_user_id),
+            self.notification_outbox.enqueue(
+                recipient_kind=RecipientKind.STUDENT,
+                recipient_ids=[sid],
                 role="student",
                 type=NotifType.GRADE_PUBLISHED,
                 title=title or "Grade published",
@@ -191,9 +187,10 @@ class TeacherService:
         *,
         teacher_id: Union[str, ObjectId],
         class_id: Union[str, ObjectId],
+        projection: Optional[Dict[str, int]] = None,
     ) -> list[dict]:
         self._assert_can_view_class_roster(teacher_id=teacher_id, class_id=class_id)
-        return self.teacher_read.list_my_students_in_class(self._oid(class_id))
+        return self.teacher_read.list_my_students_in_class(self._oid(class_id), projection=projection)
 
     # -------------------------------------------------
     # Attendance
@@ -251,6 +248,7 @@ class TeacherService:
         record_date: str | None = None,
         subject_id: str | None = None,
         schedule_slot_id: str | None = None,
+        projection: Optional[Dict[str, int]] = None,
     ) -> list[dict]:
         tid = self._oid(teacher_id)
         cid = self._oid(class_id)
@@ -263,6 +261,7 @@ class TeacherService:
                 subject_id=self._oid(subject_id) if subject_id else None,
                 schedule_slot_id=self._oid(schedule_slot_id) if schedule_slot_id else None,
                 show_deleted="active",
+                projection=projection,
             )
 
         # 2) non-homeroom => must have assignments in this class
@@ -291,6 +290,7 @@ class TeacherService:
                 subject_id=sid,
                 schedule_slot_id=self._oid(schedule_slot_id) if schedule_slot_id else None,
                 show_deleted="active",
+                projection=projection,
             )
 
         # 2b) otherwise => show all assigned subjects
@@ -300,6 +300,7 @@ class TeacherService:
             subject_ids=assigned_subject_ids,
             schedule_slot_id=self._oid(schedule_slot_id) if schedule_slot_id else None,
             show_deleted="active",
+            projection=projection,
         )
 
     def soft_delete_attendance(
@@ -486,22 +487,18 @@ class TeacherService:
         term: str | None = None,
         grade_type: str | None = None,
         q: str | None = None,
+        projection: Optional[Dict[str, int]] = None,
     ) -> Dict[str, Any]:
         tid = self._oid(teacher_id)
         cid = self._oid(class_id)
 
+        scope = self.teacher_read.scope(tid)
+
         # 1) Check homeroom
-        is_homeroom = self.teacher_read.is_homeroom_teacher(teacher_id=tid, class_id=cid)
+        is_homeroom = scope.is_homeroom(cid)
 
         # 2) Assigned subjects in this class
-        assigned_subject_ids: List[ObjectId] = (
-            self.teacher_read.assignment_read.list_subject_ids_for_teacher_in_class(
-                teacher_id=tid,
-                class_id=cid,
-                show_deleted="active",
-            )
-            or []
-        )
+        assigned_subject_ids: List[ObjectId] = scope.subject_ids_in(cid)
         assigned_subject_strs = {str(s) for s in assigned_subject_ids}
 
         teacher_filter_id = None
@@ -524,6 +521,7 @@ class TeacherService:
             term=term,
             grade_type=grade_type,
             q=q,
+            projection=projection,
         )
 
         # 4) Decorate items
@@ -541,6 +539,49 @@ class TeacherService:
         result["is_homeroom"] = is_homeroom
         return result
 
+    def get_grade_statistics_for_class(
+        self,
+        teacher_id: Union[str, ObjectId],
+        class_id: Union[str, ObjectId],
+        *,
+        subject_id: Optional[Union[str, ObjectId]] = None,
+        term: str | None = None,
+        weights: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Homeroom teacher: whole class or any subject.
+        Subject teacher: only subjects assigned in this class
+        (defaults to the single assigned subject when there is exactly one).
+        """
+        tid = self._oid(teacher_id)
+        cid = self._oid(class_id)
+
+        if not self.teacher_read.is_homeroom_teacher(teacher_id=tid, class_id=cid):
+            assigned = (
+                self.teacher_read.assignment_read.list_subject_ids_for_teacher_in_class(
+                    teacher_id=tid,
+                    class_id=cid,
+                    show_deleted="active",
+                )
+                or []
+            )
+            assigned_strs = {str(x) for x in assigned}
+
+            if subject_id:
+                if str(subject_id) not in assigned_strs:
+                    raise TeacherForbiddenException()
+            elif len(assigned) == 1:
+                subject_id = assigned[0]
+            else:
+                raise TeacherForbiddenException()
+
+        return self.teacher_read.grade_stats.get_statistics(
+            class_id=cid,
+            subject_id=self._oid(subject_id) if subject_id else None,
+            term=term,
+            weights=weights,
+        )
+
     # -------------------------------------------------
     # Schedule
     # -------------------------------------------------
@@ -555,6 +596,7 @@ class TeacherService:
         day_of_week: int | None = None,
         start_time_from: str | None = None,
         start_time_to: str | None = None,
+        projection: Optional[Dict[str, int]] = None,
     ) -> Tuple[List[Dict[str, Any]], int]:
         return self.teacher_read.list_schedule_for_teacher_enriched(
             teacher_id=self._oid(teacher_id),
@@ -565,6 +607,7 @@ class TeacherService:
             day_of_week=day_of_week,
             start_time_from=start_time_from,
             start_time_to=start_time_to,
+            projection=projection,
         )
 
     def list_schedule_slot_select_for_teacher(
@@ -0,0 +1,109 @@
+"""
+Mongo documents -> response DTOs: recursive convert_ids + per-item model_validate
+(the former list_to_dto) vs. compiled per-DTO converters + one TypeAdapter batch.
+
+    DEBUG=true python -m benchmarks.dto_conversion [documents] [iterations]
+
+Documents are shaped like enriched grade rows and class roster students (with
+embedded enrollment history), as they come out of Mongo.
+"""
+import gc
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from bson import ObjectId
+
+from app.contexts.shared.model_converter import AdvancedMongoConverter, mongo_converter
+from app.contexts.teacher.data_transfer.responses import TeacherGradeDTO, TeacherStudentDTO
+
+
+def lifecycle(i: int) -> dict:
+    t0 = datetime(2026, 9, 1, 8, 0) + timedelta(minutes=i)
+    return {"created_at": t0, "updated_at": t0, "deleted_at": None, "deleted_by": None}
+
+
+def grade_docs(n: int) -> list:
+    return [
+        {
+            "_id": ObjectId(),
+            "student_id": ObjectId(),
+            "class_id": ObjectId(),
+            "subject_id": ObjectId(),
+            "teacher_id": ObjectId(),
+            "term": "S1",
+            "type": "quiz",
+            "score": 70.0 + i % 30,
+            "lifecycle": lifecycle(i),
+            "can_edit": True,
+            "is_homeroom": False,
+            "student_name": f"Student {i}",
+            "class_name": "Grade 9A",
+            "teacher_name": "Sok Dara",
+            "subject_label": "Mathematics (MATH)",
+        }
+        for i in range(n)
+    ]
+
+
+def student_docs(n: int) -> list:
+    return [
+        {
+            "_id": ObjectId(),
+            "user_id": ObjectId(),
+            "student_id_code": f"STU{i:05d}",
+            "first_name_kh": "សុខ",
+            "last_name_kh": "ដារា",
+            "first_name_en": "Sok",
+            "last_name_en": f"Dara {i}",
+            "gender": "male",
+            "dob": date(2012, 1, 1),
+            "current_grade_level": 9,
+            "status": "active",
+            "current_class_id": ObjectId(),
+            "history": [
+                {"class_id": ObjectId(), "academic_year": f"{2020 + y}-{2021 + y}", "changed_by": ObjectId()}
+                for y in range(4)
+            ],
+            "guardians": [ObjectId(), ObjectId()],
+            "lifecycle": lifecycle(i),
+        }
+        for i in range(n)
+    ]
+
+
+def legacy(docs: list, dto_class) -> list:
+    return [dto_class.model_validate(AdvancedMongoConverter.convert_ids(doc)) for doc in docs]
+
+
+def timed(fn, docs, dto_class) -> float:
+    gc.collect()
+    gc.disable()  # like timeit: 10k fresh models otherwise trigger collections at random points
+    try:
+        t0 = time.perf_counter()
+        fn(docs, dto_class)
+        return time.perf_counter() - t0
+    finally:
+        gc.enable()
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    for name, docs, dto_class in (
+        ("grades", grade_docs(n), TeacherGradeDTO),
+        ("roster students", student_docs(n), TeacherStudentDTO),
+    ):
+        assert [m.model_dump() for m in mongo_converter.list_to_dto(docs, dto_class)] == [
+            m.model_dump() for m in legacy(docs, dto_class)
+        ], "compiled converters must produce the same DTOs"
+        # interleaved, best of N: this keeps machine noise from favouring whichever runs second
+        before = after = float("inf")
+        for _ in range(iterations):
+            before = min(before, timed(legacy, docs, dto_class) * 1e3)
+            after = min(after, timed(mongo_converter.list_to_dto, docs, dto_class) * 1e3)
+        print(f"{name} x{n}: convert_ids + model_validate {before:7.1f} ms  compiled + batch {after:7.1f} ms  ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Grade statistics: NumPy engine vs. per-document Python loops.
+
+    DEBUG=true python -m benchmarks.grade_statistics [n_grades]
+"""
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+
+from bson import ObjectId
+
+from app.contexts.school.domain.grade_statistics import (
+    DEFAULT_GRADE_TYPE_WEIGHTS,
+    GradeArrays,
+    compute_grade_statistics,
+)
+
+TYPES = list(DEFAULT_GRADE_TYPE_WEIGHTS)
+
+
+def make_rows(n: int, students: int = 2000, subjects: int = 12) -> list[dict]:
+    rnd = random.Random(42)
+    student_ids = [ObjectId() for _ in range(students)]
+    subject_ids = [ObjectId() for _ in range(subjects)]
+    return [
+        {
+            "student_id": rnd.choice(student_ids),
+            "subject_id": rnd.choice(subject_ids),
+            "type": rnd.choice(TYPES),
+            "score": round(rnd.uniform(0, 100), 1),
+        }
+        for _ in range(n)
+    ]
+
+
+def python_loops(rows: list[dict]) -> dict:
+    cells = defaultdict(lambda: defaultdict(list))
+    for r in rows:
+        cells[r["student_id"]][r["type"]].append(r["score"])
+
+    weighted = {}
+    for sid, by_type in cells.items():
+        num = den = 0.0
+        for t, scores in by_type.items():
+            w = DEFAULT_GRADE_TYPE_WEIGHTS[t]
+            num += w * (sum(scores) / len(scores))
+            den += w
+        weighted[sid] = num / den
+
+    values = list(weighted.values())
+    mu = statistics.fmean(values)
+    sigma = statistics.pstdev(values)
+    ordered = sorted(values, reverse=True)
+    out = []
+    for sid, v in weighted.items():
+        rank = 1 + sum(1 for x in ordered if x > v)
+        out.append((sid, rank, (v - mu) / sigma if sigma else 0.0))
+
+    all_scores = sorted(r["score"] for r in rows)
+    _ = statistics.quantiles(all_scores, n=10)
+    return {"students": out}
+
+
+def bench(fn, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = make_rows(n)
+
+    t_loops = bench(python_loops, rows)
+    t_build = bench(GradeArrays.from_rows, rows)
+    arrays = GradeArrays.from_rows(rows)
+    t_numpy = bench(compute_grade_statistics, arrays)
+
+    print(f"grades={n:,} students={len(arrays.student_ids):,}")
+    print(f"python loops        : {t_loops:9.1f} ms")
+    print(f"arrays (from_rows)  : {t_build:9.1f} ms")
+    print(f"numpy statistics    : {t_numpy:9.1f} ms")
+    print(f"numpy end-to-end    : {t_build + t_numpy:9.1f} ms  ({t_loops / (t_build + t_numpy):.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
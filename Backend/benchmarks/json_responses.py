@@ -0,0 +1,114 @@
+"""
+API response encoding: the former triple pass vs. the single-pass encoder.
+
+    DEBUG=true python -m benchmarks.json_responses [iterations]
+
+Before: json.dumps(json.loads(json.dumps(body, default=str))).
+After: json_encoder.dumps(body) with the stdlib backend (byte-identical) and with
+orjson (value-identical, compact UTF-8). Payloads are shaped like a teacher's
+grade page and a school-wide schedule listing, with ObjectIds and datetimes as
+they come out of Mongo.
+"""
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+from app.contexts.core.config.setting import settings
+from app.contexts.infra.http import json_encoder
+
+
+def legacy(body) -> bytes:
+    return json.dumps(json.loads(json.dumps(body, default=str))).encode("utf-8")
+
+
+def grade_page(n: int) -> dict:
+    t0 = datetime(2026, 10, 1, 8, 0)
+    return {
+        "success": True,
+        "message": "List Class Grades executed successfully",
+        "data": {
+            "items": [
+                {
+                    "id": ObjectId(),
+                    "student_id": ObjectId(),
+                    "student_name": f"Student {i}",
+                    "subject_id": ObjectId(),
+                    "subject_label": "Mathematics",
+                    "type": "quiz",
+                    "term": "S1",
+                    "score": 72.5 + i % 20,
+                    "teacher_id": ObjectId(),
+                    "created_at": t0 + timedelta(minutes=i),
+                    "updated_at": t0 + timedelta(minutes=i, seconds=30),
+                }
+                for i in range(n)
+            ],
+            "total": n,
+            "page": 1,
+            "page_size": n,
+        },
+    }
+
+
+def schedule_list(n: int) -> dict:
+    return {
+        "success": True,
+        "message": "List Schedules executed successfully",
+        "data": [
+            {
+                "id": ObjectId(),
+                "class_id": ObjectId(),
+                "class_name": f"Grade {7 + i % 6}{'ABCD'[i % 4]}",
+                "teacher_id": ObjectId(),
+                "teacher_name": "Sok Dara",
+                "subject_id": ObjectId(),
+                "subject_label": "Khmer Literature",
+                "day_of_week": 1 + i % 6,
+                "start_time": "07:00",
+                "end_time": "08:00",
+                "room": f"B-{100 + i % 30}",
+                "lifecycle": {"created_at": datetime(2026, 9, 1), "updated_at": datetime(2026, 9, 2), "deleted_at": None},
+            }
+            for i in range(n)
+        ],
+    }
+
+
+def bench(label: str, fn, body, iterations: int) -> float:
+    best = float("inf")
+    for _ in range(3):
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            fn(body)
+        best = min(best, (time.perf_counter() - t0) / iterations * 1e3)
+    print(f"  {label:18s} {best:8.2f} ms")
+    return best
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"orjson installed: {json_encoder.orjson is not None}")
+    configured = settings.JSON_BACKEND
+    for name, body in (("grade page x1000", grade_page(1000)), ("schedules x3000", schedule_list(3000))):
+        print(name)
+        base = bench("legacy triple pass", legacy, body, iterations)
+
+        settings.JSON_BACKEND = "stdlib"
+        stdlib = bench("stdlib single pass", json_encoder.dumps, body, iterations)
+        assert json_encoder.dumps(body) == legacy(body), "stdlib output must be byte-identical"
+
+        if json_encoder.orjson is not None:
+            settings.JSON_BACKEND = "orjson"
+            fast = bench("orjson", json_encoder.dumps, body, iterations)
+            assert json.loads(json_encoder.dumps(body)) == json.loads(legacy(body)), "orjson output must be value-identical"
+            print(f"  speedup: stdlib {base / stdlib:.1f}x, orjson {base / fast:.1f}x")
+        else:
+            print(f"  speedup: stdlib {base / stdlib:.1f}x")
+        settings.JSON_BACKEND = configured
+
+
+if __name__ == "__main__":
+    main()
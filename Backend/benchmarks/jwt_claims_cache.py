@@ -0,0 +1,52 @@
+"""
+Access-token verification: full HS256 decode vs. the verified-claims LRU.
+
+    DEBUG=true python -m benchmarks.jwt_claims_cache [requests] [distinct_tokens]
+
+A chatty SPA sends the same bearer token on every call of a page; `requests`
+decodes are spread over `distinct_tokens` live tokens (users), first through
+jwt.decode each time, then through decode_access_token with the cache warm.
+"""
+import sys
+import time
+from datetime import timedelta
+
+import jwt
+
+from app.contexts.iam.auth.jwt_utils import (
+    ALGORITHM,
+    SECRET_KEY,
+    claims_cache,
+    create_access_token,
+    decode_access_token,
+)
+
+
+def run(label: str, fn, tokens: list, requests: int) -> None:
+    t0 = time.perf_counter()
+    for i in range(requests):
+        fn(tokens[i % len(tokens)])
+    wall = time.perf_counter() - t0
+    print(f"{label:18s} {requests / wall:10.0f} decodes/s  {wall / requests * 1e6:7.2f} us/decode")
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    tokens = [
+        create_access_token(
+            {"id": f"{i:024x}", "role": "teacher", "username": f"user{i}", "email": f"user{i}@school.test"},
+            expire_delta=timedelta(minutes=15),
+        )
+        for i in range(distinct)
+    ]
+    print(f"requests={requests} distinct_tokens={distinct} cache_size={claims_cache.maxsize}")
+
+    run("jwt.decode", lambda t: jwt.decode(t, SECRET_KEY, algorithms=[ALGORITHM]), tokens, requests)
+    claims_cache.clear()
+    run("claims cache", decode_access_token, tokens, requests)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Logging cost on the request path: LogService.log inline vs. queued.
+
+    DEBUG=true python -m benchmarks.log_overhead [records]
+
+Each "request" logs one wrap_response-style http_error record (args, JSON body,
+headers, stack tail) plus five mongo_operation successes. Inline: sanitize +
+json.dumps + write on the caller. Queued: sanitize + enqueue; encoding and writes
+happen on the listener thread (drain time reported apart).
+
+Two sinks: a temp file (fast disk) and the same file behind a 200 us write stall,
+standing in for a stdout pipe the log collector is slow to drain.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from app.contexts.core.log.log_pipeline import EventGate
+from app.contexts.core.log.log_service import LogService
+
+ERROR_EXTRA = {
+    "event": "http_error",
+    "http": {"method": "POST", "path": "/api/teacher/grades", "status": 400, "duration_ms": 12, "request_id": "r-1"},
+    "actor_id": "65f0c0ffee0000000000abcd",
+    "args": {"page": "1", "page_size": "20", "term": "S1"},
+    "json": {
+        "student_id": "65f0c0ffee0000000000beef",
+        "class_id": "65f0c0ffee0000000000cafe",
+        "subject_id": "65f0c0ffee0000000000f00d",
+        "scores": [{"type": "quiz", "score": i, "comment": "x" * 40} for i in range(20)],
+        "password": "hunter2",
+    },
+    "headers": {"User-Agent": "Mozilla/5.0 " * 10, "X-Request-Id": "r-1", "Origin": "http://localhost:3000"},
+    "error": {"type": "GradeException", "code": "GRADE_INVALID", "message": "Score out of range", "details": {"max": 100}},
+    "stack": [f"/app/contexts/school/services/grade_service.py:{100 + i} in add_grade" for i in range(6)],
+}
+
+
+class SlowStream:
+    def __init__(self, stream, stall: float):
+        self.stream = stream
+        self.stall = stall
+
+    def write(self, data: str) -> int:
+        time.sleep(self.stall)
+        return self.stream.write(data)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+def run(svc: LogService, label: str, requests: int) -> None:
+    t0 = time.perf_counter()
+    for _ in range(requests):
+        svc.log("Request failed (business rule)", level="WARN", module="bench", extra=ERROR_EXTRA)
+        for _ in range(5):
+            svc.log("Mongo operation 'find' succeeded", level="INFO", module="bench",
+                    extra={"event": "mongo_operation", "operation": "find", "success": True})
+    caller = time.perf_counter() - t0
+    dropped = svc.queue_handler.dropped if svc.queue_handler else 0
+    svc.flush()
+    total = time.perf_counter() - t0
+    print(f"{label:28s} {caller / requests * 1e6:8.1f} us/request on caller   "
+          f"(drained after {total:5.2f}s, {dropped} dropped)")
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    svc = LogService.get_instance()
+    print(f"requests={requests}  (1 error + 5 mongo_operation records each)")
+
+    t0 = time.perf_counter()
+    for _ in range(requests):
+        svc._sanitize(ERROR_EXTRA)
+    print(f"{'sanitize only':28s} {(time.perf_counter() - t0) / requests * 1e6:8.1f} us/request")
+
+    with tempfile.TemporaryDirectory() as d:
+        for stall in (0.0, 0.0002):
+            print(f"-- sink: temp file{' + 200 us write stall' if stall else ''}")
+            for label, use_queue, sample in (
+                ("inline, no sampling", False, {}),
+                ("queued, no sampling", True, {}),
+                ("queued, mongo_operation=0.1", True, {"mongo_operation": 0.1}),
+            ):
+                with open(os.path.join(d, "bench.log"), "w") as f:
+                    svc.configure(use_queue=use_queue, stream=SlowStream(f, stall) if stall else f)
+                    svc.gate = EventGate(sample)
+                    run(svc, label, requests)
+
+if __name__ == "__main__":
+    main()
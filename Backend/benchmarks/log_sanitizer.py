@@ -0,0 +1,123 @@
+"""
+Log payload sanitizing: the previous recursive copy-everything walk vs. LogSanitizer.
+
+    DEBUG=true python -m benchmarks.log_sanitizer [iterations]
+
+Payloads mirror what the error paths log: a wrap_response http_error extra, a
+register_error_handlers context with full request headers, and a bulk
+grade/attendance body (the large case during incident spikes).
+"""
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from bson import ObjectId
+
+from app.contexts.core.log.log_service import LogService
+
+
+def recursive_sanitize(svc: LogService, obj, depth: int = 0):
+    """The pre-LogSanitizer algorithm, kept here as the baseline."""
+    if obj is None:
+        return None
+    if depth >= svc.max_depth:
+        return "[TRUNCATED_DEPTH]"
+    if isinstance(obj, dict):
+        out = {}
+        for k, v in obj.items():
+            lk = str(k).lower()
+            if lk in svc.sensitive_keys:
+                out[k] = "[REDACTED]"
+                continue
+            if lk == "headers" and isinstance(v, dict):
+                out[k] = svc.sanitizer.sanitize_headers(v)
+                continue
+            out[k] = recursive_sanitize(svc, v, depth + 1)
+        return out
+    if isinstance(obj, list):
+        trimmed = obj[: svc.max_list]
+        return [recursive_sanitize(svc, x, depth + 1) for x in trimmed] + (
+            ["...(trunc_list)"] if len(obj) > svc.max_list else []
+        )
+    if isinstance(obj, (int, float, bool)) and not isinstance(obj, (str, bytes)):
+        return obj
+    return svc._truncate(obj)
+
+
+HTTP_ERROR = {
+    "event": "http_error",
+    "http": {"method": "POST", "path": "/api/teacher/grades", "status": 400, "duration_ms": 12, "request_id": "r-1"},
+    "actor_id": "65f0c0ffee0000000000abcd",
+    "args": {"page": "1", "page_size": "20"},
+    "json": {"student_id": "65f0c0ffee0000000000beef", "score": 105, "type": "quiz", "term": "S1"},
+    "headers": {"User-Agent": "Mozilla/5.0", "X-Request-Id": "r-1", "Origin": "http://localhost:3000"},
+    "error": {"type": "GradeException", "code": "GRADE_INVALID", "message": "Score out of range", "details": {"max": 100}},
+    "stack": [f"/app/contexts/school/services/grade_service.py:{100 + i} in add_grade" for i in range(6)],
+}
+
+HANDLER_CONTEXT = {
+    "path": "/api/iam/me",
+    "method": "PATCH",
+    "args": {},
+    "json": {"username": "teacher01", "email": "t@school.test", "current_password": "old", "password": "new"},
+    "form": {},
+    "headers": {
+        "Host": "api.school.test", "User-Agent": "Mozilla/5.0 " * 8, "Accept": "application/json",
+        "Authorization": "Bearer " + "x" * 300, "Cookie": "refresh_token=" + "y" * 64,
+        "Content-Type": "application/json", "Origin": "https://school.test", "Referer": "https://school.test/me",
+        "Accept-Language": "en-US", "Accept-Encoding": "gzip, br", "Sec-Fetch-Mode": "cors",
+    },
+    "status_code": 400,
+    "type": "ValidationError",
+    "stack": "Traceback (most recent call last):\n" + "  File \"x.py\", line 1, in f\n" * 40,
+}
+
+BULK_BODY = {
+    "event": "http_error",
+    "json": {
+        "class_id": str(ObjectId()),
+        "records": [
+            {
+                "student_id": str(ObjectId()),
+                "status": "present",
+                "note": "arrived on time",
+                "marked_at": datetime(2026, 10, 19, 8, 0),
+                "meta": {"device": "tablet", "tags": ["am", "bus"]},
+            }
+            for _ in range(200)
+        ],
+    },
+}
+
+
+def bench(label: str, fn, payload, iterations: int, repeats: int = 5) -> float:
+    per = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            fn(payload)
+        per = min(per, (time.perf_counter() - t0) / iterations * 1e6)
+    print(f"  {label:10s} {per:8.1f} us")
+    return per
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    svc = LogService.get_instance()
+    svc.flush()
+    for name, payload in (("http_error", HTTP_ERROR), ("handler ctx", HANDLER_CONTEXT), ("bulk body", BULK_BODY)):
+        print(name)
+        old = bench("recursive", lambda p: recursive_sanitize(svc, p), payload, iterations)
+        new = bench("sanitizer", svc._sanitize, payload, iterations)
+        print(f"  speedup    {old / new:8.2f}x")
+        for label, fn in (("recursive", lambda p: recursive_sanitize(svc, p)), ("sanitizer", svc._sanitize)):
+            tracemalloc.start()
+            fn(payload)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"  {label:10s} {peak / 1024:8.1f} KiB peak allocated")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Login storm vs. the rest of the worker.
+
+    DEBUG=true python -m benchmarks.login_storm [logins] [concurrency]
+
+Under eventlet, `logins` password verifications run from `concurrency` greenlets
+while a probe greenlet stands in for every other request/socket on the worker: it
+asks to wake up every 10 ms and records how late it actually runs. Run once with
+hashing inline on the hub and once offloaded to tpool (PasswordHasher).
+"""
+import eventlet
+
+eventlet.monkey_patch()
+
+import statistics  # noqa: E402
+import sys  # noqa: E402
+import time  # noqa: E402
+
+from app.contexts.iam.auth.password_hashing import PasswordHasher  # noqa: E402
+
+PROBE_INTERVAL = 0.010
+
+
+def probe(lags: list, stop: list) -> None:
+    while not stop:
+        t0 = time.perf_counter()
+        eventlet.sleep(PROBE_INTERVAL)
+        lags.append((time.perf_counter() - t0 - PROBE_INTERVAL) * 1000)
+
+
+def storm(hasher: PasswordHasher, stored: str, logins: int, concurrency: int) -> dict:
+    lags: list = []
+    stop: list = []
+    prober = eventlet.spawn(probe, lags, stop)
+    eventlet.sleep(0.05)
+    lags.clear()
+
+    pool = eventlet.GreenPool(concurrency)
+    t0 = time.perf_counter()
+    for ok in pool.imap(lambda _: hasher.verify("correct horse", stored), range(logins)):
+        assert ok
+    wall = time.perf_counter() - t0
+
+    stop.append(True)
+    prober.wait()
+    lags.sort()
+    return {
+        "wall_s": wall,
+        "logins_per_s": logins / wall,
+        "probe_samples": len(lags),
+        "lag_p50_ms": statistics.median(lags) if lags else float("nan"),
+        "lag_p99_ms": lags[int(len(lags) * 0.99) - 1] if lags else float("nan"),
+        "lag_max_ms": lags[-1] if lags else float("nan"),
+    }
+
+
+def main() -> None:
+    logins = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    stored = PasswordHasher(offload=False).hash("correct horse")
+    print(f"scheme={stored.split('$', 1)[0]} logins={logins} concurrency={concurrency}")
+    for label, offload in (("inline (hub)", False), ("tpool", True)):
+        r = storm(PasswordHasher(offload=offload), stored, logins, concurrency)
+        print(
+            f"{label:13s} wall={r['wall_s']:6.2f}s  {r['logins_per_s']:6.1f} logins/s  "
+            f"probe samples={r['probe_samples']:4d}  lag p50={r['lag_p50_ms']:7.1f}ms  "
+            f"p99={r['lag_p99_ms']:7.1f}ms  max={r['lag_max_ms']:7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
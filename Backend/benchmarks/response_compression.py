@@ -0,0 +1,51 @@
+"""
+Wire size and CPU cost of compressing API responses, per gzip level (and brotli
+quality when installed), with the estimated transfer time on a slow mobile link.
+
+    DEBUG=true python -m benchmarks.response_compression [iterations] [link_kbit_s]
+
+Bodies are the grade page and schedule listing from benchmarks.json_responses,
+encoded exactly as Response.success_response sends them.
+"""
+import sys
+import time
+
+from flask import Flask, Response
+
+from app.contexts.infra.http import json_encoder
+from app.contexts.infra.http.compression import ResponseCompressor, brotli
+from benchmarks.json_responses import grade_page, schedule_list
+
+
+def run(compressor: ResponseCompressor, body: bytes, encoding: str, iterations: int):
+    app = Flask(__name__)
+    best, size = float("inf"), 0
+    with app.test_request_context(headers={"Accept-Encoding": encoding}):
+        for _ in range(iterations):
+            resp = Response(body, mimetype="application/json")
+            t0 = time.perf_counter()
+            resp = compressor.compress(resp)
+            best = min(best, time.perf_counter() - t0)
+            size = resp.content_length
+    return best * 1e3, size
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    link = int(sys.argv[2]) if len(sys.argv) > 2 else 400  # kbit/s, a weak 3G connection
+    configs = [("identity", "identity", ResponseCompressor())]
+    configs += [(f"gzip -{lvl}", "gzip", ResponseCompressor(gzip_level=lvl)) for lvl in (1, 6, 9)]
+    if brotli is not None:
+        configs += [(f"br q{q}", "br", ResponseCompressor(brotli_quality=q)) for q in (4, 11)]
+
+    for name, payload in (("grade page x1000", grade_page(1000)), ("schedules x3000", schedule_list(3000))):
+        body = json_encoder.dumps(payload)
+        print(f"{name} ({len(body) / 1024:.0f} KiB, link {link} kbit/s)")
+        for label, encoding, compressor in configs:
+            cpu_ms, size = run(compressor, body, encoding, iterations)
+            wire_ms = size * 8 / link
+            print(f"  {label:9s} {size / 1024:8.1f} KiB  cpu {cpu_ms:6.2f} ms  transfer ~{wire_ms:7.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
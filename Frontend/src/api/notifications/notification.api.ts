@@ -9,6 +9,8 @@ type ListLatestParams = {
   limit?: number;
   type?: NotifType;
   unread_only?: boolean;
+  before?: string; // next_cursor of the previous page (older items)
+  after?: string; // prev_cursor (newer items)
 };
 
 type UnreadCountParams = {
@@ -19,7 +21,7 @@ export class NotificationApi {
   constructor(private $api: AxiosInstance, private baseURL = "/api") {}
 
   async listLatest(params: ListLatestParams = {}) {
-    const { limit = 30, type, unread_only } = params;
+    const { limit = 30, type, unread_only, before, after } = params;
 
     return this.$api
       .get<NotificationListResponse>(`${this.baseURL}/notifications`, {
@@ -27,6 +29,8 @@ export class NotificationApi {
           limit,
           type: type || undefined,
           unread_only: unread_only ? 1 : undefined,
+          before: before || undefined,
+          after: after || undefined,
         },  
       })
       .then((r) => r.data);
@@ -10,12 +10,19 @@ export type NotificationDTO = {
   entity_type?: string | null;
   entity_id?: string | null;
   data?: Record<string, any>;
+  item_count?: number; // > 1 when several events were coalesced into this notification
+  group_key?: string | null;
+  room?: string | null; // set on class-wide socket broadcasts, which have no per-member id
   read_at?: string | null;
   created_at?: string | null;
 };
 
-export type NotificationListDTO = { items: NotificationDTO[] };
-export type UnreadCountDTO = { unread: number };
+export type NotificationListDTO = {
+  items: NotificationDTO[];
+  next_cursor?: string | null;
+  prev_cursor?: string | null;
+};
+export type UnreadCountDTO = { unread: number; by_type?: Record<string, number> };
 
 export type NotificationListResponse = ApiResponse<NotificationListDTO>;
 export type UnreadCountResponse = ApiResponse<UnreadCountDTO>;
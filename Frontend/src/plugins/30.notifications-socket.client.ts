@@ -66,6 +66,15 @@ export default defineNuxtPlugin(() => {
       notif.pushRealtime(payload);
     });
 
+    socket.on("notification:updated", (payload: any) => {
+      if (isDev) console.log("[socket] notification:updated", payload);
+      notif.applyUpdate(payload);
+    });
+
+    socket.on("notification:unread", (payload: any) => {
+      notif.setUnread(payload?.total);
+    });
+
     socket.on("connect_error", (err: any) => {
       if (isDev) console.log("[socket] connect_error", err?.message ?? err);
     });
@@ -41,6 +41,12 @@ export const useNotificationStore = defineStore("notification", () => {
     }
   }
 
+  // Server-pushed counter ("notification:unread"): authoritative, no polling needed
+  function setUnread(total: unknown) {
+    const n = Number(total ?? 0);
+    unread.value = Number.isFinite(n) ? Math.max(0, n) : 0;
+  }
+
   async function loadLatest(limit = 30): Promise<NotificationDTO[]> {
     try {
       const api = getApi();
@@ -76,8 +82,24 @@ export const useNotificationStore = defineStore("notification", () => {
     }, delayMs);
   }
 
+  // Room broadcasts (one emit per class) carry only the shared fields, no
+  // per-member id: fetch this user's own copy instead of inserting a placeholder.
+  let latestTimer: ReturnType<typeof setTimeout> | null = null;
+
+  function refreshLatestSoon(maxDelayMs = 1500) {
+    if (latestTimer) return;
+    // jitter: a class-wide event reaches every member at the same moment
+    latestTimer = setTimeout(() => {
+      latestTimer = null;
+      void loadLatest();
+    }, Math.random() * maxDelayMs);
+  }
+
   function pushRealtime(n: NotificationDTO) {
-    if (!n?.id) return;
+    if (!n?.id) {
+      if (n?.room) refreshLatestSoon();
+      return;
+    }
 
     const nid = String(n.id);
 
@@ -95,6 +117,21 @@ export const useNotificationStore = defineStore("notification", () => {
     refreshUnreadSoon(300);
   }
 
+  // Coalesced notification changed in place (item_count, latest title/message)
+  function applyUpdate(n: NotificationDTO) {
+    const idx = items.value.findIndex((x) =>
+      n?.id ? String(x.id) === String(n.id) : !!n?.group_key && x.group_key === n.group_key && !x.read_at
+    );
+    if (idx < 0) {
+      if (n?.id) pushRealtime(n);
+      else if (n?.room) refreshLatestSoon();
+      return;
+    }
+    const { id: _id, user_id: _uid, ...changes } = n;
+    const updated = { ...items.value[idx], ...changes };
+    items.value = [updated, ...items.value.filter((_, i) => i !== idx)];
+  }
+
   async function markRead(id: string) {
     const api = getApi();
     const sid = String(id);
@@ -137,6 +174,8 @@ export const useNotificationStore = defineStore("notification", () => {
   onScopeDispose(() => {
     if (refreshTimer) clearTimeout(refreshTimer);
     refreshTimer = null;
+    if (latestTimer) clearTimeout(latestTimer);
+    latestTimer = null;
   });
 
   return {
@@ -149,8 +188,11 @@ export const useNotificationStore = defineStore("notification", () => {
     toggleDrawer,
     refreshUnread,
     refreshUnreadSoon,
+    refreshLatestSoon,
+    setUnread,
     loadLatest,
     pushRealtime,
+    applyUpdate,
     markRead,
     markAllRead,
   };